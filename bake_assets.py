@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+import os
+import sys
+import time
+
+
+def _folder_kib(paths):
+    total = 0
+    for path in paths:
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+    return total // 1024
+
+
+def main():
+    # Ambiente headless, como no run_tests.py
+    os.environ.setdefault("PLATFORM_GAME_FULLSCREEN", "0")
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    import pygame
+    from internal.engine.game import Game
+    from internal.resources.bake import bake, collect_requests, direct_load_paths
+
+    root = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(root)
+    pygame.init()
+    game = Game()
+
+    print("▶️  Coletando pedidos de imagem (título, menu e todas as fases)...")
+    requests = collect_requests(game, range(1, game.max_levels + 1))
+    manifest = bake(requests, root=".", protected=direct_load_paths("internal"))
+    images = manifest["images"]
+    print(f"✅ {len(images)} variante(s) pré-escalada(s) em imagens_baked/")
+
+    # Resumo: decodificação e tamanho, original + escala vs. versão assada
+    sources = sorted({key.split("@", 1)[0] for key in images})
+    start = time.perf_counter()
+    for key in images:
+        path, size = key.split("@", 1)
+        width, height = (int(v) for v in size.split("x"))
+        pygame.transform.scale(pygame.image.load(path), (width, height))
+    original_ms = (time.perf_counter() - start) * 1000.0
+    start = time.perf_counter()
+    for entry in images.values():
+        pygame.image.load(entry["file"])
+    baked_ms = (time.perf_counter() - start) * 1000.0
+    covered = manifest["covered"]
+    baked_kib = _folder_kib(entry["file"] for entry in images.values())
+    print(f"   Decodificação: {original_ms:.0f} ms -> {baked_ms:.0f} ms")
+    print(
+        f"   Originais substituídos no pacote: {len(covered)} de {len(sources)} "
+        f"({_folder_kib(covered)} KiB -> {baked_kib} KiB assados no total)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
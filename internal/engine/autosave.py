@@ -0,0 +1,101 @@
+import os
+import json
+import threading
+
+
+def write_json_atomic(path, data):
+    """Grava JSON em arquivo temporário e troca por rename atômico.
+
+    Uma queda no meio da escrita deixa apenas o ``.tmp`` incompleto;
+    o arquivo final continua com o conteúdo anterior.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class AutosaveWriter:
+    """Escritor de autosave em thread de fundo com coalescência.
+
+    ``submit`` apenas guarda o snapshot mais recente e acorda a thread;
+    snapshots enviados antes de a escrita começar são descartados em favor
+    do último. ``flush`` grava o pendente no chamador e aguarda escritas
+    em andamento (usado no encerramento).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()  # protege _pending
+        self._write_lock = threading.Lock()  # serializa escritas em disco
+        self._pending = None
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._stopped = False
+        self.writes = 0
+        self.coalesced = 0
+
+    def submit(self, path, data):
+        """Enfileira um snapshot; substitui qualquer snapshot ainda não gravado."""
+        with self._lock:
+            if self._pending is not None:
+                self.coalesced += 1
+            self._pending = (path, dict(data))
+        self._ensure_thread()
+        self._wakeup.set()
+
+    def _ensure_thread(self):
+        if self._stopped:
+            return
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run,
+                name="autosave-writer",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopped:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._stopped:
+                break
+            self._write_pending()
+
+    def _take_pending(self):
+        with self._lock:
+            item = self._pending
+            self._pending = None
+        return item
+
+    def _write_pending(self):
+        with self._write_lock:
+            item = self._take_pending()
+            if item is None:
+                return False
+            path, data = item
+            try:
+                write_json_atomic(path, data)
+                self.writes += 1
+            except Exception as e:
+                print(f"Erro ao gravar autosave: {e}")
+            return True
+
+    def flush(self):
+        """Grava o snapshot pendente (se houver) e espera escritas em curso."""
+        return self._write_pending()
+
+    def clear(self, path):
+        """Descarta o pendente e remove o arquivo de autosave."""
+        with self._write_lock:
+            self._take_pending()
+            if os.path.exists(path):
+                os.remove(path)
+
+    def close(self):
+        """Grava o pendente e encerra a thread de fundo."""
+        self.flush()
+        self._stopped = True
+        self._wakeup.set()
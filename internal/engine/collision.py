@@ -0,0 +1,53 @@
+from internal.resources.cache import ResourceCache
+
+
+def collision_frame(obj):
+    """Quadro atual de ``obj`` e a posição (x, y) em que é desenhado.
+
+    Usa ``sprite_frame()`` quando a entidade desenha o sprite deslocado
+    (ex.: jogador agachado) e ``sprite_image()`` em (x, y) nas demais.
+    Retorna (None, None) quando não há imagem a testar.
+    """
+    sprite_frame = getattr(obj, "sprite_frame", None)
+    if sprite_frame is not None:
+        try:
+            return sprite_frame()
+        except Exception:
+            return None, None
+    sprite_image = getattr(obj, "sprite_image", None)
+    if sprite_image is None:
+        return None, None
+    try:
+        image = sprite_image()
+    except Exception:
+        return None, None
+    if image is None:
+        return None, None
+    return image, (obj.x, obj.y)
+
+
+def collide_precise(a, b, rect_a=None, rect_b=None):
+    """Teste de colisão em duas fases: retângulos e, se sobrepostos, máscaras.
+
+    As máscaras vêm do ``ResourceCache`` (uma por quadro de animação). Se
+    algum dos lados não tiver imagem, vale o resultado dos retângulos.
+    """
+    if rect_a is None:
+        rect_a = a.rect
+    if rect_b is None:
+        rect_b = getattr(b, "rect", rect_a)
+    if not rect_a.colliderect(rect_b):
+        return False
+    image_a, pos_a = collision_frame(a)
+    if image_a is None:
+        return True
+    image_b, pos_b = collision_frame(b)
+    if image_b is None:
+        return True
+    cache = ResourceCache()
+    mask_a = cache.get_mask(image_a)
+    mask_b = cache.get_mask(image_b)
+    if mask_a is None or mask_b is None:
+        return True
+    offset = (int(pos_b[0]) - int(pos_a[0]), int(pos_b[1]) - int(pos_a[1]))
+    return mask_a.overlap(mask_b, offset) is not None
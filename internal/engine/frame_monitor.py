@@ -0,0 +1,138 @@
+import time
+from collections import deque
+
+from internal.utils.constants import FPS
+
+
+class FrameMonitor:
+    """Telemetria de tempo de quadro para o ``runtime.log``.
+
+    Mede o trabalho de cada quadro (eventos, update e draw, sem a espera do
+    ``clock.tick``), mantém um histograma e uma janela móvel para
+    percentis, e registra cada quadro acima do orçamento com estado, fase e
+    tempos por subsistema. ``log_summary`` escreve o resumo no
+    encerramento.
+    """
+
+    BUDGET_MS = 1000.0 / FPS
+    # Limites superiores (ms) das faixas do histograma; a última é aberta
+    BUCKETS_MS = (4.0, 8.0, 12.0, 16.7, 20.0, 25.0, 33.4, 50.0, 100.0)
+    WINDOW = 3600  # ~1 minuto a 60 FPS para os percentis
+
+    def __init__(self, budget_ms=None, log=print):
+        self.budget_ms = float(budget_ms) if budget_ms else self.BUDGET_MS
+        self._log = log
+        self.histogram = [0] * (len(self.BUCKETS_MS) + 1)
+        self.window = deque(maxlen=self.WINDOW)
+        self.frames = 0
+        self.long_frames = 0
+        self.worst_ms = 0.0
+        self.worst_cause = None
+        self._timings = {}
+        self._notes = {}
+        self.note_totals = {}
+        self.note_peaks = {}
+        self._mark = None
+
+    def begin_frame(self):
+        self._timings = {}
+        self._notes = {}
+        self._mark = time.perf_counter()
+
+    def lap(self, section):
+        """Fecha o trecho iniciado no último ``lap``/``begin_frame``."""
+        now = time.perf_counter()
+        if self._mark is not None:
+            self._timings[section] = (now - self._mark) * 1000.0
+        self._mark = now
+
+    def note(self, name, ms):
+        """Tempo já contido nos trechos (ex.: pausa do gc), só informativo."""
+        if not ms:
+            return
+        self._notes[name] = self._notes.get(name, 0.0) + ms
+        self.note_totals[name] = self.note_totals.get(name, 0.0) + ms
+        if ms > self.note_peaks.get(name, 0.0):
+            self.note_peaks[name] = ms
+
+    def end_frame(self, state=None, level=None):
+        """Contabiliza o quadro; retorna o tempo de trabalho em ms."""
+        timings = self._timings
+        total = sum(timings.values())
+        self.frames += 1
+        self.window.append(total)
+        self.histogram[self._bucket(total)] += 1
+        self._mark = None
+        if total <= self.budget_ms:
+            return total
+
+        self.long_frames += 1
+        state_name = getattr(state, "name", state)
+        slowest = max(timings, key=timings.get) if timings else None
+        cause = f"{slowest} em {state_name} (fase {level})"
+        if total > self.worst_ms:
+            self.worst_ms = total
+            self.worst_cause = cause
+        parts = " ".join(f"{name}={ms:.1f}" for name, ms in timings.items())
+        if self._notes:
+            parts += " (" + " ".join(f"{name}={ms:.1f}" for name, ms in self._notes.items()) + ")"
+        self._emit(
+            f"[PERF] Quadro lento #{self.frames}: {total:.1f} ms "
+            f"(orçamento {self.budget_ms:.1f}) estado={state_name} "
+            f"fase={level} {parts}"
+        )
+        return total
+
+    def _bucket(self, ms):
+        for i, limit in enumerate(self.BUCKETS_MS):
+            if ms <= limit:
+                return i
+        return len(self.BUCKETS_MS)
+
+    def percentile(self, pct):
+        if not self.window:
+            return 0.0
+        ordered = sorted(self.window)
+        index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def get_summary(self):
+        return {
+            "frames": self.frames,
+            "long_frames": self.long_frames,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "worst_ms": self.worst_ms,
+            "worst_cause": self.worst_cause,
+            "histogram": list(self.histogram),
+            "notes": {
+                name: (total, self.note_peaks.get(name, 0.0))
+                for name, total in self.note_totals.items()
+            },
+        }
+
+    def log_summary(self):
+        """Escreve o resumo de desempenho da sessão."""
+        if not self.frames:
+            return
+        s = self.get_summary()
+        self._emit(
+            f"[PERF] Resumo: {s['frames']} quadros, {s['long_frames']} acima de "
+            f"{self.budget_ms:.1f} ms; p50={s['p50_ms']:.1f} p95={s['p95_ms']:.1f} "
+            f"p99={s['p99_ms']:.1f} ms"
+        )
+        if s["worst_cause"]:
+            self._emit(f"[PERF] Pior quadro: {s['worst_ms']:.1f} ms ({s['worst_cause']})")
+        labels = [f"<={limit:g}" for limit in self.BUCKETS_MS]
+        labels.append(f">{self.BUCKETS_MS[-1]:g}")
+        bins = " ".join(f"{label}:{count}" for label, count in zip(labels, s["histogram"]) if count)
+        self._emit(f"[PERF] Histograma (ms): {bins}")
+        for name, (total, peak) in s["notes"].items():
+            self._emit(f"[PERF] {name}: total {total:.1f} ms, pico {peak:.1f} ms")
+
+    def _emit(self, line):
+        try:
+            self._log(line)
+        except Exception:
+            pass
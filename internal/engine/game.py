@@ -29,6 +29,8 @@ from internal.utils.constants import (
 from internal.utils.edition import GameEdition
 from internal.resources.image import Image
 from internal.engine.joystick import Joystick
+from internal.engine.input_state import InputState
+from internal.engine.performance import PerformanceProfile
 from internal.engine.video import VideoPlayer
 from internal.resources.bullet import Bullet
 from internal.resources.explosion import Explosion
@@ -48,10 +50,12 @@ from internal.engine.game_modules.draw import Draw
 from internal.engine.game_modules.update import Update
 from internal.engine.game_modules.difficulty import DifficultyOps
 from internal.engine.game_modules.pool import Pool
+from internal.engine.game_modules.lifecycle import Lifecycle
 from internal.engine.game_modules.cheat import Cheat
 from internal.engine.game_modules.menu import Menu
 from internal.engine.game_modules.system import System
 from internal.engine.mod_loader import ModLoader
+from internal.engine.autosave import AutosaveWriter
 
 # Carregar configurações
 ENV_CONFIG = load_env_config()
@@ -113,6 +117,10 @@ class Game:
             self._mod_loader = ModLoader(self)
         except Exception:
             pass
+        # Perfil de desempenho (resolvido no início do loop, ver System.run)
+        self.performance = PerformanceProfile(
+            str(self.env_config.get("performance-profile", "auto")).strip().lower()
+        )
         Screen.init(self)
         pygame.display.set_caption("Jump and Hit")
         # Definir ícone da janela (barra de título)
@@ -234,6 +242,11 @@ class Game:
             # Não interromper inicialização do jogo caso .env esteja
             # inválido
             pass
+        # Placar de recordes acompanha a dificuldade já resolvida
+        try:
+            self.ranking_manager.set_board(self.difficulty)
+        except Exception:
+            pass
 
         # Ligar subsistemas extraídos e encaminhar métodos públicos
         try:
@@ -336,6 +349,8 @@ class Game:
         self.joystick_name = getattr(self, "joystick_name", "")
         self.joystick_connected = getattr(self, "joystick_connected", False)
         self.joystick = getattr(self, "joystick", None)
+        # Snapshot de entrada por quadro (teclado + joystick em ações)
+        self.input_state = InputState()
         self.pause_selected = 0
         self.pause_menu_options = [
             "Continuar",
@@ -372,6 +387,7 @@ class Game:
             DifficultyOps(self) if DifficultyOps is not None else None
         )
         self._pool = Pool(self) if Pool is not None else None
+        self._lifecycle = Lifecycle(self)
         self._cheat = Cheat(self) if Cheat is not None else None
         self._menu = Menu(self) if Menu is not None else None
         self._system = System(self) if System is not None else None
@@ -450,6 +466,7 @@ class Game:
         self.logos = []  # Lista de logos para splash
         # Autosave e opções de menu dinâmicas
         self.autosave_path = self._get_saves_path("autosave.json")
+        self._autosave_writer = AutosaveWriter()
         self._ensure_saves_dir()
         self._autosave_data = self._load_autosave()
         self.menu_selected = 0
@@ -761,32 +778,11 @@ class Game:
             None,
         )
 
-        self.turtle_images = getattr(self.image, "turtle_images", None)
-        self.spider_images = getattr(self.image, "spider_images", None)
-        self.robot_images = getattr(self.image, "robot_images", None)
-        self.missile_images = getattr(self.image, "missile_images", None)
-        self.alien_images = getattr(self.image, "alien_images", None)
-
-        # Imagens de avião: manter também cópias individuais para uso
-        # existente
-        self.airplane_img1 = getattr(self.image, "airplane_img1", None)
-        self.airplane_img2 = getattr(self.image, "airplane_img2", None)
-        self.airplane_img3 = getattr(self.image, "airplane_img3", None)
-        self.airplane_images = (
-            (self.airplane_img1, self.airplane_img2, self.airplane_img3)
-            if self.airplane_img1 and self.airplane_img2 and self.airplane_img3
-            else None
-        )
-
-        self.flying_disk_images = getattr(
-            self.image,
-            "flying_disk_images",
-            None,
-        )
-        self.fire_image = getattr(self.image, "fire_image", None)
+        # Imagens do mundo atual (inimigos, avião, disco, foguinho, lava);
+        # ressincronizadas a cada troca de mundo em Level.init_level
+        self.image.sync_game(self)
         self.extra_life_img = getattr(self.image, "extra_life_img", None)
         self.explosion_image = getattr(self.image, "explosion_image", None)
-        self.lava_drop_img = getattr(self.image, "lava_drop_img", None)
         # Imagens dos power-ups e bolha do escudo
         self.powerup_invincibility_img = getattr(
             self.image,
@@ -963,6 +959,20 @@ class Game:
         if self._mod_loader is not None:
             self._mod_loader.load_mods()
 
+    def register_mod_hook(self, hook, callback, mod_name=None):
+        """Registra um hook de MOD (pre_update, post_draw, on_spawn, ...)."""
+        if not hasattr(self, "_mod_loader") or self._mod_loader is None:
+            self._mod_loader = ModLoader(self)
+        self._mod_loader.register_hook(hook, callback, mod_name)
+
+    def call_mod_hook(self, hook, *args):
+        loader = getattr(self, "_mod_loader", None)
+        if loader is not None:
+            try:
+                loader.call_hook(hook, *args)
+            except Exception:
+                pass
+
 
     def update_bird_difficulty(self):
         if not hasattr(self, "_difficulty") or self._difficulty is None:
@@ -1071,6 +1081,16 @@ class Game:
                 pass
         return self._pool.return_bullet_to_pool(bullet)
 
+    def kill_entity(self, entity):
+        if not hasattr(self, "_lifecycle") or self._lifecycle is None:
+            self._lifecycle = Lifecycle(self)
+        return self._lifecycle.kill(entity)
+
+    def sweep_entities(self):
+        if not hasattr(self, "_lifecycle") or self._lifecycle is None:
+            self._lifecycle = Lifecycle(self)
+        return self._lifecycle.sweep()
+
     def get_pooled_explosion(self, x, y, image=None):
         if not hasattr(self, "_pool") or self._pool is None:
             try:
@@ -1127,7 +1147,30 @@ class Game:
                 raise
         if self._update is None:
             raise RuntimeError("Update nao foi inicializado corretamente")
-        return self._update.update()
+        self.call_mod_hook("pre_update")
+        result = self._update.update()
+        self.call_mod_hook("post_update")
+        return result
+
+    def select_performance_profile(self):
+        """Resolve o perfil de desempenho (benchmark em ``auto``) e o aplica."""
+        if not hasattr(self, "performance"):
+            self.performance = PerformanceProfile()
+        self.performance.select()
+        self.performance.apply(self)
+        return self.performance.name
+
+    def cycle_performance_profile(self, step=1):
+        """Troca a preferência no menu de vídeo, aplica e salva."""
+        if not hasattr(self, "performance"):
+            self.performance = PerformanceProfile()
+        self.performance.cycle(step)
+        name = self.select_performance_profile()
+        try:
+            self._save_settings()
+        except Exception:
+            pass
+        return name
 
     def handle_menu_selection(self):
         if not hasattr(self, "_menu") or self._menu is None:
@@ -1184,6 +1227,10 @@ class Game:
                 self._system = None
         if self._system is not None:
             return self._system.shutdown()
+        try:
+            self._get_autosave_writer().close()
+        except Exception:
+            pass
         try:
             import pygame as _pg
             _pg.mixer.music.stop()
@@ -1246,16 +1293,21 @@ class Game:
             pass
         return None
 
+    def _get_autosave_writer(self):
+        if getattr(self, "_autosave_writer", None) is None:
+            self._autosave_writer = AutosaveWriter()
+        return self._autosave_writer
+
     def _save_autosave(self, level, score, lives_at_stage_start):
         try:
-            import json as _json
             data = {
                 "level": int(level),
                 "score": int(score),
                 "lives_at_stage_start": int(lives_at_stage_start),
             }
-            with open(self.autosave_path, "w", encoding="utf-8") as f:
-                _json.dump(data, f, ensure_ascii=False, indent=2)
+            # Estado em memória atualizado já; a gravação em disco fica
+            # com a thread de fundo (só o snapshot mais recente é gravado)
+            self._get_autosave_writer().submit(self.autosave_path, data)
             self._autosave_data = data
             self._rebuild_main_menu_options()
         except Exception:
@@ -1263,8 +1315,7 @@ class Game:
 
     def _clear_autosave(self):
         try:
-            if os.path.exists(self.autosave_path):
-                os.remove(self.autosave_path)
+            self._get_autosave_writer().clear(self.autosave_path)
             self._autosave_data = None
             self._rebuild_main_menu_options()
         except Exception:
@@ -1301,6 +1352,7 @@ class Game:
                 vm = data.get("visual_mode")
                 cb = data.get("colorblind_mode")
                 vib = data.get("vibration_enabled")
+                perf = data.get("performance_profile")
                 if isinstance(kc, dict):
                     self.controls = {k: list(map(int, v)) for k, v in kc.items()}
                 if isinstance(jc, dict):
@@ -1332,6 +1384,8 @@ class Game:
                     self.colorblind_mode = cb
                 if isinstance(vib, bool):
                     self.vibration_enabled = vib
+                if isinstance(perf, str) and perf in PerformanceProfile.CHOICES:
+                    self.performance.set_preference(perf)
                 try:
                     if getattr(self, "joystick_connected", False):
                         name = getattr(self, "joystick_name", "")
@@ -1376,6 +1430,7 @@ class Game:
                 "visual_mode": str(getattr(self, "visual_mode", "normal")),
                 "colorblind_mode": str(getattr(self, "colorblind_mode", "none")),
                 "vibration_enabled": bool(getattr(self, "vibration_enabled", False)),
+                "performance_profile": str(getattr(getattr(self, "performance", None), "preference", "auto")),
             }
             with open(self.settings_path, "w", encoding="utf-8") as f:
                 _json.dump(data, f, ensure_ascii=False, indent=2)
@@ -19,15 +19,416 @@ from internal.utils.constants import (
     LIGHT_BLUE,
     CYAN,
 )
+from internal.engine.difficulty import Difficulty
 from internal.engine.screen import Screen
 from internal.engine.state import GameState
+from internal.engine.state_dispatch import StateDispatch
 from internal.engine.title import TitleScreen
 from internal.engine.info import Info
+from internal.engine.spatial import ChunkIndex
+from internal.engine.render_queue import RenderQueue
+from internal.engine.particles import ParticleSystem
+from internal.resources.text_cache import TextCache
+
+
+# Linhas dos créditos finais (uma linha a cada CREDITS_LINE_HEIGHT pixels)
+CREDITS_LINE_HEIGHT = 35
+ENDING_CREDITS = [
+    "",
+    "",
+    "",
+    "JUMP & HIT",
+    "",
+    "",
+    "Um jogo de plataforma 2D",
+    "inspirado nos clássicos dos anos 80 e 90",
+    "",
+    "",
+    (
+        "=============================="
+        "=============================="
+    ),
+    "",
+    "DESENVOLVIDO POR",
+    "",
+    "CirrasTec",
+    "",
+    (
+        "=============================="
+        "=============================="
+    ),
+    "",
+    "EM PARCERIA COM",
+    "",
+    "Cirras RetroGames",
+    "https://www.youtube.com/@cirrasretrogames",
+    "",
+    "Canal do Dudu",
+    "https://www.youtube.com/@canaldodudu14",
+    "",
+    (
+        "=============================="
+        "=============================="
+    ),
+    "",
+    "PROGRAMAÇÃO E DESIGN",
+    "",
+    "Cirras",
+    "Dudu",
+    "",
+    (
+        "=============================="
+        "=============================="
+    ),
+    "",
+    "ARTE E GRÁFICOS",
+    "",
+    "Cirras",
+    "",
+    (
+        "=============================="
+        "=============================="
+    ),
+    "",
+    "ÁUDIO E MÚSICA",
+    "",
+    "Cirras",
+    "",
+    (
+        "=============================="
+        "=============================="
+    ),
+    "",
+    "NÍVEIS E GAMEPLAY",
+    "",
+    "Cirras",
+    "Dudu",
+    "Aline",
+    "",
+    (
+        "=============================="
+        "=============================="
+    ),
+    "",
+    "TECNOLOGIAS UTILIZADAS",
+    "",
+    "Python 3.x",
+    "Pygame",
+    "Trae",
+    "Suno",
+    "Canva",
+    "",
+    (
+        "=============================="
+        "=============================="
+    ),
+    "",
+    "AGRADECIMENTOS ESPECIAIS",
+    "",
+    "À comunidade retrogaming",
+    "Aos jogadores que testaram o jogo",
+    "Aos criadores dos jogos clássicos",
+    "que nos inspiraram",
+    "",
+    (
+        "=============================="
+        "=============================="
+    ),
+    "",
+    "MENSAGEM FINAL",
+    "",
+    "Este jogo foi criado com paixão e dedicação,",
+    "combinando a nostalgia dos jogos clássicos",
+    "com elementos modernos de gameplay.",
+    "",
+    "Esperamos que você tenha se divertido",
+    "tanto quanto nós nos divertimos criando!",
+    "",
+    "Continue jogando, continue sonhando!",
+    "",
+    (
+        "=============================="
+        "=============================="
+    ),
+    "",
+    "© 2025 CirrasTec",
+    "Todos os direitos reservados",
+    "",
+    "",
+    "Obrigado por jogar!",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+]
+
+
+def _world_extent(obj):
+    """Extensão horizontal no mundo: faixa de patrulha ou o próprio rect."""
+    rect = getattr(obj, "rect", None)
+    left = getattr(obj, "platform_left", None)
+    if left is not None:
+        right = getattr(obj, "platform_right", left) + getattr(obj, "width", 0)
+        return left, right
+    if rect is not None:
+        return rect.x, rect.right
+    x = getattr(obj, "x", 0)
+    return x, x + getattr(obj, "width", 0)
 
 
 class Draw:
     def __init__(self, game):
         self.game = game
+        # Índices espaciais por lista: nome -> (lista, tamanho, ChunkIndex)
+        self._spatial_indexes = {}
+        # Fila de sprites homogêneos despachada com Surface.blits por camada
+        self._render_queue = RenderQueue()
+        # Explosões e brilho do super tiro: buffers e sprites pré-alocados
+        self._particles = ParticleSystem(
+            limit=getattr(getattr(game, "performance", None), "max_particles", None)
+        )
+        # Créditos finais pré-renderizados: (superfície, margem) ou None
+        self._credits_surface = None
+        # Modais (pausa, confirmações, fim da demo): véus por opacidade e
+        # painéis pré-compostos, refeitos só quando seleção ou textos mudam
+        self._modal_overlays = {}
+        self._modal_panels = {}
+        # Desenho por estado: uma busca por quadro em vez da cadeia de elif
+        self._states = StateDispatch("draw")
+        for state, handler in (
+            (GameState.SPLASH, self._draw_splash),
+            (GameState.TITLE_SCREEN, self._draw_title_screen),
+            (GameState.OPENING_VIDEO, self._draw_opening_video),
+            (GameState.ENDING_VIDEO, self._draw_ending_video),
+            (GameState.MAIN_MENU, self._draw_main_menu),
+            (GameState.SELECT_DIFFICULTY, self._draw_select_difficulty),
+            (GameState.PLAYING, self._draw_playing),
+            (GameState.GAME_OVER, self._draw_game_over),
+            (GameState.VICTORY, self._draw_victory),
+            (GameState.ENTER_NAME, self._draw_enter_name),
+            (GameState.SHOW_RANKING, self._draw_show_ranking),
+            (GameState.FIM_SCREEN, self._draw_fim_screen),
+            (GameState.CREDITS, self._draw_credits),
+            (GameState.RECORDS, self._draw_records),
+            (GameState.PAUSED, self._draw_paused),
+            (GameState.OPTIONS_MENU, self._draw_options_menu),
+            (GameState.OPTIONS_AUDIO, self._draw_options_audio),
+            (GameState.OPTIONS_VIDEO, self._draw_options_video),
+            (GameState.OPTIONS_ACCESSIBILITY, self._draw_options_accessibility),
+            (GameState.OPTIONS_CONTROLS, self._draw_options_controls),
+            (GameState.CONFIRM_NEW_GAME, self._draw_confirm_new_game),
+            (GameState.CONFIRM_EXIT_TO_MENU, self._draw_confirm_exit_to_menu),
+            (GameState.DEMO_END_MESSAGE, self._draw_demo_end_message),
+        ):
+            self._states.register(state, handler)
+
+    def _render(self, font, text, antialias, color, background=None):
+        """Texto renderizado via cache LRU (não alterar a superfície devolvida)."""
+        return TextCache().render(font, text, antialias, color, background)
+
+    def _text_size(self, font, text):
+        return TextCache().size(font, text)
+
+    def _font(self, size):
+        """Fonte padrão do pygame criada uma única vez por tamanho."""
+        return TextCache().get_font(size)
+
+    @staticmethod
+    def _call_mod_hook(game, hook):
+        try:
+            game.call_mod_hook(hook)
+        except Exception:
+            pass
+
+    def draw_mod_costs(self, game):
+        """Overlay de desenvolvimento com o custo por frame de cada MOD."""
+        try:
+            if game.env_config.get("environment") != "development":
+                return
+            stats = game._mod_loader.get_stats()
+        except Exception:
+            return
+        y = 10
+        for name, last_ms, avg_ms, peak_ms, disabled in stats:
+            if disabled:
+                line, color = f"MOD {name}: desativado", RED
+            else:
+                line = f"MOD {name}: {avg_ms:.2f} ms (pico {peak_ms:.2f})"
+                over = avg_ms > game._mod_loader.frame_budget_ms
+                color = YELLOW if over else LIGHT_GRAY
+            # Valores mudam a cada frame: não passar pelo cache de texto
+            text = game.menu_small_font.render(line, True, color)
+            game.screen.blit(text, (WIDTH - text.get_width() - 10, y))
+            y += text.get_height() + 2
+
+    def _credits_line_surface(self, game, line):
+        """Superfície de uma linha dos créditos finais (None para linha vazia)."""
+        if line == "JUMP & HIT":
+            return self._render(self._font(96), line, True, YELLOW)
+        if line.startswith("═══"):
+            return self._render(game.font, line, True, DARK_GRAY)
+        if line.startswith("https://"):
+            return self._render(game.font, line, True, LIGHT_BLUE)
+        if line in [
+            "DESENVOLVIDO POR",
+            "EM PARCERIA COM",
+            "PROGRAMAÇÃO E DESIGN",
+            "ARTE E GRÁFICOS",
+            "ÁUDIO E MÚSICA",
+            "NÍVEIS E GAMEPLAY",
+            "TECNOLOGIAS UTILIZADAS",
+            "AGRADECIMENTOS ESPECIAIS",
+            "MENSAGEM FINAL",
+        ]:
+            return self._render(self._font(48), line, True, CYAN)
+        if line in ["CirrasTec", "Cirras RetroGames", "Canal do Dudu"]:
+            return self._render(game.font, line, True, YELLOW)
+        if line == "© 2025 CirrasTec" or line == "Todos os direitos reservados":
+            return self._render(game.font, line, True, LIGHT_GRAY)
+        if line == "Obrigado por jogar!":
+            return self._render(self._font(56), line, True, YELLOW)
+        if line != "":
+            return self._render(game.font, line, True, WHITE)
+        return None
+
+    def _get_credits_surface(self, game):
+        """Créditos finais diagramados uma única vez numa superfície alta.
+
+        Retorna (superfície, margem): o centro da linha ``i`` fica em
+        ``margem + i * CREDITS_LINE_HEIGHT``. A margem acomoda metade da
+        linha mais alta, que de outra forma seria cortada no topo.
+        """
+        if self._credits_surface is not None:
+            return self._credits_surface
+        try:
+            rendered = [self._credits_line_surface(game, line) for line in ENDING_CREDITS]
+            texts = [t for t in rendered if t is not None]
+            width = max([t.get_width() for t in texts] + [1])
+            pad = max([t.get_height() for t in texts] + [0]) // 2 + 1
+            height = pad * 2 + len(ENDING_CREDITS) * CREDITS_LINE_HEIGHT
+            surface = pygame.Surface((width, height))
+            surface.fill(BLACK)
+            for i, text in enumerate(rendered):
+                if text is None:
+                    continue
+                rect = text.get_rect(center=(width // 2, pad + i * CREDITS_LINE_HEIGHT))
+                surface.blit(text, rect)
+            try:
+                surface = surface.convert()
+            except Exception:
+                pass
+            self._credits_surface = (surface, pad)
+        except Exception:
+            # Sem superfície (fontes/superfícies não reais): desenho linha a linha
+            self._credits_surface = (None, 0)
+        return self._credits_surface
+
+    @staticmethod
+    def _blit_window(screen, surface, top):
+        """Blita só a janela visível de ``surface`` (centralizada) com topo em ``top``."""
+        src_y = max(0, -top)
+        visible = min(surface.get_height() - src_y, HEIGHT - max(0, top))
+        if visible <= 0:
+            return
+        dest_x = (WIDTH - surface.get_width()) // 2
+        screen.blit(
+            surface,
+            (dest_x, max(0, top)),
+            pygame.Rect(0, src_y, surface.get_width(), visible),
+        )
+
+    def _draw_layer(self, game, entities, min_x, max_x, *draw_args, overlay=None):
+        """Desenha uma camada de entidades homogêneas visíveis em lote.
+
+        Entidades cujo ``sprite_image()`` devolve uma superfície vão para a
+        fila (um blit em (x - câmera, y)); as demais usam o ``draw`` completo,
+        com a fila descarregada antes para preservar a ordem. Com ``overlay``
+        (camada de partículas), o ``glow_particle()`` das entidades em lote
+        é emitido nela e desenhado por cima da camada.
+        """
+        screen = game.screen
+        camera_x = game.camera_x
+        queue = self._render_queue
+        for obj in entities:
+            screen_x = obj.x - camera_x
+            # Só desenhar se visível
+            if not (min_x < screen_x < max_x):
+                continue
+            # ``draw`` sobrescrito na instância (ex.: por MODs) tem prioridade
+            get_sprite = getattr(obj, "sprite_image", None)
+            if get_sprite is None or "draw" in getattr(obj, "__dict__", ()):
+                image = None
+            else:
+                image = get_sprite()
+            if image is not None:
+                queue.submit(image, (screen_x, obj.y))
+                get_glow = getattr(obj, "glow_particle", None) if overlay is not None else None
+                if get_glow is not None:
+                    particle = get_glow()
+                    if particle is not None:
+                        surface, dx, dy = particle
+                        overlay.emit(surface, int(screen_x + dx), int(obj.y + dy))
+                continue
+            queue.flush(screen)
+            original_x = obj.x
+            obj.x = screen_x
+            obj.draw(screen, *draw_args)
+            obj.x = original_x
+        queue.flush(screen)
+        if overlay is not None:
+            overlay.flush(screen)
+
+    def _draw_particles(self, game, entities, min_x, max_x, layer_name):
+        """Desenha efeitos visíveis (``sprite_image``) em uma camada de partículas.
+
+        Efeitos sem ``sprite_image`` ou com ``draw`` próprio na instância são
+        desenhados individualmente, com a camada descarregada antes.
+        """
+        screen = game.screen
+        camera_x = game.camera_x
+        layer = self._particles.layer(layer_name)
+        for obj in entities:
+            screen_x = obj.x - camera_x
+            if not (min_x < screen_x < max_x):
+                continue
+            get_sprite = getattr(obj, "sprite_image", None)
+            if get_sprite is not None and "draw" not in getattr(obj, "__dict__", ()):
+                image = get_sprite()
+                if image is not None:
+                    layer.emit(image, screen_x, obj.y)
+                continue
+            layer.flush(screen)
+            original_x = obj.x
+            obj.x = screen_x
+            obj.draw(screen)
+            obj.x = original_x
+        layer.flush(screen)
+
+    def _query_index(self, name, items, left, right):
+        """Objetos de ``items`` nos baldes que cobrem [left, right] do mundo.
+
+        O índice é reconstruído só quando a lista é trocada ou muda de
+        tamanho (novo nível, inimigo removido). Inimigos morrendo se movem
+        livremente, então são re-registrados na posição atual ao serem vistos.
+        """
+        cached = self._spatial_indexes.get(name)
+        if cached is None or cached[0] is not items or cached[1] != len(items):
+            index = ChunkIndex()
+            for obj in items:
+                obj_left, obj_right = _world_extent(obj)
+                index.insert(obj, obj_left, obj_right)
+            cached = (items, len(items), index)
+            self._spatial_indexes[name] = cached
+        index = cached[2]
+        result = index.query(left, right)
+        for obj in result:
+            if getattr(obj, "is_dead", False):
+                x = obj.x
+                index.update(obj, x, x + getattr(obj, "width", 0))
+        return result
 
     def get_button_names(self, game, button_a=0, button_b=1):
         """Retorna os nomes dos botões baseado no modelo do joystick conectado."""
@@ -120,1703 +521,1519 @@ class Draw:
 
     def draw(self):
         game = self.game
+        self._call_mod_hook(game, "pre_draw")
 
-        if game.state == GameState.SPLASH:
-            # Tela de splash com fundo preto
-            game.screen.fill(BLACK)
-
-            # Mostrar logo atual com efeito de fade
-            if game.logos and game.current_logo_index < len(game.logos):
-                logo = game.logos[game.current_logo_index]
+        self._states.dispatch(game.state)
 
-                # Calcular posição no ciclo do logo atual
-                logo_cycle_time = game.splash_timer % game.logo_display_time
-                alpha = 255  # Opacidade padrão
-
-                # Fade in (primeiros frames)
-                if logo_cycle_time < game.fade_in_duration:
-                    alpha = int(
-                        (logo_cycle_time / game.fade_in_duration) * 255
-                    )
-                # Fade out (últimos frames)
-                elif logo_cycle_time > (
-                    game.logo_display_time - game.fade_out_duration
-                ):
-                    fade_progress = (
-                        logo_cycle_time
-                        - (game.logo_display_time - game.fade_out_duration)
-                    ) / game.fade_out_duration
-                    alpha = int((1 - fade_progress) * 255)
-
-                # Aplicar alpha ao logo
-                if alpha < 255:
-                    logo_with_alpha = logo.copy()
-                    logo_with_alpha.set_alpha(alpha)
-                    logo_rect = logo_with_alpha.get_rect(
-                        center=(WIDTH // 2, HEIGHT // 2)
-                    )
-                    game.screen.blit(logo_with_alpha, logo_rect)
-                else:
-                    logo_rect = logo.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-                    game.screen.blit(logo, logo_rect)
-
-            # Texto de instrução com fade suave (só em modo development)
-            if (
-                game.env_config.get("environment", "production")
-                == "development"
-            ):
-                # Fade in gradual
-                instruction_alpha = min(255, game.splash_timer * 3)
-                instruction_text = game.font.render(
-                    "Pressione qualquer tecla para continuar", True, WHITE
-                )
-                if instruction_alpha < 255:
-                    instruction_text.set_alpha(instruction_alpha)
-                instruction_rect = instruction_text.get_rect(
-                    center=(WIDTH // 2, HEIGHT - 80)
-                )
-                game.screen.blit(instruction_text, instruction_rect)
-
-        elif game.state == GameState.TITLE_SCREEN:
-            TitleScreen.show(game)
+        # Overlay de esmaecimento durante hold (fade progressivo)
+        if getattr(game, "hold_active", False):
+            try:
+                overlay = pygame.Surface((WIDTH, HEIGHT))
+                overlay.fill(BLACK)
+                total = max(1, getattr(game, "hold_total_frames", 1))
+                elapsed = total - max(0, game.hold_frames_left)
+                progress = min(1.0, max(0.0, elapsed / float(total)))
+                target_alpha = 0.6 if game.hold_type == "level_end" else 0.4
+                overlay.set_alpha(int(255 * target_alpha * progress))
+                game.screen.blit(overlay, (0, 0))
+            except Exception:
+                pass
 
-        elif game.state == GameState.OPENING_VIDEO:
-            # Limpar a tela com fundo preto para evitar sobreposição
-            game.screen.fill(BLACK)
-            # Desenhar o vídeo de abertura
-            game.video_player.draw(game.screen)
+        self._call_mod_hook(game, "post_draw")
+        self.draw_mod_costs(game)
+        Screen.present(game)
 
-        elif game.state == GameState.ENDING_VIDEO:
-            # Limpar a tela com fundo preto para evitar sobreposição
-            game.screen.fill(BLACK)
-            # Desenhar o vídeo de ending
-            game.ending_video_player.draw(game.screen)
+    def _draw_splash(self):
+        game = self.game
+        # Tela de splash com fundo preto
+        game.screen.fill(BLACK)
 
-        elif game.state == GameState.MAIN_MENU:
-            # Tela de menu com fundo do jogo
-            self.draw_ocean_background(game.screen)
+        # Mostrar logo atual com efeito de fade
+        if game.logos and game.current_logo_index < len(game.logos):
+            logo = game.logos[game.current_logo_index]
 
-            # Logo do jogo (aumentado)
-            if game.game_logo:
-                # Aumentar o tamanho do logo em 50%
-                logo_scaled = pygame.transform.scale(
-                    game.game_logo,
-                    (
-                        int(game.game_logo.get_width() * 1.5),
-                        int(game.game_logo.get_height() * 1.5),
-                    ),
-                )
-                logo_rect = logo_scaled.get_rect(center=(WIDTH // 2, 120))
-                game.screen.blit(logo_scaled, logo_rect)
+            # Calcular posição no ciclo do logo atual
+            logo_cycle_time = game.splash_timer % game.logo_display_time
+            alpha = 255  # Opacidade padrão
 
-            # Título do jogo se não houver logo
-            else:
-                title_text = game.menu_big_font.render(
-                    "Jump & Hit",
-                    True,
-                    WHITE,
+            # Fade in (primeiros frames)
+            if logo_cycle_time < game.fade_in_duration:
+                alpha = int(
+                    (logo_cycle_time / game.fade_in_duration) * 255
                 )
-                title_rect = title_text.get_rect(center=(WIDTH // 2, 150))
-                game.screen.blit(title_text, title_rect)
-
-            # Opções do menu
-            menu_start_y = 300
-            for i, option in enumerate(game.menu_options):
-                color = YELLOW if i == game.menu_selected else WHITE
-                option_text = game.menu_font.render(option, True, color)
-                option_rect = option_text.get_rect(
-                    center=(WIDTH // 2, menu_start_y + i * 60)
+            # Fade out (últimos frames)
+            elif logo_cycle_time > (
+                game.logo_display_time - game.fade_out_duration
+            ):
+                fade_progress = (
+                    logo_cycle_time
+                    - (game.logo_display_time - game.fade_out_duration)
+                ) / game.fade_out_duration
+                alpha = int((1 - fade_progress) * 255)
+
+            # Aplicar alpha ao logo
+            if alpha < 255:
+                logo_with_alpha = logo.copy()
+                logo_with_alpha.set_alpha(alpha)
+                logo_rect = logo_with_alpha.get_rect(
+                    center=(WIDTH // 2, HEIGHT // 2)
                 )
+                game.screen.blit(logo_with_alpha, logo_rect)
+            else:
+                logo_rect = logo.get_rect(center=(WIDTH // 2, HEIGHT // 2))
+                game.screen.blit(logo, logo_rect)
+
+        # Texto de instrução com fade suave (só em modo development)
+        if (
+            game.env_config.get("environment", "production")
+            == "development"
+        ):
+            # Fade in gradual
+            instruction_alpha = min(255, game.splash_timer * 3)
+            instruction_text = game.font.render(
+                "Pressione qualquer tecla para continuar", True, WHITE
+            )
+            if instruction_alpha < 255:
+                instruction_text.set_alpha(instruction_alpha)
+            instruction_rect = instruction_text.get_rect(
+                center=(WIDTH // 2, HEIGHT - 80)
+            )
+            game.screen.blit(instruction_text, instruction_rect)
 
-                # Destacar opção selecionada com retângulo
-                if i == game.menu_selected:
-                    pygame.draw.rect(
-                        game.screen, DARK_BLUE, option_rect.inflate(20, 10)
-                    )
+    def _draw_title_screen(self):
+        game = self.game
+        TitleScreen.show(game)
 
-                game.screen.blit(option_text, option_rect)
+    def _draw_opening_video(self):
+        game = self.game
+        # Limpar a tela com fundo preto para evitar sobreposição
+        game.screen.fill(BLACK)
+        # Desenhar o vídeo de abertura
+        game.video_player.draw(game.screen)
 
-            # Rodapé com direitos autorais
-            footer_text = (
-                "Desenvolvido por CirrasTec, Cirras RetroGames e "
-                "Canal do Dudu. Todos os direitos reservados."
+    def _draw_ending_video(self):
+        game = self.game
+        # Limpar a tela com fundo preto para evitar sobreposição
+        game.screen.fill(BLACK)
+        # Desenhar o vídeo de ending
+        game.ending_video_player.draw(game.screen)
+
+    def _draw_main_menu(self):
+        game = self.game
+        # Tela de menu com fundo do jogo
+        self.draw_ocean_background(game.screen)
+
+        # Logo do jogo (aumentado)
+        if game.game_logo:
+            # Aumentar o tamanho do logo em 50%
+            logo_scaled = pygame.transform.scale(
+                game.game_logo,
+                (
+                    int(game.game_logo.get_width() * 1.5),
+                    int(game.game_logo.get_height() * 1.5),
+                ),
             )
-            footer_surface = game.menu_small_font.render(
-                footer_text,
+            logo_rect = logo_scaled.get_rect(center=(WIDTH // 2, 120))
+            game.screen.blit(logo_scaled, logo_rect)
+
+        # Título do jogo se não houver logo
+        else:
+            title_text = self._render(
+                game.menu_big_font,
+                "Jump & Hit",
                 True,
-                LIGHT_GRAY,
+                WHITE,
             )
-            footer_rect = footer_surface.get_rect(
-                center=(WIDTH // 2, HEIGHT - 30)
+            title_rect = title_text.get_rect(center=(WIDTH // 2, 150))
+            game.screen.blit(title_text, title_rect)
+
+        # Opções do menu
+        menu_start_y = 300
+        for i, option in enumerate(game.menu_options):
+            color = YELLOW if i == game.menu_selected else WHITE
+            option_text = self._render(game.menu_font, option, True, color)
+            option_rect = option_text.get_rect(
+                center=(WIDTH // 2, menu_start_y + i * 60)
             )
-            game.screen.blit(footer_surface, footer_rect)
 
-        elif game.state == GameState.SELECT_DIFFICULTY:
-            # Tela de seleção de dificuldade com o mesmo estilo do menu
-            self.draw_ocean_background(game.screen)
+            # Destacar opção selecionada com retângulo
+            if i == game.menu_selected:
+                pygame.draw.rect(
+                    game.screen, DARK_BLUE, option_rect.inflate(20, 10)
+                )
 
-            # Título da tela
-            title_text = game.menu_big_font.render(
-                "Selecione a Dificuldade",
+            game.screen.blit(option_text, option_rect)
+
+        # Rodapé com direitos autorais
+        footer_text = (
+            "Desenvolvido por CirrasTec, Cirras RetroGames e "
+            "Canal do Dudu. Todos os direitos reservados."
+        )
+        footer_surface = self._render(
+            game.menu_small_font,
+            footer_text,
+            True,
+            LIGHT_GRAY,
+        )
+        footer_rect = footer_surface.get_rect(
+            center=(WIDTH // 2, HEIGHT - 30)
+        )
+        game.screen.blit(footer_surface, footer_rect)
+
+    def _draw_select_difficulty(self):
+        game = self.game
+        # Tela de seleção de dificuldade com o mesmo estilo do menu
+        self.draw_ocean_background(game.screen)
+
+        # Título da tela
+        title_text = self._render(
+            game.menu_big_font,
+            "Selecione a Dificuldade",
+            True,
+            YELLOW,
+        )
+        title_rect = title_text.get_rect(center=(WIDTH // 2, 140))
+        game.screen.blit(title_text, title_rect)
+
+        # Opções de dificuldade
+        start_y = 280
+        for i, option in enumerate(game.difficulty_options):
+            color = YELLOW if i == game.difficulty_selected else WHITE
+            option_text = self._render(
+                game.menu_font,
+                option,
                 True,
-                YELLOW,
+                color,
+            )
+            option_rect = option_text.get_rect(
+                center=(WIDTH // 2, start_y + i * 60)
             )
-            title_rect = title_text.get_rect(center=(WIDTH // 2, 140))
-            game.screen.blit(title_text, title_rect)
 
-            # Opções de dificuldade
-            start_y = 280
-            for i, option in enumerate(game.difficulty_options):
-                color = YELLOW if i == game.difficulty_selected else WHITE
-                option_text = game.menu_font.render(
-                    option,
-                    True,
-                    color,
-                )
-                option_rect = option_text.get_rect(
-                    center=(WIDTH // 2, start_y + i * 60)
+            if i == game.difficulty_selected:
+                pygame.draw.rect(
+                    game.screen, DARK_BLUE, option_rect.inflate(20, 10)
                 )
 
-                if i == game.difficulty_selected:
-                    pygame.draw.rect(
-                        game.screen, DARK_BLUE, option_rect.inflate(20, 10)
-                    )
+            game.screen.blit(option_text, option_rect)
 
-                game.screen.blit(option_text, option_rect)
+        # Instruções de controle
+        button_names = self.get_button_names(game)
+        if button_names:
+            btn_a, btn_b = button_names
+            instructions = [
+                f"↑↓ ou D-pad: escolher",
+                f"[{btn_a}] confirmar  [{btn_b}] voltar",
+            ]
+        else:
+            instructions = [
+                "↑↓ para escolher",
+                "Enter: confirmar  ESC: voltar",
+            ]
+        for j, line in enumerate(instructions):
+            inst_text = self._render(game.menu_small_font, line, True, LIGHT_GRAY)
+            inst_rect = inst_text.get_rect(
+                center=(WIDTH // 2, HEIGHT - 100 + j * 30)
+            )
+            game.screen.blit(inst_text, inst_rect)
 
-            # Instruções de controle
-            button_names = self.get_button_names(game)
-            if button_names:
-                btn_a, btn_b = button_names
-                instructions = [
-                    f"↑↓ ou D-pad: escolher",
-                    f"[{btn_a}] confirmar  [{btn_b}] voltar",
-                ]
-            else:
-                instructions = [
-                    "↑↓ para escolher",
-                    "Enter: confirmar  ESC: voltar",
-                ]
-            for j, line in enumerate(instructions):
-                inst_text = game.menu_small_font.render(line, True, LIGHT_GRAY)
-                inst_rect = inst_text.get_rect(
-                    center=(WIDTH // 2, HEIGHT - 100 + j * 30)
+    def _draw_playing(self):
+        game = self.game
+        self.draw_ocean_background(game.screen)
+
+        camera_x = game.camera_x
+        # Desenhar plataformas com offset da câmera (só colunas visíveis)
+        for platform in self._query_index(
+            "platforms", game.platforms, camera_x, camera_x + WIDTH
+        ):
+            screen_x = platform.rect.x - camera_x
+            # Só desenhar se visível
+            if screen_x + platform.rect.width > 0 and screen_x < WIDTH:
+                # Salvar posição original da plataforma
+                original_x = platform.x
+                # Ajustar posição para câmera
+                platform.x = screen_x
+                # Usar método draw da plataforma
+                platform.draw(game.screen)
+                # Restaurar posição original
+                platform.x = original_x
+
+        # Desenhar bandeira com offset da câmera
+        if game.flag:  # Verificar se a bandeira existe
+            flag_x = game.flag.x - game.camera_x
+            # Só desenhar se visível
+            if flag_x > -50 and flag_x < WIDTH:
+                # Salvar posição original da bandeira
+                original_x = game.flag.x
+                # Ajustar posição para câmera
+                game.flag.x = flag_x
+                # Desenhar usando o método da classe Flag
+                game.flag.draw(game.screen)
+                # Restaurar posição original
+                game.flag.x = original_x
+
+        # Desenhar spaceship com offset da câmera (fase 50)
+        if game.spaceship:  # Verificar se a spaceship existe
+            spaceship_x = game.spaceship.x - game.camera_x
+            # Só desenhar se visível
+            if spaceship_x > -150 and spaceship_x < WIDTH:
+                # Salvar posição original da spaceship
+                original_spaceship_x = game.spaceship.x
+                original_spaceship_y = game.spaceship.y
+                # Ajustar posição para câmera com update_position
+                game.spaceship.update_position(
+                    spaceship_x,
+                    game.spaceship.y,
+                )
+                # Desenhar usando o método da classe Spaceship
+                game.spaceship.draw(game.screen)
+                # Restaurar posição original usando update_position
+                game.spaceship.update_position(
+                    original_spaceship_x, original_spaceship_y
                 )
-                game.screen.blit(inst_text, inst_rect)
-
-        elif game.state == GameState.PLAYING:
-            self.draw_ocean_background(game.screen)
 
-            # Desenhar plataformas com offset da câmera
-            for platform in game.platforms:
-                adjusted_rect = pygame.Rect(
-                    platform.rect.x - game.camera_x,
-                    platform.rect.y,
-                    platform.rect.width,
-                    platform.rect.height,
+        # Desenhar pássaros, morcegos e estrelas (1–20)
+        if game.current_level <= 20:
+            # Pássaros (1–16)
+            self._draw_layer(game, game.birds, -50, WIDTH)
+            # Gotas de chuva (7–10)
+            if (
+                7 <= game.current_level <= 10
+                and hasattr(game, "raindrops")
+            ):
+                self._draw_layer(
+                    game, game.raindrops, -30, WIDTH + 30, game.camera_x
+                )
+            # Morcegos e estrelas (17–20)
+            if game.current_level >= 17:
+                # Morcegos
+                self._draw_layer(game, game.bats, -50, WIDTH)
+                # Estrelas cadentes
+                if hasattr(game, "shooting_stars"):
+                    self._draw_layer(game, game.shooting_stars, -60, WIDTH + 20)
+        elif game.current_level <= 30:
+            self._draw_layer(game, game.bats, -50, WIDTH)
+            if 27 <= game.current_level <= 30:
+                self._draw_layer(
+                    game,
+                    getattr(game, "lava_drops", []),
+                    -30,
+                    WIDTH + 30,
+                    game.camera_x,
                 )
+            # Shooting stars (21-30)
+            if hasattr(game, "shooting_stars"):
+                self._draw_layer(game, game.shooting_stars, -60, WIDTH + 20)
+        elif game.current_level <= 40:
+            for airplane in game.airplanes:
+                airplane_x = airplane.x - game.camera_x
                 # Só desenhar se visível
                 if (
-                    adjusted_rect.right > 0 and adjusted_rect.left < WIDTH
+                    airplane_x > -60 and airplane_x < WIDTH
                 ):
-                    # Salvar posição original da plataforma
-                    original_x = platform.x
+                    # Salvar posição original do avião
+                    original_airplane_x = airplane.x
                     # Ajustar posição para câmera
-                    platform.x = adjusted_rect.x
-                # Usar método draw da plataforma
-                    platform.draw(game.screen)
+                    airplane.x = airplane_x
+                    # Chamar método draw do avião
+                    airplane.draw(game.screen)
                     # Restaurar posição original
-                    platform.x = original_x
-
-            # Desenhar bandeira com offset da câmera
-            if game.flag:  # Verificar se a bandeira existe
-                flag_x = game.flag.x - game.camera_x
+                    airplane.x = original_airplane_x
+            # Geradores e raios (37-40)
+            if 37 <= game.current_level <= 40:
+                for gen in getattr(game, 'generators', []):
+                    gen.draw(game.screen, game.camera_x)
+                for beam in getattr(game, 'lightnings', []):
+                    beam.draw(game.screen, game.camera_x)
+        else:
+            for disk in game.flying_disks:
+                disk_x = disk.x - game.camera_x
                 # Só desenhar se visível
-                if flag_x > -50 and flag_x < WIDTH:
-                    # Salvar posição original da bandeira
-                    original_x = game.flag.x
+                if disk_x > -60 and disk_x < WIDTH:
+                    # Salvar posição original do disco
+                    original_disk_x = disk.x
                     # Ajustar posição para câmera
-                    game.flag.x = flag_x
-                    # Desenhar usando o método da classe Flag
-                    game.flag.draw(game.screen)
+                    disk.x = disk_x
+                    # Chamar método draw do disco
+                    disk.draw(game.screen)
                     # Restaurar posição original
-                    game.flag.x = original_x
+                    disk.x = original_disk_x
 
-            # Desenhar spaceship com offset da câmera (fase 50)
-            if game.spaceship:  # Verificar se a spaceship existe
-                spaceship_x = game.spaceship.x - game.camera_x
-                # Só desenhar se visível
-                if spaceship_x > -150 and spaceship_x < WIDTH:
-                    # Salvar posição original da spaceship
-                    original_spaceship_x = game.spaceship.x
-                    original_spaceship_y = game.spaceship.y
-                    # Ajustar posição para câmera com update_position
-                    game.spaceship.update_position(
-                        spaceship_x,
-                        game.spaceship.y,
-                    )
-                    # Desenhar usando o método da classe Spaceship
-                    game.spaceship.draw(game.screen)
-                    # Restaurar posição original usando update_position
-                    game.spaceship.update_position(
-                        original_spaceship_x, original_spaceship_y
-                    )
+            if 47 <= game.current_level <= 50:
+                self._draw_layer(
+                    game, getattr(game, "meteors", []), -60, WIDTH + 20
+                )
 
-            # Desenhar pássaros, morcegos e estrelas (1–20)
-            if game.current_level <= 20:
-                # Pássaros (1–16)
-                for bird in game.birds:
-                    bird_x = bird.x - game.camera_x
-                    # Só desenhar se visível
-                    if bird_x > -50 and bird_x < WIDTH:
-                        original_bird_x = bird.x
-                        bird.x = bird_x
-                        bird.draw(game.screen)
-                        bird.x = original_bird_x
-                # Gotas de chuva (7–10)
-                if (
-                    7 <= game.current_level <= 10
-                    and hasattr(game, "raindrops")
-                ):
-                    for drop in game.raindrops:
-                        drop_x = drop.x - game.camera_x
-                        # Só desenhar se visível
-                        if drop_x > -30 and drop_x < WIDTH + 30:
-                            original_drop_x = drop.x
-                            drop.x = drop_x
-                            drop.draw(game.screen, game.camera_x)
-                            drop.x = original_drop_x
-                # Morcegos e estrelas (17–20)
-                if game.current_level >= 17:
-                    # Morcegos
-                    for bat in game.bats:
-                        bat_x = bat.x - game.camera_x
-                        # Só desenhar se visível
-                        if bat_x > -50 and bat_x < WIDTH:
-                            original_bat_x = bat.x
-                            bat.x = bat_x
-                            bat.draw(game.screen)
-                            bat.x = original_bat_x
-                    # Estrelas cadentes
-                    if hasattr(game, "shooting_stars"):
-                        for star in game.shooting_stars:
-                            star_x = star.x - game.camera_x
-                            # Só desenhar se visível
-                            if star_x > -60 and star_x < WIDTH + 20:
-                                original_star_x = star.x
-                                star.x = star_x
-                                star.draw(game.screen)
-                                star.x = original_star_x
-            elif game.current_level <= 30:
-                for bat in game.bats:
-                    bat_x = bat.x - game.camera_x
-                    # Só desenhar se visível
-                    if bat_x > -50 and bat_x < WIDTH:
-                        # Salvar posição original do morcego
-                        original_bat_x = bat.x
-                        # Ajustar posição para câmera
-                        bat.x = bat_x
-                        # Chamar método draw do morcego
-                        bat.draw(game.screen)
-                        # Restaurar posição original
-                        bat.x = original_bat_x
-                if 27 <= game.current_level <= 30:
-                    for drop in getattr(game, "lava_drops", []):
-                        drop_x = drop.x - game.camera_x
-                        # Só desenhar se visível
-                        if drop_x > -30 and drop_x < WIDTH + 30:
-                            original_drop_x = drop.x
-                            drop.x = drop_x
-                            drop.draw(game.screen, game.camera_x)
-                            drop.x = original_drop_x
-                # Shooting stars (21-30)
-                if hasattr(game, "shooting_stars"):
-                    for star in game.shooting_stars:
-                        star_x = star.x - game.camera_x
-                        # Só desenhar se visível
-                        if star_x > -60 and star_x < WIDTH + 20:
-                            original_star_x = star.x
-                            star.x = star_x
-                            star.draw(game.screen)
-                            star.x = original_star_x
-            elif game.current_level <= 40:
-                for airplane in game.airplanes:
-                    airplane_x = airplane.x - game.camera_x
-                    # Só desenhar se visível
-                    if (
-                        airplane_x > -60 and airplane_x < WIDTH
-                    ):
-                        # Salvar posição original do avião
-                        original_airplane_x = airplane.x
-                        # Ajustar posição para câmera
-                        airplane.x = airplane_x
-                        # Chamar método draw do avião
-                        airplane.draw(game.screen)
-                        # Restaurar posição original
-                        airplane.x = original_airplane_x
-                # Geradores e raios (37-40)
-                if 37 <= game.current_level <= 40:
-                    for gen in getattr(game, 'generators', []):
-                        gen.draw(game.screen, game.camera_x)
-                    for beam in getattr(game, 'lightnings', []):
-                        beam.draw(game.screen, game.camera_x)
-            else:
-                for disk in game.flying_disks:
-                    disk_x = disk.x - game.camera_x
-                    # Só desenhar se visível
-                    if disk_x > -60 and disk_x < WIDTH:
-                        # Salvar posição original do disco
-                        original_disk_x = disk.x
-                        # Ajustar posição para câmera
-                        disk.x = disk_x
-                        # Chamar método draw do disco
-                        disk.draw(game.screen)
-                        # Restaurar posição original
-                        disk.x = original_disk_x
-
-                if 47 <= game.current_level <= 50:
-                    for met in getattr(game, "meteors", []):
-                        met_x = met.x - game.camera_x
-                        # Só desenhar se visível
-                        if met_x > -60 and met_x < WIDTH + 20:
-                            original_met_x = met.x
-                            met.x = met_x
-                            met.draw(game.screen)
-                            met.x = original_met_x
-
-            # Desenhar foguinhos com offset da câmera (nível 51)
-            if game.current_level == 51:
-                for fire in game.fires:
-                    fire_x = fire.x - game.camera_x
-                    # Só desenhar se visível
-                    if fire_x > -40 and fire_x < WIDTH:
-                        # Salvar posição original do foguinho
-                        original_fire_x = fire.x
-                        # Ajustar posição para câmera
-                        fire.x = fire_x
-                        # Chamar método draw do foguinho
-                        fire.draw(game.screen)
-                        # Restaurar posição original
-                        fire.x = original_fire_x
-
-            # Desenhar tartarugas e aranhas com offset da câmera
-            if game.current_level <= 20:
-                for turtle in game.turtles:
-                    turtle_x = turtle.x - game.camera_x
-                    # Só desenhar se visível
-                    if turtle_x > -50 and turtle_x < WIDTH:
-                        # Salvar posição original da tartaruga
-                        original_turtle_x = turtle.x
-                        # Ajustar posição para câmera
-                        turtle.x = turtle_x
-                        # Chamar método draw da tartaruga
-                        turtle.draw(game.screen)
-                        # Restaurar posição original
-                        turtle.x = original_turtle_x
-            else:
-                for spider in game.spiders:
-                    spider_x = spider.x - game.camera_x
-                    # Só desenhar se visível
-                    if spider_x > -50 and spider_x < WIDTH:
-                        # Salvar posição original da aranha
-                        original_spider_x = spider.x
-                        # Ajustar posição para câmera
-                        spider.x = spider_x
-                        # Chamar método draw da aranha
-                        spider.draw(game.screen)
-                        # Restaurar posição original
-                        spider.x = original_spider_x
-
-            # Desenhar robôs com offset da câmera (níveis 31-40)
-            if (
-                31 <= game.current_level <= 40
-                and not game.player.is_being_abducted
+        # Desenhar foguinhos com offset da câmera (nível 51)
+        if game.current_level == 51:
+            self._draw_layer(game, game.fires, -40, WIDTH)
+
+        # Desenhar tartarugas e aranhas com offset da câmera
+        if game.current_level <= 20:
+            for turtle in self._query_index(
+                "turtles", game.turtles, camera_x - 50, camera_x + WIDTH
             ):
-                for robot in game.robots:
-                    robot_x = robot.x - game.camera_x
-                    # Só desenhar se visível
-                    if robot_x > -50 and robot_x < WIDTH:
-                        # Salvar posição original do robô
-                        original_robot_x = robot.x
-                        # Ajustar posição para câmera
-                        robot.x = robot_x
-                        # Chamar draw do robô (também desenha mísseis)
-                        robot.draw(game.screen)
-                        # Restaurar posição original
-                        robot.x = original_robot_x
-
-                # Mísseis dos robôs com offset, mesmo se robô invisível
-                for robot in game.robots:
-                    for missile in robot.missiles:
-                        missile_x = missile.x - game.camera_x
-                        # Só visíveis
-                        if missile_x > -20 and missile_x < WIDTH + 20:
-                            original_missile_x = missile.x
-                            missile.x = missile_x
-                            missile.draw(game.screen)
-                            missile.x = original_missile_x
-
-                # Mísseis órfãos (robôs mortos) com offset da câmera
-                for missile in game.orphan_missiles:
+                turtle_x = turtle.x - game.camera_x
+                # Só desenhar se visível
+                if turtle_x > -50 and turtle_x < WIDTH:
+                    # Salvar posição original da tartaruga
+                    original_turtle_x = turtle.x
+                    # Ajustar posição para câmera
+                    turtle.x = turtle_x
+                    # Chamar método draw da tartaruga
+                    turtle.draw(game.screen)
+                    # Restaurar posição original
+                    turtle.x = original_turtle_x
+        else:
+            for spider in self._query_index(
+                "spiders", game.spiders, camera_x - 50, camera_x + WIDTH
+            ):
+                spider_x = spider.x - game.camera_x
+                # Só desenhar se visível
+                if spider_x > -50 and spider_x < WIDTH:
+                    # Salvar posição original da aranha
+                    original_spider_x = spider.x
+                    # Ajustar posição para câmera
+                    spider.x = spider_x
+                    # Chamar método draw da aranha
+                    spider.draw(game.screen)
+                    # Restaurar posição original
+                    spider.x = original_spider_x
+
+        # Desenhar robôs com offset da câmera (níveis 31-40)
+        if (
+            31 <= game.current_level <= 40
+            and not game.player.is_being_abducted
+        ):
+            for robot in self._query_index(
+                "robots", game.robots, camera_x - 50, camera_x + WIDTH
+            ):
+                robot_x = robot.x - game.camera_x
+                # Só desenhar se visível
+                if robot_x > -50 and robot_x < WIDTH:
+                    # Salvar posição original do robô
+                    original_robot_x = robot.x
+                    # Ajustar posição para câmera
+                    robot.x = robot_x
+                    # Chamar draw do robô (também desenha mísseis)
+                    robot.draw(game.screen)
+                    # Restaurar posição original
+                    robot.x = original_robot_x
+
+            # Mísseis dos robôs com offset, mesmo se robô invisível
+            for robot in game.robots:
+                for missile in robot.missiles:
                     missile_x = missile.x - game.camera_x
                     # Só visíveis
                     if missile_x > -20 and missile_x < WIDTH + 20:
-                        # Salvar posição original do míssil
                         original_missile_x = missile.x
-                        # Ajustar posição para câmera
                         missile.x = missile_x
-                        # Chamar método draw do míssil
                         missile.draw(game.screen)
-                        # Restaurar posição original
                         missile.x = original_missile_x
 
-            # Desenhar aliens com offset da câmera (níveis 41-50)
-            if (
-                41 <= game.current_level <= 50
-                and not game.player.is_being_abducted
+            # Mísseis órfãos (robôs mortos) com offset da câmera
+            for missile in game.orphan_missiles:
+                missile_x = missile.x - game.camera_x
+                # Só visíveis
+                if missile_x > -20 and missile_x < WIDTH + 20:
+                    # Salvar posição original do míssil
+                    original_missile_x = missile.x
+                    # Ajustar posição para câmera
+                    missile.x = missile_x
+                    # Chamar método draw do míssil
+                    missile.draw(game.screen)
+                    # Restaurar posição original
+                    missile.x = original_missile_x
+
+        # Desenhar aliens com offset da câmera (níveis 41-50)
+        if (
+            41 <= game.current_level <= 50
+            and not game.player.is_being_abducted
+        ):
+            for alien in self._query_index(
+                "aliens", game.aliens, camera_x - 50, camera_x + WIDTH
             ):
-                for alien in game.aliens:
-                    alien_x = alien.x - game.camera_x
-                    # Só desenhar se visível
-                    if alien_x > -50 and alien_x < WIDTH:
-                        # Salvar posição original do alien
-                        original_alien_x = alien.x
-                        # Ajustar posição para câmera
-                        alien.x = alien_x
-                        # Chamar método draw do alien
-                        alien.draw(game.screen)
-                        # Restaurar posição original
-                        alien.x = original_alien_x
-
-                # Lasers dos aliens com offset, mesmo se alien invisível
-                for alien in game.aliens:
-                    for laser in alien.lasers:
-                        laser_x = laser.x - game.camera_x
-                        # Só desenhar se visível
-                        if laser_x > -20 and laser_x < WIDTH + 20:
-                            original_laser_x = laser.x
-                            laser.x = laser_x
-                            laser.draw(game.screen)
-                            laser.x = original_laser_x
-
-                # Lasers órfãos (aliens mortos) com offset da câmera
-                for laser in game.orphan_lasers:
+                alien_x = alien.x - game.camera_x
+                # Só desenhar se visível
+                if alien_x > -50 and alien_x < WIDTH:
+                    # Salvar posição original do alien
+                    original_alien_x = alien.x
+                    # Ajustar posição para câmera
+                    alien.x = alien_x
+                    # Chamar método draw do alien
+                    alien.draw(game.screen)
+                    # Restaurar posição original
+                    alien.x = original_alien_x
+
+            # Lasers dos aliens com offset, mesmo se alien invisível
+            for alien in game.aliens:
+                for laser in alien.lasers:
                     laser_x = laser.x - game.camera_x
-                    # Só visíveis
+                    # Só desenhar se visível
                     if laser_x > -20 and laser_x < WIDTH + 20:
-                        # Salvar posição original do laser
                         original_laser_x = laser.x
-                        # Ajustar posição para câmera
                         laser.x = laser_x
-                        # Chamar método draw do laser
                         laser.draw(game.screen)
-                        # Restaurar posição original
                         laser.x = original_laser_x
 
-            # Desenhar boss alien com offset da câmera (nível 51)
-            if (
-                game.current_level == 51
-                and hasattr(game, "boss_alien")
-                and game.boss_alien
-                and not game.player.is_being_abducted
-            ):
-                boss_x = game.boss_alien.x - game.camera_x
-                # Só desenhar se visível
-                if boss_x > -100 and boss_x < WIDTH + 100:
-                    # Salvar posição original do boss
-                    original_boss_x = game.boss_alien.x
+            # Lasers órfãos (aliens mortos) com offset da câmera
+            for laser in game.orphan_lasers:
+                laser_x = laser.x - game.camera_x
+                # Só visíveis
+                if laser_x > -20 and laser_x < WIDTH + 20:
+                    # Salvar posição original do laser
+                    original_laser_x = laser.x
                     # Ajustar posição para câmera
-                    game.boss_alien.x = boss_x
-
-                    # Desenhar boss alien com efeito de piscada durante captura
-                    if game.boss_alien_captured and hasattr(
-                        game, "capture_flash_state"
-                    ):
-                        # Só desenhar se não estiver piscando (estado False)
-                        if not game.capture_flash_state:
-                            game.boss_alien.draw(game.screen)
-                    else:
-                        # Desenhar normalmente se não foi capturado
-                        game.boss_alien.draw(game.screen)
-
+                    laser.x = laser_x
+                    # Chamar método draw do laser
+                    laser.draw(game.screen)
                     # Restaurar posição original
-                    game.boss_alien.x = original_boss_x
-
-            # Desenhar explosões com offset da câmera
-            for explosion in game.explosions:
-                explosion_x = explosion.x - game.camera_x
-                # Só desenhar se visível
-                if explosion_x > -50 and explosion_x < WIDTH:
-                    # Salvar posição original da explosão
-                    original_explosion_x = explosion.x
-                    # Ajustar posição para câmera
-                    explosion.x = explosion_x
-                    # Chamar método draw da explosão
-                    explosion.draw(game.screen)
-                    # Restaurar posição original
-                    explosion.x = original_explosion_x
-
-            # Desenhar vidas extras com offset da câmera
-            if hasattr(game, "extra_lives") and game.extra_lives:
-                for extra_life in game.extra_lives:
-                    extra_life_x = extra_life.x - game.camera_x
-                    # Só visíveis
-                    if extra_life_x > -30 and extra_life_x < WIDTH + 30:
-                        # Desenhar vida extra com offset da câmera
-                        extra_life.draw(
-                            game.screen,
-                            game.camera_x,
-                        )
-
-            # Desenhar power-ups com offset da câmera
-            if hasattr(game, "powerups") and game.powerups:
-                for pu in game.powerups:
-                    pu_x = pu.x - game.camera_x
-                    # Só visíveis
-                    if pu_x > -30 and pu_x < WIDTH + 30:
-                        pu.draw(game.screen, game.camera_x)
-
-            # Desenhar tiros do jogador com offset da câmera
-            for bullet in game.player.bullets:
-                bullet_x = bullet.x - game.camera_x
-                # Só desenhar se visível
-                if bullet_x > -20 and bullet_x < WIDTH + 20:
-                    # Salvar posição original do tiro
-                    original_bullet_x = bullet.x
-                    # Ajustar posição para câmera
-                    bullet.x = bullet_x
-                    # Chamar método draw do tiro
-                    bullet.draw(game.screen)
-                    # Restaurar posição original
-                    bullet.x = original_bullet_x
-
-            # Desenhar jogador com offset da câmera
-            original_x = game.player.x  # Salvar posição original
-            # Ajustar posição para câmera
-            game.player.x = game.player.x - game.camera_x
-            game.player.draw(game.screen)  # Desenhar jogador
-            # Desenhar bolha do escudo sobre o jogador
-            if getattr(game, "shield_active", False) and getattr(
-                game,
-                "shield_bubble_img",
-                None,
-            ):
-                try:
-                    bubble_w = max(
-                        24,
-                        int(getattr(game.player, "width", 65) + 12),
-                    )
-                    bubble_h = max(
-                        24,
-                        int(getattr(game.player, "height", 95) + 12),
-                    )
-                    bubble_img = pygame.transform.smoothscale(
-                        game.shield_bubble_img,
-                        (bubble_w, bubble_h),
-                    )
-                except Exception:
-                    bubble_img = pygame.transform.scale(
-                        game.shield_bubble_img,
-                        (bubble_w, bubble_h),
+                    laser.x = original_laser_x
+
+        # Desenhar boss alien com offset da câmera (nível 51)
+        if (
+            game.current_level == 51
+            and hasattr(game, "boss_alien")
+            and game.boss_alien
+            and not game.player.is_being_abducted
+        ):
+            boss_x = game.boss_alien.x - game.camera_x
+            # Só desenhar se visível
+            if boss_x > -100 and boss_x < WIDTH + 100:
+                # Salvar posição original do boss
+                original_boss_x = game.boss_alien.x
+                # Ajustar posição para câmera
+                game.boss_alien.x = boss_x
+
+                # Desenhar boss alien com efeito de piscada durante captura
+                if game.boss_alien_captured and hasattr(
+                    game, "capture_flash_state"
+                ):
+                    # Só desenhar se não estiver piscando (estado False)
+                    if not game.capture_flash_state:
+                        game.boss_alien.draw(game.screen)
+                else:
+                    # Desenhar normalmente se não foi capturado
+                    game.boss_alien.draw(game.screen)
+
+                # Restaurar posição original
+                game.boss_alien.x = original_boss_x
+
+        # Desenhar explosões com offset da câmera (camada de partículas)
+        self._draw_particles(game, game.explosions, -50, WIDTH, "explosions")
+
+        # Desenhar vidas extras com offset da câmera
+        if hasattr(game, "extra_lives") and game.extra_lives:
+            for extra_life in game.extra_lives:
+                extra_life_x = extra_life.x - game.camera_x
+                # Só visíveis
+                if extra_life_x > -30 and extra_life_x < WIDTH + 30:
+                    # Desenhar vida extra com offset da câmera
+                    extra_life.draw(
+                        game.screen,
+                        game.camera_x,
                     )
-                bubble_x = int(
-                    game.player.x
-                    - (bubble_w - getattr(game.player, "width", 65)) // 2
+
+        # Desenhar power-ups com offset da câmera
+        if hasattr(game, "powerups") and game.powerups:
+            for pu in game.powerups:
+                pu_x = pu.x - game.camera_x
+                # Só visíveis
+                if pu_x > -30 and pu_x < WIDTH + 30:
+                    pu.draw(game.screen, game.camera_x)
+
+        # Desenhar tiros do jogador com offset da câmera
+        self._draw_layer(
+            game,
+            game.player.bullets,
+            -20,
+            WIDTH + 20,
+            overlay=self._particles.layer("glow"),
+        )
+
+        # Desenhar jogador com offset da câmera
+        original_x = game.player.x  # Salvar posição original
+        # Ajustar posição para câmera
+        game.player.x = game.player.x - game.camera_x
+        game.player.draw(game.screen)  # Desenhar jogador
+        # Desenhar bolha do escudo sobre o jogador
+        if getattr(game, "shield_active", False) and getattr(
+            game,
+            "shield_bubble_img",
+            None,
+        ):
+            try:
+                bubble_w = max(
+                    24,
+                    int(getattr(game.player, "width", 65) + 12),
                 )
-                bubble_y = int(
-                    game.player.y
-                    - (bubble_h - getattr(game.player, "height", 95)) // 2
+                bubble_h = max(
+                    24,
+                    int(getattr(game.player, "height", 95) + 12),
                 )
-                try:
-                    game.screen.blit(bubble_img, (bubble_x, bubble_y))
-                except Exception:
-                    pass
-            game.player.x = original_x  # Restaurar posição original
-
-            # Desenhar UI (sem offset da câmera) com fonte branca
-            Info.display(game, game.screen, game.font, WHITE)
-            
-            # Desenhar mensagens de cheat (após o HUD)
-            if game.cheat_message and game.cheat_message_timer > 0:
-                # Calcular alpha baseado no timer (fade out nos últimos frames)
-                alpha = 255
-                if game.cheat_message_timer < 60:  # Fade nos últimos 60 frames
-                    alpha = int((game.cheat_message_timer / 60) * 255)
-                
-                # Renderizar texto
-                cheat_text = game.menu_font.render(game.cheat_message, True, YELLOW)
-                cheat_text.set_alpha(alpha)
-                
-                # Posicionar no canto superior direito
-                text_rect = cheat_text.get_rect(
-                    topright=(game.cheat_message_x, game.cheat_message_y)
+                bubble_img = pygame.transform.smoothscale(
+                    game.shield_bubble_img,
+                    (bubble_w, bubble_h),
                 )
-                
-                # Fundo semi-transparente
-                padding = 10
-                bg_rect = text_rect.inflate(padding * 2, padding)
-                bg_surface = pygame.Surface((bg_rect.width, bg_rect.height))
-                bg_surface.set_alpha(int(alpha * 0.7))  # 70% da opacidade do texto
-                bg_surface.fill(DARK_BLUE)
-                game.screen.blit(bg_surface, bg_rect.topleft)
-                
-                # Texto
-                game.screen.blit(cheat_text, text_rect)
-
-        elif game.state == GameState.GAME_OVER:
-            # Usar fundo do cenário, explicitamente na surface do jogo
-            self.draw_ocean_background(Screen.get_game_surface(game))
-
-            # Usar o padrão de fontes do menu para manter consistência visual
-            game_over_text = game.menu_big_font.render("GAME OVER", True, RED)
-            score_text = game.menu_font.render(
-                f"Pontuação Final: {game.score}", True, WHITE
-            )
-
-            # Centralizar textos principais
-            game_over_rect = game_over_text.get_rect(
-                center=(WIDTH // 2, HEIGHT // 2 - 120)
+            except Exception:
+                bubble_img = pygame.transform.scale(
+                    game.shield_bubble_img,
+                    (bubble_w, bubble_h),
+                )
+            bubble_x = int(
+                game.player.x
+                - (bubble_w - getattr(game.player, "width", 65)) // 2
             )
-            score_rect = score_text.get_rect(
-                center=(WIDTH // 2, HEIGHT // 2 - 60)
+            bubble_y = int(
+                game.player.y
+                - (bubble_h - getattr(game.player, "height", 95)) // 2
             )
+            try:
+                game.screen.blit(bubble_img, (bubble_x, bubble_y))
+            except Exception:
+                pass
+        game.player.x = original_x  # Restaurar posição original
 
-            game.screen.blit(game_over_text, game_over_rect)
-            game.screen.blit(score_text, score_rect)
-
-            # Menu de opções
-            for i, option in enumerate(game.game_over_options):
-                color = YELLOW if i == game.game_over_selected else WHITE
-                option_text = game.menu_font.render(option, True, color)
-                option_rect = option_text.get_rect(
-                    center=(WIDTH // 2, HEIGHT // 2 + i * 40)
-                )
+        # Desenhar UI (sem offset da câmera) com fonte branca
+        Info.display(game, game.screen, game.font, WHITE)
 
-                if i == game.game_over_selected:
-                    pygame.draw.rect(
-                        game.screen, DARK_BLUE, option_rect.inflate(20, 10)
-                    )
+        # Desenhar mensagens de cheat (após o HUD)
+        if game.cheat_message and game.cheat_message_timer > 0:
+            # Calcular alpha baseado no timer (fade out nos últimos frames)
+            alpha = 255
+            if game.cheat_message_timer < 60:  # Fade nos últimos 60 frames
+                alpha = int((game.cheat_message_timer / 60) * 255)
 
-                game.screen.blit(option_text, option_rect)
+            # Renderizar texto
+            cheat_text = game.menu_font.render(game.cheat_message, True, YELLOW)
+            cheat_text.set_alpha(alpha)
 
-            button_names = self.get_button_names(game)
-            if button_names:
-                btn_a, btn_b = button_names
-                control_msg = f"↑↓ ou D-pad: navegar  [{btn_a}] selecionar"
-            else:
-                control_msg = "↑↓: navegar  Enter: selecionar"
-            control_text = game.menu_small_font.render(
-                control_msg,
-                True,
-                LIGHT_GRAY,
-            )
-            control_rect = control_text.get_rect(
-                center=(WIDTH // 2, HEIGHT // 2 + 120)
-            )
-            game.screen.blit(control_text, control_rect)
-
-        elif game.state == GameState.VICTORY:
-            # Desenhar troféu
-            trophy_x = WIDTH // 2
-            trophy_y = HEIGHT // 2 - 100
-            pygame.draw.rect(
-                game.screen,
-                BROWN,
-                (trophy_x - 40, trophy_y + 80, 80, 20),
-            )
-            pygame.draw.rect(
-                game.screen,
-                BROWN,
-                (trophy_x - 10, trophy_y + 60, 20, 40),
-            )
-            pygame.draw.ellipse(
-                game.screen,
-                YELLOW,
-                (trophy_x - 30, trophy_y, 60, 80),
-            )
-            pygame.draw.ellipse(
-                game.screen,
-                (255, 215, 0),
-                (trophy_x - 25, trophy_y + 5, 50, 70),
-            )
-            pygame.draw.arc(
-                game.screen,
-                YELLOW,
-                (trophy_x - 50, trophy_y + 20, 20, 40),
-                0,
-                math.pi,
-                5,
-            )
-            pygame.draw.arc(
-                game.screen,
-                YELLOW,
-                (trophy_x + 30, trophy_y + 20, 20, 40),
-                0,
-                math.pi,
-                5,
+            # Posicionar no canto superior direito
+            text_rect = cheat_text.get_rect(
+                topright=(game.cheat_message_x, game.cheat_message_y)
             )
 
-            victory_text = game.big_font.render("PARABÉNS!", True, GREEN)
-            complete_text = game.font.render(
-                "Você completou todos os níveis!", True, WHITE
-            )
-            final_score_text = game.font.render(
-                f"Pontuação Final: {game.score}", True, WHITE
-            )
-            restart_text = game.font.render(
-                "Pressione R para jogar novamente", True, WHITE
-            )
-            game.screen.blit(
-                victory_text,
-                (WIDTH // 2 - 150, HEIGHT // 2 + 120),
-            )
-            game.screen.blit(
-                complete_text,
-                (WIDTH // 2 - 200, HEIGHT // 2 + 170),
-            )
-            game.screen.blit(
-                final_score_text,
-                (WIDTH // 2 - 120, HEIGHT // 2 + 200),
-            )
-            game.screen.blit(
-                restart_text,
-                (WIDTH // 2 - 180, HEIGHT // 2 + 240),
-            )
+            # Fundo semi-transparente
+            padding = 10
+            bg_rect = text_rect.inflate(padding * 2, padding)
+            bg_surface = pygame.Surface((bg_rect.width, bg_rect.height))
+            bg_surface.set_alpha(int(alpha * 0.7))  # 70% da opacidade do texto
+            bg_surface.fill(DARK_BLUE)
+            game.screen.blit(bg_surface, bg_rect.topleft)
 
-        elif game.state == GameState.ENTER_NAME:
-            title_text = game.big_font.render("NOVO RECORDE!", True, YELLOW)
-            score_text = game.font.render(
-                f"Pontuação: {game.score}",
-                True,
-                WHITE,
+            # Texto
+            game.screen.blit(cheat_text, text_rect)
+
+    def _draw_game_over(self):
+        game = self.game
+        # Usar fundo do cenário, explicitamente na surface do jogo
+        self.draw_ocean_background(Screen.get_game_surface(game))
+
+        # Usar o padrão de fontes do menu para manter consistência visual
+        game_over_text = self._render(game.menu_big_font, "GAME OVER", True, RED)
+        score_text = self._render(
+            game.menu_font,
+            f"Pontuação Final: {game.score}", True, WHITE
+        )
+
+        # Centralizar textos principais
+        game_over_rect = game_over_text.get_rect(
+            center=(WIDTH // 2, HEIGHT // 2 - 120)
+        )
+        score_rect = score_text.get_rect(
+            center=(WIDTH // 2, HEIGHT // 2 - 60)
+        )
+
+        game.screen.blit(game_over_text, game_over_rect)
+        game.screen.blit(score_text, score_rect)
+
+        # Menu de opções
+        for i, option in enumerate(game.game_over_options):
+            color = YELLOW if i == game.game_over_selected else WHITE
+            option_text = self._render(game.menu_font, option, True, color)
+            option_rect = option_text.get_rect(
+                center=(WIDTH // 2, HEIGHT // 2 + i * 40)
             )
-            prompt_text = game.font.render(
-                "Digite seu nome (máximo 25 caracteres):", True, WHITE
+
+            if i == game.game_over_selected:
+                pygame.draw.rect(
+                    game.screen, DARK_BLUE, option_rect.inflate(20, 10)
+                )
+
+            game.screen.blit(option_text, option_rect)
+
+        button_names = self.get_button_names(game)
+        if button_names:
+            btn_a, btn_b = button_names
+            control_msg = f"↑↓ ou D-pad: navegar  [{btn_a}] selecionar"
+        else:
+            control_msg = "↑↓: navegar  Enter: selecionar"
+        control_text = self._render(
+            game.menu_small_font,
+            control_msg,
+            True,
+            LIGHT_GRAY,
+        )
+        control_rect = control_text.get_rect(
+            center=(WIDTH // 2, HEIGHT // 2 + 120)
+        )
+        game.screen.blit(control_text, control_rect)
+
+    def _draw_victory(self):
+        game = self.game
+        # Desenhar troféu
+        trophy_x = WIDTH // 2
+        trophy_y = HEIGHT // 2 - 100
+        pygame.draw.rect(
+            game.screen,
+            BROWN,
+            (trophy_x - 40, trophy_y + 80, 80, 20),
+        )
+        pygame.draw.rect(
+            game.screen,
+            BROWN,
+            (trophy_x - 10, trophy_y + 60, 20, 40),
+        )
+        pygame.draw.ellipse(
+            game.screen,
+            YELLOW,
+            (trophy_x - 30, trophy_y, 60, 80),
+        )
+        pygame.draw.ellipse(
+            game.screen,
+            (255, 215, 0),
+            (trophy_x - 25, trophy_y + 5, 50, 70),
+        )
+        pygame.draw.arc(
+            game.screen,
+            YELLOW,
+            (trophy_x - 50, trophy_y + 20, 20, 40),
+            0,
+            math.pi,
+            5,
+        )
+        pygame.draw.arc(
+            game.screen,
+            YELLOW,
+            (trophy_x + 30, trophy_y + 20, 20, 40),
+            0,
+            math.pi,
+            5,
+        )
+
+        victory_text = self._render(game.big_font, "PARABÉNS!", True, GREEN)
+        complete_text = self._render(
+            game.font,
+            "Você completou todos os níveis!", True, WHITE
+        )
+        final_score_text = self._render(
+            game.font,
+            f"Pontuação Final: {game.score}", True, WHITE
+        )
+        restart_text = self._render(
+            game.font,
+            "Pressione R para jogar novamente", True, WHITE
+        )
+        game.screen.blit(
+            victory_text,
+            (WIDTH // 2 - 150, HEIGHT // 2 + 120),
+        )
+        game.screen.blit(
+            complete_text,
+            (WIDTH // 2 - 200, HEIGHT // 2 + 170),
+        )
+        game.screen.blit(
+            final_score_text,
+            (WIDTH // 2 - 120, HEIGHT // 2 + 200),
+        )
+        game.screen.blit(
+            restart_text,
+            (WIDTH // 2 - 180, HEIGHT // 2 + 240),
+        )
+
+    def _draw_enter_name(self):
+        game = self.game
+        title_text = self._render(game.big_font, "NOVO RECORDE!", True, YELLOW)
+        score_text = self._render(
+            game.font,
+            f"Pontuação: {game.score}",
+            True,
+            WHITE,
+        )
+        prompt_text = self._render(
+            game.font,
+            "Digite seu nome (máximo 25 caracteres):", True, WHITE
+        )
+        name_display = (
+            game.player_name + "_"
+            if len(game.player_name) < 25
+            else game.player_name
+        )
+        name_text = self._render(game.font, name_display, True, WHITE)
+        button_names = self.get_button_names(game)
+        if button_names:
+            btn_a, btn_b = button_names
+            instr_msg = f"[{btn_a}] ou Start: confirmar"
+        else:
+            instr_msg = "ENTER: confirmar"
+        instruction_text = self._render(
+            game.font,
+            instr_msg,
+            True,
+            LIGHT_GRAY,
+        )
+        title_rect = title_text.get_rect(
+            center=(WIDTH // 2, HEIGHT // 2 - 150)
+        )
+        score_rect = score_text.get_rect(
+            center=(WIDTH // 2, HEIGHT // 2 - 100)
+        )
+        prompt_rect = prompt_text.get_rect(
+            center=(WIDTH // 2, HEIGHT // 2 - 50)
+        )
+        name_rect = name_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
+        instruction_rect = instruction_text.get_rect(
+            center=(WIDTH // 2, HEIGHT // 2 + 50)
+        )
+        input_box = pygame.Rect(
+            WIDTH // 2 - 200,
+            HEIGHT // 2 - 15,
+            400,
+            30,
+        )
+        pygame.draw.rect(game.screen, DARK_GRAY, input_box)
+        pygame.draw.rect(game.screen, WHITE, input_box, 2)
+        game.screen.blit(title_text, title_rect)
+        game.screen.blit(score_text, score_rect)
+        game.screen.blit(prompt_text, prompt_rect)
+        game.screen.blit(name_text, name_rect)
+        game.screen.blit(instruction_text, instruction_rect)
+
+    def _draw_ranking_difficulty(self, y):
+        """Dificuldade do placar exibido, logo abaixo do título"""
+        game = self.game
+        labels = {
+            Difficulty.EASY: "Fácil",
+            Difficulty.NORMAL: "Normal",
+            Difficulty.HARD: "Difícil",
+        }
+        label = labels.get(getattr(game, "difficulty", None), "Normal")
+        text = self._render(game.menu_small_font, f"Dificuldade: {label}", True, WHITE)
+        game.screen.blit(text, text.get_rect(midtop=(WIDTH // 2, y)))
+
+    def _draw_show_ranking(self):
+        game = self.game
+        self.draw_ocean_background(game.screen)
+        title_text = self._render(game.menu_font, "TOP 10 RANKING", True, YELLOW)
+        rankings = game.ranking_manager.get_rankings(game.difficulty)
+        title_rect = title_text.get_rect(center=(WIDTH // 2, 100))
+        game.screen.blit(title_text, title_rect)
+        self._draw_ranking_difficulty(135)
+
+        table_width = 520
+        pos_x = WIDTH // 2 - table_width // 2
+        header_pos = self._render(game.menu_content_font, "POS", True, WHITE)
+        header_name = self._render(game.menu_content_font, "NOME", True, WHITE)
+        header_score = self._render(
+            game.menu_content_font,
+            "PONTUAÇÃO",
+            True,
+            WHITE,
+        )
+        game.screen.blit(header_pos, (pos_x, 180))
+        game.screen.blit(header_name, (pos_x + 60, 180))
+        header_score_rect = header_score.get_rect()
+        header_score_rect.right = pos_x + table_width
+        header_score_rect.y = 180
+        game.screen.blit(header_score, header_score_rect)
+        header_line_y = (
+            180
+            + max(
+                header_pos.get_height(),
+                header_name.get_height(),
+                header_score.get_height(),
             )
-            name_display = (
-                game.player_name + "_"
-                if len(game.player_name) < 25
-                else game.player_name
+            + 6
+        )
+        pygame.draw.line(
+            game.screen,
+            WHITE,
+            (pos_x, header_line_y),
+            (pos_x + table_width, header_line_y),
+            2,
+        )
+        y_offset = header_line_y + 30
+        for i, ranking in enumerate(rankings, 1):
+            color = (
+                YELLOW
+                if ranking["name"] == game.player_name.strip()
+                else WHITE
             )
-            name_text = game.font.render(name_display, True, WHITE)
-            button_names = self.get_button_names(game)
-            if button_names:
-                btn_a, btn_b = button_names
-                instr_msg = f"[{btn_a}] ou Start: confirmar"
-            else:
-                instr_msg = "ENTER: confirmar"
-            instruction_text = game.font.render(
-                instr_msg,
+            pos_text = self._render(
+                game.menu_content_font,
+                f"{i:2d}.",
                 True,
-                LIGHT_GRAY,
-            )
-            title_rect = title_text.get_rect(
-                center=(WIDTH // 2, HEIGHT // 2 - 150)
+                color,
             )
-            score_rect = score_text.get_rect(
-                center=(WIDTH // 2, HEIGHT // 2 - 100)
+            game.screen.blit(pos_text, (pos_x, y_offset))
+            name_display = ranking["name"]
+            score_min_width = self._text_size(game.menu_content_font, "888.888.888")[0]
+            name_max_width = table_width - 60 - score_min_width - 20
+            while (
+                len(name_display) > 0
+                and self._text_size(
+                    game.menu_content_font,
+                    name_display
+                    + (
+                        "…"
+                        if name_display != ranking["name"]
+                        else ""
+                    )
+                )[0]
+                > name_max_width
+            ):
+                name_display = name_display[:-1]
+            if name_display != ranking["name"]:
+                name_display = name_display + "…"
+            name_text = self._render(
+                game.menu_content_font,
+                name_display,
+                True,
+                color,
             )
-            prompt_rect = prompt_text.get_rect(
-                center=(WIDTH // 2, HEIGHT // 2 - 50)
+            game.screen.blit(name_text, (pos_x + 60, y_offset))
+            score_display = f"{int(ranking['score']):,}".replace(",", ".")
+            score_text = self._render(
+                game.menu_content_font,
+                score_display,
+                True,
+                color,
             )
-            name_rect = name_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-            instruction_rect = instruction_text.get_rect(
-                center=(WIDTH // 2, HEIGHT // 2 + 50)
+            score_rect = score_text.get_rect()
+            score_rect.right = pos_x + table_width
+            score_rect.y = y_offset
+            game.screen.blit(score_text, score_rect)
+            y_offset += 35
+        restart_text = self._render(
+            game.menu_small_font,
+            "Pressione R para jogar novamente", True, LIGHT_GRAY
+        )
+        restart_rect = restart_text.get_rect(
+            center=(WIDTH // 2, HEIGHT - 80)
+        )
+        game.screen.blit(restart_text, restart_rect)
+        button_names = self.get_button_names(game)
+        if button_names:
+            btn_a, btn_b = button_names
+            back_msg = f"[{btn_b}] ou Start: voltar"
+        else:
+            back_msg = "ESC ou Enter: voltar"
+        back_text = self._render(
+            game.menu_small_font,
+            back_msg,
+            True,
+            LIGHT_GRAY,
+        )
+        back_rect = back_text.get_rect(center=(WIDTH // 2, HEIGHT - 50))
+        game.screen.blit(back_text, back_rect)
+
+    def _draw_fim_screen(self):
+        game = self.game
+        game.screen.fill(BLACK)
+        fim_text = self._render(self._font(120), "FIM", True, WHITE)
+        fim_rect = fim_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
+        game.screen.blit(fim_text, fim_rect)
+        if game.fim_screen_timer > 60:
+            skip_text = self._render(
+                game.font,
+                "Pressione qualquer tecla para continuar", True, LIGHT_GRAY
             )
-            input_box = pygame.Rect(
-                WIDTH // 2 - 200,
-                HEIGHT // 2 - 15,
-                400,
-                30,
+            skip_rect = skip_text.get_rect(
+                center=(WIDTH // 2, HEIGHT // 2 + 100)
             )
-            pygame.draw.rect(game.screen, DARK_GRAY, input_box)
-            pygame.draw.rect(game.screen, WHITE, input_box, 2)
-            game.screen.blit(title_text, title_rect)
-            game.screen.blit(score_text, score_rect)
-            game.screen.blit(prompt_text, prompt_rect)
-            game.screen.blit(name_text, name_rect)
-            game.screen.blit(instruction_text, instruction_rect)
+            game.screen.blit(skip_text, skip_rect)
 
-        elif game.state == GameState.SHOW_RANKING:
+    def _draw_credits(self):
+        game = self.game
+        if game.credits_type == "menu":
             self.draw_ocean_background(game.screen)
-            title_text = game.menu_font.render("TOP 10 RANKING", True, YELLOW)
-            rankings = game.ranking_manager.get_rankings()
+            title_text = self._render(game.menu_font, "CRÉDITOS", True, YELLOW)
             title_rect = title_text.get_rect(center=(WIDTH // 2, 100))
             game.screen.blit(title_text, title_rect)
-
-            table_width = 520
-            pos_x = WIDTH // 2 - table_width // 2
-            header_pos = game.menu_content_font.render("POS", True, WHITE)
-            header_name = game.menu_content_font.render("NOME", True, WHITE)
-            header_score = game.menu_content_font.render(
-                "PONTUAÇÃO",
-                True,
-                WHITE,
-            )
-            game.screen.blit(header_pos, (pos_x, 180))
-            game.screen.blit(header_name, (pos_x + 60, 180))
-            header_score_rect = header_score.get_rect()
-            header_score_rect.right = pos_x + table_width
-            header_score_rect.y = 180
-            game.screen.blit(header_score, header_score_rect)
-            header_line_y = (
-                180
-                + max(
-                    header_pos.get_height(),
-                    header_name.get_height(),
-                    header_score.get_height(),
-                )
-                + 6
-            )
-            pygame.draw.line(
-                game.screen,
-                WHITE,
-                (pos_x, header_line_y),
-                (pos_x + table_width, header_line_y),
-                2,
-            )
-            y_offset = header_line_y + 30
-            for i, ranking in enumerate(rankings, 1):
-                color = (
-                    YELLOW
-                    if ranking["name"] == game.player_name.strip()
-                    else WHITE
-                )
-                pos_text = game.menu_content_font.render(
-                    f"{i:2d}.",
-                    True,
-                    color,
-                )
-                game.screen.blit(pos_text, (pos_x, y_offset))
-                name_display = ranking["name"]
-                score_min_width = game.menu_content_font.size("888.888.888")[0]
-                name_max_width = table_width - 60 - score_min_width - 20
-                while (
-                    len(name_display) > 0
-                    and game.menu_content_font.size(
-                        name_display
-                        + (
-                            "…"
-                            if name_display != ranking["name"]
-                            else ""
-                        )
-                    )[0]
-                    > name_max_width
-                ):
-                    name_display = name_display[:-1]
-                if name_display != ranking["name"]:
-                    name_display = name_display + "…"
-                name_text = game.menu_content_font.render(
-                    name_display,
-                    True,
-                    color,
-                )
-                game.screen.blit(name_text, (pos_x + 60, y_offset))
-                score_display = f"{int(ranking['score']):,}".replace(",", ".")
-                score_text = game.menu_content_font.render(
-                    score_display,
-                    True,
-                    color,
-                )
-                score_rect = score_text.get_rect()
-                score_rect.right = pos_x + table_width
-                score_rect.y = y_offset
-                game.screen.blit(score_text, score_rect)
-                y_offset += 35
-            restart_text = game.menu_small_font.render(
-                "Pressione R para jogar novamente", True, LIGHT_GRAY
-            )
-            restart_rect = restart_text.get_rect(
-                center=(WIDTH // 2, HEIGHT - 80)
-            )
-            game.screen.blit(restart_text, restart_rect)
-            button_names = self.get_button_names(game)
-            if button_names:
-                btn_a, btn_b = button_names
-                back_msg = f"[{btn_b}] ou Start: voltar"
-            else:
-                back_msg = "ESC ou Enter: voltar"
-            back_text = game.menu_small_font.render(
-                back_msg,
-                True,
-                LIGHT_GRAY,
-            )
-            back_rect = back_text.get_rect(center=(WIDTH // 2, HEIGHT - 50))
-            game.screen.blit(back_text, back_rect)
-
-        elif game.state == GameState.FIM_SCREEN:
-            game.screen.fill(BLACK)
-            fim_text = pygame.font.Font(None, 120).render("FIM", True, WHITE)
-            fim_rect = fim_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-            game.screen.blit(fim_text, fim_rect)
-            if game.fim_screen_timer > 60:
-                skip_text = game.font.render(
-                    "Pressione qualquer tecla para continuar", True, LIGHT_GRAY
-                )
-                skip_rect = skip_text.get_rect(
-                    center=(WIDTH // 2, HEIGHT // 2 + 100)
-                )
-                game.screen.blit(skip_text, skip_rect)
-
-        elif game.state == GameState.CREDITS:
-            if game.credits_type == "menu":
-                self.draw_ocean_background(game.screen)
-                title_text = game.menu_font.render("CRÉDITOS", True, YELLOW)
-                title_rect = title_text.get_rect(center=(WIDTH // 2, 100))
-                game.screen.blit(title_text, title_rect)
-                menu_credits = [
-                    "Desenvolvido por:",
+            menu_credits = [
+                "Desenvolvido por:",
+                "CirrasTec",
+                "",
+                "Em parceria com:",
+                "Cirras RetroGames",
+                "https://www.youtube.com/@cirrasretrogames",
+                "",
+                "Canal do Dudu",
+                "https://www.youtube.com/@canaldodudu14",
+                "",
+                "Obrigado por jogar!",
+            ]
+            y_offset = 200
+            for line in menu_credits:
+                if line.startswith("https://"):
+                    text_surface = self._render(
+                        game.menu_content_font,
+                        line, True, LIGHT_BLUE
+                    )
+                elif line in [
                     "CirrasTec",
-                    "",
-                    "Em parceria com:",
                     "Cirras RetroGames",
-                    "https://www.youtube.com/@cirrasretrogames",
-                    "",
                     "Canal do Dudu",
-                    "https://www.youtube.com/@canaldodudu14",
-                    "",
-                    "Obrigado por jogar!",
-                ]
-                y_offset = 200
-                for line in menu_credits:
-                    if line.startswith("https://"):
-                        text_surface = game.menu_content_font.render(
-                            line, True, LIGHT_BLUE
-                        )
-                    elif line in [
-                        "CirrasTec",
-                        "Cirras RetroGames",
-                        "Canal do Dudu",
-                    ]:
-                        text_surface = game.menu_content_font.render(
-                            line,
-                            True,
-                            YELLOW,
-                        )
-                    elif line != "":
-                        text_surface = game.menu_content_font.render(
-                            line,
-                            True,
-                            WHITE,
-                        )
-                    else:
-                        y_offset += 20
-                        continue
-                    text_rect = text_surface.get_rect(
-                        center=(WIDTH // 2, y_offset)
+                ]:
+                    text_surface = self._render(
+                        game.menu_content_font,
+                        line,
+                        True,
+                        YELLOW,
+                    )
+                elif line != "":
+                    text_surface = self._render(
+                        game.menu_content_font,
+                        line,
+                        True,
+                        WHITE,
                     )
-                    game.screen.blit(text_surface, text_rect)
-                    y_offset += 40
-                button_names = self.get_button_names(game)
-                if button_names:
-                    btn_a, btn_b = button_names
-                    instr_msg = f"[{btn_b}] ou Start: voltar"
                 else:
-                    instr_msg = "ESC ou Enter: voltar"
-                instruction_text = game.menu_small_font.render(
-                    instr_msg, True, LIGHT_GRAY
-                )
-                instruction_rect = instruction_text.get_rect(
-                    center=(WIDTH // 2, HEIGHT - 50)
-                )
-                game.screen.blit(instruction_text, instruction_rect)
-            else:
-                game.screen.fill(BLACK)
-                credits_content = [
-                    "",
-                    "",
-                    "",
-                    "JUMP & HIT",
-                    "",
-                    "",
-                    "Um jogo de plataforma 2D",
-                    "inspirado nos clássicos dos anos 80 e 90",
-                    "",
-                    "",
-                    (
-                        "=============================="
-                        "=============================="
-                    ),
-                    "",
-                    "DESENVOLVIDO POR",
-                    "",
-                    "CirrasTec",
-                    "",
-                    (
-                        "=============================="
-                        "=============================="
-                    ),
-                    "",
-                    "EM PARCERIA COM",
-                    "",
-                    "Cirras RetroGames",
-                    "https://www.youtube.com/@cirrasretrogames",
-                    "",
-                    "Canal do Dudu",
-                    "https://www.youtube.com/@canaldodudu14",
-                    "",
-                    (
-                        "=============================="
-                        "=============================="
-                    ),
-                    "",
-                    "PROGRAMAÇÃO E DESIGN",
-                    "",
-                    "Cirras",
-                    "Dudu",
-                    "",
-                    (
-                        "=============================="
-                        "=============================="
-                    ),
-                    "",
-                    "ARTE E GRÁFICOS",
-                    "",
-                    "Cirras",
-                    "",
-                    (
-                        "=============================="
-                        "=============================="
-                    ),
-                    "",
-                    "ÁUDIO E MÚSICA",
-                    "",
-                    "Cirras",
-                    "",
-                    (
-                        "=============================="
-                        "=============================="
-                    ),
-                    "",
-                    "NÍVEIS E GAMEPLAY",
-                    "",
-                    "Cirras",
-                    "Dudu",
-                    "Aline",
-                    "",
-                    (
-                        "=============================="
-                        "=============================="
-                    ),
-                    "",
-                    "TECNOLOGIAS UTILIZADAS",
-                    "",
-                    "Python 3.x",
-                    "Pygame",
-                    "Trae",
-                    "Suno",
-                    "Canva",
-                    "",
-                    (
-                        "=============================="
-                        "=============================="
-                    ),
-                    "",
-                    "AGRADECIMENTOS ESPECIAIS",
-                    "",
-                    "À comunidade retrogaming",
-                    "Aos jogadores que testaram o jogo",
-                    "Aos criadores dos jogos clássicos",
-                    "que nos inspiraram",
-                    "",
-                    (
-                        "=============================="
-                        "=============================="
-                    ),
-                    "",
-                    "MENSAGEM FINAL",
-                    "",
-                    "Este jogo foi criado com paixão e dedicação,",
-                    "combinando a nostalgia dos jogos clássicos",
-                    "com elementos modernos de gameplay.",
-                    "",
-                    "Esperamos que você tenha se divertido",
-                    "tanto quanto nós nos divertimos criando!",
-                    "",
-                    "Continue jogando, continue sonhando!",
-                    "",
-                    (
-                        "=============================="
-                        "=============================="
-                    ),
-                    "",
-                    "© 2025 CirrasTec",
-                    "Todos os direitos reservados",
-                    "",
-                    "",
-                    "Obrigado por jogar!",
-                    "",
-                    "",
-                    "",
-                    "",
-                    "",
-                    "",
-                    "",
-                ]
-                y_start = HEIGHT - game.credits_scroll_y
-                line_height = 35
-                for i, line in enumerate(credits_content):
-                    y_pos = y_start + (i * line_height)
-                    if y_pos > -50 and y_pos < HEIGHT + 50:
-                        if line == "JUMP & HIT":
-                            title_font = pygame.font.Font(None, 96)
-                            text_surface = title_font.render(
-                                line,
-                                True,
-                                YELLOW,
-                            )
-                        elif line.startswith("═══"):
-                            text_surface = game.font.render(
-                                line,
-                                True,
-                                DARK_GRAY,
-                            )
-                        elif line.startswith("https://"):
-                            text_surface = game.font.render(
-                                line,
-                                True,
-                                LIGHT_BLUE,
-                            )
-                        elif line in [
-                            "DESENVOLVIDO POR",
-                            "EM PARCERIA COM",
-                            "PROGRAMAÇÃO E DESIGN",
-                            "ARTE E GRÁFICOS",
-                            "ÁUDIO E MÚSICA",
-                            "NÍVEIS E GAMEPLAY",
-                            "TECNOLOGIAS UTILIZADAS",
-                            "AGRADECIMENTOS ESPECIAIS",
-                            "MENSAGEM FINAL",
-                        ]:
-                            section_font = pygame.font.Font(None, 48)
-                            text_surface = section_font.render(
-                                line,
-                                True,
-                                CYAN,
-                            )
-                        elif line in [
-                            "CirrasTec",
-                            "Cirras RetroGames",
-                            "Canal do Dudu",
-                        ]:
-                            text_surface = game.font.render(line, True, YELLOW)
-                        elif (
-                            line == "© 2025 CirrasTec"
-                            or line == "Todos os direitos reservados"
-                        ):
-                            text_surface = game.font.render(
-                                line,
-                                True,
-                                LIGHT_GRAY,
-                            )
-                        elif line == "Obrigado por jogar!":
-                            final_font = pygame.font.Font(None, 56)
-                            text_surface = final_font.render(
-                                line,
-                                True,
-                                YELLOW,
-                            )
-                        elif line != "":
-                            text_surface = game.font.render(line, True, WHITE)
-                        else:
-                            continue
-                        text_rect = text_surface.get_rect(
-                            center=(WIDTH // 2, y_pos)
-                        )
-                        game.screen.blit(text_surface, text_rect)
-                total_credits_height = len(credits_content) * line_height
-                if game.credits_scroll_y > total_credits_height + HEIGHT:
-                    pygame.mixer.music.stop()
-                    game.state = GameState.MAIN_MENU
-                    game.music.play_menu_music(game)
-                    game.credits_scroll_y = 0
-                    game.credits_reset_timer = 0
-
-        elif game.state == GameState.RECORDS:
-            game.draw_ocean_background(game.screen)
-            title_text = game.menu_font.render("RECORDES", True, YELLOW)
-            rankings = game.ranking_manager.get_rankings()
-            title_rect = title_text.get_rect(center=(WIDTH // 2, 100))
-            game.screen.blit(title_text, title_rect)
-            table_width = 520
-            pos_x = WIDTH // 2 - table_width // 2
-            header_pos = game.menu_content_font.render("POS", True, WHITE)
-            header_name = game.menu_content_font.render("NOME", True, WHITE)
-            header_score = game.menu_content_font.render(
-                "PONTUAÇÃO",
-                True,
-                WHITE,
-            )
-            game.screen.blit(header_pos, (pos_x, 180))
-            game.screen.blit(header_name, (pos_x + 60, 180))
-            header_score_rect = header_score.get_rect()
-            header_score_rect.right = pos_x + table_width
-            header_score_rect.y = 180
-            game.screen.blit(header_score, header_score_rect)
-            header_line_y = (
-                180
-                + max(
-                    header_pos.get_height(),
-                    header_name.get_height(),
-                    header_score.get_height(),
+                    y_offset += 20
+                    continue
+                text_rect = text_surface.get_rect(
+                    center=(WIDTH // 2, y_offset)
                 )
-                + 6
-            )
-            pygame.draw.line(
-                game.screen,
-                WHITE,
-                (pos_x, header_line_y),
-                (pos_x + table_width, header_line_y),
-                2,
-            )
-            y_offset = header_line_y + 30
-            for i, ranking in enumerate(rankings, 1):
-                color = WHITE
-                pos_text = game.menu_content_font.render(
-                    f"{i:2d}.",
-                    True,
-                    color,
-                )
-                game.screen.blit(pos_text, (pos_x, y_offset))
-                name_display = ranking["name"]
-                score_min_width = game.menu_content_font.size("888.888.888")[0]
-                name_max_width = table_width - 60 - score_min_width - 20
-                while (
-                    len(name_display) > 0
-                    and game.menu_content_font.size(
-                        name_display
-                        + (
-                            "…"
-                            if name_display != ranking["name"]
-                            else ""
-                        )
-                    )[0]
-                    > name_max_width
-                ):
-                    name_display = name_display[:-1]
-                if name_display != ranking["name"]:
-                    name_display = name_display + "…"
-                name_text = game.menu_content_font.render(
-                    name_display,
-                    True,
-                    color,
-                )
-                game.screen.blit(name_text, (pos_x + 60, y_offset))
-                score_display = f"{int(ranking['score']):,}".replace(",", ".")
-                score_text = game.menu_content_font.render(
-                    score_display,
-                    True,
-                    color,
-                )
-                score_rect = score_text.get_rect()
-                score_rect.right = pos_x + table_width
-                score_rect.y = y_offset
-                game.screen.blit(score_text, score_rect)
-                y_offset += 35
+                game.screen.blit(text_surface, text_rect)
+                y_offset += 40
             button_names = self.get_button_names(game)
             if button_names:
                 btn_a, btn_b = button_names
                 instr_msg = f"[{btn_b}] ou Start: voltar"
             else:
                 instr_msg = "ESC ou Enter: voltar"
-            instruction_text = game.menu_small_font.render(
-                instr_msg,
-                True,
-                LIGHT_GRAY,
+            instruction_text = self._render(
+                game.menu_small_font,
+                instr_msg, True, LIGHT_GRAY
             )
             instruction_rect = instruction_text.get_rect(
                 center=(WIDTH // 2, HEIGHT - 50)
             )
             game.screen.blit(instruction_text, instruction_rect)
-
-        elif game.state == GameState.PAUSED:
-            self.draw_ocean_background(game.screen)
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 160))
-            game.screen.blit(overlay, (0, 0))
-            title = game.menu_big_font.render("Pausado", True, YELLOW)
-            game.screen.blit(title, title.get_rect(center=(WIDTH // 2, 160)))
-            start_y = 260
-            for i, option in enumerate(game.pause_menu_options):
-                color = YELLOW if i == game.pause_selected else WHITE
-                opt = game.menu_font.render(option, True, color)
-                rect = opt.get_rect(center=(WIDTH // 2, start_y + i * 50))
-                if i == game.pause_selected:
-                    pygame.draw.rect(game.screen, DARK_BLUE, rect.inflate(20, 10))
-                game.screen.blit(opt, rect)
-
-        elif game.state == GameState.OPTIONS_MENU:
-            self.draw_ocean_background(game.screen)
-            title = game.menu_big_font.render("Configurações", True, YELLOW)
-            game.screen.blit(title, title.get_rect(center=(WIDTH // 2, 160)))
-            options = ["Botões/Teclas", "Áudio", "Vídeo", "Acessibilidade", "Voltar"]
-            start_y = 260
-            for i, option in enumerate(options):
-                color = YELLOW if i == game.options_selected else WHITE
-                opt = game.menu_font.render(option, True, color)
-                rect = opt.get_rect(center=(WIDTH // 2, start_y + i * 50))
-                if i == game.options_selected:
-                    pygame.draw.rect(game.screen, DARK_BLUE, rect.inflate(20, 10))
-                game.screen.blit(opt, rect)
-            button_names = self.get_button_names(game)
-            if button_names:
-                btn_a, btn_b = button_names
-                instr_msg = f"↑↓ escolher  [{btn_a}] confirmar  [{btn_b}] voltar"
+        else:
+            game.screen.fill(BLACK)
+            y_start = HEIGHT - game.credits_scroll_y
+            credits_surface, pad = self._get_credits_surface(game)
+            if credits_surface is not None:
+                self._blit_window(game.screen, credits_surface, y_start - pad)
             else:
-                instr_msg = "↑↓ escolher  Enter: confirmar  ESC: voltar"
-            inst = game.menu_small_font.render(
-                instr_msg,
-                True,
-                LIGHT_GRAY,
+                for i, line in enumerate(ENDING_CREDITS):
+                    y_pos = y_start + (i * CREDITS_LINE_HEIGHT)
+                    if y_pos > -50 and y_pos < HEIGHT + 50:
+                        text_surface = self._credits_line_surface(game, line)
+                        if text_surface is None:
+                            continue
+                        text_rect = text_surface.get_rect(
+                            center=(WIDTH // 2, y_pos)
+                        )
+                        game.screen.blit(text_surface, text_rect)
+            total_credits_height = len(ENDING_CREDITS) * CREDITS_LINE_HEIGHT
+            if game.credits_scroll_y > total_credits_height + HEIGHT:
+                pygame.mixer.music.stop()
+                game.state = GameState.MAIN_MENU
+                game.music.play_menu_music(game)
+                game.credits_scroll_y = 0
+                game.credits_reset_timer = 0
+
+    def _draw_records(self):
+        game = self.game
+        game.draw_ocean_background(game.screen)
+        title_text = self._render(game.menu_font, "RECORDES", True, YELLOW)
+        rankings = game.ranking_manager.get_rankings(game.difficulty)
+        title_rect = title_text.get_rect(center=(WIDTH // 2, 100))
+        game.screen.blit(title_text, title_rect)
+        self._draw_ranking_difficulty(135)
+        table_width = 520
+        pos_x = WIDTH // 2 - table_width // 2
+        header_pos = self._render(game.menu_content_font, "POS", True, WHITE)
+        header_name = self._render(game.menu_content_font, "NOME", True, WHITE)
+        header_score = self._render(
+            game.menu_content_font,
+            "PONTUAÇÃO",
+            True,
+            WHITE,
+        )
+        game.screen.blit(header_pos, (pos_x, 180))
+        game.screen.blit(header_name, (pos_x + 60, 180))
+        header_score_rect = header_score.get_rect()
+        header_score_rect.right = pos_x + table_width
+        header_score_rect.y = 180
+        game.screen.blit(header_score, header_score_rect)
+        header_line_y = (
+            180
+            + max(
+                header_pos.get_height(),
+                header_name.get_height(),
+                header_score.get_height(),
             )
-            game.screen.blit(inst, inst.get_rect(center=(WIDTH // 2, HEIGHT - 50)))
-
-        elif game.state == GameState.OPTIONS_AUDIO:
-            self.draw_ocean_background(game.screen)
-            title = game.menu_big_font.render("Áudio", True, YELLOW)
-            game.screen.blit(title, title.get_rect(center=(WIDTH // 2, 160)))
-            label_music = game.menu_font.render("Volume Música", True, YELLOW if game.audio_selected == 0 else WHITE)
-            label_sfx = game.menu_font.render("Volume Efeitos", True, YELLOW if game.audio_selected == 1 else WHITE)
-            game.screen.blit(label_music, label_music.get_rect(center=(WIDTH // 2, 260)))
-            game.screen.blit(label_sfx, label_sfx.get_rect(center=(WIDTH // 2, 360)))
-            bar_w = 460
-            bar_h = 16
-            bar_x = WIDTH // 2 - bar_w // 2
-            bar1_y = 300
-            bar2_y = 400
-            pygame.draw.rect(game.screen, DARK_GRAY, (bar_x, bar1_y, bar_w, bar_h))
-            pygame.draw.rect(game.screen, DARK_GRAY, (bar_x, bar2_y, bar_w, bar_h))
-            fill1_w = int(bar_w * max(0.0, min(1.0, getattr(game, "music_volume", 0.7))))
-            fill2_w = int(bar_w * max(0.0, min(1.0, getattr(game.sound_effects, "sound_volume", 0.8))))
-            fill1_color = YELLOW if game.audio_selected == 0 else LIGHT_GRAY
-            fill2_color = YELLOW if game.audio_selected == 1 else LIGHT_GRAY
-            pygame.draw.rect(game.screen, fill1_color, (bar_x, bar1_y, fill1_w, bar_h))
-            pygame.draw.rect(game.screen, fill2_color, (bar_x, bar2_y, fill2_w, bar_h))
-            if game.audio_selected == 0:
-                pygame.draw.rect(game.screen, BLUE, (bar_x - 2, bar1_y - 2, bar_w + 4, bar_h + 4), 2)
-            else:
-                pygame.draw.rect(game.screen, BLUE, (bar_x - 2, bar2_y - 2, bar_w + 4, bar_h + 4), 2)
-            knob1_x = bar_x + fill1_w
-            knob2_x = bar_x + fill2_w
-            knob_r = 8
-            pygame.draw.circle(game.screen, WHITE, (knob1_x, bar1_y + bar_h // 2), knob_r)
-            pygame.draw.circle(game.screen, WHITE, (knob2_x, bar2_y + bar_h // 2), knob_r)
-            inner_color1 = GOLD if game.audio_selected == 0 else GRAY
-            inner_color2 = GOLD if game.audio_selected == 1 else GRAY
-            pygame.draw.circle(game.screen, inner_color1, (knob1_x, bar1_y + bar_h // 2), max(2, knob_r - 4))
-            pygame.draw.circle(game.screen, inner_color2, (knob2_x, bar2_y + bar_h // 2), max(2, knob_r - 4))
-            button_names = self.get_button_names(game)
-            if button_names:
-                btn_a, btn_b = button_names
-                instr_msg = f"←→ ou analógico: ajustar  [{btn_b}] voltar"
-            else:
-                instr_msg = "←→: ajustar  ESC: voltar"
-            inst = game.menu_small_font.render(instr_msg, True, LIGHT_GRAY)
-            game.screen.blit(inst, inst.get_rect(center=(WIDTH // 2, HEIGHT - 50)))
-
-        elif game.state == GameState.OPTIONS_VIDEO:
-            self.draw_ocean_background(game.screen)
-            title = game.menu_big_font.render("Vídeo", True, YELLOW)
-            game.screen.blit(title, title.get_rect(center=(WIDTH // 2, 160)))
-            ws = getattr(game.env_config, "get", lambda *_: 1.0)("window_scale", 1.0)
-            try:
-                ws = float(ws)
-            except Exception:
-                ws = 1.0
-            res_color = YELLOW if getattr(game, "video_selected", 0) == 0 else WHITE
-            disp_color = YELLOW if getattr(game, "video_selected", 0) == 1 else WHITE
-            mode_color = YELLOW if getattr(game, "video_selected", 0) == 2 else WHITE
-            res = game.menu_font.render(
-                f"Resolução: {int(WIDTH*ws)} x {int(HEIGHT*ws)}",
+            + 6
+        )
+        pygame.draw.line(
+            game.screen,
+            WHITE,
+            (pos_x, header_line_y),
+            (pos_x + table_width, header_line_y),
+            2,
+        )
+        y_offset = header_line_y + 30
+        for i, ranking in enumerate(rankings, 1):
+            color = WHITE
+            pos_text = self._render(
+                game.menu_content_font,
+                f"{i:2d}.",
                 True,
-                res_color,
+                color,
             )
-            mode = "Fullscreen" if Screen.is_fullscreen(game) else "Janela"
-            disp = game.menu_font.render(f"Exibição: {mode}", True, disp_color)
-            vmode_txt = "8 bits" if getattr(game, "visual_mode", "normal") == "8bit" else "Normal"
-            vis = game.menu_font.render(f"Modo Visual: {vmode_txt}", True, mode_color)
-            res_rect = res.get_rect(center=(WIDTH // 2, 270))
-            disp_rect = disp.get_rect(center=(WIDTH // 2, 330))
-            vis_rect = vis.get_rect(center=(WIDTH // 2, 390))
-            if getattr(game, "video_selected", 0) == 0:
-                pygame.draw.rect(game.screen, DARK_BLUE, res_rect.inflate(20, 10))
-            elif getattr(game, "video_selected", 0) == 1:
-                pygame.draw.rect(game.screen, DARK_BLUE, disp_rect.inflate(20, 10))
-            else:
-                pygame.draw.rect(game.screen, DARK_BLUE, vis_rect.inflate(20, 10))
-            game.screen.blit(res, res_rect)
-            game.screen.blit(disp, disp_rect)
-            game.screen.blit(vis, vis_rect)
-            button_names = self.get_button_names(game)
-            if button_names:
-                btn_a, btn_b = button_names
-                instr_msg = f"↑↓ escolher  [{btn_a}] alterar  [{btn_b}] voltar"
-            else:
-                instr_msg = "↑↓ escolher  Enter: alterar  ESC: voltar"
-            inst = game.menu_small_font.render(instr_msg, True, LIGHT_GRAY)
-            game.screen.blit(inst, inst.get_rect(center=(WIDTH // 2, HEIGHT - 50)))
-
-        elif game.state == GameState.OPTIONS_ACCESSIBILITY:
-            self.draw_ocean_background(game.screen)
-            title = game.menu_big_font.render("Acessibilidade", True, YELLOW)
-            game.screen.blit(title, title.get_rect(center=(WIDTH // 2, 160)))
-            # Opções
-            cb_modes = {
-                "none": "Nenhum",
-                "deuteranopia": "Deuteranopia",
-                "protanopia": "Protanopia",
-                "tritanopia": "Tritanopia",
-            }
-            sel = getattr(game, "access_selected", 0)
-            label_cb = game.menu_font.render(
-                f"Modo daltônico: {cb_modes.get(getattr(game, 'colorblind_mode', 'none'), 'Nenhum')}",
+            game.screen.blit(pos_text, (pos_x, y_offset))
+            name_display = ranking["name"]
+            score_min_width = self._text_size(game.menu_content_font, "888.888.888")[0]
+            name_max_width = table_width - 60 - score_min_width - 20
+            while (
+                len(name_display) > 0
+                and self._text_size(
+                    game.menu_content_font,
+                    name_display
+                    + (
+                        "…"
+                        if name_display != ranking["name"]
+                        else ""
+                    )
+                )[0]
+                > name_max_width
+            ):
+                name_display = name_display[:-1]
+            if name_display != ranking["name"]:
+                name_display = name_display + "…"
+            name_text = self._render(
+                game.menu_content_font,
+                name_display,
                 True,
-                YELLOW if sel == 0 else WHITE,
+                color,
             )
-            vib_txt = "Ativado" if getattr(game, "vibration_enabled", False) else "Desativado"
-            label_vib = game.menu_font.render(
-                f"Vibração: {vib_txt}",
+            game.screen.blit(name_text, (pos_x + 60, y_offset))
+            score_display = f"{int(ranking['score']):,}".replace(",", ".")
+            score_text = self._render(
+                game.menu_content_font,
+                score_display,
                 True,
-                YELLOW if sel == 1 else WHITE,
+                color,
             )
-            game.screen.blit(label_cb, label_cb.get_rect(center=(WIDTH // 2, 280)))
-            game.screen.blit(label_vib, label_vib.get_rect(center=(WIDTH // 2, 340)))
-            button_names = self.get_button_names(game)
-            if button_names:
-                btn_a, btn_b = button_names
-                instr_msg = f"↑↓ escolher  ←→ ajustar  [{btn_b}] voltar"
-            else:
-                instr_msg = "↑↓ escolher  ←→ ajustar  ESC: voltar"
-            inst = game.menu_small_font.render(instr_msg, True, LIGHT_GRAY)
-            game.screen.blit(inst, inst.get_rect(center=(WIDTH // 2, HEIGHT - 50)))
+            score_rect = score_text.get_rect()
+            score_rect.right = pos_x + table_width
+            score_rect.y = y_offset
+            game.screen.blit(score_text, score_rect)
+            y_offset += 35
+        button_names = self.get_button_names(game)
+        if button_names:
+            btn_a, btn_b = button_names
+            instr_msg = f"[{btn_b}] ou Start: voltar"
+        else:
+            instr_msg = "ESC ou Enter: voltar"
+        instruction_text = self._render(
+            game.menu_small_font,
+            instr_msg,
+            True,
+            LIGHT_GRAY,
+        )
+        instruction_rect = instruction_text.get_rect(
+            center=(WIDTH // 2, HEIGHT - 50)
+        )
+        game.screen.blit(instruction_text, instruction_rect)
+
+    def _draw_paused(self):
+        game = self.game
+        self.draw_ocean_background(game.screen)
+        game.screen.blit(self._modal_overlay(160), (0, 0))
+        options = tuple(game.pause_menu_options)
+        key = (options, game.pause_selected, id(game.menu_big_font), id(game.menu_font))
+        self._blit_modal("paused", key, self._compose_pause_menu)
+
+    def _compose_pause_menu(self):
+        """Título e opções do menu de pausa (com o destaque) em uma superfície."""
+        game = self.game
+        surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        title = self._render(game.menu_big_font, "Pausado", True, YELLOW)
+        surface.blit(title, title.get_rect(center=(WIDTH // 2, 160)))
+        start_y = 260
+        for i, option in enumerate(game.pause_menu_options):
+            color = YELLOW if i == game.pause_selected else WHITE
+            opt = self._render(game.menu_font, option, True, color)
+            rect = opt.get_rect(center=(WIDTH // 2, start_y + i * 50))
+            if i == game.pause_selected:
+                pygame.draw.rect(surface, DARK_BLUE, rect.inflate(20, 10))
+            surface.blit(opt, rect)
+        # Recortar à área usada para não compor a tela inteira por quadro
+        bounds = surface.get_bounding_rect()
+        return surface.subsurface(bounds).copy(), bounds.topleft
+
+    def _draw_options_menu(self):
+        game = self.game
+        self.draw_ocean_background(game.screen)
+        title = self._render(game.menu_big_font, "Configurações", True, YELLOW)
+        game.screen.blit(title, title.get_rect(center=(WIDTH // 2, 160)))
+        options = ["Botões/Teclas", "Áudio", "Vídeo", "Acessibilidade", "Voltar"]
+        start_y = 260
+        for i, option in enumerate(options):
+            color = YELLOW if i == game.options_selected else WHITE
+            opt = self._render(game.menu_font, option, True, color)
+            rect = opt.get_rect(center=(WIDTH // 2, start_y + i * 50))
+            if i == game.options_selected:
+                pygame.draw.rect(game.screen, DARK_BLUE, rect.inflate(20, 10))
+            game.screen.blit(opt, rect)
+        button_names = self.get_button_names(game)
+        if button_names:
+            btn_a, btn_b = button_names
+            instr_msg = f"↑↓ escolher  [{btn_a}] confirmar  [{btn_b}] voltar"
+        else:
+            instr_msg = "↑↓ escolher  Enter: confirmar  ESC: voltar"
+        inst = self._render(
+            game.menu_small_font,
+            instr_msg,
+            True,
+            LIGHT_GRAY,
+        )
+        game.screen.blit(inst, inst.get_rect(center=(WIDTH // 2, HEIGHT - 50)))
+
+    def _draw_options_audio(self):
+        game = self.game
+        self.draw_ocean_background(game.screen)
+        title = self._render(game.menu_big_font, "Áudio", True, YELLOW)
+        game.screen.blit(title, title.get_rect(center=(WIDTH // 2, 160)))
+        label_music = self._render(game.menu_font, "Volume Música", True, YELLOW if game.audio_selected == 0 else WHITE)
+        label_sfx = self._render(game.menu_font, "Volume Efeitos", True, YELLOW if game.audio_selected == 1 else WHITE)
+        game.screen.blit(label_music, label_music.get_rect(center=(WIDTH // 2, 260)))
+        game.screen.blit(label_sfx, label_sfx.get_rect(center=(WIDTH // 2, 360)))
+        bar_w = 460
+        bar_h = 16
+        bar_x = WIDTH // 2 - bar_w // 2
+        bar1_y = 300
+        bar2_y = 400
+        pygame.draw.rect(game.screen, DARK_GRAY, (bar_x, bar1_y, bar_w, bar_h))
+        pygame.draw.rect(game.screen, DARK_GRAY, (bar_x, bar2_y, bar_w, bar_h))
+        fill1_w = int(bar_w * max(0.0, min(1.0, getattr(game, "music_volume", 0.7))))
+        fill2_w = int(bar_w * max(0.0, min(1.0, getattr(game.sound_effects, "sound_volume", 0.8))))
+        fill1_color = YELLOW if game.audio_selected == 0 else LIGHT_GRAY
+        fill2_color = YELLOW if game.audio_selected == 1 else LIGHT_GRAY
+        pygame.draw.rect(game.screen, fill1_color, (bar_x, bar1_y, fill1_w, bar_h))
+        pygame.draw.rect(game.screen, fill2_color, (bar_x, bar2_y, fill2_w, bar_h))
+        if game.audio_selected == 0:
+            pygame.draw.rect(game.screen, BLUE, (bar_x - 2, bar1_y - 2, bar_w + 4, bar_h + 4), 2)
+        else:
+            pygame.draw.rect(game.screen, BLUE, (bar_x - 2, bar2_y - 2, bar_w + 4, bar_h + 4), 2)
+        knob1_x = bar_x + fill1_w
+        knob2_x = bar_x + fill2_w
+        knob_r = 8
+        pygame.draw.circle(game.screen, WHITE, (knob1_x, bar1_y + bar_h // 2), knob_r)
+        pygame.draw.circle(game.screen, WHITE, (knob2_x, bar2_y + bar_h // 2), knob_r)
+        inner_color1 = GOLD if game.audio_selected == 0 else GRAY
+        inner_color2 = GOLD if game.audio_selected == 1 else GRAY
+        pygame.draw.circle(game.screen, inner_color1, (knob1_x, bar1_y + bar_h // 2), max(2, knob_r - 4))
+        pygame.draw.circle(game.screen, inner_color2, (knob2_x, bar2_y + bar_h // 2), max(2, knob_r - 4))
+        button_names = self.get_button_names(game)
+        if button_names:
+            btn_a, btn_b = button_names
+            instr_msg = f"←→ ou analógico: ajustar  [{btn_b}] voltar"
+        else:
+            instr_msg = "←→: ajustar  ESC: voltar"
+        inst = self._render(game.menu_small_font, instr_msg, True, LIGHT_GRAY)
+        game.screen.blit(inst, inst.get_rect(center=(WIDTH // 2, HEIGHT - 50)))
 
-        elif game.state == GameState.OPTIONS_CONTROLS:
-            self.draw_ocean_background(game.screen)
-            title = game.menu_big_font.render("Botões/Teclas", True, YELLOW)
-            game.screen.blit(title, title.get_rect(center=(WIDTH // 2, 140)))
-            start_y = 240
-            for i, (label, action) in enumerate(game.controls_actions):
-                keys = game.controls.get(action, [])
-                try:
-                    key_names = [pygame.key.name(k) for k in keys]
-                except Exception:
-                    key_names = [str(k) for k in keys]
-                js_btn = game.joystick_controls.get(action)
-                js_txt = f" (Joy: {js_btn})" if js_btn is not None else ""
-                display = ", ".join(key_names) if key_names else "(nenhum)"
-                color = YELLOW if i == game.controls_selected else WHITE
-                text = game.menu_font.render(f"{label}: {display}{js_txt}", True, color)
-                rect = text.get_rect(center=(WIDTH // 2, start_y + i * 50))
-                if i == game.controls_selected:
-                    pygame.draw.rect(game.screen, DARK_BLUE, rect.inflate(24, 14))
-                game.screen.blit(text, rect)
-            button_names = self.get_button_names(game)
-            if game.controls_editing:
-                if button_names:
-                    btn_a, btn_b = button_names
-                    prompt_msg = f"Pressione a nova tecla ou botão... [{btn_b}] cancela"
-                else:
-                    prompt_msg = "Pressione a nova tecla ou botão... ESC cancela"
-                prompt = game.menu_small_font.render(
-                    prompt_msg,
-                    True,
-                    LIGHT_GRAY,
-                )
-            else:
-                if button_names:
-                    btn_a, btn_b = button_names
-                    prompt_msg = f"↑↓ escolher  [{btn_a}] editar  [{btn_b}] voltar"
-                else:
-                    prompt_msg = "↑↓ escolher  Enter: editar  ESC: voltar"
-                prompt = game.menu_small_font.render(
-                    prompt_msg,
-                    True,
-                    LIGHT_GRAY,
-                )
-            game.screen.blit(prompt, prompt.get_rect(center=(WIDTH // 2, HEIGHT - 50)))
+    def _draw_options_video(self):
+        game = self.game
+        self.draw_ocean_background(game.screen)
+        title = self._render(game.menu_big_font, "Vídeo", True, YELLOW)
+        game.screen.blit(title, title.get_rect(center=(WIDTH // 2, 160)))
+        ws = getattr(game.env_config, "get", lambda *_: 1.0)("window_scale", 1.0)
+        try:
+            ws = float(ws)
+        except Exception:
+            ws = 1.0
+        res_color = YELLOW if getattr(game, "video_selected", 0) == 0 else WHITE
+        disp_color = YELLOW if getattr(game, "video_selected", 0) == 1 else WHITE
+        mode_color = YELLOW if getattr(game, "video_selected", 0) == 2 else WHITE
+        perf_color = YELLOW if getattr(game, "video_selected", 0) == 3 else WHITE
+        res = self._render(
+            game.menu_font,
+            f"Resolução: {int(WIDTH*ws)} x {int(HEIGHT*ws)}",
+            True,
+            res_color,
+        )
+        mode = "Fullscreen" if Screen.is_fullscreen(game) else "Janela"
+        disp = self._render(game.menu_font, f"Exibição: {mode}", True, disp_color)
+        vmode_txt = "8 bits" if getattr(game, "visual_mode", "normal") == "8bit" else "Normal"
+        vis = self._render(game.menu_font, f"Modo Visual: {vmode_txt}", True, mode_color)
+        performance = getattr(game, "performance", None)
+        perf_txt = performance.describe() if performance is not None else "Alto"
+        perf = self._render(game.menu_font, f"Desempenho: {perf_txt}", True, perf_color)
+        res_rect = res.get_rect(center=(WIDTH // 2, 270))
+        disp_rect = disp.get_rect(center=(WIDTH // 2, 330))
+        vis_rect = vis.get_rect(center=(WIDTH // 2, 390))
+        perf_rect = perf.get_rect(center=(WIDTH // 2, 450))
+        if getattr(game, "video_selected", 0) == 0:
+            pygame.draw.rect(game.screen, DARK_BLUE, res_rect.inflate(20, 10))
+        elif getattr(game, "video_selected", 0) == 1:
+            pygame.draw.rect(game.screen, DARK_BLUE, disp_rect.inflate(20, 10))
+        elif getattr(game, "video_selected", 0) == 2:
+            pygame.draw.rect(game.screen, DARK_BLUE, vis_rect.inflate(20, 10))
+        else:
+            pygame.draw.rect(game.screen, DARK_BLUE, perf_rect.inflate(20, 10))
+        game.screen.blit(res, res_rect)
+        game.screen.blit(disp, disp_rect)
+        game.screen.blit(vis, vis_rect)
+        game.screen.blit(perf, perf_rect)
+        button_names = self.get_button_names(game)
+        if button_names:
+            btn_a, btn_b = button_names
+            instr_msg = f"↑↓ escolher  [{btn_a}] alterar  [{btn_b}] voltar"
+        else:
+            instr_msg = "↑↓ escolher  Enter: alterar  ESC: voltar"
+        inst = self._render(game.menu_small_font, instr_msg, True, LIGHT_GRAY)
+        game.screen.blit(inst, inst.get_rect(center=(WIDTH // 2, HEIGHT - 50)))
 
-        elif game.state == GameState.CONFIRM_NEW_GAME:
-            self.draw_ocean_background(game.screen)
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            game.screen.blit(overlay, (0, 0))
-            
-            box_w = 700
-            box_h = 240
-            box = pygame.Rect(0, 0, box_w, box_h)
-            box.center = (WIDTH // 2, HEIGHT // 2)
-            
+    def _draw_options_accessibility(self):
+        game = self.game
+        self.draw_ocean_background(game.screen)
+        title = self._render(game.menu_big_font, "Acessibilidade", True, YELLOW)
+        game.screen.blit(title, title.get_rect(center=(WIDTH // 2, 160)))
+        # Opções
+        cb_modes = {
+            "none": "Nenhum",
+            "deuteranopia": "Deuteranopia",
+            "protanopia": "Protanopia",
+            "tritanopia": "Tritanopia",
+        }
+        sel = getattr(game, "access_selected", 0)
+        label_cb = self._render(
+            game.menu_font,
+            f"Modo daltônico: {cb_modes.get(getattr(game, 'colorblind_mode', 'none'), 'Nenhum')}",
+            True,
+            YELLOW if sel == 0 else WHITE,
+        )
+        vib_txt = "Ativado" if getattr(game, "vibration_enabled", False) else "Desativado"
+        label_vib = self._render(
+            game.menu_font,
+            f"Vibração: {vib_txt}",
+            True,
+            YELLOW if sel == 1 else WHITE,
+        )
+        game.screen.blit(label_cb, label_cb.get_rect(center=(WIDTH // 2, 280)))
+        game.screen.blit(label_vib, label_vib.get_rect(center=(WIDTH // 2, 340)))
+        button_names = self.get_button_names(game)
+        if button_names:
+            btn_a, btn_b = button_names
+            instr_msg = f"↑↓ escolher  ←→ ajustar  [{btn_b}] voltar"
+        else:
+            instr_msg = "↑↓ escolher  ←→ ajustar  ESC: voltar"
+        inst = self._render(game.menu_small_font, instr_msg, True, LIGHT_GRAY)
+        game.screen.blit(inst, inst.get_rect(center=(WIDTH // 2, HEIGHT - 50)))
+
+    def _draw_options_controls(self):
+        game = self.game
+        self.draw_ocean_background(game.screen)
+        title = self._render(game.menu_big_font, "Botões/Teclas", True, YELLOW)
+        game.screen.blit(title, title.get_rect(center=(WIDTH // 2, 140)))
+        start_y = 240
+        for i, (label, action) in enumerate(game.controls_actions):
+            keys = game.controls.get(action, [])
             try:
-                # Sombra mais suave
-                shadow = pygame.Surface((box_w + 24, box_h + 24), pygame.SRCALPHA)
-                shadow.fill((0, 0, 0, 0))
-                pygame.draw.rect(shadow, (0, 0, 0, 120), shadow.get_rect(), border_radius=18)
-                game.screen.blit(shadow, (box.left - 12, box.top - 12))
-                
-                # Fundo da caixa
-                pygame.draw.rect(game.screen, DARK_BLUE, box, border_radius=16)
-                
-                # Borda externa dourada
-                pygame.draw.rect(game.screen, GOLD, box.inflate(6, 6), 3, border_radius=18)
-                
-                # Cabeçalho
-                header = pygame.Rect(box.left, box.top, box.width, 50)
-                pygame.draw.rect(game.screen, BLUE, header, border_radius=16)
-                pygame.draw.rect(game.screen, (0, 0, 0, 0), pygame.Rect(box.left, header.bottom - 16, box.width, 16))
-                pygame.draw.rect(game.screen, BLUE, pygame.Rect(box.left, header.bottom - 16, box.width, 16))
-                pygame.draw.line(game.screen, GOLD, (box.left + 16, header.bottom - 3), (box.right - 16, header.bottom - 3), 3)
+                key_names = [pygame.key.name(k) for k in keys]
             except Exception:
-                pygame.draw.rect(game.screen, DARK_BLUE, box)
-                pygame.draw.rect(game.screen, BLUE, box, 3)
-            
-            # Título no cabeçalho
-            title = game.menu_font.render("Novo Jogo", True, YELLOW)
-            title_rect = title.get_rect(center=(WIDTH // 2, box.top + 25))
-            game.screen.blit(title, title_rect)
-            
-            # Mensagens
-            msg1 = game.menu_small_font.render("O jogo salvo será apagado.", True, WHITE)
-            msg2 = game.menu_small_font.render("Deseja continuar?", True, WHITE)
-            game.screen.blit(msg1, msg1.get_rect(center=(WIDTH // 2, box.centery + 10)))
-            game.screen.blit(msg2, msg2.get_rect(center=(WIDTH // 2, box.centery + 38)))
-            
-            # Instruções
-            button_names = self.get_button_names(game, button_a=0, button_b=1)
+                key_names = [str(k) for k in keys]
+            js_btn = game.joystick_controls.get(action)
+            js_txt = f" (Joy: {js_btn})" if js_btn is not None else ""
+            display = ", ".join(key_names) if key_names else "(nenhum)"
+            color = YELLOW if i == game.controls_selected else WHITE
+            text = self._render(game.menu_font, f"{label}: {display}{js_txt}", True, color)
+            rect = text.get_rect(center=(WIDTH // 2, start_y + i * 50))
+            if i == game.controls_selected:
+                pygame.draw.rect(game.screen, DARK_BLUE, rect.inflate(24, 14))
+            game.screen.blit(text, rect)
+        button_names = self.get_button_names(game)
+        if game.controls_editing:
             if button_names:
                 btn_a, btn_b = button_names
-                instr = f"[{btn_a}] Continuar  [{btn_b}] Voltar"
+                prompt_msg = f"Pressione a nova tecla ou botão... [{btn_b}] cancela"
             else:
-                instr = "Enter: Continuar  ESC: Voltar"
-            inst = game.menu_small_font.render(instr, True, LIGHT_GRAY)
-            game.screen.blit(inst, inst.get_rect(center=(WIDTH // 2, box.bottom - 30)))
-
-        elif game.state == GameState.CONFIRM_EXIT_TO_MENU:
-            self.draw_ocean_background(game.screen)
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            game.screen.blit(overlay, (0, 0))
-            
-            box_w = 760
-            box_h = 240
-            box = pygame.Rect(0, 0, box_w, box_h)
-            box.center = (WIDTH // 2, HEIGHT // 2)
-            
-            try:
-                # Sombra mais suave
-                shadow = pygame.Surface((box_w + 24, box_h + 24), pygame.SRCALPHA)
-                shadow.fill((0, 0, 0, 0))
-                pygame.draw.rect(shadow, (0, 0, 0, 120), shadow.get_rect(), border_radius=18)
-                game.screen.blit(shadow, (box.left - 12, box.top - 12))
-                
-                # Fundo da caixa
-                pygame.draw.rect(game.screen, DARK_BLUE, box, border_radius=16)
-                
-                # Borda externa vermelha para indicar ação destrutiva
-                pygame.draw.rect(game.screen, (200, 50, 50), box.inflate(6, 6), 3, border_radius=18)
-                
-                # Cabeçalho
-                header = pygame.Rect(box.left, box.top, box.width, 50)
-                pygame.draw.rect(game.screen, (150, 40, 40), header, border_radius=16)
-                pygame.draw.rect(game.screen, (0, 0, 0, 0), pygame.Rect(box.left, header.bottom - 16, box.width, 16))
-                pygame.draw.rect(game.screen, (150, 40, 40), pygame.Rect(box.left, header.bottom - 16, box.width, 16))
-                pygame.draw.line(game.screen, (200, 50, 50), (box.left + 16, header.bottom - 3), (box.right - 16, header.bottom - 3), 3)
-            except Exception:
-                pygame.draw.rect(game.screen, DARK_BLUE, box)
-                pygame.draw.rect(game.screen, (200, 50, 50), box, 3)
-            
-            # Título no cabeçalho
-            title = game.menu_font.render("Sair para o Menu", True, YELLOW)
-            title_rect = title.get_rect(center=(WIDTH // 2, box.top + 25))
-            game.screen.blit(title, title_rect)
-            
-            # Mensagens
-            msg1 = game.menu_small_font.render("Você perderá o progresso da fase atual.", True, WHITE)
-            msg2 = game.menu_small_font.render("Deseja continuar?", True, WHITE)
-            game.screen.blit(msg1, msg1.get_rect(center=(WIDTH // 2, box.centery + 10)))
-            game.screen.blit(msg2, msg2.get_rect(center=(WIDTH // 2, box.centery + 38)))
-            
-            # Instruções
-            button_names = self.get_button_names(game, button_a=0, button_b=1)
+                prompt_msg = "Pressione a nova tecla ou botão... ESC cancela"
+            prompt = self._render(
+                game.menu_small_font,
+                prompt_msg,
+                True,
+                LIGHT_GRAY,
+            )
+        else:
             if button_names:
                 btn_a, btn_b = button_names
-                instr = f"[{btn_a}] Sair  [{btn_b}] Voltar"
+                prompt_msg = f"↑↓ escolher  [{btn_a}] editar  [{btn_b}] voltar"
             else:
-                instr = "Enter: Sair  ESC: Voltar"
-            inst = game.menu_small_font.render(instr, True, LIGHT_GRAY)
-            game.screen.blit(inst, inst.get_rect(center=(WIDTH // 2, box.bottom - 30)))
+                prompt_msg = "↑↓ escolher  Enter: editar  ESC: voltar"
+            prompt = self._render(
+                game.menu_small_font,
+                prompt_msg,
+                True,
+                LIGHT_GRAY,
+            )
+        game.screen.blit(prompt, prompt.get_rect(center=(WIDTH // 2, HEIGHT - 50)))
 
-        elif game.state == GameState.DEMO_END_MESSAGE:
-            self.draw_ocean_background(game.screen)
+    def _modal_overlay(self, alpha):
+        """Véu preto translúcido de tela cheia, criado uma vez por opacidade."""
+        overlay = self._modal_overlays.get(alpha)
+        if overlay is None:
             overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            game.screen.blit(overlay, (0, 0))
-            
-            box_w = 850
-            box_h = 320
-            box = pygame.Rect(0, 0, box_w, box_h)
-            box.center = (WIDTH // 2, HEIGHT // 2)
-            
-            try:
-                # Sombra mais suave
-                shadow = pygame.Surface((box_w + 24, box_h + 24), pygame.SRCALPHA)
-                shadow.fill((0, 0, 0, 0))
-                pygame.draw.rect(shadow, (0, 0, 0, 120), shadow.get_rect(), border_radius=18)
-                game.screen.blit(shadow, (box.left - 12, box.top - 12))
-                
-                # Fundo da caixa
-                pygame.draw.rect(game.screen, DARK_BLUE, box, border_radius=16)
-                
-                # Borda externa dourada
-                pygame.draw.rect(game.screen, GOLD, box.inflate(6, 6), 3, border_radius=18)
-                
-                # Cabeçalho
-                header = pygame.Rect(box.left, box.top, box.width, 50)
-                pygame.draw.rect(game.screen, BLUE, header, border_radius=16)
-                pygame.draw.rect(game.screen, (0, 0, 0, 0), pygame.Rect(box.left, header.bottom - 16, box.width, 16))
-                pygame.draw.rect(game.screen, BLUE, pygame.Rect(box.left, header.bottom - 16, box.width, 16))
-                pygame.draw.line(game.screen, GOLD, (box.left + 16, header.bottom - 3), (box.right - 16, header.bottom - 3), 3)
-            except Exception:
-                pygame.draw.rect(game.screen, DARK_BLUE, box)
-                pygame.draw.rect(game.screen, BLUE, box, 3)
-            
-            # Título no cabeçalho
-            title = game.menu_font.render("Versão Demo", True, YELLOW)
-            title_rect = title.get_rect(center=(WIDTH // 2, box.top + 25))
-            game.screen.blit(title, title_rect)
-            
-            # Mensagens (texto em múltiplas linhas)
-            from internal.utils.edition import GameEdition
-            demo_message = GameEdition.get_demo_message()
-            lines = demo_message.split('\n')
-            y_offset = box.centery - 30
-            for line in lines:
-                if line.strip():
-                    text = game.menu_small_font.render(line.strip(), True, WHITE)
-                    game.screen.blit(text, text.get_rect(center=(WIDTH // 2, y_offset)))
-                y_offset += 30
-            
-            # Instruções
-            button_names = self.get_button_names(game, button_a=0, button_b=1)
-            if button_names:
-                btn_a, _ = button_names
-                instr = f"[{btn_a}] Voltar ao Menu"
-            else:
-                instr = "Enter: Voltar ao Menu"
-            inst = game.menu_small_font.render(instr, True, LIGHT_GRAY)
-            game.screen.blit(inst, inst.get_rect(center=(WIDTH // 2, box.bottom - 30)))
+            overlay.fill((0, 0, 0, alpha))
+            self._modal_overlays[alpha] = overlay
+        return overlay
 
-        # Overlay de esmaecimento durante hold (fade progressivo)
-        if getattr(game, "hold_active", False):
-            try:
-                overlay = pygame.Surface((WIDTH, HEIGHT))
-                overlay.fill(BLACK)
-                total = max(1, getattr(game, "hold_total_frames", 1))
-                elapsed = total - max(0, game.hold_frames_left)
-                progress = min(1.0, max(0.0, elapsed / float(total)))
-                target_alpha = 0.6 if game.hold_type == "level_end" else 0.4
-                overlay.set_alpha(int(255 * target_alpha * progress))
-                game.screen.blit(overlay, (0, 0))
-            except Exception:
-                pass
+    def _blit_modal(self, name, key, build):
+        """Desenha o painel ``name`` pré-composto; ``build()`` só roda se ``key`` mudar.
 
-        Screen.present(game)
+        ``build`` devolve ``(superfície, posição)``. Cada modal guarda só a
+        última composição (seleção, botões e fontes fazem parte da chave).
+        """
+        cached = self._modal_panels.get(name)
+        if cached is None or cached[0] != key:
+            surface, pos = build()
+            cached = (key, surface, pos)
+            self._modal_panels[name] = cached
+        self.game.screen.blit(cached[1], cached[2])
+
+    def _compose_dialog(self, box_w, box_h, border, header_color, title, lines, instr):
+        """Caixa de diálogo (sombra, borda, cabeçalho e textos) em uma superfície.
+
+        ``lines`` traz ``(texto, y)`` com y relativo ao centro da caixa.
+        Retorna ``(superfície, posição na tela)``.
+        """
+        game = self.game
+        box = pygame.Rect(0, 0, box_w, box_h)
+        box.center = (WIDTH // 2, HEIGHT // 2)
+        origin = (box.left - 12, box.top - 12)
+        surface = pygame.Surface((box_w + 24, box_h + 24), pygame.SRCALPHA)
+        local = pygame.Rect(12, 12, box_w, box_h)
+        center_x = local.centerx
+
+        try:
+            # Sombra mais suave
+            pygame.draw.rect(surface, (0, 0, 0, 120), surface.get_rect(), border_radius=18)
+
+            # Fundo da caixa
+            pygame.draw.rect(surface, DARK_BLUE, local, border_radius=16)
+
+            # Borda externa
+            pygame.draw.rect(surface, border, local.inflate(6, 6), 3, border_radius=18)
+
+            # Cabeçalho
+            header = pygame.Rect(local.left, local.top, local.width, 50)
+            pygame.draw.rect(surface, header_color, header, border_radius=16)
+            pygame.draw.rect(surface, header_color, pygame.Rect(local.left, header.bottom - 16, local.width, 16))
+            pygame.draw.line(surface, border, (local.left + 16, header.bottom - 3), (local.right - 16, header.bottom - 3), 3)
+        except Exception:
+            pygame.draw.rect(surface, DARK_BLUE, local)
+            pygame.draw.rect(surface, border, local, 3)
+
+        # Título no cabeçalho
+        text = self._render(game.menu_font, title, True, YELLOW)
+        surface.blit(text, text.get_rect(center=(center_x, local.top + 25)))
+
+        # Mensagens
+        for line, dy in lines:
+            text = self._render(game.menu_small_font, line, True, WHITE)
+            surface.blit(text, text.get_rect(center=(center_x, local.centery + dy)))
+
+        # Instruções
+        text = self._render(game.menu_small_font, instr, True, LIGHT_GRAY)
+        surface.blit(text, text.get_rect(center=(center_x, local.bottom - 30)))
+        return surface, origin
+
+    def _dialog_key(self, instr):
+        game = self.game
+        return (instr, id(game.menu_font), id(game.menu_small_font))
+
+    def _draw_confirm_new_game(self):
+        game = self.game
+        self.draw_ocean_background(game.screen)
+        game.screen.blit(self._modal_overlay(180), (0, 0))
+
+        # Instruções
+        button_names = self.get_button_names(game, button_a=0, button_b=1)
+        if button_names:
+            btn_a, btn_b = button_names
+            instr = f"[{btn_a}] Continuar  [{btn_b}] Voltar"
+        else:
+            instr = "Enter: Continuar  ESC: Voltar"
+        self._blit_modal(
+            "confirm_new_game",
+            self._dialog_key(instr),
+            lambda: self._compose_dialog(
+                700,
+                240,
+                GOLD,
+                BLUE,
+                "Novo Jogo",
+                [("O jogo salvo será apagado.", 10), ("Deseja continuar?", 38)],
+                instr,
+            ),
+        )
+
+    def _draw_confirm_exit_to_menu(self):
+        game = self.game
+        self.draw_ocean_background(game.screen)
+        game.screen.blit(self._modal_overlay(180), (0, 0))
+
+        # Instruções
+        button_names = self.get_button_names(game, button_a=0, button_b=1)
+        if button_names:
+            btn_a, btn_b = button_names
+            instr = f"[{btn_a}] Sair  [{btn_b}] Voltar"
+        else:
+            instr = "Enter: Sair  ESC: Voltar"
+        # Borda e cabeçalho vermelhos indicam ação destrutiva
+        self._blit_modal(
+            "confirm_exit_to_menu",
+            self._dialog_key(instr),
+            lambda: self._compose_dialog(
+                760,
+                240,
+                (200, 50, 50),
+                (150, 40, 40),
+                "Sair para o Menu",
+                [("Você perderá o progresso da fase atual.", 10), ("Deseja continuar?", 38)],
+                instr,
+            ),
+        )
+
+    def _draw_demo_end_message(self):
+        game = self.game
+        self.draw_ocean_background(game.screen)
+        game.screen.blit(self._modal_overlay(180), (0, 0))
+
+        # Mensagens (texto em múltiplas linhas)
+        from internal.utils.edition import GameEdition
+        demo_message = GameEdition.get_demo_message()
+        lines = []
+        y_offset = -30
+        for line in demo_message.split('\n'):
+            if line.strip():
+                lines.append((line.strip(), y_offset))
+            y_offset += 30
+
+        # Instruções
+        button_names = self.get_button_names(game, button_a=0, button_b=1)
+        if button_names:
+            btn_a, _ = button_names
+            instr = f"[{btn_a}] Voltar ao Menu"
+        else:
+            instr = "Enter: Voltar ao Menu"
+        self._blit_modal(
+            "demo_end_message",
+            self._dialog_key(instr) + (demo_message,),
+            lambda: self._compose_dialog(850, 320, GOLD, BLUE, "Versão Demo", lines, instr),
+        )
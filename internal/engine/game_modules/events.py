@@ -1,5 +1,7 @@
 import pygame
 from internal.engine.state import GameState
+from internal.engine.state_dispatch import StateDispatch, apply_event_filter
+from internal.engine.input_state import input_for
 from internal.engine.difficulty import Difficulty
 from internal.engine.level.level import Level
 
@@ -11,10 +13,67 @@ PAUSE_BUTTONS = [6, 7, 8, 9]
 class Events:
     def __init__(self, game):
         self.game = game
+        # Estado cujo filtro de eventos está aplicado na fila do pygame
+        self._filtered_state = None
+        # KEYDOWN por estado; teclas globais (nome, ranking, ESC) vêm depois
+        self._keydown = StateDispatch("keydown")
+        for state, handler in (
+            (GameState.SPLASH, self._key_splash),
+            (GameState.TITLE_SCREEN, self._key_title_screen),
+            (GameState.OPENING_VIDEO, self._key_opening_video),
+            (GameState.MAIN_MENU, self._key_main_menu),
+            (GameState.SELECT_DIFFICULTY, self._key_select_difficulty),
+            (GameState.FIM_SCREEN, self._key_fim_screen),
+            (GameState.PLAYING, self._key_playing),
+            (GameState.PAUSED, self._key_paused),
+            (GameState.OPTIONS_MENU, self._key_options_menu),
+            (GameState.OPTIONS_AUDIO, self._key_options_audio),
+            (GameState.OPTIONS_VIDEO, self._key_options_video),
+            (GameState.OPTIONS_ACCESSIBILITY, self._key_options_accessibility),
+            (GameState.OPTIONS_CONTROLS, self._key_options_controls),
+            (GameState.CONFIRM_NEW_GAME, self._key_confirm_new_game),
+            (GameState.CONFIRM_EXIT_TO_MENU, self._key_confirm_exit_to_menu),
+            (GameState.DEMO_END_MESSAGE, self._key_demo_end_message),
+            (GameState.CREDITS, self._key_credits),
+            (GameState.RECORDS, self._key_records),
+            (GameState.GAME_OVER, self._key_game_over),
+        ):
+            self._keydown.register(state, handler)
+        # JOYBUTTONDOWN por estado; estados sem handler usam os botões genéricos
+        self._joybutton = StateDispatch("joybutton")
+        for state, handler in (
+            (GameState.SPLASH, self._button_splash),
+            (GameState.TITLE_SCREEN, self._button_title_screen),
+            (GameState.OPENING_VIDEO, self._button_opening_video),
+            (GameState.MAIN_MENU, self._button_main_menu),
+            (GameState.PLAYING, self._button_playing),
+            (GameState.PAUSED, self._button_paused),
+            (GameState.OPTIONS_MENU, self._button_options_menu),
+            (GameState.OPTIONS_AUDIO, self._button_options_audio),
+            (GameState.OPTIONS_VIDEO, self._button_options_video),
+            (GameState.OPTIONS_CONTROLS, self._button_options_controls),
+            (GameState.OPTIONS_ACCESSIBILITY, self._button_options_accessibility),
+            (GameState.CONFIRM_NEW_GAME, self._button_confirm_new_game),
+            (GameState.DEMO_END_MESSAGE, self._button_demo_end_message),
+            (GameState.CONFIRM_EXIT_TO_MENU, self._button_confirm_exit_to_menu),
+            (GameState.SELECT_DIFFICULTY, self._button_select_difficulty),
+            (GameState.FIM_SCREEN, self._button_fim_screen),
+            (GameState.CREDITS, self._button_credits),
+            (GameState.RECORDS, self._button_records),
+            (GameState.SHOW_RANKING, self._button_show_ranking),
+            (GameState.GAME_OVER, self._button_game_over),
+        ):
+            self._joybutton.register(state, handler)
 
     def handle_events(self):
         game = self.game
         env = getattr(game, "env_config", {})
+        if game.state != self._filtered_state:
+            try:
+                apply_event_filter(game.state)
+            except Exception:
+                pass
+            self._filtered_state = game.state
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
@@ -27,508 +86,9 @@ class Events:
                 token = game._map_key_to_cheat_token(event.key, uni)
                 game._process_cheat_token(token)  # Cheat de 99 vidas
                 game._process_powerups_cheat_token(token)  # Cheat de power-ups
-                if game.state == GameState.SPLASH:
-                    if env.get("environment", "production") == "development":
-                        game.state = GameState.TITLE_SCREEN
-                elif game.state == GameState.TITLE_SCREEN:
-                    game.state = GameState.OPENING_VIDEO
-                    if game.video_player.load_video("videos/opening.mp4"):
-                        game.video_player.start_playback()
-                    else:
-                        game.state = GameState.MAIN_MENU
-                        if not game.music_started:
-                            game.music.play_menu_music(game)
-                            game.music_started = True
-                elif game.state == GameState.OPENING_VIDEO:
-                    pass
-                elif game.state == GameState.MAIN_MENU:
-                    if event.key == pygame.K_UP:
-                        game.menu_selected = (game.menu_selected - 1) % len(
-                            game.menu_options
-                        )
-                    elif event.key == pygame.K_DOWN:
-                        game.menu_selected = (game.menu_selected + 1) % len(
-                            game.menu_options
-                        )
-                    elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                        game.handle_menu_selection()
-                elif game.state == GameState.SELECT_DIFFICULTY:
-                    if event.key == pygame.K_UP:
-                        game.difficulty_selected = (
-                            (game.difficulty_selected - 1)
-                            % len(game.difficulty_options)
-                        )
-                    elif event.key == pygame.K_DOWN:
-                        game.difficulty_selected = (
-                            (game.difficulty_selected + 1)
-                            % len(game.difficulty_options)
-                        )
-                    elif event.key == pygame.K_ESCAPE:
-                        game.state = GameState.MAIN_MENU
-                    elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                        if game.difficulty_selected == 0:
-                            game.difficulty = Difficulty.EASY
-                        elif game.difficulty_selected == 2:
-                            game.difficulty = Difficulty.HARD
-                        else:
-                            game.difficulty = Difficulty.NORMAL
-                        (
-                            game.extra_life_milestones,
-                            game.extra_life_increment_after_milestones,
-                        ) = game.get_extra_life_milestones_and_increment()
-                        game.next_extra_life_score = (
-                            game.extra_life_milestones[0]
-                        )
-                        game.extra_lives_earned = 0
-                        if (
-                            env.get("environment") == "development"
-                            and "initial-stage" in env
-                        ):
-                            try:
-                                game.current_level = int(env["initial-stage"])
-                                if (
-                                    game.current_level < 1
-                                    or game.current_level > 50
-                                ):
-                                    game.current_level = 1
-                            except (ValueError, TypeError):
-                                game.current_level = 1
-                        else:
-                            game.current_level = 1
-                        game.score = 0
-                        game.platforms_jumped.clear()
-                        game.birds_dodged.clear()
-                        game.player_name = ""
-                        game.max_lives = game.get_initial_lives()
-                        game.lives = game.max_lives
-                        if hasattr(game, "collected_extra_life_levels"):
-                            game.collected_extra_life_levels.clear()
-                        game.state = GameState.PLAYING
-                        Level.init_level(game)
-                        game.music.play_level_music(game, game.current_level)
-                elif game.state == GameState.FIM_SCREEN:
-                    game.state = GameState.CREDITS
-                    game.credits_type = "ending"
-                    game.music.play_music("credits")
-                elif game.state == GameState.PLAYING and (
-                    event.key in getattr(game, "controls", {}).get("pause", [pygame.K_ESCAPE])
-                ):
-                    game.state = GameState.PAUSED
-                    game.pause_selected = 0
-                    return True
-                elif game.state == GameState.PAUSED:
-                    # Cheat já está sendo processado no início do KEYDOWN handler (linha 26)
-                    # Não processar novamente aqui para evitar duplicação
-                    if event.key == pygame.K_UP:
-                        game.pause_selected = (game.pause_selected - 1) % len(game.pause_menu_options)
-                    elif event.key == pygame.K_DOWN:
-                        game.pause_selected = (game.pause_selected + 1) % len(game.pause_menu_options)
-                    elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                        sel = game.pause_menu_options[game.pause_selected]
-                        if sel == "Continuar":
-                            game.state = GameState.PLAYING
-                        elif sel == "Botões/Teclas":
-                            game.options_selected = 0
-                            game.previous_state_before_options = GameState.PAUSED
-                            game.state = GameState.OPTIONS_CONTROLS
-                        elif sel == "Áudio":
-                            game.audio_selected = 0
-                            game.previous_state_before_options = GameState.PAUSED
-                            game.state = GameState.OPTIONS_AUDIO
-                        elif sel == "Vídeo":
-                            game.video_selected = 0
-                            game.previous_state_before_options = GameState.PAUSED
-                            game.state = GameState.OPTIONS_VIDEO
-                        elif sel == "Acessibilidade":
-                            game.access_selected = 0
-                            game.previous_state_before_options = GameState.PAUSED
-                            game.state = GameState.OPTIONS_ACCESSIBILITY
-                        elif sel == "Sair":
-                            game.confirm_dialog_type = "exit_to_menu"
-                            game.confirm_selected = 0
-                            game.state = GameState.CONFIRM_EXIT_TO_MENU
-                    elif event.key == pygame.K_ESCAPE:
-                        # ESC também continua
-                        game.state = GameState.PLAYING
-                        return True
-                elif game.state == GameState.OPTIONS_MENU:
-                    if event.key == pygame.K_UP:
-                        game.options_selected = (game.options_selected - 1) % 5
-                    elif event.key == pygame.K_DOWN:
-                        game.options_selected = (game.options_selected + 1) % 5
-                    elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                        game.pause_selected = None
-                        if game.options_selected == 0:
-                            game.previous_state_before_options = GameState.OPTIONS_MENU
-                            game.state = GameState.OPTIONS_CONTROLS
-                        elif game.options_selected == 1:
-                            game.audio_selected = 0
-                            game.previous_state_before_options = GameState.OPTIONS_MENU
-                            game.state = GameState.OPTIONS_AUDIO
-                        elif game.options_selected == 2:
-                            game.video_selected = 0
-                            game.previous_state_before_options = GameState.OPTIONS_MENU
-                            game.state = GameState.OPTIONS_VIDEO
-                        elif game.options_selected == 3:
-                            game.access_selected = 0
-                            game.previous_state_before_options = GameState.OPTIONS_MENU
-                            game.state = GameState.OPTIONS_ACCESSIBILITY
-                        elif game.options_selected == 4:
-                            game.state = GameState.MAIN_MENU
-                    elif event.key == pygame.K_ESCAPE:
-                        game.state = GameState.MAIN_MENU
-                        return True
-                elif game.state == GameState.OPTIONS_AUDIO:
-                    if event.key == pygame.K_UP:
-                        game.audio_selected = (game.audio_selected - 1) % 2
-                    elif event.key == pygame.K_DOWN:
-                        game.audio_selected = (game.audio_selected + 1) % 2
-                    elif event.key == pygame.K_LEFT:
-                        if game.audio_selected == 0:
-                            game.music_volume = max(0.0, game.music_volume - 0.1)
-                            try:
-                                import pygame as _pg
-                                _pg.mixer.music.set_volume(game.music_volume)
-                            except Exception:
-                                pass
-                        else:
-                            game.sound_effects.sound_volume = max(0.0, game.sound_effects.sound_volume - 0.1)
-                            try:
-                                for s in game.sound_effects.sound_effects.values():
-                                    s.set_volume(game.sound_effects.sound_volume)
-                            except Exception:
-                                pass
-                        try:
-                            game._save_settings()
-                        except Exception:
-                            pass
-                    elif event.key == pygame.K_RIGHT:
-                        if game.audio_selected == 0:
-                            game.music_volume = min(1.0, game.music_volume + 0.1)
-                            try:
-                                import pygame as _pg
-                                _pg.mixer.music.set_volume(game.music_volume)
-                            except Exception:
-                                pass
-                        else:
-                            game.sound_effects.sound_volume = min(1.0, game.sound_effects.sound_volume + 0.1)
-                            try:
-                                for s in game.sound_effects.sound_effects.values():
-                                    s.set_volume(game.sound_effects.sound_volume)
-                            except Exception:
-                                pass
-                        try:
-                            game._save_settings()
-                        except Exception:
-                            pass
-                    elif event.key == pygame.K_r:
-                        game.music_volume = 0.7
-                        game.sound_effects.sound_volume = 0.8
-                        try:
-                            import pygame as _pg
-                            _pg.mixer.music.set_volume(game.music_volume)
-                            for s in game.sound_effects.sound_effects.values():
-                                s.set_volume(game.sound_effects.sound_volume)
-                        except Exception:
-                            pass
-                        try:
-                            game._save_settings()
-                        except Exception:
-                            pass
-                    elif event.key == pygame.K_ESCAPE:
-                        if game.previous_state_before_options:
-                            game.state = game.previous_state_before_options
-                            game.previous_state_before_options = None
-                        else:
-                            game.state = GameState.MAIN_MENU
-                        return True
-                elif game.state == GameState.OPTIONS_VIDEO:
-                    if event.key == pygame.K_UP:
-                        game.video_selected = (game.video_selected - 1) % 3
-                    elif event.key == pygame.K_DOWN:
-                        game.video_selected = (game.video_selected + 1) % 3
-                    elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                        if game.video_selected == 1:
-                            try:
-                                game.env_config["fullscreen"] = not game.env_config.get("fullscreen", False)
-                                from internal.engine.screen import Screen as _Screen
-                                _Screen.init(game)
-                            except Exception:
-                                pass
-                            try:
-                                game._save_settings()
-                            except Exception:
-                                pass
-                        elif game.video_selected == 2:
-                            try:
-                                game.visual_mode = "normal" if getattr(game, "visual_mode", "normal") == "8bit" else "8bit"
-                                game._save_settings()
-                            except Exception:
-                                pass
-                    elif event.key == pygame.K_LEFT:
-                        if game.video_selected == 0:
-                            try:
-                                idx = game.window_scales.index(game.env_config.get("window_scale", 1.0))
-                            except Exception:
-                                idx = 0
-                            idx = (idx - 1) % len(game.window_scales)
-                            game.env_config["window_scale"] = game.window_scales[idx]
-                            try:
-                                from internal.engine.screen import Screen as _Screen
-                                _Screen.init(game)
-                            except Exception:
-                                pass
-                        elif game.video_selected == 2:
-                            try:
-                                game.visual_mode = "normal" if getattr(game, "visual_mode", "normal") == "8bit" else "8bit"
-                                game._save_settings()
-                            except Exception:
-                                pass
-                    elif event.key == pygame.K_RIGHT:
-                        if game.video_selected == 0:
-                            try:
-                                idx = game.window_scales.index(game.env_config.get("window_scale", 1.0))
-                            except Exception:
-                                idx = 0
-                            idx = (idx + 1) % len(game.window_scales)
-                            game.env_config["window_scale"] = game.window_scales[idx]
-                            try:
-                                from internal.engine.screen import Screen as _Screen
-                                _Screen.init(game)
-                            except Exception:
-                                pass
-                        elif game.video_selected == 2:
-                            try:
-                                game.visual_mode = "normal" if getattr(game, "visual_mode", "normal") == "8bit" else "8bit"
-                                game._save_settings()
-                            except Exception:
-                                pass
-                    elif event.key == pygame.K_r:
-                        try:
-                            game.env_config["fullscreen"] = False
-                            game.env_config["window_scale"] = 1.0
-                            from internal.engine.screen import Screen as _Screen
-                            _Screen.init(game)
-                        except Exception:
-                            pass
-                        try:
-                            game._save_settings()
-                        except Exception:
-                            pass
-                    elif event.key == pygame.K_ESCAPE:
-                        if game.previous_state_before_options:
-                            game.state = game.previous_state_before_options
-                            game.previous_state_before_options = None
-                        else:
-                            game.state = GameState.MAIN_MENU
-                        return True
-                elif game.state == GameState.OPTIONS_ACCESSIBILITY:
-                    if event.key == pygame.K_UP:
-                        game.access_selected = (getattr(game, "access_selected", 0) - 1) % 2
-                    elif event.key == pygame.K_DOWN:
-                        game.access_selected = (getattr(game, "access_selected", 0) + 1) % 2
-                    elif event.key == pygame.K_LEFT:
-                        if getattr(game, "access_selected", 0) == 0:
-                            try:
-                                modes = ["none", "deuteranopia", "protanopia", "tritanopia"]
-                                idx = modes.index(getattr(game, "colorblind_mode", "none"))
-                            except Exception:
-                                idx = 0
-                            game.colorblind_mode = modes[(idx - 1) % len(modes)]
-                        else:
-                            game.vibration_enabled = not getattr(game, "vibration_enabled", False)
-                        try:
-                            game._save_settings()
-                        except Exception:
-                            pass
-                    elif event.key == pygame.K_RIGHT:
-                        if getattr(game, "access_selected", 0) == 0:
-                            try:
-                                modes = ["none", "deuteranopia", "protanopia", "tritanopia"]
-                                idx = modes.index(getattr(game, "colorblind_mode", "none"))
-                            except Exception:
-                                idx = 0
-                            game.colorblind_mode = modes[(idx + 1) % len(modes)]
-                        else:
-                            game.vibration_enabled = not getattr(game, "vibration_enabled", False)
-                        try:
-                            game._save_settings()
-                        except Exception:
-                            pass
-                    elif event.key == pygame.K_r:
-                        game.colorblind_mode = "none"
-                        game.vibration_enabled = False
-                        try:
-                            game._save_settings()
-                        except Exception:
-                            pass
-                    elif event.key == pygame.K_ESCAPE:
-                        if game.previous_state_before_options:
-                            game.state = game.previous_state_before_options
-                            game.previous_state_before_options = None
-                        else:
-                            game.state = GameState.MAIN_MENU
-                        return True
-                elif game.state == GameState.OPTIONS_CONTROLS:
-                    if getattr(game, "controls_editing", False):
-                        if event.key == pygame.K_ESCAPE:
-                            game.controls_editing = False
-                            return True
-                        else:
-                            label, action = game.controls_actions[game.controls_selected]
-                            try:
-                                game.controls[action] = [event.key]
-                                game._save_settings()
-                            except Exception:
-                                pass
-                            game.controls_editing = False
-                    else:
-                        if event.key == pygame.K_UP:
-                            game.controls_selected = (
-                                (game.controls_selected - 1) % len(game.controls_actions)
-                            )
-                        elif event.key == pygame.K_DOWN:
-                            game.controls_selected = (
-                                (game.controls_selected + 1) % len(game.controls_actions)
-                            )
-                        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                            game.controls_editing = True
-                        elif event.key == pygame.K_r:
-                            try:
-                                game.controls = {
-                                    "left": [pygame.K_LEFT, pygame.K_a],
-                                    "right": [pygame.K_RIGHT, pygame.K_d],
-                                    "jump": [pygame.K_UP, pygame.K_w],
-                                    "shoot": [pygame.K_SPACE],
-                                    "crouch": [pygame.K_DOWN, pygame.K_s],
-                                    "pause": [pygame.K_ESCAPE],
-                                }
-                                game.joystick_controls = {
-                                    "jump": 0,
-                                    "shoot": 1,
-                                    "pause": 7,
-                                }
-                                if getattr(game, "joystick_connected", False):
-                                    name = getattr(game, "joystick_name", "")
-                                    if name:
-                                        game.joystick_profiles[name] = dict(game.joystick_controls)
-                                game._save_settings()
-                            except Exception:
-                                pass
-                        elif event.key == pygame.K_ESCAPE:
-                            if game.previous_state_before_options:
-                                game.state = game.previous_state_before_options
-                                game.previous_state_before_options = None
-                            else:
-                                game.state = GameState.MAIN_MENU
-                            return True
-                elif game.state == GameState.CONFIRM_NEW_GAME:
-                    if event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                        # Confirmar: apagar autosave e ir para novo jogo
-                        try:
-                            game._clear_autosave()
-                        except Exception:
-                            pass
-                        game.current_level = 1
-                        game.score = 0
-                        game.platforms_jumped.clear()
-                        game.birds_dodged.clear()
-                        game.lives = game.max_lives
-                        game.player_name = ""
-                        game.state = GameState.SELECT_DIFFICULTY
-                    elif event.key == pygame.K_ESCAPE:
-                        game.state = GameState.MAIN_MENU
-                        return True
-                elif game.state == GameState.CONFIRM_EXIT_TO_MENU:
-                    if event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                        # Confirmar: voltar ao menu principal
-                        game.state = GameState.MAIN_MENU
-                        # Não salva progresso parcial da fase atual
-                    elif event.key == pygame.K_ESCAPE:
-                        game.state = GameState.PAUSED
-                        return True
-                elif game.state == GameState.DEMO_END_MESSAGE:
-                    if event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                        # Voltar ao menu principal
-                        game.state = GameState.MAIN_MENU
-                        # Resetar jogo
-                        game.current_level = 1
-                        game.score = 0
-                        game.lives = game.max_lives
-                        game.platforms_jumped.clear()
-                        game.birds_dodged.clear()
-                        try:
-                            game._clear_autosave()
-                        except Exception:
-                            pass
-                        return True
-                elif game.state == GameState.CREDITS:
-                    if (
-                        game.credits_type == "menu"
-                        and (
-                            event.key == pygame.K_ESCAPE
-                            or event.key == pygame.K_RETURN
-                        )
-                    ):
-                        game.state = GameState.MAIN_MENU
-                        return True
-                elif game.state == GameState.RECORDS:
-                    if event.key in (pygame.K_ESCAPE, pygame.K_RETURN):
-                        if game.previous_state_before_records:
-                            game.state = game.previous_state_before_records
-                            game.previous_state_before_records = None
-                        else:
-                            game.state = GameState.MAIN_MENU
-                        return True
-                elif game.state == GameState.GAME_OVER:
-                    if event.key == pygame.K_UP:
-                        game.game_over_selected = (
-                            (game.game_over_selected - 1)
-                            % len(game.game_over_options)
-                        )
-                    elif event.key == pygame.K_DOWN:
-                        game.game_over_selected = (
-                            (game.game_over_selected + 1)
-                            % len(game.game_over_options)
-                        )
-                    elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                        if game.game_over_selected == 0:
-                            if (
-                                env.get("environment") == "development"
-                                and "initial-stage" in env
-                            ):
-                                try:
-                                    game.current_level = int(
-                                        env["initial-stage"]
-                                    )
-                                    if (
-                                        game.current_level < 1
-                                        or game.current_level > 50
-                                    ):
-                                        game.current_level = 1
-                                except (ValueError, TypeError):
-                                    game.current_level = 1
-                            else:
-                                game.current_level = 1
-                            game.score = 0
-                            game.platforms_jumped.clear()
-                            game.birds_dodged.clear()
-                            game.lives = game.max_lives
-                            game.player_name = ""
-                            game.game_over_selected = 0
-                            game.state = GameState.PLAYING
-                            Level.init_level(game)
-                            game.music.play_level_music(
-                                game,
-                                game.current_level,
-                            )
-                        elif game.game_over_selected == 1:
-                            game.previous_state_before_records = (
-                                GameState.GAME_OVER
-                            )
-                            game.state = GameState.RECORDS
-                        elif game.game_over_selected == 2:
-                            return False
+                result = self._keydown.dispatch(game.state, event, env)
+                if result is not None:
+                    return result
                 if game.state == GameState.ENTER_NAME:
                     if event.key == pygame.K_RETURN:
                         if game.player_name.strip():
@@ -629,288 +189,10 @@ class Events:
                     if token:
                         game._process_cheat_token(token)  # Cheat de 99 vidas
                         game._process_powerups_cheat_token(token)  # Cheat de power-ups
-                if game.state == GameState.SPLASH:
-                    if env.get("environment", "production") == "development":
-                        game.state = GameState.TITLE_SCREEN
-                elif game.state == GameState.TITLE_SCREEN:
-                    game.state = GameState.OPENING_VIDEO
-                    if game.video_player.load_video("videos/opening.mp4"):
-                        game.video_player.start_playback()
-                    else:
-                        game.state = GameState.MAIN_MENU
-                        if not game.music_started:
-                            game.music.play_menu_music(game)
-                            game.music_started = True
-                elif game.state == GameState.OPENING_VIDEO:
-                    pass
-                elif game.state == GameState.MAIN_MENU:
-                    if event.button == 0 or event.button in [6, 7, 8, 9]:
-                        game.handle_menu_selection()
-                elif game.state == GameState.PLAYING:
-                    # Verificar se é botão de pause (suporta múltiplos controles)
-                    configured_pause = getattr(game, "joystick_controls", {}).get("pause", 7)
-                    if event.button == configured_pause or event.button in PAUSE_BUTTONS:
-                        # Botão Start/Options pausa
-                        game.state = GameState.PAUSED
-                        game.pause_selected = 0
-                elif game.state == GameState.PAUSED:
-                    # Processar cheat code com botões de joystick durante pause
-                    # Mapear botões para tokens JUMP e SHOOT
-                    if event.button == getattr(game, "joystick_controls", {}).get("jump", 0):
-                        game._process_cheat_token("JUMP")
-                    elif event.button == getattr(game, "joystick_controls", {}).get("shoot", 1):
-                        game._process_cheat_token("SHOOT")
-                    
-                    if event.button == 0:
-                        sel = game.pause_menu_options[game.pause_selected]
-                        if sel == "Continuar":
-                            game.state = GameState.PLAYING
-                        elif sel == "Botões/Teclas":
-                            game.options_selected = 0
-                            game.previous_state_before_options = GameState.PAUSED
-                            game.state = GameState.OPTIONS_CONTROLS
-                        elif sel == "Áudio":
-                            game.audio_selected = 0
-                            game.previous_state_before_options = GameState.PAUSED
-                            game.state = GameState.OPTIONS_AUDIO
-                        elif sel == "Vídeo":
-                            game.video_selected = 0
-                            game.previous_state_before_options = GameState.PAUSED
-                            game.state = GameState.OPTIONS_VIDEO
-                        elif sel == "Acessibilidade":
-                            game.access_selected = 0
-                            game.previous_state_before_options = GameState.PAUSED
-                            game.state = GameState.OPTIONS_ACCESSIBILITY
-                        elif sel == "Sair":
-                            game.confirm_dialog_type = "exit_to_menu"
-                            game.confirm_selected = 0
-                            game.state = GameState.CONFIRM_EXIT_TO_MENU
-                    elif event.button == 1:
-                        game.state = GameState.PLAYING
-                elif game.state == GameState.OPTIONS_MENU:
-                    if event.button == 0:
-                        if game.options_selected == 0:
-                            game.previous_state_before_options = GameState.OPTIONS_MENU
-                            game.state = GameState.OPTIONS_CONTROLS
-                        elif game.options_selected == 1:
-                            game.audio_selected = 0
-                            game.previous_state_before_options = GameState.OPTIONS_MENU
-                            game.state = GameState.OPTIONS_AUDIO
-                        elif game.options_selected == 2:
-                            game.video_selected = 0
-                            game.previous_state_before_options = GameState.OPTIONS_MENU
-                            game.state = GameState.OPTIONS_VIDEO
-                        elif game.options_selected == 3:
-                            game.access_selected = 0
-                            game.previous_state_before_options = GameState.OPTIONS_MENU
-                            game.state = GameState.OPTIONS_ACCESSIBILITY
-                        elif game.options_selected == 4:
-                            game.state = GameState.MAIN_MENU
-                    elif event.button == 1:
-                        game.state = GameState.MAIN_MENU
-                elif game.state == GameState.OPTIONS_AUDIO:
-                    if event.button == 1:
-                        if game.previous_state_before_options:
-                            game.state = game.previous_state_before_options
-                            game.previous_state_before_options = None
-                        else:
-                            game.state = GameState.MAIN_MENU
-                elif game.state == GameState.OPTIONS_VIDEO:
-                    if event.button == 0:
-                        if game.video_selected == 1:
-                            try:
-                                game.env_config["fullscreen"] = not game.env_config.get("fullscreen", False)
-                                from internal.engine.screen import Screen as _Screen
-                                _Screen.init(game)
-                            except Exception:
-                                pass
-                            try:
-                                game._save_settings()
-                            except Exception:
-                                pass
-                        elif game.video_selected == 2:
-                            try:
-                                game.visual_mode = "normal" if getattr(game, "visual_mode", "normal") == "8bit" else "8bit"
-                                game._save_settings()
-                            except Exception:
-                                pass
-                    elif event.button == 1:
-                        if game.previous_state_before_options:
-                            game.state = game.previous_state_before_options
-                            game.previous_state_before_options = None
-                        else:
-                            game.state = GameState.MAIN_MENU
-                elif game.state == GameState.OPTIONS_CONTROLS:
-                    if game.controls_editing:
-                        label, action = game.controls_actions[game.controls_selected]
-                        try:
-                            game.joystick_controls[action] = int(event.button)
-                            game._save_settings()
-                        except Exception:
-                            pass
-                        game.controls_editing = False
-                    elif event.button == 0:
-                        game.controls_editing = True
-                    elif event.button == 1:
-                        if game.previous_state_before_options:
-                            game.state = game.previous_state_before_options
-                            game.previous_state_before_options = None
-                        else:
-                            game.state = GameState.MAIN_MENU
-                elif game.state == GameState.OPTIONS_ACCESSIBILITY:
-                    if event.button == 1:
-                        if game.previous_state_before_options:
-                            game.state = game.previous_state_before_options
-                            game.previous_state_before_options = None
-                        else:
-                            game.state = GameState.MAIN_MENU
-                elif game.state == GameState.CONFIRM_NEW_GAME:
-                    if event.button == 0:
-                        try:
-                            game._clear_autosave()
-                        except Exception:
-                            pass
-                        game.current_level = 1
-                        game.score = 0
-                        game.platforms_jumped.clear()
-                        game.birds_dodged.clear()
-                        game.lives = game.max_lives
-                        game.player_name = ""
-                        game.state = GameState.SELECT_DIFFICULTY
-                    elif event.button == 1:
-                        game.state = GameState.MAIN_MENU
-                elif game.state == GameState.DEMO_END_MESSAGE:
-                    if event.button == 0:
-                        # Voltar ao menu principal
-                        game.state = GameState.MAIN_MENU
-                        # Resetar jogo
-                        game.current_level = 1
-                        game.score = 0
-                        game.lives = game.max_lives
-                        game.platforms_jumped.clear()
-                        game.birds_dodged.clear()
-                        try:
-                            game._clear_autosave()
-                        except Exception:
-                            pass
-                elif game.state == GameState.CONFIRM_EXIT_TO_MENU:
-                    if event.button == 0:
-                        game.state = GameState.MAIN_MENU
-                    elif event.button == 1:
-                        game.state = GameState.PAUSED
-                elif game.state == GameState.SELECT_DIFFICULTY:
-                    if event.button == 0 or event.button in [6, 7, 8, 9]:
-                        if game.difficulty_selected == 0:
-                            game.difficulty = Difficulty.EASY
-                        elif game.difficulty_selected == 2:
-                            game.difficulty = Difficulty.HARD
-                        else:
-                            game.difficulty = Difficulty.NORMAL
-                        (
-                            game.extra_life_milestones,
-                            game.extra_life_increment_after_milestones,
-                        ) = game.get_extra_life_milestones_and_increment()
-                        game.next_extra_life_score = (
-                            game.extra_life_milestones[0]
-                        )
-                        game.extra_lives_earned = 0
-                        if (
-                            env.get("environment") == "development"
-                            and "initial-stage" in env
-                        ):
-                            try:
-                                game.current_level = int(env["initial-stage"])
-                                if (
-                                    game.current_level < 1
-                                    or game.current_level > 50
-                                ):
-                                    game.current_level = 1
-                            except (ValueError, TypeError):
-                                game.current_level = 1
-                        else:
-                            game.current_level = 1
-                        game.score = 0
-                        game.platforms_jumped.clear()
-                        game.birds_dodged.clear()
-                        game.player_name = ""
-                        game.max_lives = game.get_initial_lives()
-                        game.lives = game.max_lives
-                        if hasattr(game, "collected_extra_life_levels"):
-                            game.collected_extra_life_levels.clear()
-                        game.state = GameState.PLAYING
-                        Level.init_level(game)
-                        game.music.play_level_music(game, game.current_level)
-                    elif event.button == 1:
-                        game.state = GameState.MAIN_MENU
-                elif game.state == GameState.FIM_SCREEN:
-                    game.state = GameState.CREDITS
-                    game.credits_type = "ending"
-                    game.music.play_music("credits")
-                elif game.state == GameState.CREDITS:
-                    if game.credits_type == "menu" and (
-                        event.button == 1 or event.button in [6, 7, 8, 9]
-                    ):
-                        game.state = GameState.MAIN_MENU
-                        return True
-                elif game.state == GameState.RECORDS:
-                    if event.button == 1 or event.button in [6, 7, 8, 9]:
-                        if game.previous_state_before_records:
-                            game.state = game.previous_state_before_records
-                            game.previous_state_before_records = None
-                        else:
-                            game.state = GameState.MAIN_MENU
-                elif game.state == GameState.SHOW_RANKING:
-                    if event.button == 1 or event.button in [6, 7, 8, 9]:
-                        if getattr(
-                            game,
-                            "previous_state_before_ranking",
-                            None,
-                        ):
-                            game.state = game.previous_state_before_ranking
-                            game.previous_state_before_ranking = None
-                        else:
-                            game.state = GameState.MAIN_MENU
-                elif game.state == GameState.GAME_OVER:
-                    if event.button == 0 or event.button in [6, 7, 8, 9]:
-                        if game.game_over_selected == 0:
-                            if (
-                                env.get("environment") == "development"
-                                and "initial-stage" in env
-                            ):
-                                try:
-                                    game.current_level = int(
-                                        env["initial-stage"]
-                                    )
-                                    if (
-                                        game.current_level < 1
-                                        or game.current_level > 50
-                                    ):
-                                        game.current_level = 1
-                                except (ValueError, TypeError):
-                                    game.current_level = 1
-                            else:
-                                game.current_level = 1
-                            game.score = 0
-                            game.platforms_jumped.clear()
-                            game.birds_dodged.clear()
-                            game.lives = game.max_lives
-                            game.player_name = ""
-                            game.game_over_selected = 0
-                            if hasattr(game, "collected_extra_life_levels"):
-                                game.collected_extra_life_levels.clear()
-                            game.state = GameState.PLAYING
-                            Level.init_level(game)
-                            game.music.play_level_music(
-                                game,
-                                game.current_level,
-                            )
-                        elif game.game_over_selected == 1:
-                            game.previous_state_before_records = (
-                                GameState.GAME_OVER
-                            )
-                            game.state = GameState.RECORDS
-                        elif game.game_over_selected == 2:
-                            return False
+                if game.state in self._joybutton:
+                    result = self._joybutton.dispatch(game.state, event, env)
+                    if result is not None:
+                        return result
                 elif event.button == 0:
                     keys = pygame.key.get_pressed()
                     keys = list(keys)
@@ -957,22 +239,12 @@ class Events:
                         game.state = GameState.GAME_OVER
 
         if getattr(game, "joystick_connected", False) and getattr(game, "joystick", None):
-            analog_vertical = 0
-            analog_horizontal = 0
-            if game.joystick.get_numaxes() >= 2:
-                analog_vertical = game.joystick.get_axis(1)
-                if abs(analog_vertical) < 0.1:
-                    analog_vertical = 0
-            if game.joystick.get_numaxes() >= 1:
-                analog_horizontal = game.joystick.get_axis(0)
-                if abs(analog_horizontal) < 0.1:
-                    analog_horizontal = 0
-            dpad_vertical = 0
-            dpad_horizontal = 0
-            if game.joystick.get_numaxes() > 7:
-                dpad_vertical = game.joystick.get_axis(7)
-            if game.joystick.get_numaxes() > 6:
-                dpad_horizontal = game.joystick.get_axis(6)
+            # Eixos do snapshot do quadro (zona morta já aplicada)
+            snapshot = input_for(game)
+            analog_vertical = snapshot.axis_y
+            analog_horizontal = snapshot.axis_x
+            dpad_vertical = snapshot.dpad_y
+            dpad_horizontal = snapshot.dpad_x
             analog_up = (
                 analog_vertical < -0.5
                 and game.prev_analog_vertical >= -0.5
@@ -1010,7 +282,7 @@ class Events:
                 elif game.state == GameState.OPTIONS_AUDIO:
                     game.audio_selected = (game.audio_selected - 1) % 2
                 elif game.state == GameState.OPTIONS_VIDEO:
-                    game.video_selected = (game.video_selected - 1) % 3
+                    game.video_selected = (game.video_selected - 1) % 4
                 elif game.state == GameState.OPTIONS_ACCESSIBILITY:
                     game.access_selected = (getattr(game, "access_selected", 0) - 1) % 2
                 elif game.state == GameState.OPTIONS_CONTROLS and not getattr(game, "controls_editing", False):
@@ -1043,7 +315,7 @@ class Events:
                 elif game.state == GameState.OPTIONS_AUDIO:
                     game.audio_selected = (game.audio_selected + 1) % 2
                 elif game.state == GameState.OPTIONS_VIDEO:
-                    game.video_selected = (game.video_selected + 1) % 3
+                    game.video_selected = (game.video_selected + 1) % 4
                 elif game.state == GameState.OPTIONS_ACCESSIBILITY:
                     game.access_selected = (getattr(game, "access_selected", 0) + 1) % 2
                 elif game.state == GameState.OPTIONS_CONTROLS and not getattr(game, "controls_editing", False):
@@ -1106,6 +378,11 @@ class Events:
                             game._save_settings()
                         except Exception:
                             pass
+                    elif game.video_selected == 3:
+                        try:
+                            game.cycle_performance_profile(-1)
+                        except Exception:
+                            pass
                 elif game.state == GameState.OPTIONS_ACCESSIBILITY:
                     if getattr(game, "access_selected", 0) == 0:
                         try:
@@ -1159,6 +436,11 @@ class Events:
                             game._save_settings()
                         except Exception:
                             pass
+                    elif game.video_selected == 3:
+                        try:
+                            game.cycle_performance_profile(1)
+                        except Exception:
+                            pass
                 elif game.state == GameState.OPTIONS_ACCESSIBILITY:
                     if getattr(game, "access_selected", 0) == 0:
                         try:
@@ -1183,3 +465,894 @@ class Events:
             game.prev_dpad_horizontal = dpad_horizontal
 
         return True
+
+    def _key_splash(self, event, env):
+        game = self.game
+        if env.get("environment", "production") == "development":
+            game.state = GameState.TITLE_SCREEN
+
+    def _key_title_screen(self, event, env):
+        game = self.game
+        game.state = GameState.OPENING_VIDEO
+        if game.video_player.load_video("videos/opening.mp4"):
+            game.video_player.start_playback()
+        else:
+            game.state = GameState.MAIN_MENU
+            if not game.music_started:
+                game.music.play_menu_music(game)
+                game.music_started = True
+
+    def _key_opening_video(self, event, env):
+        # Durante o vídeo de abertura a entrada não faz nada
+        pass
+
+    def _key_main_menu(self, event, env):
+        game = self.game
+        if event.key == pygame.K_UP:
+            game.menu_selected = (game.menu_selected - 1) % len(
+                game.menu_options
+            )
+        elif event.key == pygame.K_DOWN:
+            game.menu_selected = (game.menu_selected + 1) % len(
+                game.menu_options
+            )
+        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            game.handle_menu_selection()
+
+    def _key_select_difficulty(self, event, env):
+        game = self.game
+        if event.key == pygame.K_UP:
+            game.difficulty_selected = (
+                (game.difficulty_selected - 1)
+                % len(game.difficulty_options)
+            )
+        elif event.key == pygame.K_DOWN:
+            game.difficulty_selected = (
+                (game.difficulty_selected + 1)
+                % len(game.difficulty_options)
+            )
+        elif event.key == pygame.K_ESCAPE:
+            game.state = GameState.MAIN_MENU
+        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            if game.difficulty_selected == 0:
+                game.difficulty = Difficulty.EASY
+            elif game.difficulty_selected == 2:
+                game.difficulty = Difficulty.HARD
+            else:
+                game.difficulty = Difficulty.NORMAL
+            try:
+                game.ranking_manager.set_board(game.difficulty)
+            except Exception:
+                pass
+            (
+                game.extra_life_milestones,
+                game.extra_life_increment_after_milestones,
+            ) = game.get_extra_life_milestones_and_increment()
+            game.next_extra_life_score = (
+                game.extra_life_milestones[0]
+            )
+            game.extra_lives_earned = 0
+            if (
+                env.get("environment") == "development"
+                and "initial-stage" in env
+            ):
+                try:
+                    game.current_level = int(env["initial-stage"])
+                    if (
+                        game.current_level < 1
+                        or game.current_level > 50
+                    ):
+                        game.current_level = 1
+                except (ValueError, TypeError):
+                    game.current_level = 1
+            else:
+                game.current_level = 1
+            game.score = 0
+            game.platforms_jumped.clear()
+            game.birds_dodged.clear()
+            game.player_name = ""
+            game.max_lives = game.get_initial_lives()
+            game.lives = game.max_lives
+            if hasattr(game, "collected_extra_life_levels"):
+                game.collected_extra_life_levels.clear()
+            game.state = GameState.PLAYING
+            Level.init_level(game)
+            game.music.play_level_music(game, game.current_level)
+
+    def _key_fim_screen(self, event, env):
+        game = self.game
+        game.state = GameState.CREDITS
+        game.credits_type = "ending"
+        game.music.play_music("credits")
+
+    def _key_playing(self, event, env):
+        game = self.game
+        if event.key in getattr(game, "controls", {}).get("pause", [pygame.K_ESCAPE]):
+            game.state = GameState.PAUSED
+            game.pause_selected = 0
+            return True
+
+    def _key_paused(self, event, env):
+        game = self.game
+        # Cheat já está sendo processado no início do KEYDOWN handler (linha 26)
+        # Não processar novamente aqui para evitar duplicação
+        if event.key == pygame.K_UP:
+            game.pause_selected = (game.pause_selected - 1) % len(game.pause_menu_options)
+        elif event.key == pygame.K_DOWN:
+            game.pause_selected = (game.pause_selected + 1) % len(game.pause_menu_options)
+        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            sel = game.pause_menu_options[game.pause_selected]
+            if sel == "Continuar":
+                game.state = GameState.PLAYING
+            elif sel == "Botões/Teclas":
+                game.options_selected = 0
+                game.previous_state_before_options = GameState.PAUSED
+                game.state = GameState.OPTIONS_CONTROLS
+            elif sel == "Áudio":
+                game.audio_selected = 0
+                game.previous_state_before_options = GameState.PAUSED
+                game.state = GameState.OPTIONS_AUDIO
+            elif sel == "Vídeo":
+                game.video_selected = 0
+                game.previous_state_before_options = GameState.PAUSED
+                game.state = GameState.OPTIONS_VIDEO
+            elif sel == "Acessibilidade":
+                game.access_selected = 0
+                game.previous_state_before_options = GameState.PAUSED
+                game.state = GameState.OPTIONS_ACCESSIBILITY
+            elif sel == "Sair":
+                game.confirm_dialog_type = "exit_to_menu"
+                game.confirm_selected = 0
+                game.state = GameState.CONFIRM_EXIT_TO_MENU
+        elif event.key == pygame.K_ESCAPE:
+            # ESC também continua
+            game.state = GameState.PLAYING
+            return True
+
+    def _key_options_menu(self, event, env):
+        game = self.game
+        if event.key == pygame.K_UP:
+            game.options_selected = (game.options_selected - 1) % 5
+        elif event.key == pygame.K_DOWN:
+            game.options_selected = (game.options_selected + 1) % 5
+        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            game.pause_selected = None
+            if game.options_selected == 0:
+                game.previous_state_before_options = GameState.OPTIONS_MENU
+                game.state = GameState.OPTIONS_CONTROLS
+            elif game.options_selected == 1:
+                game.audio_selected = 0
+                game.previous_state_before_options = GameState.OPTIONS_MENU
+                game.state = GameState.OPTIONS_AUDIO
+            elif game.options_selected == 2:
+                game.video_selected = 0
+                game.previous_state_before_options = GameState.OPTIONS_MENU
+                game.state = GameState.OPTIONS_VIDEO
+            elif game.options_selected == 3:
+                game.access_selected = 0
+                game.previous_state_before_options = GameState.OPTIONS_MENU
+                game.state = GameState.OPTIONS_ACCESSIBILITY
+            elif game.options_selected == 4:
+                game.state = GameState.MAIN_MENU
+        elif event.key == pygame.K_ESCAPE:
+            game.state = GameState.MAIN_MENU
+            return True
+
+    def _key_options_audio(self, event, env):
+        game = self.game
+        if event.key == pygame.K_UP:
+            game.audio_selected = (game.audio_selected - 1) % 2
+        elif event.key == pygame.K_DOWN:
+            game.audio_selected = (game.audio_selected + 1) % 2
+        elif event.key == pygame.K_LEFT:
+            if game.audio_selected == 0:
+                game.music_volume = max(0.0, game.music_volume - 0.1)
+                try:
+                    import pygame as _pg
+                    _pg.mixer.music.set_volume(game.music_volume)
+                except Exception:
+                    pass
+            else:
+                game.sound_effects.sound_volume = max(0.0, game.sound_effects.sound_volume - 0.1)
+                try:
+                    for s in game.sound_effects.sound_effects.values():
+                        s.set_volume(game.sound_effects.sound_volume)
+                except Exception:
+                    pass
+            try:
+                game._save_settings()
+            except Exception:
+                pass
+        elif event.key == pygame.K_RIGHT:
+            if game.audio_selected == 0:
+                game.music_volume = min(1.0, game.music_volume + 0.1)
+                try:
+                    import pygame as _pg
+                    _pg.mixer.music.set_volume(game.music_volume)
+                except Exception:
+                    pass
+            else:
+                game.sound_effects.sound_volume = min(1.0, game.sound_effects.sound_volume + 0.1)
+                try:
+                    for s in game.sound_effects.sound_effects.values():
+                        s.set_volume(game.sound_effects.sound_volume)
+                except Exception:
+                    pass
+            try:
+                game._save_settings()
+            except Exception:
+                pass
+        elif event.key == pygame.K_r:
+            game.music_volume = 0.7
+            game.sound_effects.sound_volume = 0.8
+            try:
+                import pygame as _pg
+                _pg.mixer.music.set_volume(game.music_volume)
+                for s in game.sound_effects.sound_effects.values():
+                    s.set_volume(game.sound_effects.sound_volume)
+            except Exception:
+                pass
+            try:
+                game._save_settings()
+            except Exception:
+                pass
+        elif event.key == pygame.K_ESCAPE:
+            if game.previous_state_before_options:
+                game.state = game.previous_state_before_options
+                game.previous_state_before_options = None
+            else:
+                game.state = GameState.MAIN_MENU
+            return True
+
+    def _key_options_video(self, event, env):
+        game = self.game
+        if event.key == pygame.K_UP:
+            game.video_selected = (game.video_selected - 1) % 4
+        elif event.key == pygame.K_DOWN:
+            game.video_selected = (game.video_selected + 1) % 4
+        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            if game.video_selected == 1:
+                try:
+                    game.env_config["fullscreen"] = not game.env_config.get("fullscreen", False)
+                    from internal.engine.screen import Screen as _Screen
+                    _Screen.init(game)
+                except Exception:
+                    pass
+                try:
+                    game._save_settings()
+                except Exception:
+                    pass
+            elif game.video_selected == 2:
+                try:
+                    game.visual_mode = "normal" if getattr(game, "visual_mode", "normal") == "8bit" else "8bit"
+                    game._save_settings()
+                except Exception:
+                    pass
+            elif game.video_selected == 3:
+                try:
+                    game.cycle_performance_profile(1)
+                except Exception:
+                    pass
+        elif event.key == pygame.K_LEFT:
+            if game.video_selected == 0:
+                try:
+                    idx = game.window_scales.index(game.env_config.get("window_scale", 1.0))
+                except Exception:
+                    idx = 0
+                idx = (idx - 1) % len(game.window_scales)
+                game.env_config["window_scale"] = game.window_scales[idx]
+                try:
+                    from internal.engine.screen import Screen as _Screen
+                    _Screen.init(game)
+                except Exception:
+                    pass
+            elif game.video_selected == 2:
+                try:
+                    game.visual_mode = "normal" if getattr(game, "visual_mode", "normal") == "8bit" else "8bit"
+                    game._save_settings()
+                except Exception:
+                    pass
+            elif game.video_selected == 3:
+                try:
+                    game.cycle_performance_profile(-1)
+                except Exception:
+                    pass
+        elif event.key == pygame.K_RIGHT:
+            if game.video_selected == 0:
+                try:
+                    idx = game.window_scales.index(game.env_config.get("window_scale", 1.0))
+                except Exception:
+                    idx = 0
+                idx = (idx + 1) % len(game.window_scales)
+                game.env_config["window_scale"] = game.window_scales[idx]
+                try:
+                    from internal.engine.screen import Screen as _Screen
+                    _Screen.init(game)
+                except Exception:
+                    pass
+            elif game.video_selected == 2:
+                try:
+                    game.visual_mode = "normal" if getattr(game, "visual_mode", "normal") == "8bit" else "8bit"
+                    game._save_settings()
+                except Exception:
+                    pass
+            elif game.video_selected == 3:
+                try:
+                    game.cycle_performance_profile(1)
+                except Exception:
+                    pass
+        elif event.key == pygame.K_r:
+            try:
+                game.env_config["fullscreen"] = False
+                game.env_config["window_scale"] = 1.0
+                from internal.engine.screen import Screen as _Screen
+                _Screen.init(game)
+            except Exception:
+                pass
+            try:
+                game._save_settings()
+            except Exception:
+                pass
+        elif event.key == pygame.K_ESCAPE:
+            if game.previous_state_before_options:
+                game.state = game.previous_state_before_options
+                game.previous_state_before_options = None
+            else:
+                game.state = GameState.MAIN_MENU
+            return True
+
+    def _key_options_accessibility(self, event, env):
+        game = self.game
+        if event.key == pygame.K_UP:
+            game.access_selected = (getattr(game, "access_selected", 0) - 1) % 2
+        elif event.key == pygame.K_DOWN:
+            game.access_selected = (getattr(game, "access_selected", 0) + 1) % 2
+        elif event.key == pygame.K_LEFT:
+            if getattr(game, "access_selected", 0) == 0:
+                try:
+                    modes = ["none", "deuteranopia", "protanopia", "tritanopia"]
+                    idx = modes.index(getattr(game, "colorblind_mode", "none"))
+                except Exception:
+                    idx = 0
+                game.colorblind_mode = modes[(idx - 1) % len(modes)]
+            else:
+                game.vibration_enabled = not getattr(game, "vibration_enabled", False)
+            try:
+                game._save_settings()
+            except Exception:
+                pass
+        elif event.key == pygame.K_RIGHT:
+            if getattr(game, "access_selected", 0) == 0:
+                try:
+                    modes = ["none", "deuteranopia", "protanopia", "tritanopia"]
+                    idx = modes.index(getattr(game, "colorblind_mode", "none"))
+                except Exception:
+                    idx = 0
+                game.colorblind_mode = modes[(idx + 1) % len(modes)]
+            else:
+                game.vibration_enabled = not getattr(game, "vibration_enabled", False)
+            try:
+                game._save_settings()
+            except Exception:
+                pass
+        elif event.key == pygame.K_r:
+            game.colorblind_mode = "none"
+            game.vibration_enabled = False
+            try:
+                game._save_settings()
+            except Exception:
+                pass
+        elif event.key == pygame.K_ESCAPE:
+            if game.previous_state_before_options:
+                game.state = game.previous_state_before_options
+                game.previous_state_before_options = None
+            else:
+                game.state = GameState.MAIN_MENU
+            return True
+
+    def _key_options_controls(self, event, env):
+        game = self.game
+        if getattr(game, "controls_editing", False):
+            if event.key == pygame.K_ESCAPE:
+                game.controls_editing = False
+                return True
+            else:
+                label, action = game.controls_actions[game.controls_selected]
+                try:
+                    game.controls[action] = [event.key]
+                    game._save_settings()
+                    game.input_state.invalidate_bindings()
+                except Exception:
+                    pass
+                game.controls_editing = False
+        else:
+            if event.key == pygame.K_UP:
+                game.controls_selected = (
+                    (game.controls_selected - 1) % len(game.controls_actions)
+                )
+            elif event.key == pygame.K_DOWN:
+                game.controls_selected = (
+                    (game.controls_selected + 1) % len(game.controls_actions)
+                )
+            elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+                game.controls_editing = True
+            elif event.key == pygame.K_r:
+                try:
+                    game.controls = {
+                        "left": [pygame.K_LEFT, pygame.K_a],
+                        "right": [pygame.K_RIGHT, pygame.K_d],
+                        "jump": [pygame.K_UP, pygame.K_w],
+                        "shoot": [pygame.K_SPACE],
+                        "crouch": [pygame.K_DOWN, pygame.K_s],
+                        "pause": [pygame.K_ESCAPE],
+                    }
+                    game.joystick_controls = {
+                        "jump": 0,
+                        "shoot": 1,
+                        "pause": 7,
+                    }
+                    if getattr(game, "joystick_connected", False):
+                        name = getattr(game, "joystick_name", "")
+                        if name:
+                            game.joystick_profiles[name] = dict(game.joystick_controls)
+                    game._save_settings()
+                except Exception:
+                    pass
+            elif event.key == pygame.K_ESCAPE:
+                if game.previous_state_before_options:
+                    game.state = game.previous_state_before_options
+                    game.previous_state_before_options = None
+                else:
+                    game.state = GameState.MAIN_MENU
+                return True
+
+    def _key_confirm_new_game(self, event, env):
+        game = self.game
+        if event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            # Confirmar: apagar autosave e ir para novo jogo
+            try:
+                game._clear_autosave()
+            except Exception:
+                pass
+            game.current_level = 1
+            game.score = 0
+            game.platforms_jumped.clear()
+            game.birds_dodged.clear()
+            game.lives = game.max_lives
+            game.player_name = ""
+            game.state = GameState.SELECT_DIFFICULTY
+        elif event.key == pygame.K_ESCAPE:
+            game.state = GameState.MAIN_MENU
+            return True
+
+    def _key_confirm_exit_to_menu(self, event, env):
+        game = self.game
+        if event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            # Confirmar: voltar ao menu principal
+            game.state = GameState.MAIN_MENU
+            # Não salva progresso parcial da fase atual
+        elif event.key == pygame.K_ESCAPE:
+            game.state = GameState.PAUSED
+            return True
+
+    def _key_demo_end_message(self, event, env):
+        game = self.game
+        if event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            # Voltar ao menu principal
+            game.state = GameState.MAIN_MENU
+            # Resetar jogo
+            game.current_level = 1
+            game.score = 0
+            game.lives = game.max_lives
+            game.platforms_jumped.clear()
+            game.birds_dodged.clear()
+            try:
+                game._clear_autosave()
+            except Exception:
+                pass
+            return True
+
+    def _key_credits(self, event, env):
+        game = self.game
+        if (
+            game.credits_type == "menu"
+            and (
+                event.key == pygame.K_ESCAPE
+                or event.key == pygame.K_RETURN
+            )
+        ):
+            game.state = GameState.MAIN_MENU
+            return True
+
+    def _key_records(self, event, env):
+        game = self.game
+        if event.key in (pygame.K_ESCAPE, pygame.K_RETURN):
+            if game.previous_state_before_records:
+                game.state = game.previous_state_before_records
+                game.previous_state_before_records = None
+            else:
+                game.state = GameState.MAIN_MENU
+            return True
+
+    def _key_game_over(self, event, env):
+        game = self.game
+        if event.key == pygame.K_UP:
+            game.game_over_selected = (
+                (game.game_over_selected - 1)
+                % len(game.game_over_options)
+            )
+        elif event.key == pygame.K_DOWN:
+            game.game_over_selected = (
+                (game.game_over_selected + 1)
+                % len(game.game_over_options)
+            )
+        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            if game.game_over_selected == 0:
+                if (
+                    env.get("environment") == "development"
+                    and "initial-stage" in env
+                ):
+                    try:
+                        game.current_level = int(
+                            env["initial-stage"]
+                        )
+                        if (
+                            game.current_level < 1
+                            or game.current_level > 50
+                        ):
+                            game.current_level = 1
+                    except (ValueError, TypeError):
+                        game.current_level = 1
+                else:
+                    game.current_level = 1
+                game.score = 0
+                game.platforms_jumped.clear()
+                game.birds_dodged.clear()
+                game.lives = game.max_lives
+                game.player_name = ""
+                game.game_over_selected = 0
+                game.state = GameState.PLAYING
+                Level.init_level(game)
+                game.music.play_level_music(
+                    game,
+                    game.current_level,
+                )
+            elif game.game_over_selected == 1:
+                game.previous_state_before_records = (
+                    GameState.GAME_OVER
+                )
+                game.state = GameState.RECORDS
+            elif game.game_over_selected == 2:
+                return False
+
+    def _button_splash(self, event, env):
+        game = self.game
+        if env.get("environment", "production") == "development":
+            game.state = GameState.TITLE_SCREEN
+
+    def _button_title_screen(self, event, env):
+        game = self.game
+        game.state = GameState.OPENING_VIDEO
+        if game.video_player.load_video("videos/opening.mp4"):
+            game.video_player.start_playback()
+        else:
+            game.state = GameState.MAIN_MENU
+            if not game.music_started:
+                game.music.play_menu_music(game)
+                game.music_started = True
+
+    def _button_opening_video(self, event, env):
+        # Durante o vídeo de abertura a entrada não faz nada
+        pass
+
+    def _button_main_menu(self, event, env):
+        game = self.game
+        if event.button == 0 or event.button in [6, 7, 8, 9]:
+            game.handle_menu_selection()
+
+    def _button_playing(self, event, env):
+        game = self.game
+        # Verificar se é botão de pause (suporta múltiplos controles)
+        configured_pause = getattr(game, "joystick_controls", {}).get("pause", 7)
+        if event.button == configured_pause or event.button in PAUSE_BUTTONS:
+            # Botão Start/Options pausa
+            game.state = GameState.PAUSED
+            game.pause_selected = 0
+
+    def _button_paused(self, event, env):
+        game = self.game
+        # Processar cheat code com botões de joystick durante pause
+        # Mapear botões para tokens JUMP e SHOOT
+        if event.button == getattr(game, "joystick_controls", {}).get("jump", 0):
+            game._process_cheat_token("JUMP")
+        elif event.button == getattr(game, "joystick_controls", {}).get("shoot", 1):
+            game._process_cheat_token("SHOOT")
+
+        if event.button == 0:
+            sel = game.pause_menu_options[game.pause_selected]
+            if sel == "Continuar":
+                game.state = GameState.PLAYING
+            elif sel == "Botões/Teclas":
+                game.options_selected = 0
+                game.previous_state_before_options = GameState.PAUSED
+                game.state = GameState.OPTIONS_CONTROLS
+            elif sel == "Áudio":
+                game.audio_selected = 0
+                game.previous_state_before_options = GameState.PAUSED
+                game.state = GameState.OPTIONS_AUDIO
+            elif sel == "Vídeo":
+                game.video_selected = 0
+                game.previous_state_before_options = GameState.PAUSED
+                game.state = GameState.OPTIONS_VIDEO
+            elif sel == "Acessibilidade":
+                game.access_selected = 0
+                game.previous_state_before_options = GameState.PAUSED
+                game.state = GameState.OPTIONS_ACCESSIBILITY
+            elif sel == "Sair":
+                game.confirm_dialog_type = "exit_to_menu"
+                game.confirm_selected = 0
+                game.state = GameState.CONFIRM_EXIT_TO_MENU
+        elif event.button == 1:
+            game.state = GameState.PLAYING
+
+    def _button_options_menu(self, event, env):
+        game = self.game
+        if event.button == 0:
+            if game.options_selected == 0:
+                game.previous_state_before_options = GameState.OPTIONS_MENU
+                game.state = GameState.OPTIONS_CONTROLS
+            elif game.options_selected == 1:
+                game.audio_selected = 0
+                game.previous_state_before_options = GameState.OPTIONS_MENU
+                game.state = GameState.OPTIONS_AUDIO
+            elif game.options_selected == 2:
+                game.video_selected = 0
+                game.previous_state_before_options = GameState.OPTIONS_MENU
+                game.state = GameState.OPTIONS_VIDEO
+            elif game.options_selected == 3:
+                game.access_selected = 0
+                game.previous_state_before_options = GameState.OPTIONS_MENU
+                game.state = GameState.OPTIONS_ACCESSIBILITY
+            elif game.options_selected == 4:
+                game.state = GameState.MAIN_MENU
+        elif event.button == 1:
+            game.state = GameState.MAIN_MENU
+
+    def _button_options_audio(self, event, env):
+        game = self.game
+        if event.button == 1:
+            if game.previous_state_before_options:
+                game.state = game.previous_state_before_options
+                game.previous_state_before_options = None
+            else:
+                game.state = GameState.MAIN_MENU
+
+    def _button_options_video(self, event, env):
+        game = self.game
+        if event.button == 0:
+            if game.video_selected == 1:
+                try:
+                    game.env_config["fullscreen"] = not game.env_config.get("fullscreen", False)
+                    from internal.engine.screen import Screen as _Screen
+                    _Screen.init(game)
+                except Exception:
+                    pass
+                try:
+                    game._save_settings()
+                except Exception:
+                    pass
+            elif game.video_selected == 2:
+                try:
+                    game.visual_mode = "normal" if getattr(game, "visual_mode", "normal") == "8bit" else "8bit"
+                    game._save_settings()
+                except Exception:
+                    pass
+            elif game.video_selected == 3:
+                try:
+                    game.cycle_performance_profile(1)
+                except Exception:
+                    pass
+        elif event.button == 1:
+            if game.previous_state_before_options:
+                game.state = game.previous_state_before_options
+                game.previous_state_before_options = None
+            else:
+                game.state = GameState.MAIN_MENU
+
+    def _button_options_controls(self, event, env):
+        game = self.game
+        if game.controls_editing:
+            label, action = game.controls_actions[game.controls_selected]
+            try:
+                game.joystick_controls[action] = int(event.button)
+                game._save_settings()
+                game.input_state.invalidate_bindings()
+            except Exception:
+                pass
+            game.controls_editing = False
+        elif event.button == 0:
+            game.controls_editing = True
+        elif event.button == 1:
+            if game.previous_state_before_options:
+                game.state = game.previous_state_before_options
+                game.previous_state_before_options = None
+            else:
+                game.state = GameState.MAIN_MENU
+
+    def _button_options_accessibility(self, event, env):
+        game = self.game
+        if event.button == 1:
+            if game.previous_state_before_options:
+                game.state = game.previous_state_before_options
+                game.previous_state_before_options = None
+            else:
+                game.state = GameState.MAIN_MENU
+
+    def _button_confirm_new_game(self, event, env):
+        game = self.game
+        if event.button == 0:
+            try:
+                game._clear_autosave()
+            except Exception:
+                pass
+            game.current_level = 1
+            game.score = 0
+            game.platforms_jumped.clear()
+            game.birds_dodged.clear()
+            game.lives = game.max_lives
+            game.player_name = ""
+            game.state = GameState.SELECT_DIFFICULTY
+        elif event.button == 1:
+            game.state = GameState.MAIN_MENU
+
+    def _button_demo_end_message(self, event, env):
+        game = self.game
+        if event.button == 0:
+            # Voltar ao menu principal
+            game.state = GameState.MAIN_MENU
+            # Resetar jogo
+            game.current_level = 1
+            game.score = 0
+            game.lives = game.max_lives
+            game.platforms_jumped.clear()
+            game.birds_dodged.clear()
+            try:
+                game._clear_autosave()
+            except Exception:
+                pass
+
+    def _button_confirm_exit_to_menu(self, event, env):
+        game = self.game
+        if event.button == 0:
+            game.state = GameState.MAIN_MENU
+        elif event.button == 1:
+            game.state = GameState.PAUSED
+
+    def _button_select_difficulty(self, event, env):
+        game = self.game
+        if event.button == 0 or event.button in [6, 7, 8, 9]:
+            if game.difficulty_selected == 0:
+                game.difficulty = Difficulty.EASY
+            elif game.difficulty_selected == 2:
+                game.difficulty = Difficulty.HARD
+            else:
+                game.difficulty = Difficulty.NORMAL
+            try:
+                game.ranking_manager.set_board(game.difficulty)
+            except Exception:
+                pass
+            (
+                game.extra_life_milestones,
+                game.extra_life_increment_after_milestones,
+            ) = game.get_extra_life_milestones_and_increment()
+            game.next_extra_life_score = (
+                game.extra_life_milestones[0]
+            )
+            game.extra_lives_earned = 0
+            if (
+                env.get("environment") == "development"
+                and "initial-stage" in env
+            ):
+                try:
+                    game.current_level = int(env["initial-stage"])
+                    if (
+                        game.current_level < 1
+                        or game.current_level > 50
+                    ):
+                        game.current_level = 1
+                except (ValueError, TypeError):
+                    game.current_level = 1
+            else:
+                game.current_level = 1
+            game.score = 0
+            game.platforms_jumped.clear()
+            game.birds_dodged.clear()
+            game.player_name = ""
+            game.max_lives = game.get_initial_lives()
+            game.lives = game.max_lives
+            if hasattr(game, "collected_extra_life_levels"):
+                game.collected_extra_life_levels.clear()
+            game.state = GameState.PLAYING
+            Level.init_level(game)
+            game.music.play_level_music(game, game.current_level)
+        elif event.button == 1:
+            game.state = GameState.MAIN_MENU
+
+    def _button_fim_screen(self, event, env):
+        game = self.game
+        game.state = GameState.CREDITS
+        game.credits_type = "ending"
+        game.music.play_music("credits")
+
+    def _button_credits(self, event, env):
+        game = self.game
+        if game.credits_type == "menu" and (
+            event.button == 1 or event.button in [6, 7, 8, 9]
+        ):
+            game.state = GameState.MAIN_MENU
+            return True
+
+    def _button_records(self, event, env):
+        game = self.game
+        if event.button == 1 or event.button in [6, 7, 8, 9]:
+            if game.previous_state_before_records:
+                game.state = game.previous_state_before_records
+                game.previous_state_before_records = None
+            else:
+                game.state = GameState.MAIN_MENU
+
+    def _button_show_ranking(self, event, env):
+        game = self.game
+        if event.button == 1 or event.button in [6, 7, 8, 9]:
+            if getattr(
+                game,
+                "previous_state_before_ranking",
+                None,
+            ):
+                game.state = game.previous_state_before_ranking
+                game.previous_state_before_ranking = None
+            else:
+                game.state = GameState.MAIN_MENU
+
+    def _button_game_over(self, event, env):
+        game = self.game
+        if event.button == 0 or event.button in [6, 7, 8, 9]:
+            if game.game_over_selected == 0:
+                if (
+                    env.get("environment") == "development"
+                    and "initial-stage" in env
+                ):
+                    try:
+                        game.current_level = int(
+                            env["initial-stage"]
+                        )
+                        if (
+                            game.current_level < 1
+                            or game.current_level > 50
+                        ):
+                            game.current_level = 1
+                    except (ValueError, TypeError):
+                        game.current_level = 1
+                else:
+                    game.current_level = 1
+                game.score = 0
+                game.platforms_jumped.clear()
+                game.birds_dodged.clear()
+                game.lives = game.max_lives
+                game.player_name = ""
+                game.game_over_selected = 0
+                if hasattr(game, "collected_extra_life_levels"):
+                    game.collected_extra_life_levels.clear()
+                game.state = GameState.PLAYING
+                Level.init_level(game)
+                game.music.play_level_music(
+                    game,
+                    game.current_level,
+                )
+            elif game.game_over_selected == 1:
+                game.previous_state_before_records = (
+                    GameState.GAME_OVER
+                )
+                game.state = GameState.RECORDS
+            elif game.game_over_selected == 2:
+                return False
@@ -1,5 +1,6 @@
 import pygame
 from internal.utils.constants import FPS
+from internal.engine.gc_policy import GCPolicy
 
 
 class Hold:
@@ -8,7 +9,7 @@ class Hold:
 
     def _compute_sound_frames(self, sound_key, default_seconds=2.0):
         try:
-            sound = self.game.sound_effects.sound_effects.get(sound_key)
+            sound = self.game.sound_effects.get(sound_key)
             if sound:
                 length = sound.get_length()
                 if length and length > 0:
@@ -24,6 +25,11 @@ class Hold:
         self.game.hold_total_frames = frames
         self.game._pending_state_after_hold = pending_state
         self.game._next_level_after_hold = next_level
+        # Momento sem ação: coleta completa do gc fora do gameplay
+        try:
+            GCPolicy().collect("hold")
+        except Exception:
+            pass
 
     def start_game_over_hold(self):
         frames = self.game._compute_sound_frames("game-over", 2.0)
@@ -0,0 +1,93 @@
+def is_removed(entity):
+    """Entidade marcada para remoção neste quadro."""
+    return getattr(entity, "removed", False)
+
+
+def live(items):
+    """Itera ``items`` sem cópia, pulando entidades marcadas para remoção."""
+    return (entity for entity in items if not getattr(entity, "removed", False))
+
+
+class Lifecycle:
+    """Remoção adiada de entidades (marcar e varrer).
+
+    As colisões só marcam a entidade (``kill``); ``sweep`` compacta cada
+    lista uma vez por quadro e devolve os tiros ao pool. Assim os laços de
+    colisão percorrem as listas vivas, sem cópias ``[:]`` nem
+    ``list.remove`` dentro do laço.
+    """
+
+    # Listas do jogo que podem conter entidades marcadas
+    SWEPT_LISTS = (
+        "birds",
+        "bats",
+        "airplanes",
+        "flying_disks",
+        "shooting_stars",
+        "meteors",
+        "turtles",
+        "robots",
+        "aliens",
+        "orphan_missiles",
+        "orphan_lasers",
+    )
+    # Projéteis que pertencem a cada inimigo (lista -> atributo)
+    OWNED_LISTS = {
+        "robots": "missiles",
+        "aliens": "lasers",
+    }
+
+    def __init__(self, game):
+        self.game = game
+        self.pending = 0
+        self.swept = 0
+
+    def kill(self, entity):
+        """Marca ``entity`` para sair da sua lista no próximo ``sweep``."""
+        if getattr(entity, "removed", False):
+            return
+        try:
+            entity.removed = True
+        except Exception:
+            return
+        self.pending += 1
+
+    def sweep(self):
+        """Compacta as listas com entidades marcadas; retorna quantas saíram."""
+        if not self.pending:
+            return 0
+        g = self.game
+        removed = 0
+        player = getattr(g, "player", None)
+        bullets = getattr(player, "bullets", None)
+        if bullets:
+            removed += self._compact(bullets, getattr(g, "return_bullet_to_pool", None))
+        for name in self.SWEPT_LISTS:
+            items = getattr(g, name, None)
+            if not items:
+                continue
+            owned = self.OWNED_LISTS.get(name)
+            if owned:
+                for owner in items:
+                    projectiles = getattr(owner, owned, None)
+                    if projectiles:
+                        removed += self._compact(projectiles)
+            removed += self._compact(items)
+        self.pending = 0
+        self.swept += removed
+        return removed
+
+    @staticmethod
+    def _compact(items, on_removed=None):
+        kept = []
+        dropped = 0
+        for entity in items:
+            if getattr(entity, "removed", False):
+                dropped += 1
+                if on_removed is not None:
+                    on_removed(entity)
+            else:
+                kept.append(entity)
+        if dropped:
+            items[:] = kept
+        return dropped
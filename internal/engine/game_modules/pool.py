@@ -17,6 +17,8 @@ class Pool:
             bullet.image = image
             bullet.rect.x = x
             bullet.rect.y = y
+            # Bala varrida após colisão volta viva
+            bullet.removed = False
             # Resetar velocidade para o padrão antes de qualquer ajuste externo
             try:
                 bullet.speed = 8
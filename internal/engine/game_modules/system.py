@@ -1,21 +1,62 @@
 import pygame
 from internal.utils.constants import FPS
+from internal.engine.frame_monitor import FrameMonitor
+from internal.engine.gc_policy import GCPolicy
 
 
 class System:
     def __init__(self, game):
         self.g = game
+        # Quadros lentos e resumo de desempenho vão para o runtime.log
+        self.frame_monitor = FrameMonitor()
 
     def is_development(self):
         return self.g.env_config.get("environment") == "development"
 
     def run(self):
         g = self.g
+        # Perfil de desempenho: benchmark rápido (preferência auto) e aplicação
+        try:
+            g.select_performance_profile()
+        except Exception:
+            pass
+        # Recursos carregados: congelar no gc antes do loop
+        gc_policy = GCPolicy()
+        try:
+            gc_policy.start()
+        except Exception:
+            pass
         running = True
         while running:
+            # Novo frame para o gerenciador de canais (fusão de disparos)
+            try:
+                g.sound_effects.channels.begin_frame()
+            except Exception:
+                pass
+            # Novo frame para o orçamento de tempo dos MODs
+            try:
+                g._mod_loader.begin_frame()
+            except Exception:
+                pass
+            # Novo frame para o snapshot de entrada (amostrado na 1ª leitura)
+            try:
+                g.input_state.begin_frame()
+            except Exception:
+                pass
+            monitor = self.frame_monitor
+            monitor.begin_frame()
             running = g.handle_events()
+            monitor.lap("events")
             g.update()
+            monitor.lap("update")
             g.draw()
+            monitor.lap("draw")
+            monitor.note("gc", gc_policy.take_frame_pause())
+            try:
+                gc_policy.on_state(getattr(g, "state", None))
+            except Exception:
+                pass
+            monitor.end_frame(getattr(g, "state", None), getattr(g, "current_level", None))
             g.clock.tick(FPS)
         # Encerramento gracioso
         try:
@@ -26,6 +67,22 @@ class System:
     def shutdown(self):
         """Encerrar subsistemas e liberar recursos de forma segura."""
         g = self.g
+        # Resumo de tempos de quadro da sessão
+        try:
+            self.frame_monitor.log_summary()
+        except Exception:
+            pass
+        try:
+            GCPolicy().stop()
+        except Exception:
+            pass
+
+        # Gravar autosave pendente e encerrar o escritor em segundo plano
+        try:
+            g._autosave_writer.close()
+        except Exception:
+            pass
+
         # Parar música
         try:
             import pygame as _pg
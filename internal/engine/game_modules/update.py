@@ -1,8 +1,11 @@
 import pygame
-from internal.utils.constants import WIDTH, HEIGHT, FPS, CAMERA_OFFSET_X
+from internal.utils.constants import WIDTH, HEIGHT, FPS, CAMERA_OFFSET_X, ENEMY_ACTIVATION_MARGIN
 from internal.engine.difficulty import Difficulty
 from internal.engine.state import GameState
+from internal.engine.state_dispatch import StateDispatch
 from internal.engine.level.level import Level
+from internal.engine.collision import collide_precise
+from internal.engine.game_modules.lifecycle import is_removed, live
 from internal.resources.explosion import Explosion
 from internal.resources.enemies.bird import Bird
 from internal.resources.enemies.bat import Bat
@@ -16,8 +19,109 @@ from internal.resources.enemies.meteor import Meteor
 
 
 class Update:
+    # Sistemas da fase, na ordem do quadro: spawns, inimigos, tiros,
+    # colisões com o jogador e saída. (primeira fase, última fase, método);
+    # None deixa a faixa aberta. ``build_world_pipeline`` seleciona os
+    # ativos no nível atual.
+    WORLD_SYSTEMS = (
+        (None, 16, "_spawn_birds"),
+        (7, 10, "_spawn_raindrops"),
+        (17, 20, "_spawn_bats_capped"),
+        (21, 30, "_spawn_bats"),
+        (27, 30, "_spawn_lava_drops"),
+        (17, 30, "_spawn_shooting_stars"),
+        (31, 40, "_spawn_airplanes"),
+        (41, 50, "_spawn_flying_disks"),
+        (47, 50, "_spawn_meteors"),
+        (51, 51, "_spawn_fires"),
+        (None, 16, "_update_birds"),
+        (7, 10, "_update_raindrops"),
+        (17, 30, "_update_bats"),
+        (17, 20, "_update_shooting_stars"),
+        (27, 30, "_update_lava_drops"),
+        (21, 30, "_clear_shooting_stars"),
+        (31, 40, "_update_airplanes"),
+        (41, 50, "_update_flying_disks"),
+        (41, 50, "_update_meteors"),
+        (51, 51, "_update_fires"),
+        (None, 20, "_update_turtles"),
+        (21, None, "_update_spiders"),
+        (31, 40, "_update_robots"),
+        (41, 50, "_update_aliens"),
+        (51, 51, "_update_boss"),
+        (None, None, "_update_explosions"),
+        (None, 20, "_bullets_vs_birds"),
+        (17, 20, "_bullets_vs_bats_and_stars"),
+        (21, 30, "_bullets_vs_bats"),
+        (31, 40, "_bullets_vs_airplanes"),
+        (41, 50, "_bullets_vs_disks_and_meteors"),
+        (21, None, "_bullets_vs_spiders"),
+        (31, 40, "_bullets_vs_robots"),
+        (31, 40, "_missiles_vs_player"),
+        (41, 50, "_lasers_vs_player"),
+        (41, 50, "_bullets_vs_aliens"),
+        (31, 40, "_update_orphan_missiles"),
+        (41, 50, "_update_orphan_lasers"),
+        (None, 20, "_player_vs_birds"),
+        (7, 10, "_player_vs_raindrops"),
+        (17, 30, "_player_vs_bats"),
+        (27, 30, "_player_vs_lava_drops"),
+        (17, 30, "_player_vs_shooting_stars"),
+        (31, 40, "_player_vs_airplanes"),
+        (37, 40, "_update_lightning"),
+        (41, None, "_player_vs_flying_disks"),
+        (51, 51, "_player_vs_fires"),
+        (47, 50, "_player_vs_meteors"),
+        (None, 20, "_player_vs_turtles"),
+        (21, None, "_player_vs_spiders"),
+        (31, 40, "_player_vs_robots"),
+        (41, 50, "_player_vs_aliens"),
+        (None, None, "_check_level_exit"),
+    )
+
     def __init__(self, game):
         self.game = game
+        # Sistemas da fase atual (ver ``build_world_pipeline``)
+        self._world_pipeline = []
+        self._world_pipeline_level = None
+        # Atualização por estado; estados sem handler não têm lógica própria
+        self._states = StateDispatch("update")
+        self._states.register(GameState.SPLASH, self._update_splash)
+        self._states.register(GameState.OPENING_VIDEO, self._update_opening_video)
+        self._states.register(GameState.ENDING_VIDEO, self._update_ending_video)
+        self._states.register(GameState.FIM_SCREEN, self._update_fim_screen)
+        self._states.register(GameState.CREDITS, self._update_credits)
+        self._states.register(GameState.PLAYING, self._update_playing)
+
+    def _apply_animation_step(self, entity):
+        """Perfil leve: a animação de ``entity`` troca de quadro com menos frequência.
+
+        Vale para inimigos criados pelo ``Level.init_level`` e pelos spawners;
+        cada entidade é ajustada uma única vez.
+        """
+        step = getattr(getattr(self.game, "performance", None), "animation_step", 1)
+        if step <= 1 or not hasattr(entity, "animation_speed"):
+            return
+        try:
+            if getattr(entity, "_animation_step_applied", False):
+                return
+            entity.animation_speed *= step
+            entity._animation_step_applied = True
+        except Exception:
+            pass
+
+    def _notify_spawn(self, entity):
+        """Dispara o hook on_spawn dos MODs para um inimigo recém-criado."""
+        self._apply_animation_step(entity)
+        try:
+            self.game.call_mod_hook("on_spawn", entity)
+        except Exception:
+            pass
+
+    def _hazard_room(self, items):
+        """Cabe mais um perigo em ``items`` no limite do perfil de desempenho?"""
+        cap = getattr(getattr(self.game, "performance", None), "max_hazards", None)
+        return cap is None or len(items) < cap
 
     def _apply_tempo_speed(self, obj):
         g = self.game
@@ -44,15 +148,31 @@ class Update:
             except Exception:
                 pass
 
+    def _is_awake(self, enemy, camera_x, projectiles_attr=None):
+        """Janela de ativação: inimigo só é atualizado perto da câmera.
+
+        Usa a faixa de patrulha da plataforma (ou ``x``) contra
+        ``camera_x ± ENEMY_ACTIVATION_MARGIN``. Inimigos morrendo ou com
+        projéteis em voo continuam sempre ativos.
+        """
+        if getattr(enemy, "is_dead", False):
+            return True
+        if projectiles_attr and getattr(enemy, projectiles_attr, None):
+            return True
+        x = getattr(enemy, "x", 0)
+        left = getattr(enemy, "platform_left", x)
+        right = getattr(enemy, "platform_right", x) + getattr(enemy, "width", 0)
+        return (
+            right >= camera_x - ENEMY_ACTIVATION_MARGIN
+            and left <= camera_x + WIDTH + ENEMY_ACTIVATION_MARGIN
+        )
+
     def update(self):
         g = self.game
-        sfx = g.sound_effects
-        exp_img = g.image.explosion_image
-        
+
         # Decrementar timer de mensagem de cheat
         if g.cheat_message_timer > 0:
             g.cheat_message_timer -= 1
-        high_score = g.ranking_manager.is_high_score
 
         # Se estamos em hold, gerenciar contagem.
         if getattr(g, "hold_active", False):
@@ -164,7 +284,11 @@ class Update:
                     g.tempo_frames_left = 0
                     g.tempo_factor = 1.0
                     try:
-                        g._tempo_music_active = False
+                        if g.hold_type == "level_end":
+                            g._tempo_music_active = False
+                        else:
+                            # Voltar à faixa normal na posição equivalente
+                            g.music.exit_tempo_music(g)
                     except Exception:
                         pass
         except Exception:
@@ -185,411 +309,387 @@ class Update:
         except Exception:
             pass
 
-        if g.state == GameState.SPLASH:
-            # Atualizar timer do splash screen
-            g.splash_timer += 1
+        self._states.dispatch(g.state)
 
-            # Calcular qual logo mostrar baseado no tempo com fade
-            if g.logos:
-                g.current_logo_index = (
-                    (g.splash_timer // g.logo_display_time)
-                    % len(
-                        g.logos
-                    )
+    def _update_playing(self):
+        """Gameplay: a parte 2 só roda se a parte 1 não trocou de estado."""
+        g = self.game
+        self._update_playing_player()
+        # Entidades marcadas nas colisões saem das listas antes da parte 2
+        g.sweep_entities()
+        if g.state == GameState.PLAYING:
+            self._update_playing_world()
+            g.sweep_entities()
+
+    def _update_splash(self):
+        """Splash: alternar logos e seguir para a tela de título."""
+        g = self.game
+        # Atualizar timer do splash screen
+        g.splash_timer += 1
+
+        # Calcular qual logo mostrar baseado no tempo com fade
+        if g.logos:
+            g.current_logo_index = (
+                (g.splash_timer // g.logo_display_time)
+                % len(
+                    g.logos
                 )
+            )
+
+        # Após o tempo total, ir para a tela de título
+        if g.splash_timer >= g.splash_duration:
+            g.state = GameState.TITLE_SCREEN
 
-            # Após o tempo total, ir para a tela de título
-            if g.splash_timer >= g.splash_duration:
-                g.state = GameState.TITLE_SCREEN
+    def _update_opening_video(self):
+        """Vídeo de abertura: avançar reprodução e ir ao menu ao terminar."""
+        g = self.game
+        # Atualizar reprodução do vídeo
+        g.video_player.update()
+
+        # Verificar se o vídeo terminou
+        if g.video_player.is_finished():
+            g.video_player.cleanup()
+            g.state = GameState.MAIN_MENU
+            # Iniciar música do menu
+            if not g.music_started:
+                g.music.play_menu_music(g)
+                g.music_started = True
+
+    def _update_ending_video(self):
+        """Vídeo final: carregar, reproduzir e seguir para a tela FIM."""
+        g = self.game
+        # Carregar vídeo de ending se ainda não foi carregado
+        if not hasattr(g, "ending_video_loaded"):
+            if g.ending_video_player.load_video("videos/ending.mp4"):
+                g.ending_video_loaded = True
+                # Iniciar reprodução do vídeo
+                g.ending_video_player.start_playback()
+            else:
+                # Se não conseguir carregar o vídeo,
+                # ir direto para tela FIM
+                g.state = GameState.FIM_SCREEN
+                g.fim_screen_timer = 0
 
-        elif g.state == GameState.OPENING_VIDEO:
-            # Atualizar reprodução do vídeo
-            g.video_player.update()
+        # Atualizar reprodução do vídeo de ending
+        if hasattr(g, "ending_video_loaded") and g.ending_video_loaded:
+            g.ending_video_player.update()
 
             # Verificar se o vídeo terminou
-            if g.video_player.is_finished():
-                g.video_player.cleanup()
-                g.state = GameState.MAIN_MENU
-                # Iniciar música do menu
-                if not g.music_started:
-                    g.music.play_menu_music(g)
-                    g.music_started = True
-
-        elif g.state == GameState.ENDING_VIDEO:
-            # Carregar vídeo de ending se ainda não foi carregado
-            if not hasattr(g, "ending_video_loaded"):
-                if g.ending_video_player.load_video("videos/ending.mp4"):
-                    g.ending_video_loaded = True
-                    # Iniciar reprodução do vídeo
-                    g.ending_video_player.start_playback()
-                else:
-                    # Se não conseguir carregar o vídeo,
-                    # ir direto para tela FIM
-                    g.state = GameState.FIM_SCREEN
-                    g.fim_screen_timer = 0
-
-            # Atualizar reprodução do vídeo de ending
-            if hasattr(g, "ending_video_loaded") and g.ending_video_loaded:
-                g.ending_video_player.update()
-
-                # Verificar se o vídeo terminou
-                if g.ending_video_player.is_finished():
-                    g.ending_video_player.cleanup()
-                    g.state = GameState.FIM_SCREEN
-                    # Inicializar timer para a tela FIM
-                    g.fim_screen_timer = 0
-
-        elif g.state == GameState.FIM_SCREEN:
-            # Atualizar timer da tela FIM
-            g.fim_screen_timer += 1
-
-            # Após 3 segundos (180 frames a 60 FPS), ir para os créditos
-            if g.fim_screen_timer >= 180:
-                g.state = GameState.CREDITS
-                g.credits_type = "ending"
-                g.music.play_music("credits")
-                # Resetar rolagem dos créditos
-                g.credits_scroll_y = 0
-                g.credits_reset_timer = 0
-
-        elif g.state == GameState.CREDITS:
-            # Atualizar rolagem dos créditos
-            g.credits_scroll_y += g.credits_scroll_speed
-            g.credits_reset_timer += 1
-
-            # Resetar rolagem apenas para créditos do menu (loop contínuo)
-            if (
-                g.credits_type == "menu" and g.credits_reset_timer >= 1800
-            ):  # 30 segundos a 60 FPS
-                g.credits_scroll_y = 0
-                g.credits_reset_timer = 0
+            if g.ending_video_player.is_finished():
+                g.ending_video_player.cleanup()
+                g.state = GameState.FIM_SCREEN
+                # Inicializar timer para a tela FIM
+                g.fim_screen_timer = 0
+
+    def _update_fim_screen(self):
+        """Tela FIM: após 3 segundos, iniciar os créditos finais."""
+        g = self.game
+        # Atualizar timer da tela FIM
+        g.fim_screen_timer += 1
+
+        # Após 3 segundos (180 frames a 60 FPS), ir para os créditos
+        if g.fim_screen_timer >= 180:
+            g.state = GameState.CREDITS
+            g.credits_type = "ending"
+            g.music.play_music("credits")
+            # Resetar rolagem dos créditos
+            g.credits_scroll_y = 0
+            g.credits_reset_timer = 0
+
+    def _update_credits(self):
+        """Créditos: rolagem (em loop apenas nos créditos do menu)."""
+        g = self.game
+        # Atualizar rolagem dos créditos
+        g.credits_scroll_y += g.credits_scroll_speed
+        g.credits_reset_timer += 1
+
+        # Resetar rolagem apenas para créditos do menu (loop contínuo)
+        if (
+            g.credits_type == "menu" and g.credits_reset_timer >= 1800
+        ):  # 30 segundos a 60 FPS
+            g.credits_scroll_y = 0
+            g.credits_reset_timer = 0
+
+    def _update_playing_player(self):
+        """Gameplay, parte 1: jogador, coletas, colisões antecipadas e câmera."""
+        g = self.game
+        sfx = g.sound_effects
+        exp_img = g.image.explosion_image
+        # Sanitizar listas de inimigos fora do intervalo do nível atual
+        if g.current_level <= 20:
+            g.flying_disks = []
+            g.airplanes = []
+            g.meteors = []
+        else:
+            # Fases acima de 20 não têm shooting stars até 31+; limpar restos
+            if hasattr(g, "shooting_stars"):
+                g.shooting_stars = []
+        pre_score_bullets = g.score
+        # Durante holds de transição, manter atualizações leves ativas
+        # para evitar sensação de travamento
+
+        # Continua processamento normal do frame
 
-        elif g.state == GameState.PLAYING:
-            # Sanitizar listas de inimigos fora do intervalo do nível atual
+        # Fail-safe: colisões imediatas de tiros com inimigos leves
+        # Necessário para garantir pontuação nos testes unitários
+        for bullet in live(getattr(g.player, "bullets", [])):
+            hit_local = False
             if g.current_level <= 20:
-                g.flying_disks = []
-                g.airplanes = []
-                g.meteors = []
-            else:
-                # Fases acima de 20 não têm shooting stars até 31+; limpar restos
-                if hasattr(g, "shooting_stars"):
-                    g.shooting_stars = []
-            pre_score_bullets = g.score
-            # Durante holds de transição, manter atualizações leves ativas
-            # para evitar sensação de travamento
-
-            # Continua processamento normal do frame
-
-            # Fail-safe: colisões imediatas de tiros com inimigos leves
-            # Necessário para garantir pontuação nos testes unitários
-            for bullet in getattr(g.player, "bullets", [])[:]:
-                hit_local = False
-                if g.current_level <= 20:
-                    for turtle in getattr(g, "turtles", [])[:]:
-                        if getattr(turtle, "is_dead", False):
-                            continue
-                        if bullet.rect.colliderect(getattr(turtle, "rect", bullet.rect)):
-                            hit_local = True
-                            try:
-                                if hasattr(turtle, "die"):
-                                    turtle.die()
-                                sfx.play_sound_effect("bird-hit")
-                            except Exception:
-                                pass
-                            try:
-                                if not hasattr(turtle, "is_dead") and turtle in g.turtles:
-                                    g.turtles.remove(turtle)
-                            except Exception:
-                                pass
-                            g.add_score(70)
-                            break
-                    if hit_local:
-                        if bullet in g.player.bullets:
-                            g.player.bullets.remove(bullet)
-                        g.return_bullet_to_pool(bullet)
+                for turtle in live(getattr(g, "turtles", [])):
+                    if getattr(turtle, "is_dead", False):
                         continue
-                for bird in getattr(g, "birds", [])[:]:
-                    if bullet.rect.colliderect(getattr(bird, "rect", bullet.rect)):
+                    if bullet.rect.colliderect(getattr(turtle, "rect", bullet.rect)):
                         hit_local = True
                         try:
-                            if hasattr(bird, "die"):
-                                bird.die()
+                            if hasattr(turtle, "die"):
+                                turtle.die()
                             sfx.play_sound_effect("bird-hit")
                         except Exception:
                             pass
-                        # Não remover pássaro imediatamente; permitir animação de morte
+                        try:
+                            if not hasattr(turtle, "is_dead") and turtle in g.turtles:
+                                g.kill_entity(turtle)
+                        except Exception:
+                            pass
+                        g.add_score(70)
+                        break
+                if hit_local:
+                    g.kill_entity(bullet)
+                    continue
+            for bird in live(getattr(g, "birds", [])):
+                if bullet.rect.colliderect(getattr(bird, "rect", bullet.rect)):
+                    hit_local = True
+                    try:
+                        if hasattr(bird, "die"):
+                            bird.die()
+                        sfx.play_sound_effect("bird-hit")
+                    except Exception:
+                        pass
+                    # Não remover pássaro imediatamente; permitir animação de morte
+                    g.add_score(100)
+                    break
+            if hit_local:
+                g.kill_entity(bullet)
+                continue
+            if 31 <= g.current_level <= 40:
+                for robot in live(getattr(g, "robots", [])):
+                    if bullet.rect.colliderect(getattr(robot, "rect", bullet.rect)):
+                        hit_local = True
+                        try:
+                            explosion = g.get_pooled_explosion(robot.x, robot.y, exp_img)
+                            g.explosions.append(explosion)
+                            sfx.play_sound_effect("explosion")
+                        except Exception:
+                            pass
+                        for m in getattr(robot, "missiles", []):
+                            g.orphan_missiles.append(m)
+                        try:
+                            if not hasattr(robot, "is_dead") and robot in g.robots:
+                                g.kill_entity(robot)
+                        except Exception:
+                            pass
                         g.add_score(100)
                         break
                 if hit_local:
-                    if bullet in g.player.bullets:
-                        g.player.bullets.remove(bullet)
-                    g.return_bullet_to_pool(bullet)
+                    g.kill_entity(bullet)
+                    continue
+            if 41 <= g.current_level <= 50:
+                for alien in live(getattr(g, "aliens", [])):
+                    if bullet.rect.colliderect(getattr(alien, "rect", bullet.rect)):
+                        hit_local = True
+                        try:
+                            if hasattr(alien, "die"):
+                                alien.die()
+                                sfx.play_sound_effect("bird-hit")
+                        except Exception:
+                            pass
+                        for laser in getattr(alien, "lasers", []):
+                            g.orphan_lasers.append(laser)
+                        g.add_score(60)
+                        break
+                if hit_local:
+                    g.kill_entity(bullet)
+                    continue
+            # (removido) fail-safe duplicado para colisões de tiros em morcegos
+            if 31 <= g.current_level <= 40:
+                for airplane in live(getattr(g, "airplanes", [])):
+                    if bullet.rect.colliderect(getattr(airplane, "rect", bullet.rect)):
+                        hit_local = True
+                        try:
+                            explosion = g.get_pooled_explosion(airplane.x, airplane.y, exp_img)
+                            g.explosions.append(explosion)
+                            sfx.play_sound_effect("explosion")
+                        except Exception:
+                            pass
+                        g.add_score(50)
+                        try:
+                            g.kill_entity(airplane)
+                        except Exception:
+                            pass
+                        break
+                if hit_local:
+                    g.kill_entity(bullet)
                     continue
-                if 31 <= g.current_level <= 40:
-                    for robot in getattr(g, "robots", [])[:]:
-                        if bullet.rect.colliderect(getattr(robot, "rect", bullet.rect)):
-                            hit_local = True
-                            try:
-                                explosion = g.get_pooled_explosion(robot.x, robot.y, exp_img)
-                                g.explosions.append(explosion)
-                                sfx.play_sound_effect("explosion")
-                            except Exception:
-                                pass
-                            for m in getattr(robot, "missiles", []):
-                                g.orphan_missiles.append(m)
-                            try:
-                                if not hasattr(robot, "is_dead") and robot in g.robots:
-                                    g.robots.remove(robot)
-                            except Exception:
-                                pass
-                            g.add_score(100)
-                            break
-                    if hit_local:
-                        if bullet in g.player.bullets:
-                            g.player.bullets.remove(bullet)
-                        g.return_bullet_to_pool(bullet)
-                        continue
                 if 41 <= g.current_level <= 50:
-                    for alien in getattr(g, "aliens", [])[:]:
-                        if bullet.rect.colliderect(getattr(alien, "rect", bullet.rect)):
-                            hit_local = True
-                            try:
-                                if hasattr(alien, "die"):
-                                    alien.die()
-                                    sfx.play_sound_effect("bird-hit")
-                            except Exception:
-                                pass
-                            for laser in getattr(alien, "lasers", []):
-                                g.orphan_lasers.append(laser)
-                            g.add_score(60)
-                            break
-                    if hit_local:
-                        if bullet in g.player.bullets:
-                            g.player.bullets.remove(bullet)
-                        g.return_bullet_to_pool(bullet)
-                        continue
-                # (removido) fail-safe duplicado para colisões de tiros em morcegos
-                if 31 <= g.current_level <= 40:
-                    for airplane in getattr(g, "airplanes", [])[:]:
-                        if bullet.rect.colliderect(getattr(airplane, "rect", bullet.rect)):
+                    for disk in live(getattr(g, "flying_disks", [])):
+                        if bullet.rect.colliderect(getattr(disk, "rect", bullet.rect)):
                             hit_local = True
+                            g.add_score(90)
                             try:
-                                explosion = g.get_pooled_explosion(airplane.x, airplane.y, exp_img)
-                                g.explosions.append(explosion)
-                                sfx.play_sound_effect("explosion")
+                                sfx.play_sound_effect("bird-hit")
                             except Exception:
                                 pass
-                            g.add_score(50)
                             try:
-                                if airplane in g.airplanes:
-                                    g.airplanes.remove(airplane)
+                                g.kill_entity(disk)
                             except Exception:
                                 pass
                             break
-                    if hit_local:
-                        if bullet in g.player.bullets:
-                            g.player.bullets.remove(bullet)
-                        g.return_bullet_to_pool(bullet)
-                        continue
-                    if 41 <= g.current_level <= 50:
-                        for disk in getattr(g, "flying_disks", [])[:]:
-                            if bullet.rect.colliderect(getattr(disk, "rect", bullet.rect)):
-                                hit_local = True
-                                g.add_score(90)
-                                try:
-                                    sfx.play_sound_effect("bird-hit")
-                                except Exception:
-                                    pass
-                                try:
-                                    if disk in g.flying_disks:
-                                        g.flying_disks.remove(disk)
-                                except Exception:
-                                    pass
-                                break
-                    if hit_local:
-                        if bullet in g.player.bullets:
-                            g.player.bullets.remove(bullet)
-                        g.return_bullet_to_pool(bullet)
-                        continue
-
-            # Fail-safe: atualizar projéteis órfãos
-            # REMOVIDO: Atualização duplicada que causava bug de velocidade
-            # Os orphan_missiles e orphan_lasers já são atualizados mais adiante no código
-            # (linhas ~2210-2230), e a dupla atualização causava problemas com o efeito tempo
-
-            # Sequência de captura do boss (nível 51) antecipada
-            if (
-                g.current_level == 51
-                and hasattr(g, "boss_alien")
-                and g.boss_alien
-            ):
-                try:
-                    if (
-                        not g.boss_alien_captured
-                        and g.boss_alien.is_captured(g.player.rect)
-                    ):
-                        g.boss_alien_captured = True
-                        g.capture_sequence_timer = 0
-                        g.capture_flash_timer = 0
-                        g.capture_flash_state = False
-                        try:
-                            g.music.play_music("capture")
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-                if g.boss_alien_captured:
-                    g.capture_sequence_timer += 1
-                    g.capture_flash_timer += 1
-                    if g.capture_flash_timer >= 30:
-                        g.capture_flash_timer = 0
-                        g.capture_flash_state = not g.capture_flash_state
-                    if g.capture_sequence_timer >= 300:
-                        g.state = GameState.ENDING_VIDEO
-
-            # Atualizar jogador
-            player_action = g.player.update(
-                g.platforms,
-                g.image.bullet_image,
-                g.camera_x,
-                g.joystick if g.joystick_connected else None,
-                g,
-            )
+                if hit_local:
+                    g.kill_entity(bullet)
+                    continue
 
-            # Verificar ações do jogador e tocar sons
-            if player_action == "jump":
-                g.sound_effects.play_sound_effect("jump")
-            elif player_action == "shot":
-                g.sound_effects.play_sound_effect("shot")
-
-            # Verificar se jogador morreu (retorno False)
-            if player_action is False:
-                # Jogador morreu (caiu da tela) - decrementar vida
-                g.lives -= 1
-                if g.lives <= 0:
-                    # Disparar rotina de game over e esmaecer
-                    # enquanto o som toca
-                    if g.ranking_manager.is_high_score(g.score):
-                        g.state = GameState.ENTER_NAME
-                    else:
-                        g.state = GameState.GAME_OVER
-                    g.start_game_over_hold()
+        # Fail-safe: atualizar projéteis órfãos
+        # REMOVIDO: Atualização duplicada que causava bug de velocidade
+        # Os orphan_missiles e orphan_lasers já são atualizados mais adiante no código
+        # (linhas ~2210-2230), e a dupla atualização causava problemas com o efeito tempo
+
+        # Sequência de captura do boss (nível 51) antecipada
+        if (
+            g.current_level == 51
+            and hasattr(g, "boss_alien")
+            and g.boss_alien
+        ):
+            try:
+                if (
+                    not g.boss_alien_captured
+                    and g.boss_alien.is_captured(g.player.rect)
+                ):
+                    g.boss_alien_captured = True
+                    g.capture_sequence_timer = 0
+                    g.capture_flash_timer = 0
+                    g.capture_flash_state = False
+                    try:
+                        g.music.play_music("capture")
+                    except Exception:
+                        pass
+            except Exception:
+                pass
+            if g.boss_alien_captured:
+                g.capture_sequence_timer += 1
+                g.capture_flash_timer += 1
+                if g.capture_flash_timer >= 30:
+                    g.capture_flash_timer = 0
+                    g.capture_flash_state = not g.capture_flash_state
+                if g.capture_sequence_timer >= 300:
+                    g.state = GameState.ENDING_VIDEO
+
+        # Atualizar jogador
+        player_action = g.player.update(
+            g.platforms,
+            g.image.bullet_image,
+            g.camera_x,
+            g.joystick if g.joystick_connected else None,
+            g,
+        )
+
+        # Verificar ações do jogador e tocar sons
+        if player_action == "jump":
+            g.sound_effects.play_sound_effect("jump")
+        elif player_action == "shot":
+            g.sound_effects.play_sound_effect("shot")
+
+        # Verificar se jogador morreu (retorno False)
+        if player_action is False:
+            # Jogador morreu (caiu da tela) - decrementar vida
+            g.lives -= 1
+            if g.lives <= 0:
+                # Disparar rotina de game over e esmaecer
+                # enquanto o som toca
+                if g.ranking_manager.is_high_score(g.score):
+                    g.state = GameState.ENTER_NAME
                 else:
-                    # Ainda tem vidas, reiniciar nível atual
-                    Level.init_level(g)
-                    # Tocar música do nível atual
-                    g.music.play_level_music(g, g.current_level)
-            # Verificar bandeira e abdução imediatamente após atualizar jogador
-            if g.flag and g.player.rect.colliderect(getattr(g.flag, "rect", g.player.rect)):
+                    g.state = GameState.GAME_OVER
+                g.start_game_over_hold()
+            else:
+                # Ainda tem vidas, reiniciar nível atual
+                Level.init_level(g)
+                # Tocar música do nível atual
+                g.music.play_level_music(g, g.current_level)
+        # Verificar bandeira e abdução imediatamente após atualizar jogador
+        if g.flag and g.player.rect.colliderect(getattr(g.flag, "rect", g.player.rect)):
+            if not getattr(g, "hold_active", False):
+                g.start_level_end_hold(g.current_level >= g.max_levels)
+                g._next_level_after_hold = True
+        if (
+            getattr(g, "spaceship", None)
+            and g.player.rect.colliderect(getattr(g.spaceship, "abduction_rect", g.player.rect))
+        ):
+            if not g.player.is_being_abducted:
+                g.player.start_abduction()
+            if g.player.abduction_timer >= 600:
                 if not getattr(g, "hold_active", False):
                     g.start_level_end_hold(g.current_level >= g.max_levels)
                     g._next_level_after_hold = True
-            if (
-                getattr(g, "spaceship", None)
-                and g.player.rect.colliderect(getattr(g.spaceship, "abduction_rect", g.player.rect))
-            ):
-                if not g.player.is_being_abducted:
-                    g.player.start_abduction()
-                if g.player.abduction_timer >= 600:
-                    if not getattr(g, "hold_active", False):
-                        g.start_level_end_hold(g.current_level >= g.max_levels)
-                        g._next_level_after_hold = True
-            # Coleta de vidas extras
-            if hasattr(g, "extra_lives") and g.extra_lives:
-                remaining_items = []
-                for item in g.extra_lives:
+        # Coleta de vidas extras
+        if hasattr(g, "extra_lives") and g.extra_lives:
+            remaining_items = []
+            for item in g.extra_lives:
+                try:
+                    item.update()
+                except Exception:
+                    pass
+                if g.player.rect.colliderect(getattr(item, "rect", g.player.rect)):
+                    g.lives += 1
+                    if hasattr(g, "collected_extra_life_levels"):
+                        g.collected_extra_life_levels.add(g.current_level)
                     try:
-                        item.update()
+                        sfx.play_sound_effect("new-life")
                     except Exception:
                         pass
-                    if g.player.rect.colliderect(getattr(item, "rect", g.player.rect)):
-                        g.lives += 1
-                        if hasattr(g, "collected_extra_life_levels"):
-                            g.collected_extra_life_levels.add(g.current_level)
+                else:
+                    remaining_items.append(item)
+            g.extra_lives = remaining_items
+        # Spawn antecipado de gotas de chuva (níveis 7-10)
+        if 7 <= g.current_level <= 10:
+            g.raindrop_spawn_timer += 1
+            if g.raindrop_spawn_timer >= getattr(g, "raindrop_spawn_interval", 999999):
+                import random
+                for i in range(getattr(g, "raindrops_per_spawn", 1)):
+                    if not self._hazard_room(g.raindrops):
+                        break
+                    drop_x = g.camera_x + random.randint(0, WIDTH)
+                    drop_y = -20 - (i * 15)
+                    drop_img = getattr(g.image, "raindrop_img", None)
+                    g.raindrops.append(Raindrop(drop_x, drop_y, drop_img))
+                    self._notify_spawn(g.raindrops[-1])
+                g.raindrop_spawn_timer = 0
+            # Colisão e culling simples para garantir consistência nos testes
+            g.raindrops = [
+                d
+                for d in getattr(g, "raindrops", [])
+                if (
+                    d.x > g.camera_x - 100
+                    and d.x < g.camera_x + WIDTH + 100
+                )
+            ]
+            for drop in live(getattr(g, "raindrops", [])):
+                if collide_precise(g.player, drop, g.player.rect):
+                    if getattr(drop, "is_dead", False):
+                        continue
+                    if g.player.is_invulnerable or not getattr(g.player, "on_ground", True):
                         try:
-                            sfx.play_sound_effect("new-life")
+                            drop.die()
+                            g.sound_effects.play_sound_effect("water-hit")
                         except Exception:
                             pass
+                        g.add_score(20)
                     else:
-                        remaining_items.append(item)
-                g.extra_lives = remaining_items
-            # Spawn antecipado de gotas de chuva (níveis 7-10)
-            if 7 <= g.current_level <= 10:
-                g.raindrop_spawn_timer += 1
-                if g.raindrop_spawn_timer >= getattr(g, "raindrop_spawn_interval", 999999):
-                    import random
-                    for i in range(getattr(g, "raindrops_per_spawn", 1)):
-                        drop_x = g.camera_x + random.randint(0, WIDTH)
-                        drop_y = -20 - (i * 15)
-                        drop_img = getattr(g.image, "raindrop_img", None)
-                        g.raindrops.append(Raindrop(drop_x, drop_y, drop_img))
-                    g.raindrop_spawn_timer = 0
-                # Colisão e culling simples para garantir consistência nos testes
-                g.raindrops = [
-                    d
-                    for d in getattr(g, "raindrops", [])
-                    if (
-                        d.x > g.camera_x - 100
-                        and d.x < g.camera_x + WIDTH + 100
-                    )
-                ]
-                for drop in getattr(g, "raindrops", [])[:]:
-                    if g.player.rect.colliderect(getattr(drop, "rect", g.player.rect)):
-                        if getattr(drop, "is_dead", False):
-                            continue
-                        if g.player.is_invulnerable or not getattr(g.player, "on_ground", True):
-                            try:
-                                drop.die()
-                                g.sound_effects.play_sound_effect("water-hit")
-                            except Exception:
-                                pass
-                            g.add_score(20)
-                        else:
-                            if not g.player.is_hit:
-                                if getattr(g, "shield_active", False):
-                                    g.shield_active = False
-                                    try:
-                                        drop.die()
-                                        g.sound_effects.play_sound_effect("water-hit")
-                                    except Exception:
-                                        pass
-                                else:
-                                    g.player.take_hit()
-                                    try:
-                                        g.sound_effects.play_sound_effect("player-hit")
-                                    except Exception:
-                                        pass
-                                    try:
-                                        drop.die()
-                                    except Exception:
-                                        pass
-                                    g.lives -= 1
-                                    if g.lives <= 0:
-                                        if g.ranking_manager.is_high_score(g.score):
-                                            g.state = GameState.ENTER_NAME
-                                        else:
-                                            g.state = GameState.GAME_OVER
-                                        g.start_game_over_hold()
-            # Spawn antecipado de lava-drops (níveis 27-30)
-            if 27 <= g.current_level <= 30:
-                g.lavadrop_spawn_timer += 1
-                if g.lavadrop_spawn_timer >= getattr(g, "lavadrop_spawn_interval", 999999):
-                    import random
-                    for i in range(getattr(g, "lavadrops_per_spawn", 0)):
-                        drop_x = g.camera_x + random.randint(0, WIDTH)
-                        drop_y = -20 - (i * 15)
-                        drop_img = getattr(g.image, "lava_drop_img", None)
-                        g.lava_drops.append(LavaDrop(drop_x, drop_y, drop_img))
-                    g.lavadrop_spawn_timer = 0
-                # Colisão antecipada com lava-drops
-                for drop in getattr(g, "lava_drops", [])[:]:
-                    if g.player.rect.colliderect(getattr(drop, "rect", g.player.rect)):
-                        if not g.player.is_invulnerable and not g.player.is_hit:
+                        if not g.player.is_hit:
                             if getattr(g, "shield_active", False):
                                 g.shield_active = False
-                                g.player.take_hit()
                                 try:
-                                    g.sound_effects.play_sound_effect("player-hit")
+                                    drop.die()
+                                    g.sound_effects.play_sound_effect("water-hit")
                                 except Exception:
                                     pass
                             else:
@@ -598,107 +698,8 @@ class Update:
                                     g.sound_effects.play_sound_effect("player-hit")
                                 except Exception:
                                     pass
-                                g.lives -= 1
-                                if g.lives <= 0:
-                                    if g.ranking_manager.is_high_score(g.score):
-                                        g.state = GameState.ENTER_NAME
-                                    else:
-                                        g.state = GameState.GAME_OVER
-                                    g.start_game_over_hold()
-                # Culling com rolagem da câmera
-                g.lava_drops = [
-                    d
-                    for d in getattr(g, "lava_drops", [])
-                    if (
-                        d.x > g.camera_x - 100
-                        and d.x < g.camera_x + WIDTH + 100
-                    )
-                ]
-            # Spawn antecipado de morcegos e estrelas (níveis 17-20)
-            if 17 <= g.current_level <= 20:
-                try:
-                    if getattr(g, "difficulty", Difficulty.NORMAL) == Difficulty.EASY:
-                        qty_factor = 0.7
-                    elif getattr(g, "difficulty", Difficulty.NORMAL) == Difficulty.HARD:
-                        qty_factor = 1.4
-                    else:
-                        qty_factor = 1.0
-                except Exception:
-                    qty_factor = 1.0
-                max_bats = int(getattr(g, "max_bats_visible", int(8 * qty_factor)))
-                max_stars = max(1, int(4 * qty_factor))
-                combined_max = max(1, int((4 + (g.current_level - 16)) * qty_factor))
-                vb = 0
-                vs = 0
-                try:
-                    vb = sum(
-                        1
-                        for b in getattr(g, "bats", [])
-                        if (b.x > g.camera_x - 50 and b.x < g.camera_x + WIDTH + 150)
-                    )
-                except Exception:
-                    vb = len(getattr(g, "bats", []))
-                try:
-                    vs = sum(
-                        1
-                        for s in getattr(g, "shooting_stars", [])
-                        if (s.x > g.camera_x - 50 and s.x < g.camera_x + WIDTH + 150)
-                    )
-                except Exception:
-                    vs = len(getattr(g, "shooting_stars", []))
-                g.bat_spawn_timer += 1
-                bs = 0
-                if g.bat_spawn_timer >= getattr(g, "bat_spawn_interval", 999999):
-                    import random
-                    comb_allow = max(0, combined_max - (vb + vs))
-                    allow = min(max(0, max_bats - vb), comb_allow)
-                    bs = min(getattr(g, "bats_per_spawn", 0), allow)
-                    for i in range(bs):
-                        bat_y = random.randint(HEIGHT // 4, HEIGHT - 150)
-                        bat_x = g.camera_x + WIDTH + 50 + (i * 100)
-                        bat_images = (
-                            (
-                                g.image.bat_img1,
-                                g.image.bat_img2,
-                                g.image.bat_img3,
-                            )
-                            if hasattr(g.image, "bat_img1")
-                            else None
-                        )
-                        g.bats.append(Bat(bat_x, bat_y, bat_images))
-                    g.bat_spawn_timer = 0
-                g.shooting_star_spawn_timer += 1
-                if g.shooting_star_spawn_timer >= getattr(g, "shooting_star_spawn_interval", 999999):
-                    import random
-                    comb_allow_s = max(0, combined_max - (vb + vs + bs))
-                    allow_s = min(max(0, max_stars - vs), comb_allow_s)
-                    to_spawn_s = min(getattr(g, "shooting_stars_per_spawn", 0), allow_s)
-                    for i in range(to_spawn_s):
-                        star_y = random.randint(HEIGHT // 6, HEIGHT // 2)
-                        star_x = g.camera_x + WIDTH + 50 + (i * 90)
-                        star_img = getattr(g.image, "shooting_star_img", None)
-                        g.shooting_stars.append(ShootingStar(star_x, star_y, star_img))
-                    g.shooting_star_spawn_timer = 0
-            # Spawn antecipado de meteors (níveis 47-50)
-            if 47 <= g.current_level <= 50:
-                g.meteor_spawn_timer += 1
-                if g.meteor_spawn_timer >= getattr(g, "meteor_spawn_interval", 999999):
-                    import random
-                    for i in range(getattr(g, "meteors_per_spawn", 0)):
-                        x = g.camera_x + WIDTH + 50 + (i * 70)
-                        y = random.randint(0, HEIGHT // 2)
-                        g.meteors.append(Meteor(x, y, getattr(g.image, "meteor_img", None)))
-                    g.meteor_spawn_timer = 0
-            if g.current_level == 51:
-                for fire in getattr(g, "fires", [])[:]:
-                    if g.player.rect.colliderect(getattr(fire, "rect", g.player.rect)):
-                        if not g.player.is_invulnerable and not g.player.is_hit:
-                            if getattr(g, "shield_active", False):
-                                g.shield_active = False
-                            else:
-                                g.player.take_hit()
                                 try:
-                                    g.sound_effects.play_sound_effect("player-hit")
+                                    drop.die()
                                 except Exception:
                                     pass
                                 g.lives -= 1
@@ -708,158 +709,686 @@ class Update:
                                     else:
                                         g.state = GameState.GAME_OVER
                                     g.start_game_over_hold()
+        # Spawn antecipado de lava-drops (níveis 27-30)
+        if 27 <= g.current_level <= 30:
+            g.lavadrop_spawn_timer += 1
+            if g.lavadrop_spawn_timer >= getattr(g, "lavadrop_spawn_interval", 999999):
+                import random
+                for i in range(getattr(g, "lavadrops_per_spawn", 0)):
+                    if not self._hazard_room(g.lava_drops):
                         break
-            # Colisões antecipadas com tartarugas/aranhas (compatibilidade de testes)
-            if g.current_level <= 20:
-                for turtle in getattr(g, "turtles", [])[:]:
-                    if g.player.rect.colliderect(getattr(turtle, "rect", g.player.rect)):
-                        if hasattr(turtle, "is_dead") and turtle.is_dead:
-                            continue
-                        if g.player.is_invulnerable:
+                    drop_x = g.camera_x + random.randint(0, WIDTH)
+                    drop_y = -20 - (i * 15)
+                    drop_img = getattr(g.image, "lava_drop_img", None)
+                    g.lava_drops.append(LavaDrop(drop_x, drop_y, drop_img))
+                    self._notify_spawn(g.lava_drops[-1])
+                g.lavadrop_spawn_timer = 0
+            # Colisão antecipada com lava-drops
+            for drop in live(getattr(g, "lava_drops", [])):
+                if collide_precise(g.player, drop, g.player.rect):
+                    if not g.player.is_invulnerable and not g.player.is_hit:
+                        if getattr(g, "shield_active", False):
+                            g.shield_active = False
+                            g.player.take_hit()
                             try:
-                                if hasattr(turtle, "die"):
-                                    turtle.die()
-                                g.sound_effects.play_sound_effect("bird-hit")
+                                g.sound_effects.play_sound_effect("player-hit")
                             except Exception:
                                 pass
-                            g.add_score(20)
                         else:
-                            if not g.player.is_hit:
-                                if getattr(g, "shield_active", False):
-                                    g.shield_active = False
-                                    try:
-                                        if hasattr(turtle, "die"):
-                                            turtle.die()
-                                        g.sound_effects.play_sound_effect("bird-hit")
-                                    except Exception:
-                                        pass
-                                else:
-                                    g.player.take_hit()
-                                    try:
-                                        g.sound_effects.play_sound_effect("player-hit")
-                                    except Exception:
-                                        pass
-                                    try:
-                                        if hasattr(turtle, "die"):
-                                            turtle.die()
-                                        g.sound_effects.play_sound_effect("bird-hit")
-                                    except Exception:
-                                        pass
-                                    g.lives -= 1
-                                    if g.lives <= 0:
-                                        if g.ranking_manager.is_high_score(g.score):
-                                            g.state = GameState.ENTER_NAME
-                                        else:
-                                            g.state = GameState.GAME_OVER
-                                        g.start_game_over_hold()
-                        break
-            else:
-                for spider in getattr(g, "spiders", [])[:]:
-                    if g.player.rect.colliderect(getattr(spider, "rect", g.player.rect)):
-                        if hasattr(spider, "is_dead") and spider.is_dead:
-                            continue
-                        if g.player.is_invulnerable:
+                            g.player.take_hit()
                             try:
-                                if hasattr(spider, "die"):
-                                    spider.die()
-                                g.sound_effects.play_sound_effect("bird-hit")
+                                g.sound_effects.play_sound_effect("player-hit")
                             except Exception:
                                 pass
-                            g.add_score(35)
-                        else:
-                            if not g.player.is_hit:
-                                if getattr(g, "shield_active", False):
-                                    g.shield_active = False
-                                    try:
-                                        if hasattr(spider, "die"):
-                                            spider.die()
-                                        g.sound_effects.play_sound_effect("bird-hit")
-                                    except Exception:
-                                        pass
+                            g.lives -= 1
+                            if g.lives <= 0:
+                                if g.ranking_manager.is_high_score(g.score):
+                                    g.state = GameState.ENTER_NAME
                                 else:
-                                    g.player.take_hit()
-                                    try:
-                                        g.sound_effects.play_sound_effect("player-hit")
-                                    except Exception:
-                                        pass
-                                    try:
-                                        if hasattr(spider, "die"):
-                                            spider.die()
-                                        g.sound_effects.play_sound_effect("bird-hit")
-                                    except Exception:
-                                        pass
-                                    g.lives -= 1
-                                    if g.lives <= 0:
-                                        if g.ranking_manager.is_high_score(g.score):
-                                            g.state = GameState.ENTER_NAME
-                                        else:
-                                            g.state = GameState.GAME_OVER
-                                        g.start_game_over_hold()
+                                    g.state = GameState.GAME_OVER
+                                g.start_game_over_hold()
+            # Culling com rolagem da câmera
+            g.lava_drops = [
+                d
+                for d in getattr(g, "lava_drops", [])
+                if (
+                    d.x > g.camera_x - 100
+                    and d.x < g.camera_x + WIDTH + 100
+                )
+            ]
+        # Spawn antecipado de morcegos e estrelas (níveis 17-20)
+        if 17 <= g.current_level <= 20:
+            try:
+                if getattr(g, "difficulty", Difficulty.NORMAL) == Difficulty.EASY:
+                    qty_factor = 0.7
+                elif getattr(g, "difficulty", Difficulty.NORMAL) == Difficulty.HARD:
+                    qty_factor = 1.4
+                else:
+                    qty_factor = 1.0
+            except Exception:
+                qty_factor = 1.0
+            max_bats = int(getattr(g, "max_bats_visible", int(8 * qty_factor)))
+            max_stars = max(1, int(4 * qty_factor))
+            combined_max = max(1, int((4 + (g.current_level - 16)) * qty_factor))
+            vb = 0
+            vs = 0
+            try:
+                vb = sum(
+                    1
+                    for b in getattr(g, "bats", [])
+                    if (b.x > g.camera_x - 50 and b.x < g.camera_x + WIDTH + 150)
+                )
+            except Exception:
+                vb = len(getattr(g, "bats", []))
+            try:
+                vs = sum(
+                    1
+                    for s in getattr(g, "shooting_stars", [])
+                    if (s.x > g.camera_x - 50 and s.x < g.camera_x + WIDTH + 150)
+                )
+            except Exception:
+                vs = len(getattr(g, "shooting_stars", []))
+            g.bat_spawn_timer += 1
+            bs = 0
+            if g.bat_spawn_timer >= getattr(g, "bat_spawn_interval", 999999):
+                import random
+                comb_allow = max(0, combined_max - (vb + vs))
+                allow = min(max(0, max_bats - vb), comb_allow)
+                bs = min(getattr(g, "bats_per_spawn", 0), allow)
+                for i in range(bs):
+                    bat_y = random.randint(HEIGHT // 4, HEIGHT - 150)
+                    bat_x = g.camera_x + WIDTH + 50 + (i * 100)
+                    bat_images = (
+                        (
+                            g.image.bat_img1,
+                            g.image.bat_img2,
+                            g.image.bat_img3,
+                        )
+                        if hasattr(g.image, "bat_img1")
+                        else None
+                    )
+                    g.bats.append(Bat(bat_x, bat_y, bat_images))
+                    self._notify_spawn(g.bats[-1])
+                g.bat_spawn_timer = 0
+            g.shooting_star_spawn_timer += 1
+            if g.shooting_star_spawn_timer >= getattr(g, "shooting_star_spawn_interval", 999999):
+                import random
+                comb_allow_s = max(0, combined_max - (vb + vs + bs))
+                allow_s = min(max(0, max_stars - vs), comb_allow_s)
+                to_spawn_s = min(getattr(g, "shooting_stars_per_spawn", 0), allow_s)
+                for i in range(to_spawn_s):
+                    if not self._hazard_room(g.shooting_stars):
+                        break
+                    star_y = random.randint(HEIGHT // 6, HEIGHT // 2)
+                    star_x = g.camera_x + WIDTH + 50 + (i * 90)
+                    star_img = getattr(g.image, "shooting_star_img", None)
+                    g.shooting_stars.append(ShootingStar(star_x, star_y, star_img))
+                    self._notify_spawn(g.shooting_stars[-1])
+                g.shooting_star_spawn_timer = 0
+        # Spawn antecipado de meteors (níveis 47-50)
+        if 47 <= g.current_level <= 50:
+            g.meteor_spawn_timer += 1
+            if g.meteor_spawn_timer >= getattr(g, "meteor_spawn_interval", 999999):
+                import random
+                for i in range(getattr(g, "meteors_per_spawn", 0)):
+                    if not self._hazard_room(g.meteors):
+                        break
+                    x = g.camera_x + WIDTH + 50 + (i * 70)
+                    y = random.randint(0, HEIGHT // 2)
+                    g.meteors.append(Meteor(x, y, getattr(g.image, "meteor_img", None)))
+                    self._notify_spawn(g.meteors[-1])
+                g.meteor_spawn_timer = 0
+        if g.current_level == 51:
+            for fire in live(getattr(g, "fires", [])):
+                if collide_precise(g.player, fire, g.player.rect):
+                    if not g.player.is_invulnerable and not g.player.is_hit:
+                        if getattr(g, "shield_active", False):
+                            g.shield_active = False
+                        else:
+                            g.player.take_hit()
+                            try:
+                                g.sound_effects.play_sound_effect("player-hit")
+                            except Exception:
+                                pass
+                            g.lives -= 1
+                            if g.lives <= 0:
+                                if g.ranking_manager.is_high_score(g.score):
+                                    g.state = GameState.ENTER_NAME
+                                else:
+                                    g.state = GameState.GAME_OVER
+                                g.start_game_over_hold()
+                    break
+        # Colisões antecipadas com tartarugas/aranhas (compatibilidade de testes)
+        if g.current_level <= 20:
+            for turtle in live(getattr(g, "turtles", [])):
+                if g.player.rect.colliderect(getattr(turtle, "rect", g.player.rect)):
+                    if hasattr(turtle, "is_dead") and turtle.is_dead:
+                        continue
+                    if g.player.is_invulnerable:
+                        try:
+                            if hasattr(turtle, "die"):
+                                turtle.die()
+                            g.sound_effects.play_sound_effect("bird-hit")
+                        except Exception:
+                            pass
+                        g.add_score(20)
+                    else:
+                        if not g.player.is_hit:
+                            if getattr(g, "shield_active", False):
+                                g.shield_active = False
+                                try:
+                                    if hasattr(turtle, "die"):
+                                        turtle.die()
+                                    g.sound_effects.play_sound_effect("bird-hit")
+                                except Exception:
+                                    pass
+                            else:
+                                g.player.take_hit()
+                                try:
+                                    g.sound_effects.play_sound_effect("player-hit")
+                                except Exception:
+                                    pass
+                                try:
+                                    if hasattr(turtle, "die"):
+                                        turtle.die()
+                                    g.sound_effects.play_sound_effect("bird-hit")
+                                except Exception:
+                                    pass
+                                g.lives -= 1
+                                if g.lives <= 0:
+                                    if g.ranking_manager.is_high_score(g.score):
+                                        g.state = GameState.ENTER_NAME
+                                    else:
+                                        g.state = GameState.GAME_OVER
+                                    g.start_game_over_hold()
+                    break
+        else:
+            for spider in live(getattr(g, "spiders", [])):
+                if g.player.rect.colliderect(getattr(spider, "rect", g.player.rect)):
+                    if hasattr(spider, "is_dead") and spider.is_dead:
+                        continue
+                    if g.player.is_invulnerable:
+                        try:
+                            if hasattr(spider, "die"):
+                                spider.die()
+                            g.sound_effects.play_sound_effect("bird-hit")
+                        except Exception:
+                            pass
+                        g.add_score(35)
+                    else:
+                        if not g.player.is_hit:
+                            if getattr(g, "shield_active", False):
+                                g.shield_active = False
+                                try:
+                                    if hasattr(spider, "die"):
+                                        spider.die()
+                                    g.sound_effects.play_sound_effect("bird-hit")
+                                except Exception:
+                                    pass
+                            else:
+                                g.player.take_hit()
+                                try:
+                                    g.sound_effects.play_sound_effect("player-hit")
+                                except Exception:
+                                    pass
+                                try:
+                                    if hasattr(spider, "die"):
+                                        spider.die()
+                                    g.sound_effects.play_sound_effect("bird-hit")
+                                except Exception:
+                                    pass
+                                g.lives -= 1
+                                if g.lives <= 0:
+                                    if g.ranking_manager.is_high_score(g.score):
+                                        g.state = GameState.ENTER_NAME
+                                    else:
+                                        g.state = GameState.GAME_OVER
+                                    g.start_game_over_hold()
+                    break
+        # Colisões antecipadas com aves (<=20)
+        if g.current_level <= 20:
+            for bird in live(getattr(g, "birds", [])):
+                try:
+                    player_rect = g.player.get_airborne_collision_rect()
+                except Exception:
+                    player_rect = g.player.rect
+                if collide_precise(g.player, bird, player_rect):
+                    if hasattr(bird, "is_dead") and bird.is_dead:
+                        continue
+                    if g.player.is_invulnerable:
+                        try:
+                            explosion = g.get_pooled_explosion(
+                                bird.x,
+                                bird.y,
+                                exp_img,
+                            )
+                            g.explosions.append(explosion)
+                        except Exception:
+                            pass
+                        try:
+                            g.kill_entity(bird)
+                        except Exception:
+                            pass
+                        g.add_score(20)
+                    else:
+                        if not g.player.is_hit:
+                            if getattr(g, "shield_active", False):
+                                g.shield_active = False
+                                try:
+                                    explosion = g.get_pooled_explosion(
+                                        bird.x,
+                                        bird.y,
+                                        exp_img,
+                                    )
+                                    g.explosions.append(explosion)
+                                except Exception:
+                                    pass
+                                try:
+                                    g.kill_entity(bird)
+                                except Exception:
+                                    pass
+                            else:
+                                g.player.take_hit()
+                                try:
+                                    sfx.play_sound_effect("player-hit")
+                                except Exception:
+                                    pass
+                                try:
+                                    explosion = g.get_pooled_explosion(
+                                        bird.x,
+                                        bird.y,
+                                        exp_img,
+                                    )
+                                    g.explosions.append(explosion)
+                                except Exception:
+                                    pass
+                                try:
+                                    g.kill_entity(bird)
+                                except Exception:
+                                    pass
+                                g.lives -= 1
+                                if g.lives <= 0:
+                                    if g.ranking_manager.is_high_score(g.score):
+                                        g.state = GameState.ENTER_NAME
+                                    else:
+                                        g.state = GameState.GAME_OVER
+                                    g.start_game_over_hold()
+                    break
+        # Colisões antecipadas com robôs (31-40)
+        if 31 <= g.current_level <= 40 and not g.player.is_being_abducted:
+            for robot in live(getattr(g, "robots", [])):
+                if g.player.rect.colliderect(getattr(robot, "rect", g.player.rect)):
+                    if g.player.is_invulnerable:
+                        try:
+                            explosion = g.get_pooled_explosion(
+                                robot.x,
+                                robot.y,
+                                exp_img,
+                            )
+                            g.explosions.append(explosion)
+                            sfx.play_sound_effect("explosion")
+                        except Exception:
+                            pass
+                        for missile in getattr(robot, "missiles", []):
+                            g.orphan_missiles.append(missile)
+                        try:
+                            g.kill_entity(robot)
+                        except Exception:
+                            pass
+                        g.add_score(50)
+                    else:
+                        if not g.player.is_hit:
+                            if getattr(g, "shield_active", False):
+                                g.shield_active = False
+                                try:
+                                    explosion = g.get_pooled_explosion(
+                                        robot.x,
+                                        robot.y,
+                                        exp_img,
+                                    )
+                                    g.explosions.append(explosion)
+                                    sfx.play_sound_effect("explosion")
+                                except Exception:
+                                    pass
+                                for missile in getattr(robot, "missiles", []):
+                                    g.orphan_missiles.append(missile)
+                                try:
+                                    g.kill_entity(robot)
+                                except Exception:
+                                    pass
+                            else:
+                                g.player.take_hit()
+                                try:
+                                    sfx.play_sound_effect("player-hit")
+                                except Exception:
+                                    pass
+                                try:
+                                    explosion = g.get_pooled_explosion(
+                                        robot.x,
+                                        robot.y,
+                                        exp_img,
+                                    )
+                                    g.explosions.append(explosion)
+                                    sfx.play_sound_effect("explosion")
+                                except Exception:
+                                    pass
+                                for missile in getattr(robot, "missiles", []):
+                                    g.orphan_missiles.append(missile)
+                                try:
+                                    g.kill_entity(robot)
+                                except Exception:
+                                    pass
+                                g.lives -= 1
+                                if g.lives <= 0:
+                                    if g.ranking_manager.is_high_score(g.score):
+                                        g.state = GameState.ENTER_NAME
+                                    else:
+                                        g.state = GameState.GAME_OVER
+                                    g.start_game_over_hold()
+                    break
+        # Colisões antecipadas com aliens (41-50)
+        if 41 <= g.current_level <= 50 and not g.player.is_being_abducted:
+            for alien in live(getattr(g, "aliens", [])):
+                if g.player.rect.colliderect(getattr(alien, "rect", g.player.rect)):
+                    if hasattr(alien, "is_dead") and alien.is_dead:
+                        continue
+                    if g.player.is_invulnerable:
+                        try:
+                            if hasattr(alien, "die"):
+                                alien.die()
+                                sfx.play_sound_effect("bird-hit")
+                        except Exception:
+                            pass
+                        for laser in getattr(alien, "lasers", []):
+                            g.orphan_lasers.append(laser)
+                        g.add_score(60)
+                    else:
+                        if not g.player.is_hit:
+                            if getattr(g, "shield_active", False):
+                                g.shield_active = False
+                                try:
+                                    if hasattr(alien, "die"):
+                                        alien.die()
+                                        sfx.play_sound_effect("bird-hit")
+                                except Exception:
+                                    pass
+                                for laser in getattr(alien, "lasers", []):
+                                    g.orphan_lasers.append(laser)
+                            else:
+                                g.player.take_hit()
+                                try:
+                                    sfx.play_sound_effect("player-hit")
+                                except Exception:
+                                    pass
+                                try:
+                                    if hasattr(alien, "die"):
+                                        alien.die()
+                                        sfx.play_sound_effect("bird-hit")
+                                except Exception:
+                                    pass
+                                for laser in getattr(alien, "lasers", []):
+                                    g.orphan_lasers.append(laser)
+                                g.lives -= 1
+                                if g.lives <= 0:
+                                    if g.ranking_manager.is_high_score(g.score):
+                                        g.state = GameState.ENTER_NAME
+                                    else:
+                                        g.state = GameState.GAME_OVER
+                            break
+        # Meteoro (47-50) — colisão antecipada com jogador
+        if 47 <= g.current_level <= 50:
+            for met in live(getattr(g, "meteors", [])):
+                try:
+                    player_rect = g.player.get_airborne_collision_rect()
+                except Exception:
+                    player_rect = g.player.rect
+                if collide_precise(g.player, met, player_rect):
+                    if getattr(met, "is_dead", False):
+                        continue
+                    if g.player.is_invulnerable:
+                        pass
+                    else:
+                        if not g.player.is_hit:
+                            if getattr(g, "shield_active", False):
+                                g.shield_active = False
+                            else:
+                                g.player.take_hit()
+                                try:
+                                    g.sound_effects.play_sound_effect("player-hit")
+                                except Exception:
+                                    pass
+                                g.lives -= 1
+                                if g.lives <= 0:
+                                    if g.ranking_manager.is_high_score(g.score):
+                                        g.state = GameState.ENTER_NAME
+                                    else:
+                                        g.state = GameState.GAME_OVER
+                                    g.start_game_over_hold()
+                    break
+        # Colisões antecipadas de tiros vs inimigos leves
+        # Pássaros, morcegos, aviões, discos
+        for bullet in live(g.player.bullets):
+            hit = False
+            for bird in live(getattr(g, "birds", [])):
+                if bullet.rect.colliderect(getattr(bird, "rect", bullet.rect)):
+                    hit = True
+                    try:
+                        if hasattr(bird, "die"):
+                            bird.die()
+                        sfx.play_sound_effect("bird-hit")
+                    except Exception:
+                        pass
+                    # Não remover pássaro imediatamente; permitir animação de morte
+                    g.add_score(100)
+                    break
+            if hit:
+                g.kill_entity(bullet)
+                continue
+            # Turtles (<=20)
+            if g.current_level <= 20:
+                for turtle in live(getattr(g, "turtles", [])):
+                    if getattr(turtle, "is_dead", False):
+                        continue
+                    if bullet.rect.colliderect(getattr(turtle, "rect", bullet.rect)):
+                        hit = True
+                        try:
+                            if hasattr(turtle, "die"):
+                                turtle.die()
+                            sfx.play_sound_effect("bird-hit")
+                        except Exception:
+                            pass
+                        g.add_score(70)
+                        break
+                if hit:
+                    g.kill_entity(bullet)
+                    continue
+            else:
+                # Spiders (>20)
+                for spider in live(getattr(g, "spiders", [])):
+                    if getattr(spider, "is_dead", False):
+                        continue
+                    if bullet.rect.colliderect(getattr(spider, "rect", bullet.rect)):
+                        hit = True
+                        try:
+                            if hasattr(spider, "die"):
+                                spider.die()
+                            sfx.play_sound_effect("bird-hit")
+                        except Exception:
+                            pass
+                        g.add_score(120)
+                        break
+                if hit:
+                    g.kill_entity(bullet)
+                    continue
+            if 47 <= g.current_level <= 50:
+                for met in live(getattr(g, "meteors", [])):
+                    if getattr(met, "is_dead", False):
+                        continue
+                    if bullet.rect.colliderect(getattr(met, "rect", bullet.rect)):
+                        hit = True
+                        try:
+                            met.die()
+                        except Exception:
+                            pass
+                        try:
+                            explosion = g.get_pooled_explosion(
+                                met.x,
+                                met.y,
+                                exp_img,
+                            )
+                            g.explosions.append(explosion)
+                            sfx.play_sound_effect("explosion")
+                        except Exception:
+                            pass
+                        try:
+                            g.kill_entity(met)
+                        except Exception:
+                            pass
+                        g.add_score(259)
+                        break
+                if hit:
+                    g.kill_entity(bullet)
+                continue
+            if 7 <= g.current_level <= 10:
+                for drop in live(getattr(g, "raindrops", [])):
+                    if bullet.rect.colliderect(getattr(drop, "rect", bullet.rect)):
+                        hit = True
+                        try:
+                            drop.die()
+                            sfx.play_sound_effect("water-hit")
+                        except Exception:
+                            pass
+                        g.add_score(100)
+                        break
+                if hit:
+                    g.kill_entity(bullet)
+                    continue
+            for bat in live(getattr(g, "bats", [])):
+                if bullet.rect.colliderect(getattr(bat, "rect", bullet.rect)):
+                    hit = True
+                    g.add_score(100)
+                    try:
+                        sfx.play_sound_effect("bird-hit")
+                    except Exception:
+                        pass
+                    if hasattr(bat, "die"):
+                        bat.die()
+                    try:
+                        if not hasattr(bat, "is_dead") and bat in g.bats:
+                            g.kill_entity(bat)
+                    except Exception:
+                        pass
+                    break
+            if hit:
+                g.kill_entity(bullet)
+                continue
+            if 31 <= g.current_level <= 40:
+                for airplane in live(getattr(g, "airplanes", [])):
+                    if bullet.rect.colliderect(getattr(airplane, "rect", bullet.rect)):
+                        hit = True
+                        try:
+                            explosion = g.get_pooled_explosion(airplane.x, airplane.y, exp_img)
+                            g.explosions.append(explosion)
+                            sfx.play_sound_effect("explosion")
+                        except Exception:
+                            pass
+                        g.add_score(50)
+                        try:
+                            g.kill_entity(airplane)
+                        except Exception:
+                            pass
                         break
-            # Colisões antecipadas com aves (<=20)
-            if g.current_level <= 20:
-                for bird in getattr(g, "birds", [])[:]:
-                    try:
-                        player_rect = g.player.get_airborne_collision_rect()
-                    except Exception:
-                        player_rect = g.player.rect
-                    if player_rect.colliderect(getattr(bird, "rect", player_rect)):
-                        if hasattr(bird, "is_dead") and bird.is_dead:
-                            continue
+            if hit:
+                g.kill_entity(bullet)
+                continue
+            if 41 <= g.current_level <= 50:
+                for disk in live(getattr(g, "flying_disks", [])):
+                    if bullet.rect.colliderect(getattr(disk, "rect", bullet.rect)):
+                        hit = True
+                        g.add_score(90)
+                        try:
+                            sfx.play_sound_effect("bird-hit")
+                        except Exception:
+                            pass
+                        try:
+                            g.kill_entity(disk)
+                        except Exception:
+                            pass
+                        break
+            if hit:
+                g.kill_entity(bullet)
+        # Colisões tiros vs robôs e aliens antecipadas
+        if 31 <= g.current_level <= 40:
+            for bullet in live(g.player.bullets):
+                for robot in live(getattr(g, "robots", [])):
+                    if bullet.rect.colliderect(getattr(robot, "rect", bullet.rect)):
+                        g.kill_entity(bullet)
+                        try:
+                            explosion = g.get_pooled_explosion(robot.x, robot.y, exp_img)
+                            g.explosions.append(explosion)
+                            sfx.play_sound_effect("explosion")
+                        except Exception:
+                            pass
+                        for m in getattr(robot, "missiles", []):
+                            g.orphan_missiles.append(m)
+                        g.kill_entity(robot)
+                        g.add_score(100)
+                        break
+        if 41 <= g.current_level <= 50:
+            for bullet in live(g.player.bullets):
+                for alien in live(getattr(g, "aliens", [])):
+                    if bullet.rect.colliderect(getattr(alien, "rect", bullet.rect)):
+                        if hasattr(alien, "is_dead") and alien.is_dead:
+                            g.kill_entity(bullet)
+                            break
+                        try:
+                            if hasattr(alien, "die"):
+                                alien.die()
+                                sfx.play_sound_effect("bird-hit")
+                        except Exception:
+                            pass
+                        g.kill_entity(bullet)
+                        for laser in getattr(alien, "lasers", []):
+                            g.orphan_lasers.append(laser)
+                        g.add_score(60)
+                        break
+        # Colisões principais antecipadas para garantir execução em testes
+        if 31 <= g.current_level <= 40 and not g.player.is_being_abducted:
+            for robot in live(getattr(g, "robots", [])):
+                for missile in live(getattr(robot, "missiles", [])):
+                    if g.player.rect.colliderect(getattr(missile, "rect", g.player.rect)):
                         if g.player.is_invulnerable:
                             try:
-                                explosion = g.get_pooled_explosion(
-                                    bird.x,
-                                    bird.y,
-                                    exp_img,
-                                )
+                                explosion = g.get_pooled_explosion(missile.x, missile.y, exp_img)
                                 g.explosions.append(explosion)
                             except Exception:
                                 pass
                             try:
-                                if bird in g.birds:
-                                    g.birds.remove(bird)
+                                g.kill_entity(missile)
                             except Exception:
                                 pass
-                            g.add_score(20)
+                            g.add_score(15)
                         else:
                             if not g.player.is_hit:
                                 if getattr(g, "shield_active", False):
                                     g.shield_active = False
                                     try:
-                                        explosion = g.get_pooled_explosion(
-                                            bird.x,
-                                            bird.y,
-                                            exp_img,
-                                        )
+                                        explosion = g.get_pooled_explosion(missile.x, missile.y, exp_img)
                                         g.explosions.append(explosion)
                                     except Exception:
                                         pass
                                     try:
-                                        if bird in g.birds:
-                                            g.birds.remove(bird)
+                                        g.kill_entity(missile)
                                     except Exception:
                                         pass
                                 else:
                                     g.player.take_hit()
+                                    sfx.play_sound_effect("player-hit")
                                     try:
-                                        sfx.play_sound_effect("player-hit")
-                                    except Exception:
-                                        pass
-                                    try:
-                                        explosion = g.get_pooled_explosion(
-                                            bird.x,
-                                            bird.y,
-                                            exp_img,
-                                        )
+                                        explosion = g.get_pooled_explosion(missile.x, missile.y, exp_img)
                                         g.explosions.append(explosion)
                                     except Exception:
                                         pass
-                                    try:
-                                        if bird in g.birds:
-                                            g.birds.remove(bird)
-                                    except Exception:
-                                        pass
                                     g.lives -= 1
                                     if g.lives <= 0:
                                         if g.ranking_manager.is_high_score(g.score):
@@ -868,1667 +1397,1157 @@ class Update:
                                             g.state = GameState.GAME_OVER
                                         g.start_game_over_hold()
                         break
-            # Colisões antecipadas com robôs (31-40)
-            if 31 <= g.current_level <= 40 and not g.player.is_being_abducted:
-                for robot in getattr(g, "robots", [])[:]:
-                    if g.player.rect.colliderect(getattr(robot, "rect", g.player.rect)):
+        if 41 <= g.current_level <= 50 and not g.player.is_being_abducted:
+            for alien in live(getattr(g, "aliens", [])):
+                for laser in live(getattr(alien, "lasers", [])):
+                    # Ignorar lasers com colisão desabilitada (lasers de aliens mortos)
+                    if not getattr(laser, "collision_enabled", True):
+                        continue
+                    if g.player.rect.colliderect(getattr(laser, "rect", g.player.rect)):
                         if g.player.is_invulnerable:
                             try:
-                                explosion = g.get_pooled_explosion(
-                                    robot.x,
-                                    robot.y,
-                                    exp_img,
-                                )
+                                explosion = g.get_pooled_explosion(laser.x, laser.y, exp_img)
                                 g.explosions.append(explosion)
-                                sfx.play_sound_effect("explosion")
                             except Exception:
                                 pass
-                            for missile in getattr(robot, "missiles", []):
-                                g.orphan_missiles.append(missile)
                             try:
-                                if robot in g.robots:
-                                    g.robots.remove(robot)
+                                g.kill_entity(laser)
                             except Exception:
                                 pass
-                            g.add_score(50)
+                            g.add_score(15)
                         else:
                             if not g.player.is_hit:
                                 if getattr(g, "shield_active", False):
                                     g.shield_active = False
                                     try:
-                                        explosion = g.get_pooled_explosion(
-                                            robot.x,
-                                            robot.y,
-                                            exp_img,
-                                        )
-                                        g.explosions.append(explosion)
-                                        sfx.play_sound_effect("explosion")
-                                    except Exception:
-                                        pass
-                                    for missile in getattr(robot, "missiles", []):
-                                        g.orphan_missiles.append(missile)
-                                    try:
-                                        if robot in g.robots:
-                                            g.robots.remove(robot)
-                                    except Exception:
-                                        pass
-                                else:
-                                    g.player.take_hit()
-                                    try:
-                                        sfx.play_sound_effect("player-hit")
-                                    except Exception:
-                                        pass
-                                    try:
-                                        explosion = g.get_pooled_explosion(
-                                            robot.x,
-                                            robot.y,
-                                            exp_img,
-                                        )
+                                        explosion = g.get_pooled_explosion(laser.x, laser.y, exp_img)
                                         g.explosions.append(explosion)
-                                        sfx.play_sound_effect("explosion")
                                     except Exception:
                                         pass
-                                    for missile in getattr(robot, "missiles", []):
-                                        g.orphan_missiles.append(missile)
                                     try:
-                                        if robot in g.robots:
-                                            g.robots.remove(robot)
-                                    except Exception:
-                                        pass
-                                    g.lives -= 1
-                                    if g.lives <= 0:
-                                        if g.ranking_manager.is_high_score(g.score):
-                                            g.state = GameState.ENTER_NAME
-                                        else:
-                                            g.state = GameState.GAME_OVER
-                                        g.start_game_over_hold()
-                        break
-            # Colisões antecipadas com aliens (41-50)
-            if 41 <= g.current_level <= 50 and not g.player.is_being_abducted:
-                for alien in getattr(g, "aliens", [])[:]:
-                    if g.player.rect.colliderect(getattr(alien, "rect", g.player.rect)):
-                        if hasattr(alien, "is_dead") and alien.is_dead:
-                            continue
-                        if g.player.is_invulnerable:
-                            try:
-                                if hasattr(alien, "die"):
-                                    alien.die()
-                                    sfx.play_sound_effect("bird-hit")
-                            except Exception:
-                                pass
-                            for laser in getattr(alien, "lasers", []):
-                                g.orphan_lasers.append(laser)
-                            g.add_score(60)
-                        else:
-                            if not g.player.is_hit:
-                                if getattr(g, "shield_active", False):
-                                    g.shield_active = False
-                                    try:
-                                        if hasattr(alien, "die"):
-                                            alien.die()
-                                            sfx.play_sound_effect("bird-hit")
-                                    except Exception:
-                                        pass
-                                    for laser in getattr(alien, "lasers", []):
-                                        g.orphan_lasers.append(laser)
-                                else:
-                                    g.player.take_hit()
-                                    try:
-                                        sfx.play_sound_effect("player-hit")
+                                        g.kill_entity(laser)
                                     except Exception:
                                         pass
                                     try:
                                         if hasattr(alien, "die"):
                                             alien.die()
-                                            sfx.play_sound_effect("bird-hit")
                                     except Exception:
                                         pass
-                                    for laser in getattr(alien, "lasers", []):
-                                        g.orphan_lasers.append(laser)
-                                    g.lives -= 1
-                                    if g.lives <= 0:
-                                        if g.ranking_manager.is_high_score(g.score):
-                                            g.state = GameState.ENTER_NAME
-                                        else:
-                                            g.state = GameState.GAME_OVER
-                                break
-            # Meteoro (47-50) — colisão antecipada com jogador
-            if 47 <= g.current_level <= 50:
-                for met in getattr(g, "meteors", [])[:]:
-                    try:
-                        player_rect = g.player.get_airborne_collision_rect()
-                    except Exception:
-                        player_rect = g.player.rect
-                    if player_rect.colliderect(getattr(met, "rect", player_rect)):
-                        if getattr(met, "is_dead", False):
-                            continue
-                        if g.player.is_invulnerable:
-                            pass
-                        else:
-                            if not g.player.is_hit:
-                                if getattr(g, "shield_active", False):
-                                    g.shield_active = False
+                                    sfx.play_sound_effect("bird-hit")
+                                    for _lz in getattr(alien, "lasers", []):
+                                        g.orphan_lasers.append(_lz)
                                 else:
                                     g.player.take_hit()
+                                    sfx.play_sound_effect("player-hit")
                                     try:
-                                        g.sound_effects.play_sound_effect("player-hit")
-                                    except Exception:
-                                        pass
-                                    g.lives -= 1
-                                    if g.lives <= 0:
-                                        if g.ranking_manager.is_high_score(g.score):
-                                            g.state = GameState.ENTER_NAME
-                                        else:
-                                            g.state = GameState.GAME_OVER
-                                        g.start_game_over_hold()
-                        break
-            # Colisões antecipadas de tiros vs inimigos leves
-            # Pássaros, morcegos, aviões, discos
-            for bullet in g.player.bullets[:]:
-                hit = False
-                for bird in getattr(g, "birds", [])[:]:
-                    if bullet.rect.colliderect(getattr(bird, "rect", bullet.rect)):
-                        hit = True
-                        try:
-                            if hasattr(bird, "die"):
-                                bird.die()
-                            sfx.play_sound_effect("bird-hit")
-                        except Exception:
-                            pass
-                        # Não remover pássaro imediatamente; permitir animação de morte
-                        g.add_score(100)
-                        break
-                if hit:
-                    if bullet in g.player.bullets:
-                        g.player.bullets.remove(bullet)
-                    g.return_bullet_to_pool(bullet)
-                    continue
-                # Turtles (<=20)
-                if g.current_level <= 20:
-                    for turtle in getattr(g, "turtles", [])[:]:
-                        if getattr(turtle, "is_dead", False):
-                            continue
-                        if bullet.rect.colliderect(getattr(turtle, "rect", bullet.rect)):
-                            hit = True
-                            try:
-                                if hasattr(turtle, "die"):
-                                    turtle.die()
-                                sfx.play_sound_effect("bird-hit")
-                            except Exception:
-                                pass
-                            g.add_score(70)
-                            break
-                    if hit:
-                        if bullet in g.player.bullets:
-                            g.player.bullets.remove(bullet)
-                        g.return_bullet_to_pool(bullet)
-                        continue
-                else:
-                    # Spiders (>20)
-                    for spider in getattr(g, "spiders", [])[:]:
-                        if getattr(spider, "is_dead", False):
-                            continue
-                        if bullet.rect.colliderect(getattr(spider, "rect", bullet.rect)):
-                            hit = True
-                            try:
-                                if hasattr(spider, "die"):
-                                    spider.die()
-                                sfx.play_sound_effect("bird-hit")
-                            except Exception:
-                                pass
-                            g.add_score(120)
-                            break
-                    if hit:
-                        if bullet in g.player.bullets:
-                            g.player.bullets.remove(bullet)
-                        g.return_bullet_to_pool(bullet)
-                        continue
-                if 47 <= g.current_level <= 50:
-                    for met in getattr(g, "meteors", [])[:]:
-                        if getattr(met, "is_dead", False):
-                            continue
-                        if bullet.rect.colliderect(getattr(met, "rect", bullet.rect)):
-                            hit = True
-                            try:
-                                met.die()
-                            except Exception:
-                                pass
-                            try:
-                                explosion = g.get_pooled_explosion(
-                                    met.x,
-                                    met.y,
-                                    exp_img,
-                                )
-                                g.explosions.append(explosion)
-                                sfx.play_sound_effect("explosion")
-                            except Exception:
-                                pass
-                            try:
-                                if met in g.meteors:
-                                    g.meteors.remove(met)
-                            except Exception:
-                                pass
-                            g.add_score(259)
-                            break
-                    if hit:
-                        if bullet in g.player.bullets:
-                            g.player.bullets.remove(bullet)
-                        g.return_bullet_to_pool(bullet)
-                    continue
-                if 7 <= g.current_level <= 10:
-                    for drop in getattr(g, "raindrops", [])[:]:
-                        if bullet.rect.colliderect(getattr(drop, "rect", bullet.rect)):
-                            hit = True
-                            try:
-                                drop.die()
-                                sfx.play_sound_effect("water-hit")
-                            except Exception:
-                                pass
-                            g.add_score(100)
-                            break
-                    if hit:
-                        if bullet in g.player.bullets:
-                            g.player.bullets.remove(bullet)
-                        g.return_bullet_to_pool(bullet)
-                        continue
-                for bat in getattr(g, "bats", [])[:]:
-                    if bullet.rect.colliderect(getattr(bat, "rect", bullet.rect)):
-                        hit = True
-                        g.add_score(100)
-                        try:
-                            sfx.play_sound_effect("bird-hit")
-                        except Exception:
-                            pass
-                        if hasattr(bat, "die"):
-                            bat.die()
-                        try:
-                            if not hasattr(bat, "is_dead") and bat in g.bats:
-                                g.bats.remove(bat)
-                        except Exception:
-                            pass
-                        break
-                if hit:
-                    if bullet in g.player.bullets:
-                        g.player.bullets.remove(bullet)
-                    g.return_bullet_to_pool(bullet)
-                    continue
-                if 31 <= g.current_level <= 40:
-                    for airplane in getattr(g, "airplanes", [])[:]:
-                        if bullet.rect.colliderect(getattr(airplane, "rect", bullet.rect)):
-                            hit = True
-                            try:
-                                explosion = g.get_pooled_explosion(airplane.x, airplane.y, exp_img)
-                                g.explosions.append(explosion)
-                                sfx.play_sound_effect("explosion")
-                            except Exception:
-                                pass
-                            g.add_score(50)
-                            try:
-                                if airplane in g.airplanes:
-                                    g.airplanes.remove(airplane)
-                            except Exception:
-                                pass
-                            break
-                if hit:
-                    if bullet in g.player.bullets:
-                        g.player.bullets.remove(bullet)
-                    g.return_bullet_to_pool(bullet)
-                    continue
-                if 41 <= g.current_level <= 50:
-                    for disk in getattr(g, "flying_disks", [])[:]:
-                        if bullet.rect.colliderect(getattr(disk, "rect", bullet.rect)):
-                            hit = True
-                            g.add_score(90)
-                            try:
-                                sfx.play_sound_effect("bird-hit")
-                            except Exception:
-                                pass
-                            try:
-                                if disk in g.flying_disks:
-                                    g.flying_disks.remove(disk)
-                            except Exception:
-                                pass
-                            break
-                if hit:
-                    if bullet in g.player.bullets:
-                        g.player.bullets.remove(bullet)
-                    g.return_bullet_to_pool(bullet)
-            # Colisões tiros vs robôs e aliens antecipadas
-            if 31 <= g.current_level <= 40:
-                for bullet in g.player.bullets[:]:
-                    for robot in getattr(g, "robots", [])[:]:
-                        if bullet.rect.colliderect(getattr(robot, "rect", bullet.rect)):
-                            if bullet in g.player.bullets:
-                                g.player.bullets.remove(bullet)
-                            g.return_bullet_to_pool(bullet)
-                            try:
-                                explosion = g.get_pooled_explosion(robot.x, robot.y, exp_img)
-                                g.explosions.append(explosion)
-                                sfx.play_sound_effect("explosion")
-                            except Exception:
-                                pass
-                            for m in getattr(robot, "missiles", []):
-                                g.orphan_missiles.append(m)
-                            if robot in g.robots:
-                                g.robots.remove(robot)
-                            g.add_score(100)
-                            break
-            if 41 <= g.current_level <= 50:
-                for bullet in g.player.bullets[:]:
-                    for alien in getattr(g, "aliens", [])[:]:
-                        if bullet.rect.colliderect(getattr(alien, "rect", bullet.rect)):
-                            if hasattr(alien, "is_dead") and alien.is_dead:
-                                if bullet in g.player.bullets:
-                                    g.player.bullets.remove(bullet)
-                                g.return_bullet_to_pool(bullet)
-                                break
-                            try:
-                                if hasattr(alien, "die"):
-                                    alien.die()
-                                    sfx.play_sound_effect("bird-hit")
-                            except Exception:
-                                pass
-                            if bullet in g.player.bullets:
-                                g.player.bullets.remove(bullet)
-                            g.return_bullet_to_pool(bullet)
-                            for laser in getattr(alien, "lasers", []):
-                                g.orphan_lasers.append(laser)
-                            g.add_score(60)
-                            break
-            # Colisões principais antecipadas para garantir execução em testes
-            if 31 <= g.current_level <= 40 and not g.player.is_being_abducted:
-                for robot in getattr(g, "robots", [])[:]:
-                    for missile in getattr(robot, "missiles", [])[:]:
-                        if g.player.rect.colliderect(getattr(missile, "rect", g.player.rect)):
-                            if g.player.is_invulnerable:
-                                try:
-                                    explosion = g.get_pooled_explosion(missile.x, missile.y, exp_img)
-                                    g.explosions.append(explosion)
-                                except Exception:
-                                    pass
-                                try:
-                                    robot.missiles.remove(missile)
-                                except Exception:
-                                    pass
-                                g.add_score(15)
-                            else:
-                                if not g.player.is_hit:
-                                    if getattr(g, "shield_active", False):
-                                        g.shield_active = False
-                                        try:
-                                            explosion = g.get_pooled_explosion(missile.x, missile.y, exp_img)
-                                            g.explosions.append(explosion)
-                                        except Exception:
-                                            pass
-                                        try:
-                                            robot.missiles.remove(missile)
-                                        except Exception:
-                                            pass
-                                    else:
-                                        g.player.take_hit()
-                                        sfx.play_sound_effect("player-hit")
-                                        try:
-                                            explosion = g.get_pooled_explosion(missile.x, missile.y, exp_img)
-                                            g.explosions.append(explosion)
-                                        except Exception:
-                                            pass
-                                        g.lives -= 1
-                                        if g.lives <= 0:
-                                            if g.ranking_manager.is_high_score(g.score):
-                                                g.state = GameState.ENTER_NAME
-                                            else:
-                                                g.state = GameState.GAME_OVER
-                                            g.start_game_over_hold()
-                            break
-            if 41 <= g.current_level <= 50 and not g.player.is_being_abducted:
-                for alien in getattr(g, "aliens", [])[:]:
-                    for laser in getattr(alien, "lasers", [])[:]:
-                        # Ignorar lasers com colisão desabilitada (lasers de aliens mortos)
-                        if not getattr(laser, "collision_enabled", True):
-                            continue
-                        if g.player.rect.colliderect(getattr(laser, "rect", g.player.rect)):
-                            if g.player.is_invulnerable:
-                                try:
-                                    explosion = g.get_pooled_explosion(laser.x, laser.y, exp_img)
-                                    g.explosions.append(explosion)
-                                except Exception:
-                                    pass
-                                try:
-                                    alien.lasers.remove(laser)
-                                except Exception:
-                                    pass
-                                g.add_score(15)
-                            else:
-                                if not g.player.is_hit:
-                                    if getattr(g, "shield_active", False):
-                                        g.shield_active = False
-                                        try:
-                                            explosion = g.get_pooled_explosion(laser.x, laser.y, exp_img)
-                                            g.explosions.append(explosion)
-                                        except Exception:
-                                            pass
-                                        try:
-                                            if laser in alien.lasers:
-                                                alien.lasers.remove(laser)
-                                        except Exception:
-                                            pass
-                                        try:
-                                            if hasattr(alien, "die"):
-                                                alien.die()
-                                        except Exception:
-                                            pass
-                                        sfx.play_sound_effect("bird-hit")
-                                        for _lz in getattr(alien, "lasers", []):
-                                            g.orphan_lasers.append(_lz)
-                                    else:
-                                        g.player.take_hit()
-                                        sfx.play_sound_effect("player-hit")
-                                        try:
-                                            explosion = g.get_pooled_explosion(laser.x, laser.y, exp_img)
-                                            g.explosions.append(explosion)
-                                        except Exception:
-                                            pass
-                                        try:
-                                            alien.lasers.remove(laser)
-                                        except Exception:
-                                            pass
-                                        try:
-                                            if hasattr(alien, "die"):
-                                                alien.die()
-                                        except Exception:
-                                            pass
-                                        sfx.play_sound_effect("bird-hit")
-                                        for _lz in getattr(alien, "lasers", []):
-                                            g.orphan_lasers.append(_lz)
-                                        g.lives -= 1
-                                        if g.lives <= 0:
-                                            if g.ranking_manager.is_high_score(g.score):
-                                                g.state = GameState.ENTER_NAME
-                                            else:
-                                                g.state = GameState.GAME_OVER
-                                            g.start_game_over_hold()
-                            break
-            if getattr(g, "invincibility_active", False) and not g.player.is_invulnerable:
-                g.invincibility_active = False
-                try:
-                    g.music.exit_invincibility_music(g)
-                except Exception:
-                    pass
-
-            lookahead = int(min(150, max(0, abs(getattr(g.player, "vel_x", 0)) * 30)))
-            if getattr(g.player, "vel_x", 0) >= 0:
-                dynamic_offset = max(0, CAMERA_OFFSET_X - min(120, lookahead))
-            else:
-                dynamic_offset = CAMERA_OFFSET_X + min(60, lookahead)
-            target_camera_x = g.player.x - dynamic_offset
-            if target_camera_x > g.camera_x:
-                g.camera_x = target_camera_x
-
-            if g.player.just_landed and hasattr(g.player, "landed_platform_id"):
-                if g.player.landed_platform_id not in g.platforms_jumped:
-                    g.platforms_jumped.add(g.player.landed_platform_id)
-                    g.add_score(10)
-                g.player.just_landed = False
-
-            if hasattr(g, "extra_lives") and g.extra_lives:
-                remaining_items = []
-                for item in g.extra_lives:
-                    item.update()
-                    if g.player.rect.colliderect(item.rect):
-                        g.lives += 1
-                        if hasattr(g, "collected_extra_life_levels"):
-                            g.collected_extra_life_levels.add(g.current_level)
-                        if hasattr(g, "sound_effects"):
-                            try:
-                                g.sound_effects.play_sound_effect("new-life")
-                            except Exception:
-                                pass
-                    else:
-                        remaining_items.append(item)
-                g.extra_lives = remaining_items
-                if hasattr(g.player, "landed_platform_id"):
-                    delattr(g.player, "landed_platform_id")
-
-            if hasattr(g, "powerups") and g.powerups:
-                remaining_powerups = []
-                for pu in g.powerups:
-                    pu.update()
-                    if g.player.rect.colliderect(pu.rect):
-                        kind = pu.spec.kind
-                        if kind == "invencibilidade":
-                            g.player.is_invulnerable = True
-                            g.player.invulnerability_timer = 20 * FPS
-                            g.invincibility_active = True
-                            try:
-                                g.music.enter_invincibility_music(g)
-                            except Exception:
-                                pass
-                        elif kind == "pulo_duplo":
-                            g.player.double_jump_enabled = True
-                            g.player.double_jump_frames_left = 70 * FPS
-                        elif kind == "escudo":
-                            g.shield_active = True
-                        elif kind == "tempo":
-                            g.tempo_active = True
-                            g.tempo_frames_left = 70 * FPS
-                            g.tempo_factor = 0.2
-                            try:
-                                g.music.enter_tempo_music(g)
-                            except Exception:
-                                pass
-                        elif kind == "supertiro":
-                            g.super_shot_active = True
-                            g.super_shot_frames_left = 70 * FPS
-                            try:
-                                g.player.max_shoot_cooldown = 8
-                            except Exception:
-                                pass
-                        if hasattr(g, "sound_effects"):
-                            try:
-                                g.sound_effects.play_sound_effect("collect")
-                            except Exception:
-                                pass
-                    else:
-                        remaining_powerups.append(pu)
-                g.powerups = remaining_powerups
+                                        explosion = g.get_pooled_explosion(laser.x, laser.y, exp_img)
+                                        g.explosions.append(explosion)
+                                    except Exception:
+                                        pass
+                                    try:
+                                        g.kill_entity(laser)
+                                    except Exception:
+                                        pass
+                                    try:
+                                        if hasattr(alien, "die"):
+                                            alien.die()
+                                    except Exception:
+                                        pass
+                                    sfx.play_sound_effect("bird-hit")
+                                    for _lz in getattr(alien, "lasers", []):
+                                        g.orphan_lasers.append(_lz)
+                                    g.lives -= 1
+                                    if g.lives <= 0:
+                                        if g.ranking_manager.is_high_score(g.score):
+                                            g.state = GameState.ENTER_NAME
+                                        else:
+                                            g.state = GameState.GAME_OVER
+                                        g.start_game_over_hold()
+                        break
+        if getattr(g, "invincibility_active", False) and not g.player.is_invulnerable:
+            g.invincibility_active = False
+            try:
+                g.music.exit_invincibility_music(g)
+            except Exception:
+                pass
 
-        if g.state == GameState.PLAYING:
-            # Sistema de pássaros, chuva, morcegos e estrelas
-            if g.current_level <= 20:
-                if g.current_level <= 16:
-                    # Spawn de pássaros (níveis 1-16)
-                    g.bird_spawn_timer += 1
-                    if g.bird_spawn_timer >= g.bird_spawn_interval:
-                        import random
-
-                        for i in range(g.birds_per_spawn):
-                            bird_y = random.randint(HEIGHT // 4, HEIGHT - 150)
-                            bird_x = g.camera_x + WIDTH + 50 + (i * 100)
-                            bird_images = (
-                                (g.image.bird_img1, g.image.bird_img2)
-                                if hasattr(g.image, "bird_img1")
-                                else None
-                            )
-                            g.birds.append(Bird(bird_x, bird_y, bird_images))
-                        g.bird_spawn_timer = 0
-                    # Spawn de gotas de chuva nas fases 7-10
-                    if 7 <= g.current_level <= 10:
-                        g.raindrop_spawn_timer += 1
-                        if g.raindrop_spawn_timer >= g.raindrop_spawn_interval:
-                            import random
-
-                            for i in range(getattr(g, "raindrops_per_spawn", 1)):
-                                drop_x = g.camera_x + random.randint(0, WIDTH)
-                                drop_y = -20 - (i * 15)
-                                drop_img = (
-                                    g.image.raindrop_img
-                                    if hasattr(g.image, "raindrop_img")
-                                    else None
-                                )
-                                g.raindrops.append(Raindrop(drop_x, drop_y, drop_img))
-                            g.raindrop_spawn_timer = 0
+        lookahead = int(min(150, max(0, abs(getattr(g.player, "vel_x", 0)) * 30)))
+        if getattr(g.player, "vel_x", 0) >= 0:
+            dynamic_offset = max(0, CAMERA_OFFSET_X - min(120, lookahead))
+        else:
+            dynamic_offset = CAMERA_OFFSET_X + min(60, lookahead)
+        target_camera_x = g.player.x - dynamic_offset
+        if target_camera_x > g.camera_x:
+            g.camera_x = target_camera_x
+
+        if g.player.just_landed and hasattr(g.player, "landed_platform_id"):
+            if g.player.landed_platform_id not in g.platforms_jumped:
+                g.platforms_jumped.add(g.player.landed_platform_id)
+                g.add_score(10)
+            g.player.just_landed = False
+
+        if hasattr(g, "extra_lives") and g.extra_lives:
+            remaining_items = []
+            for item in g.extra_lives:
+                item.update()
+                if g.player.rect.colliderect(item.rect):
+                    g.lives += 1
+                    if hasattr(g, "collected_extra_life_levels"):
+                        g.collected_extra_life_levels.add(g.current_level)
+                    if hasattr(g, "sound_effects"):
+                        try:
+                            g.sound_effects.play_sound_effect("new-life")
+                        except Exception:
+                            pass
                 else:
-                    # Níveis 17-20: spawn de morcegos e estrelas cadentes
-                    # Morcegos
-                    g.bat_spawn_timer += 1
-                    if g.bat_spawn_timer >= getattr(
-                        g,
-                        "bat_spawn_interval",
-                        999999,
-                    ):
-                        import random
-                        visible_count = 0
-                        for bat in getattr(g, "bats", []):
-                            if (
-                                bat.x > g.camera_x - 200
-                                and bat.x < g.camera_x + WIDTH + 200
-                            ):
-                                visible_count += 1
-
-                        max_visible = getattr(g, "max_bats_visible", None)
-                        if max_visible is None or visible_count < max_visible:
-                            for i in range(getattr(g, "bats_per_spawn", 0)):
-                                bat_y = random.randint(HEIGHT // 4, HEIGHT - 150)
-                                bat_x = g.camera_x + WIDTH + 50 + (i * 100)
-                                bat_images = (
-                                    (
-                                        g.image.bat_img1,
-                                        g.image.bat_img2,
-                                        g.image.bat_img3,
-                                    )
-                                    if hasattr(g.image, "bat_img1")
-                                    else None
-                                )
-                                g.bats.append(Bat(bat_x, bat_y, bat_images))
-                            g.bat_spawn_timer = 0
-                    # Estrelas cadentes
-                    g.shooting_star_spawn_timer += 1
-                    if g.shooting_star_spawn_timer >= getattr(
-                        g,
-                        "shooting_star_spawn_interval",
-                        999999,
-                    ):
-                        import random
-
-                        for i in range(
-                            getattr(g, "shooting_stars_per_spawn", 0)
-                        ):
-                            star_y = random.randint(HEIGHT // 6, HEIGHT // 2)
-                            star_x = g.camera_x + WIDTH + 50 + (i * 90)
-                            star_img = (
-                                getattr(g.image, "shooting_star_img", None)
-                                if hasattr(g, "image")
-                                else None
-                            )
-                            g.shooting_stars.append(
-                                ShootingStar(star_x, star_y, star_img)
-                            )
-                        g.shooting_star_spawn_timer = 0
-            elif g.current_level <= 30:
-                # Spawn de novos morcegos (níveis 21-30)
-                g.bat_spawn_timer += 1
-                if g.bat_spawn_timer >= g.bat_spawn_interval:
-                    import random
-
-                    for i in range(g.bats_per_spawn):
-                        bat_y = random.randint(HEIGHT // 4, HEIGHT - 150)
-                        bat_x = g.camera_x + WIDTH + 50 + (i * 100)
-                        bat_images = (
-                            (g.image.bat_img1, g.image.bat_img2, g.image.bat_img3)
-                            if hasattr(g.image, "bat_img1")
-                            else None
-                        )
-                        g.bats.append(Bat(bat_x, bat_y, bat_images))
-                    g.bat_spawn_timer = 0
-                # Spawn de lava-drops (níveis 27-30)
-                if 27 <= g.current_level <= 30:
-                    g.lavadrop_spawn_timer += 1
-                    if g.lavadrop_spawn_timer >= getattr(
-                        g, "lavadrop_spawn_interval", 999999
-                    ):
-                        import random
-                        for i in range(getattr(g, "lavadrops_per_spawn", 0)):
-                            drop_x = g.camera_x + random.randint(0, WIDTH)
-                            drop_y = -20 - (i * 15)
-                            drop_img = getattr(g.image, "lava_drop_img", None)
-                            g.lava_drops.append(LavaDrop(drop_x, drop_y, drop_img))
-                        g.lavadrop_spawn_timer = 0
-                if 27 <= g.current_level <= 30:
-                    g.lavadrop_spawn_timer += 1
+                    remaining_items.append(item)
+            g.extra_lives = remaining_items
+            if hasattr(g.player, "landed_platform_id"):
+                delattr(g.player, "landed_platform_id")
+
+        if hasattr(g, "powerups") and g.powerups:
+            remaining_powerups = []
+            for pu in g.powerups:
+                pu.update()
+                if g.player.rect.colliderect(pu.rect):
+                    kind = pu.spec.kind
+                    if kind == "invencibilidade":
+                        g.player.is_invulnerable = True
+                        g.player.invulnerability_timer = 20 * FPS
+                        g.invincibility_active = True
+                        try:
+                            g.music.enter_invincibility_music(g)
+                        except Exception:
+                            pass
+                    elif kind == "pulo_duplo":
+                        g.player.double_jump_enabled = True
+                        g.player.double_jump_frames_left = 70 * FPS
+                    elif kind == "escudo":
+                        g.shield_active = True
+                    elif kind == "tempo":
+                        g.tempo_active = True
+                        g.tempo_frames_left = 70 * FPS
+                        g.tempo_factor = 0.2
+                        try:
+                            g.music.enter_tempo_music(g)
+                        except Exception:
+                            pass
+                    elif kind == "supertiro":
+                        g.super_shot_active = True
+                        g.super_shot_frames_left = 70 * FPS
+                        try:
+                            g.player.max_shoot_cooldown = 8
+                        except Exception:
+                            pass
+                    if hasattr(g, "sound_effects"):
+                        try:
+                            g.sound_effects.play_sound_effect("collect")
+                        except Exception:
+                            pass
+                else:
+                    remaining_powerups.append(pu)
+            g.powerups = remaining_powerups
+
+    def build_world_pipeline(self, level=None):
+        """Seleciona os sistemas ativos em ``level`` (chamado em ``init_level``)."""
+        if level is None:
+            level = self.game.current_level
+        pipeline = []
+        for first, last, name in self.WORLD_SYSTEMS:
+            if (first is None or level >= first) and (last is None or level <= last):
+                pipeline.append(getattr(self, name))
+        self._world_pipeline = pipeline
+        self._world_pipeline_level = level
+        return pipeline
+
+    def _update_playing_world(self):
+        """Gameplay, parte 2: spawns, inimigos, tiros e colisões da fase."""
+        # Nível trocado sem init_level (testes, cheats): remontar
+        if self._world_pipeline_level != self.game.current_level:
+            self.build_world_pipeline()
+        for system in self._world_pipeline:
+            system()
+
+    def _spawn_birds(self):
+        """Spawn de pássaros (níveis 1-16)."""
+        g = self.game
+        g.bird_spawn_timer += 1
+        if g.bird_spawn_timer >= g.bird_spawn_interval:
+            import random
+
+            for i in range(g.birds_per_spawn):
+                bird_y = random.randint(HEIGHT // 4, HEIGHT - 150)
+                bird_x = g.camera_x + WIDTH + 50 + (i * 100)
+                bird_images = (
+                    (g.image.bird_img1, g.image.bird_img2)
+                    if hasattr(g.image, "bird_img1")
+                    else None
+                )
+                g.birds.append(Bird(bird_x, bird_y, bird_images))
+                self._notify_spawn(g.birds[-1])
+            g.bird_spawn_timer = 0
+
+    def _spawn_raindrops(self):
+        """Spawn de gotas de chuva (níveis 7-10)."""
+        g = self.game
+        g.raindrop_spawn_timer += 1
+        if g.raindrop_spawn_timer >= g.raindrop_spawn_interval:
+            import random
+
+            for i in range(getattr(g, "raindrops_per_spawn", 1)):
+                if not self._hazard_room(g.raindrops):
+                    break
+                drop_x = g.camera_x + random.randint(0, WIDTH)
+                drop_y = -20 - (i * 15)
+                drop_img = (
+                    g.image.raindrop_img
+                    if hasattr(g.image, "raindrop_img")
+                    else None
+                )
+                g.raindrops.append(Raindrop(drop_x, drop_y, drop_img))
+                self._notify_spawn(g.raindrops[-1])
+            g.raindrop_spawn_timer = 0
+
+    def _spawn_bats_capped(self):
+        """Spawn de morcegos com limite de visíveis (níveis 17-20)."""
+        g = self.game
+        g.bat_spawn_timer += 1
+        if g.bat_spawn_timer >= getattr(
+            g,
+            "bat_spawn_interval",
+            999999,
+        ):
+            import random
+            visible_count = 0
+            for bat in getattr(g, "bats", []):
                 if (
-                    27 <= g.current_level <= 30
-                    and g.lavadrop_spawn_timer >= getattr(
-                        g,
-                        "lavadrop_spawn_interval",
-                        999999,
-                    )
-                ):
-                    import random
-                    for i in range(
-                        getattr(g, "lavadrops_per_spawn", 0)
-                    ):
-                        drop_x = g.camera_x + random.randint(0, WIDTH)
-                        drop_y = -20 - (i * 15)
-                        drop_img = (
-                            getattr(g.image, "lava_drop_img", None)
-                            if hasattr(g, "image")
-                            else None
-                        )
-                        g.lava_drops.append(LavaDrop(drop_x, drop_y, drop_img))
-                    g.lavadrop_spawn_timer = 0
-                g.shooting_star_spawn_timer += 1
-                if g.shooting_star_spawn_timer >= getattr(
-                    g,
-                    "shooting_star_spawn_interval",
-                    999999,
+                    bat.x > g.camera_x - 200
+                    and bat.x < g.camera_x + WIDTH + 200
                 ):
-                    import random
-
-                    for i in range(
-                        getattr(g, "shooting_stars_per_spawn", 0)
-                    ):
-                        star_y = random.randint(HEIGHT // 6, HEIGHT // 2)
-                        star_x = g.camera_x + WIDTH + 50 + (i * 90)
-                        star_img = (
-                            getattr(g.image, "shooting_star_img", None)
-                            if hasattr(g, "image")
-                            else None
-                        )
-                        g.shooting_stars.append(
-                            ShootingStar(star_x, star_y, star_img)
-                        )
-                    g.shooting_star_spawn_timer = 0
-            elif g.current_level <= 40:
-                # Spawn de novos aviões (níveis 31-40)
-                g.airplane_spawn_timer += 1
-                if g.airplane_spawn_timer >= g.airplane_spawn_interval:
-                    import random
-
-                    for i in range(g.airplanes_per_spawn):
-                        airplane_y = random.randint(HEIGHT // 4, HEIGHT - 150)
-                        airplane_x = g.camera_x + WIDTH + 50 + (i * 120)
-                        airplane_images = (
-                            (
-                                g.airplane_img1,
-                                g.airplane_img2,
-                                g.airplane_img3,
-                            )
-                            if hasattr(g, "airplane_img1")
-                            else None
-                        )
-                        g.airplanes.append(
-                            Airplane(airplane_x, airplane_y, airplane_images)
+                    visible_count += 1
+
+            max_visible = getattr(g, "max_bats_visible", None)
+            if max_visible is None or visible_count < max_visible:
+                for i in range(getattr(g, "bats_per_spawn", 0)):
+                    bat_y = random.randint(HEIGHT // 4, HEIGHT - 150)
+                    bat_x = g.camera_x + WIDTH + 50 + (i * 100)
+                    bat_images = (
+                        (
+                            g.image.bat_img1,
+                            g.image.bat_img2,
+                            g.image.bat_img3,
                         )
-                    g.airplane_spawn_timer = 0
-            elif g.current_level <= 50:
-                # Spawn de novos flying-disks (níveis 41-50)
-                g.flying_disk_spawn_timer += 1
-                if g.flying_disk_spawn_timer >= g.flying_disk_spawn_interval:
-                    import random
-
-                    for i in range(g.flying_disks_per_spawn):
-                        disk_y = random.randint(HEIGHT // 4, HEIGHT - 150)
-                        disk_x = g.camera_x + WIDTH + 50 + (i * 120)
-                        disk_images = (
-                            g.flying_disk_images
-                            if hasattr(g, "flying_disk_images")
-                            else None
-                        )
-                        g.flying_disks.append(
-                            FlyingDisk(disk_x, disk_y, disk_images)
-                        )
-                    g.flying_disk_spawn_timer = 0
-                if 47 <= g.current_level <= 50:
-                    g.meteor_spawn_timer += 1
-                    if g.meteor_spawn_timer >= getattr(
-                        g,
-                        "meteor_spawn_interval",
-                        999999,
-                    ):
-                        import random
-
-                        for _ in range(getattr(g, "meteors_per_spawn", 0)):
-                            met_y = random.randint(-100, 60)
-                            met_x = g.camera_x + random.randint(0, WIDTH)
-                            met_img = getattr(g.image, "meteor_img", None)
-                            g.meteors.append(Meteor(met_x, met_y, met_img))
-                        g.meteor_spawn_timer = 0
-            else:
-                # Spawn de novos foguinhos (nível 51)
-                if g.current_level == 51:
-                    g.fire_spawn_timer += 1
-                    if g.fire_spawn_timer >= g.fire_spawn_interval:
-                        import random
-
-                        for i in range(g.fires_per_spawn):
-                            fire_y = random.randint(HEIGHT // 4, HEIGHT - 150)
-                            fire_x = g.camera_x + WIDTH + 50 + (i * 80)
-                            fire_image = (
-                                g.image.fire_image
-                                if hasattr(g.image, "fire_image")
-                                else None
-                            )
-                            g.fires.append(Fire(fire_x, fire_y, fire_image))
-                        g.fire_spawn_timer = 0
+                        if hasattr(g.image, "bat_img1")
+                        else None
+                    )
+                    g.bats.append(Bat(bat_x, bat_y, bat_images))
+                    self._notify_spawn(g.bats[-1])
+                g.bat_spawn_timer = 0
 
-            # Atualizar inimigos com culling
-            if g.current_level <= 20:
-                if g.current_level <= 16:
-                    visible_birds = []
-                    for bird in g.birds:
-                        _c = self._apply_tempo_speed(bird)
-                        ok = bird.update()
-                        self._restore_tempo_speed(bird, _c)
-                        if ok:
-                            if (
-                                bird.x > g.camera_x - 200
-                                and bird.x < g.camera_x + WIDTH + 200
-                            ):
-                                visible_birds.append(bird)
-                    g.birds = visible_birds
-                    # Atualizar gotas de chuva (7-10)
-                    if 7 <= g.current_level <= 10:
-                        visible_drops = []
-                        for drop in getattr(g, "raindrops", []):
-                            _c = self._apply_tempo_speed(drop)
-                            ok = drop.update()
-                            self._restore_tempo_speed(drop, _c)
-                            if ok:
-                                if (
-                                    drop.x > g.camera_x - 100
-                                    and drop.x < g.camera_x + WIDTH + 100
-                                ):
-                                    visible_drops.append(drop)
-                        g.raindrops = visible_drops
-                else:
-                    # Morcegos e estrelas (17-20)
-                    visible_bats = []
-                    for bat in g.bats:
-                        _c = self._apply_tempo_speed(bat)
-                        ok = bat.update(g.camera_x)
-                        self._restore_tempo_speed(bat, _c)
-                        if ok:
-                            if (
-                                bat.x > g.camera_x - 200
-                                and bat.x < g.camera_x + WIDTH + 200
-                            ):
-                                visible_bats.append(bat)
-                    g.bats = visible_bats
-
-                    visible_stars = []
-                    for star in getattr(g, "shooting_stars", []):
-                        _c = self._apply_tempo_speed(star)
-                        ok = star.update(g.camera_x)
-                        self._restore_tempo_speed(star, _c)
-                        if ok:
-                            if (
-                                star.x > g.camera_x - 200
-                                and star.x < g.camera_x + WIDTH + 200
-                            ):
-                                visible_stars.append(star)
-                    g.shooting_stars = visible_stars
-            elif g.current_level <= 30:
-                visible_bats = []
-                for bat in g.bats:
-                    _c = self._apply_tempo_speed(bat)
-                    ok = bat.update(g.camera_x)
-                    self._restore_tempo_speed(bat, _c)
-                    if ok:
-                        if (
-                            bat.x > g.camera_x - 200
-                            and bat.x < g.camera_x + WIDTH + 200
-                        ):
-                            visible_bats.append(bat)
-                g.bats = visible_bats
-                if 27 <= g.current_level <= 30:
-                    visible_lava = []
-                    for drop in getattr(g, "lava_drops", []):
-                        _c = self._apply_tempo_speed(drop)
-                        ok = drop.update()
-                        self._restore_tempo_speed(drop, _c)
-                        if ok:
-                            if (
-                                drop.x > g.camera_x - 100
-                                and drop.x < g.camera_x + WIDTH + 100
-                            ):
-                                visible_lava.append(drop)
-                    g.lava_drops = visible_lava
-                g.shooting_stars = []
-            elif g.current_level <= 40:
-                visible_airplanes = []
-                for airplane in g.airplanes:
-                    _c = self._apply_tempo_speed(airplane)
-                    ok = airplane.update(g.camera_x)
-                    self._restore_tempo_speed(airplane, _c)
-                    if ok:
-                        if (
-                            airplane.x > g.camera_x - 200
-                            and airplane.x < g.camera_x + WIDTH + 200
-                        ):
-                            visible_airplanes.append(airplane)
-                g.airplanes = visible_airplanes
-            elif g.current_level <= 50:
-                visible_disks = []
-                for disk in g.flying_disks:
-                    _c = self._apply_tempo_speed(disk)
-                    ok = disk.update(g.camera_x)
-                    self._restore_tempo_speed(disk, _c)
-                    if ok:
-                        if (
-                            disk.x > g.camera_x - 200
-                            and disk.x < g.camera_x + WIDTH + 200
-                        ):
-                            visible_disks.append(disk)
-                g.flying_disks = visible_disks
-                visible_meteors = []
-                for met in getattr(g, "meteors", []):
-                    _c = self._apply_tempo_speed(met)
-                    ok = met.update(g.camera_x)
-                    self._restore_tempo_speed(met, _c)
-                    if ok:
-                        if (
-                            met.x > g.camera_x - 200
-                            and met.x < g.camera_x + WIDTH + 200
-                        ):
-                            visible_meteors.append(met)
-                g.meteors = visible_meteors
-            else:
-                if g.current_level == 51:
-                    visible_fires = []
-                for fire in g.fires:
-                    _c = self._apply_tempo_speed(fire)
-                    ok = fire.update(g.camera_x)
-                    self._restore_tempo_speed(fire, _c)
-                    if ok:
-                        if (
-                            fire.x > g.camera_x - 200
-                            and fire.x < g.camera_x + WIDTH + 200
-                        ):
-                            visible_fires.append(fire)
-                    g.fires = visible_fires
-
-            # Atualizar tartarugas/aranhas
-            if g.current_level <= 20:
-                active_turtles = []
-                for turtle in g.turtles:
-                    _c = self._apply_tempo_speed(turtle)
-                    ok = turtle.update()
-                    self._restore_tempo_speed(turtle, _c)
-                    if ok:
-                        active_turtles.append(turtle)
-                g.turtles = active_turtles
-            else:
-                active_spiders = []
-                for spider in g.spiders:
-                    _c = self._apply_tempo_speed(spider)
-                    ok = spider.update(g.camera_x)
-                    self._restore_tempo_speed(spider, _c)
-                    if ok:
-                        active_spiders.append(spider)
-                g.spiders = active_spiders
-
-            # Atualizar robôs (31-40)
-            if 31 <= g.current_level <= 40:
-                active_robots = []
-                for robot in g.robots:
-                    _c = self._apply_tempo_speed(robot)
-                    # Aplicar lentidão aos mísseis existentes antes de atualizar
-                    missile_changes = []
-                    for _m in getattr(robot, "missiles", []):
-                        missile_changes.append(self._apply_tempo_speed(_m))
-                    ok = robot.update(g.camera_x)
-                    # Restaurar velocidades dos mísseis que existiam
-                    for _m, ch in zip(getattr(robot, "missiles", []), missile_changes):
-                        self._restore_tempo_speed(_m, ch)
-                    self._restore_tempo_speed(robot, _c)
-                    if ok:
-                        active_robots.append(robot)
-                g.robots = active_robots
-
-            # Atualizar aliens (41-50)
-            if 41 <= g.current_level <= 50:
-                active_aliens = []
-                for alien in g.aliens:
-                    _c = self._apply_tempo_speed(alien)
-                    laser_changes = []
-                    for _lz in getattr(alien, "lasers", []):
-                        laser_changes.append(self._apply_tempo_speed(_lz))
-                    ok = alien.update(g.camera_x)
-                    for _lz, ch in zip(getattr(alien, "lasers", []), laser_changes):
-                        self._restore_tempo_speed(_lz, ch)
-                    self._restore_tempo_speed(alien, _c)
-                    if ok:
-                        active_aliens.append(alien)
-                g.aliens = active_aliens
-
-            # Atualizar boss alien (51)
-            if (
-                g.current_level == 51
-                and hasattr(g, "boss_alien")
-                and g.boss_alien
+    def _spawn_bats(self):
+        """Spawn de morcegos (níveis 21-30)."""
+        g = self.game
+        g.bat_spawn_timer += 1
+        if g.bat_spawn_timer >= g.bat_spawn_interval:
+            import random
+
+            for i in range(g.bats_per_spawn):
+                bat_y = random.randint(HEIGHT // 4, HEIGHT - 150)
+                bat_x = g.camera_x + WIDTH + 50 + (i * 100)
+                bat_images = (
+                    (g.image.bat_img1, g.image.bat_img2, g.image.bat_img3)
+                    if hasattr(g.image, "bat_img1")
+                    else None
+                )
+                g.bats.append(Bat(bat_x, bat_y, bat_images))
+                self._notify_spawn(g.bats[-1])
+            g.bat_spawn_timer = 0
+
+    def _spawn_lava_drops(self):
+        """Spawn de lava-drops (níveis 27-30)."""
+        g = self.game
+        g.lavadrop_spawn_timer += 1
+        if g.lavadrop_spawn_timer >= getattr(
+            g, "lavadrop_spawn_interval", 999999
+        ):
+            import random
+            for i in range(getattr(g, "lavadrops_per_spawn", 0)):
+                if not self._hazard_room(g.lava_drops):
+                    break
+                drop_x = g.camera_x + random.randint(0, WIDTH)
+                drop_y = -20 - (i * 15)
+                drop_img = getattr(g.image, "lava_drop_img", None)
+                g.lava_drops.append(LavaDrop(drop_x, drop_y, drop_img))
+                self._notify_spawn(g.lava_drops[-1])
+            g.lavadrop_spawn_timer = 0
+        g.lavadrop_spawn_timer += 1
+        if g.lavadrop_spawn_timer >= getattr(
+            g,
+            "lavadrop_spawn_interval",
+            999999,
+        ):
+            import random
+            for i in range(
+                getattr(g, "lavadrops_per_spawn", 0)
+            ):
+                if not self._hazard_room(g.lava_drops):
+                    break
+                drop_x = g.camera_x + random.randint(0, WIDTH)
+                drop_y = -20 - (i * 15)
+                drop_img = (
+                    getattr(g.image, "lava_drop_img", None)
+                    if hasattr(g, "image")
+                    else None
+                )
+                g.lava_drops.append(LavaDrop(drop_x, drop_y, drop_img))
+                self._notify_spawn(g.lava_drops[-1])
+            g.lavadrop_spawn_timer = 0
+
+    def _spawn_shooting_stars(self):
+        """Spawn de estrelas cadentes (níveis 17-30)."""
+        g = self.game
+        g.shooting_star_spawn_timer += 1
+        if g.shooting_star_spawn_timer >= getattr(
+            g,
+            "shooting_star_spawn_interval",
+            999999,
+        ):
+            import random
+
+            for i in range(
+                getattr(g, "shooting_stars_per_spawn", 0)
             ):
-                _c = self._apply_tempo_speed(g.boss_alien)
-                g.boss_alien.update(g.player.x, g.camera_x)
-                self._restore_tempo_speed(g.boss_alien, _c)
+                if not self._hazard_room(g.shooting_stars):
+                    break
+                star_y = random.randint(HEIGHT // 6, HEIGHT // 2)
+                star_x = g.camera_x + WIDTH + 50 + (i * 90)
+                star_img = (
+                    getattr(g.image, "shooting_star_img", None)
+                    if hasattr(g, "image")
+                    else None
+                )
+                g.shooting_stars.append(
+                    ShootingStar(star_x, star_y, star_img)
+                )
+                self._notify_spawn(g.shooting_stars[-1])
+            g.shooting_star_spawn_timer = 0
+
+    def _spawn_airplanes(self):
+        """Spawn de aviões (níveis 31-40)."""
+        g = self.game
+        g.airplane_spawn_timer += 1
+        if g.airplane_spawn_timer >= g.airplane_spawn_interval:
+            import random
+
+            for i in range(g.airplanes_per_spawn):
+                airplane_y = random.randint(HEIGHT // 4, HEIGHT - 150)
+                airplane_x = g.camera_x + WIDTH + 50 + (i * 120)
+                airplane_images = (
+                    (
+                        g.airplane_img1,
+                        g.airplane_img2,
+                        g.airplane_img3,
+                    )
+                    if hasattr(g, "airplane_img1")
+                    else None
+                )
+                g.airplanes.append(
+                    Airplane(airplane_x, airplane_y, airplane_images)
+                )
+                self._notify_spawn(g.airplanes[-1])
+            g.airplane_spawn_timer = 0
+
+    def _spawn_flying_disks(self):
+        """Spawn de flying-disks (níveis 41-50)."""
+        g = self.game
+        g.flying_disk_spawn_timer += 1
+        if g.flying_disk_spawn_timer >= g.flying_disk_spawn_interval:
+            import random
+
+            for i in range(g.flying_disks_per_spawn):
+                disk_y = random.randint(HEIGHT // 4, HEIGHT - 150)
+                disk_x = g.camera_x + WIDTH + 50 + (i * 120)
+                disk_images = (
+                    g.flying_disk_images
+                    if hasattr(g, "flying_disk_images")
+                    else None
+                )
+                g.flying_disks.append(
+                    FlyingDisk(disk_x, disk_y, disk_images)
+                )
+                self._notify_spawn(g.flying_disks[-1])
+            g.flying_disk_spawn_timer = 0
+
+    def _spawn_meteors(self):
+        """Spawn de meteoros (níveis 47-50)."""
+        g = self.game
+        g.meteor_spawn_timer += 1
+        if g.meteor_spawn_timer >= getattr(
+            g,
+            "meteor_spawn_interval",
+            999999,
+        ):
+            import random
+
+            for _ in range(getattr(g, "meteors_per_spawn", 0)):
+                if not self._hazard_room(g.meteors):
+                    break
+                met_y = random.randint(-100, 60)
+                met_x = g.camera_x + random.randint(0, WIDTH)
+                met_img = getattr(g.image, "meteor_img", None)
+                g.meteors.append(Meteor(met_x, met_y, met_img))
+                self._notify_spawn(g.meteors[-1])
+            g.meteor_spawn_timer = 0
+
+    def _spawn_fires(self):
+        """Spawn de foguinhos (nível 51)."""
+        g = self.game
+        g.fire_spawn_timer += 1
+        if g.fire_spawn_timer >= g.fire_spawn_interval:
+            import random
+
+            for i in range(g.fires_per_spawn):
+                if not self._hazard_room(g.fires):
+                    break
+                fire_y = random.randint(HEIGHT // 4, HEIGHT - 150)
+                fire_x = g.camera_x + WIDTH + 50 + (i * 80)
+                fire_image = (
+                    g.image.fire_image
+                    if hasattr(g.image, "fire_image")
+                    else None
+                )
+                g.fires.append(Fire(fire_x, fire_y, fire_image))
+                self._notify_spawn(g.fires[-1])
+            g.fire_spawn_timer = 0
 
-                if not g.boss_alien_captured and g.boss_alien.is_captured(
-                    g.player.rect
+    def _update_birds(self):
+        """Atualizar pássaros com culling."""
+        g = self.game
+        visible_birds = []
+        for bird in g.birds:
+            _c = self._apply_tempo_speed(bird)
+            ok = bird.update()
+            self._restore_tempo_speed(bird, _c)
+            if ok:
+                if (
+                    bird.x > g.camera_x - 200
+                    and bird.x < g.camera_x + WIDTH + 200
                 ):
-                    g.boss_alien_captured = True
-                    g.capture_sequence_timer = 0
-                    g.capture_flash_timer = 0
-                    g.capture_flash_state = False
-                    g.music.play_music("capture")
-
-                if g.boss_alien_captured:
-                    g.capture_sequence_timer += 1
-                    g.capture_flash_timer += 1
-                    if g.capture_flash_timer >= 30:
-                        g.capture_flash_timer = 0
-                        g.capture_flash_state = not g.capture_flash_state
-                    if g.capture_sequence_timer >= 300:
-                        g.state = GameState.ENDING_VIDEO
-
-            # Atualizar explosões com pool
-            active_explosions = []
-            for explosion in g.explosions:
-                if explosion.update():
-                    active_explosions.append(explosion)
-                else:
-                    g.return_explosion_to_pool(explosion)
-            g.explosions = active_explosions
+                    visible_birds.append(bird)
+        g.birds = visible_birds
 
-            # Colisões tiros vs aves/morcegos/aviões/discos
-            if g.current_level <= 20:
-                if g.current_level <= 16:
-                    for bullet in g.player.bullets[:]:
-                        for bird in g.birds[:]:
-                            if getattr(bird, "is_dead", False):
-                                continue
-                            if bullet.rect.colliderect(bird.rect):
-                                g.player.bullets.remove(bullet)
-                                g.return_bullet_to_pool(bullet)
-                                if hasattr(bird, "die"):
-                                    bird.die()
-                                g.sound_effects.play_sound_effect("bird-hit")
-                                g.add_score(100)
-                                break
-                        # Colisões com gotas de chuva (7-10)
-                        if 7 <= g.current_level <= 10:
-                            for drop in g.raindrops[:]:
-                                if getattr(drop, "is_dead", False):
-                                    continue
-                                if bullet.rect.colliderect(drop.rect):
-                                    g.player.bullets.remove(bullet)
-                                    g.return_bullet_to_pool(bullet)
-                                    drop.die()
-                                    sfx.play_sound_effect("water-hit")
-                                    g.add_score(100)
-                                    break
-                else:
-                    # Compatibilidade de testes: se pássaros forem injetados manualmente,
-                    # ainda processar colisões com tiros nas fases 17-20.
-                    for bullet in g.player.bullets[:]:
-                        for bird in g.birds[:]:
-                            if getattr(bird, "is_dead", False):
-                                continue
-                            if bullet.rect.colliderect(bird.rect):
-                                g.player.bullets.remove(bullet)
-                                g.return_bullet_to_pool(bullet)
-                                if hasattr(bird, "die"):
-                                    bird.die()
-                                g.sound_effects.play_sound_effect("bird-hit")
-                                g.add_score(100)
-                                break
-                    for bullet in g.player.bullets[:]:
-                        for bat in g.bats[:]:
-                            if getattr(bat, "is_dead", False):
-                                continue
-                            if bullet.rect.colliderect(bat.rect):
-                                g.player.bullets.remove(bullet)
-                                g.return_bullet_to_pool(bullet)
-                                if hasattr(bat, "die"):
-                                    bat.die()
-                                # Remover somente se não houver suporte a animação de morte
-                                if not hasattr(bat, "is_dead") and bat in g.bats:
-                                    g.bats.remove(bat)
-                                g.sound_effects.play_sound_effect("bird-hit")
-                                g.add_score(100)
-                                break
-                        # Estrelas cadentes
-                        for star in getattr(g, "shooting_stars", [])[:]:
-                            if getattr(star, "is_dead", False):
-                                continue
-                            if bullet.rect.colliderect(star.rect):
-                                if bullet in g.player.bullets:
-                                    g.player.bullets.remove(bullet)
-                                g.return_bullet_to_pool(bullet)
-                                star.die()
-                                explosion = g.get_pooled_explosion(
-                                    star.x,
-                                    star.y,
-                                    exp_img,
-                                )
-                                g.explosions.append(explosion)
-                                g.sound_effects.play_sound_effect("explosion")
-                                g.add_score(225)
-                                break
-            elif g.current_level <= 30:
-                for bullet in g.player.bullets[:]:
-                    for bat in g.bats[:]:
-                        if getattr(bat, "is_dead", False):
-                            continue
-                        if bullet.rect.colliderect(bat.rect):
-                            g.player.bullets.remove(bullet)
-                            g.return_bullet_to_pool(bullet)
-                            if hasattr(bat, "die"):
-                                bat.die()
-                            # Remover somente se não houver suporte a animação de morte
-                            if not hasattr(bat, "is_dead") and bat in g.bats:
-                                g.bats.remove(bat)
-                            import os as _os
-                            if _os.environ.get("DEBUG_SCORE"):
-                                print(f"bat_removed len={len(g.bats)}")
-                            g.sound_effects.play_sound_effect("bird-hit")
-                            import os as _os
-                            if _os.environ.get("DEBUG_SCORE"):
-                                print("bat_bullet_score")
-                            g.add_score(100)
-                            break
-                    # Sem shooting stars nas fases 21–30
-            elif g.current_level <= 40:
-                for bullet in g.player.bullets[:]:
-                    for airplane in g.airplanes[:]:
-                        if bullet.rect.colliderect(airplane.rect):
-                            g.player.bullets.remove(bullet)
-                            g.airplanes.remove(airplane)
-                            explosion = g.get_pooled_explosion(
-                                airplane.x,
-                                airplane.y,
-                                exp_img,
-                            )
-                            g.explosions.append(explosion)
-                            g.return_bullet_to_pool(bullet)
-                            g.sound_effects.play_sound_effect("explosion")
-                            g.add_score(50)
-                            break
+    def _update_raindrops(self):
+        """Atualizar gotas de chuva com culling."""
+        g = self.game
+        visible_drops = []
+        for drop in getattr(g, "raindrops", []):
+            _c = self._apply_tempo_speed(drop)
+            ok = drop.update()
+            self._restore_tempo_speed(drop, _c)
+            if ok:
+                if (
+                    drop.x > g.camera_x - 100
+                    and drop.x < g.camera_x + WIDTH + 100
+                ):
+                    visible_drops.append(drop)
+        g.raindrops = visible_drops
+
+    def _update_bats(self):
+        """Atualizar morcegos com culling."""
+        g = self.game
+        visible_bats = []
+        for bat in g.bats:
+            _c = self._apply_tempo_speed(bat)
+            ok = bat.update(g.camera_x)
+            self._restore_tempo_speed(bat, _c)
+            if ok:
+                if (
+                    bat.x > g.camera_x - 200
+                    and bat.x < g.camera_x + WIDTH + 200
+                ):
+                    visible_bats.append(bat)
+        g.bats = visible_bats
+
+    def _update_shooting_stars(self):
+        """Atualizar estrelas cadentes com culling."""
+        g = self.game
+        visible_stars = []
+        for star in getattr(g, "shooting_stars", []):
+            _c = self._apply_tempo_speed(star)
+            ok = star.update(g.camera_x)
+            self._restore_tempo_speed(star, _c)
+            if ok:
+                if (
+                    star.x > g.camera_x - 200
+                    and star.x < g.camera_x + WIDTH + 200
+                ):
+                    visible_stars.append(star)
+        g.shooting_stars = visible_stars
+
+    def _update_lava_drops(self):
+        """Atualizar lava-drops com culling."""
+        g = self.game
+        visible_lava = []
+        for drop in getattr(g, "lava_drops", []):
+            _c = self._apply_tempo_speed(drop)
+            ok = drop.update()
+            self._restore_tempo_speed(drop, _c)
+            if ok:
+                if (
+                    drop.x > g.camera_x - 100
+                    and drop.x < g.camera_x + WIDTH + 100
+                ):
+                    visible_lava.append(drop)
+        g.lava_drops = visible_lava
+
+    def _clear_shooting_stars(self):
+        """Sem estrelas cadentes ativas nas fases 21-30."""
+        g = self.game
+        g.shooting_stars = []
+
+    def _update_airplanes(self):
+        """Atualizar aviões com culling."""
+        g = self.game
+        visible_airplanes = []
+        for airplane in g.airplanes:
+            _c = self._apply_tempo_speed(airplane)
+            ok = airplane.update(g.camera_x)
+            self._restore_tempo_speed(airplane, _c)
+            if ok:
+                if (
+                    airplane.x > g.camera_x - 200
+                    and airplane.x < g.camera_x + WIDTH + 200
+                ):
+                    visible_airplanes.append(airplane)
+        g.airplanes = visible_airplanes
+
+    def _update_flying_disks(self):
+        """Atualizar flying-disks com culling."""
+        g = self.game
+        visible_disks = []
+        for disk in g.flying_disks:
+            _c = self._apply_tempo_speed(disk)
+            ok = disk.update(g.camera_x)
+            self._restore_tempo_speed(disk, _c)
+            if ok:
+                if (
+                    disk.x > g.camera_x - 200
+                    and disk.x < g.camera_x + WIDTH + 200
+                ):
+                    visible_disks.append(disk)
+        g.flying_disks = visible_disks
+
+    def _update_meteors(self):
+        """Atualizar meteoros com culling."""
+        g = self.game
+        visible_meteors = []
+        for met in getattr(g, "meteors", []):
+            _c = self._apply_tempo_speed(met)
+            ok = met.update(g.camera_x)
+            self._restore_tempo_speed(met, _c)
+            if ok:
+                if (
+                    met.x > g.camera_x - 200
+                    and met.x < g.camera_x + WIDTH + 200
+                ):
+                    visible_meteors.append(met)
+        g.meteors = visible_meteors
+
+    def _update_fires(self):
+        """Atualizar foguinhos com culling."""
+        g = self.game
+        visible_fires = []
+        for fire in g.fires:
+            _c = self._apply_tempo_speed(fire)
+            ok = fire.update(g.camera_x)
+            self._restore_tempo_speed(fire, _c)
+            if ok:
+                if (
+                    fire.x > g.camera_x - 200
+                    and fire.x < g.camera_x + WIDTH + 200
+                ):
+                    visible_fires.append(fire)
+        g.fires = visible_fires
+
+    def _update_turtles(self):
+        """Atualizar tartarugas despertas."""
+        g = self.game
+        active_turtles = []
+        for turtle in g.turtles:
+            if not self._is_awake(turtle, g.camera_x):
+                active_turtles.append(turtle)
+                continue
+            _c = self._apply_tempo_speed(turtle)
+            ok = turtle.update()
+            self._restore_tempo_speed(turtle, _c)
+            if ok:
+                active_turtles.append(turtle)
+        g.turtles[:] = active_turtles
+
+    def _update_spiders(self):
+        """Atualizar aranhas despertas."""
+        g = self.game
+        active_spiders = []
+        for spider in g.spiders:
+            if not self._is_awake(spider, g.camera_x):
+                active_spiders.append(spider)
+                continue
+            _c = self._apply_tempo_speed(spider)
+            ok = spider.update(g.camera_x)
+            self._restore_tempo_speed(spider, _c)
+            if ok:
+                active_spiders.append(spider)
+        g.spiders[:] = active_spiders
+
+    def _update_robots(self):
+        """Atualizar robôs despertos e seus mísseis."""
+        g = self.game
+        active_robots = []
+        for robot in g.robots:
+            if not self._is_awake(robot, g.camera_x, "missiles"):
+                active_robots.append(robot)
+                continue
+            _c = self._apply_tempo_speed(robot)
+            # Aplicar lentidão aos mísseis existentes antes de atualizar
+            missile_changes = []
+            for _m in getattr(robot, "missiles", []):
+                missile_changes.append(self._apply_tempo_speed(_m))
+            ok = robot.update(g.camera_x)
+            # Restaurar velocidades dos mísseis que existiam
+            for _m, ch in zip(getattr(robot, "missiles", []), missile_changes):
+                self._restore_tempo_speed(_m, ch)
+            self._restore_tempo_speed(robot, _c)
+            if ok:
+                active_robots.append(robot)
+        g.robots[:] = active_robots
+
+    def _update_aliens(self):
+        """Atualizar aliens despertos e seus lasers."""
+        g = self.game
+        active_aliens = []
+        for alien in g.aliens:
+            if not self._is_awake(alien, g.camera_x, "lasers"):
+                active_aliens.append(alien)
+                continue
+            _c = self._apply_tempo_speed(alien)
+            laser_changes = []
+            for _lz in getattr(alien, "lasers", []):
+                laser_changes.append(self._apply_tempo_speed(_lz))
+            ok = alien.update(g.camera_x)
+            for _lz, ch in zip(getattr(alien, "lasers", []), laser_changes):
+                self._restore_tempo_speed(_lz, ch)
+            self._restore_tempo_speed(alien, _c)
+            if ok:
+                active_aliens.append(alien)
+        g.aliens[:] = active_aliens
+
+    def _update_boss(self):
+        """Atualizar boss alien e a sequência de captura."""
+        g = self.game
+        if not getattr(g, "boss_alien", None):
+            return
+        _c = self._apply_tempo_speed(g.boss_alien)
+        g.boss_alien.update(g.player.x, g.camera_x)
+        self._restore_tempo_speed(g.boss_alien, _c)
+
+        if not g.boss_alien_captured and g.boss_alien.is_captured(
+            g.player.rect
+        ):
+            g.boss_alien_captured = True
+            g.capture_sequence_timer = 0
+            g.capture_flash_timer = 0
+            g.capture_flash_state = False
+            g.music.play_music("capture")
+
+        if g.boss_alien_captured:
+            g.capture_sequence_timer += 1
+            g.capture_flash_timer += 1
+            if g.capture_flash_timer >= 30:
+                g.capture_flash_timer = 0
+                g.capture_flash_state = not g.capture_flash_state
+            if g.capture_sequence_timer >= 300:
+                g.state = GameState.ENDING_VIDEO
+
+    def _update_explosions(self):
+        """Atualizar explosões com pool."""
+        g = self.game
+        active_explosions = []
+        for explosion in g.explosions:
+            if explosion.update():
+                active_explosions.append(explosion)
             else:
-                if 41 <= g.current_level <= 50:
-                    for bullet in g.player.bullets[:]:
-                        for disk in g.flying_disks[:]:
-                            if bullet.rect.colliderect(disk.rect):
-                                g.player.bullets.remove(bullet)
-                                g.flying_disks.remove(disk)
+                g.return_explosion_to_pool(explosion)
+        g.explosions = active_explosions
+
+    def _bullets_vs_birds(self):
+        """Colisões tiros vs pássaros (e gotas de chuva nas fases 7-10)."""
+        g = self.game
+        sfx = g.sound_effects
+        # Gotas de chuva (7-10) intercaladas por tiro
+        rain = 7 <= g.current_level <= 10
+        for bullet in live(g.player.bullets):
+            for bird in live(g.birds):
+                if getattr(bird, "is_dead", False):
+                    continue
+                if bullet.rect.colliderect(bird.rect):
+                    g.kill_entity(bullet)
+                    if hasattr(bird, "die"):
+                        bird.die()
+                    g.sound_effects.play_sound_effect("bird-hit")
+                    g.add_score(100)
+                    break
+            # Colisões com gotas de chuva (7-10)
+            if rain and not is_removed(bullet):
+                for drop in live(g.raindrops):
+                    if getattr(drop, "is_dead", False):
+                        continue
+                    if bullet.rect.colliderect(drop.rect):
+                        g.kill_entity(bullet)
+                        drop.die()
+                        sfx.play_sound_effect("water-hit")
+                        g.add_score(100)
+                        break
+
+    def _bullets_vs_bats_and_stars(self):
+        """Colisões tiros vs morcegos e estrelas cadentes."""
+        g = self.game
+        exp_img = g.image.explosion_image
+        for bullet in live(g.player.bullets):
+            for bat in live(g.bats):
+                if getattr(bat, "is_dead", False):
+                    continue
+                if bullet.rect.colliderect(bat.rect):
+                    g.kill_entity(bullet)
+                    if hasattr(bat, "die"):
+                        bat.die()
+                    # Remover somente se não houver suporte a animação de morte
+                    if not hasattr(bat, "is_dead") and bat in g.bats:
+                        g.kill_entity(bat)
+                    g.sound_effects.play_sound_effect("bird-hit")
+                    g.add_score(100)
+                    break
+            # Estrelas cadentes
+            for star in live(getattr(g, "shooting_stars", [])):
+                if getattr(star, "is_dead", False):
+                    continue
+                if bullet.rect.colliderect(star.rect):
+                    g.kill_entity(bullet)
+                    star.die()
+                    explosion = g.get_pooled_explosion(
+                        star.x,
+                        star.y,
+                        exp_img,
+                    )
+                    g.explosions.append(explosion)
+                    g.sound_effects.play_sound_effect("explosion")
+                    g.add_score(225)
+                    break
+
+    def _bullets_vs_bats(self):
+        """Colisões tiros vs morcegos."""
+        g = self.game
+        for bullet in live(g.player.bullets):
+            for bat in live(g.bats):
+                if getattr(bat, "is_dead", False):
+                    continue
+                if bullet.rect.colliderect(bat.rect):
+                    g.kill_entity(bullet)
+                    if hasattr(bat, "die"):
+                        bat.die()
+                    # Remover somente se não houver suporte a animação de morte
+                    if not hasattr(bat, "is_dead") and bat in g.bats:
+                        g.kill_entity(bat)
+                    import os as _os
+                    if _os.environ.get("DEBUG_SCORE"):
+                        print(f"bat_removed len={len(g.bats)}")
+                    g.sound_effects.play_sound_effect("bird-hit")
+                    import os as _os
+                    if _os.environ.get("DEBUG_SCORE"):
+                        print("bat_bullet_score")
+                    g.add_score(100)
+                    break
+            # Sem shooting stars nas fases 21–30
+
+    def _bullets_vs_airplanes(self):
+        """Colisões tiros vs aviões."""
+        g = self.game
+        exp_img = g.image.explosion_image
+        for bullet in live(g.player.bullets):
+            for airplane in live(g.airplanes):
+                if bullet.rect.colliderect(airplane.rect):
+                    g.kill_entity(bullet)
+                    g.kill_entity(airplane)
+                    explosion = g.get_pooled_explosion(
+                        airplane.x,
+                        airplane.y,
+                        exp_img,
+                    )
+                    g.explosions.append(explosion)
+                    g.sound_effects.play_sound_effect("explosion")
+                    g.add_score(50)
+                    break
+
+    def _bullets_vs_disks_and_meteors(self):
+        """Colisões tiros vs flying-disks e meteoros."""
+        g = self.game
+        exp_img = g.image.explosion_image
+        for bullet in live(g.player.bullets):
+            for disk in live(g.flying_disks):
+                if bullet.rect.colliderect(disk.rect):
+                    g.kill_entity(bullet)
+                    g.kill_entity(disk)
+                    explosion = g.get_pooled_explosion(
+                        disk.x,
+                        disk.y,
+                        exp_img,
+                    )
+                    g.explosions.append(explosion)
+                    g.sound_effects.play_sound_effect("explosion")
+                    g.add_score(90)
+                    break
+            for met in live(getattr(g, "meteors", [])):
+                if getattr(met, "is_dead", False):
+                    continue
+                if bullet.rect.colliderect(met.rect):
+                    g.kill_entity(bullet)
+                    met.die()
+                    explosion = g.get_pooled_explosion(
+                        met.x,
+                        met.y,
+                        exp_img,
+                    )
+                    g.explosions.append(explosion)
+                    g.kill_entity(met)
+                    g.sound_effects.play_sound_effect("explosion")
+                    g.add_score(259)
+                    break
+
+    def _bullets_vs_spiders(self):
+        """Colisões tiros vs aranhas."""
+        g = self.game
+        for bullet in live(g.player.bullets):
+            for spider in live(g.spiders):
+                if getattr(spider, "is_dead", False):
+                    continue
+                if bullet.rect.colliderect(spider.rect):
+                    g.kill_entity(bullet)
+                    if hasattr(spider, "die"):
+                        spider.die()
+                    g.sound_effects.play_sound_effect("bird-hit")
+                    g.add_score(120)
+                    break
+
+    def _bullets_vs_robots(self):
+        """Colisões tiros do jogador vs robôs."""
+        g = self.game
+        exp_img = g.image.explosion_image
+        for bullet in live(g.player.bullets):
+            for robot in live(g.robots):
+                if bullet.rect.colliderect(robot.rect):
+                    g.kill_entity(bullet)
+                    explosion = g.get_pooled_explosion(
+                        robot.x,
+                        robot.y,
+                        exp_img,
+                    )
+                    g.explosions.append(explosion)
+                    g.sound_effects.play_sound_effect("explosion")
+                    for missile in getattr(robot, "missiles", []):
+                        g.orphan_missiles.append(missile)
+                    g.kill_entity(robot)
+                    g.add_score(100)
+                    break
+
+    def _missiles_vs_player(self):
+        """Colisões mísseis dos robôs vs jogador."""
+        g = self.game
+        sfx = g.sound_effects
+        exp_img = g.image.explosion_image
+        high_score = g.ranking_manager.is_high_score
+        if g.player.is_being_abducted:
+            return
+        for robot in live(g.robots):
+            for missile in live(robot.missiles):
+                if g.player.rect.colliderect(missile.rect):
+                    if g.player.is_invulnerable:
+                        explosion = g.get_pooled_explosion(
+                            missile.x,
+                            missile.y,
+                            exp_img,
+                        )
+                        g.explosions.append(explosion)
+                        g.kill_entity(missile)
+                        g.add_score(15)
+                    else:
+                        if not g.player.is_hit:
+                            if getattr(g, "shield_active", False):
+                                g.shield_active = False
                                 explosion = g.get_pooled_explosion(
-                                    disk.x,
-                                    disk.y,
+                                    missile.x,
+                                    missile.y,
                                     exp_img,
                                 )
                                 g.explosions.append(explosion)
-                                g.return_bullet_to_pool(bullet)
-                                g.sound_effects.play_sound_effect("explosion")
-                                g.add_score(90)
-                                break
-                        for met in getattr(g, "meteors", [])[:]:
-                            if getattr(met, "is_dead", False):
-                                continue
-                            if bullet.rect.colliderect(met.rect):
-                                if bullet in g.player.bullets:
-                                    g.player.bullets.remove(bullet)
-                                g.return_bullet_to_pool(bullet)
-                                met.die()
-                                explosion = g.get_pooled_explosion(
-                                    met.x,
-                                    met.y,
-                                    exp_img,
+                                g.kill_entity(missile)
+                            else:
+                                g.player.take_hit()
+                                sfx.play_sound_effect(
+                                    "player-hit"
                                 )
-                                g.explosions.append(explosion)
-                                if met in g.meteors:
-                                    g.meteors.remove(met)
-                                g.sound_effects.play_sound_effect("explosion")
-                                g.add_score(259)
-                                break
-
-            # Colisões tiros vs aranhas (>20)
-            if not (g.current_level <= 20):
-                for bullet in g.player.bullets[:]:
-                    for spider in g.spiders[:]:
-                        if getattr(spider, "is_dead", False):
-                            continue
-                        if bullet.rect.colliderect(spider.rect):
-                            g.player.bullets.remove(bullet)
-                            g.return_bullet_to_pool(bullet)
-                            if hasattr(spider, "die"):
-                                spider.die()
-                            g.sound_effects.play_sound_effect("bird-hit")
-                            g.add_score(120)
-                            break
-
-            # Colisões tiros do jogador vs robôs (31-40)
-            if 31 <= g.current_level <= 40:
-                for bullet in g.player.bullets[:]:
-                    for robot in g.robots[:]:
-                        if bullet.rect.colliderect(robot.rect):
-                            if bullet in g.player.bullets:
-                                g.player.bullets.remove(bullet)
-                            g.return_bullet_to_pool(bullet)
-                            explosion = g.get_pooled_explosion(
-                                robot.x,
-                                robot.y,
-                                exp_img,
-                            )
-                            g.explosions.append(explosion)
-                            g.sound_effects.play_sound_effect("explosion")
-                            for missile in getattr(robot, "missiles", []):
-                                g.orphan_missiles.append(missile)
-                            if robot in g.robots:
-                                g.robots.remove(robot)
-                            g.add_score(100)
-                            break
-
-            # Colisões mísseis dos robôs vs jogador (31-40)
-            if 31 <= g.current_level <= 40 and not g.player.is_being_abducted:
-                for robot in g.robots[:]:
-                    for missile in robot.missiles[:]:
-                        if g.player.rect.colliderect(missile.rect):
-                            if g.player.is_invulnerable:
                                 explosion = g.get_pooled_explosion(
                                     missile.x,
                                     missile.y,
                                     exp_img,
                                 )
                                 g.explosions.append(explosion)
-                                robot.missiles.remove(missile)
-                                g.add_score(15)
-                            else:
-                                if not g.player.is_hit:
-                                    if getattr(g, "shield_active", False):
-                                        g.shield_active = False
-                                        explosion = g.get_pooled_explosion(
-                                            missile.x,
-                                            missile.y,
-                                            exp_img,
-                                        )
-                                        g.explosions.append(explosion)
-                                        if missile in robot.missiles:
-                                            robot.missiles.remove(missile)
+                                g.kill_entity(missile)
+                                g.lives -= 1
+                                if g.lives <= 0:
+                                    if high_score(g.score):
+                                        g.state = GameState.ENTER_NAME
                                     else:
-                                        g.player.take_hit()
-                                        sfx.play_sound_effect(
-                                            "player-hit"
-                                        )
-                                        explosion = g.get_pooled_explosion(
-                                            missile.x,
-                                            missile.y,
-                                            exp_img,
-                                        )
-                                        g.explosions.append(explosion)
-                                        robot.missiles.remove(missile)
-                                        g.lives -= 1
-                                        if g.lives <= 0:
-                                            if high_score(g.score):
-                                                g.state = GameState.ENTER_NAME
-                                            else:
-                                                g.state = GameState.GAME_OVER
-                                            g.start_game_over_hold()
-                            break
+                                        g.state = GameState.GAME_OVER
+                                    g.start_game_over_hold()
+                    break
 
-            # Colisões lasers dos aliens vs jogador (41-50)
-            if 41 <= g.current_level <= 50 and not g.player.is_being_abducted:
-                for alien in g.aliens[:]:
-                    if hasattr(alien, "is_dead") and alien.is_dead:
-                        continue
-                    for laser in alien.lasers[:]:
-                        if not getattr(laser, "collision_enabled", True):
-                            continue
-                        if g.player.rect.colliderect(laser.rect):
-                            if g.player.is_invulnerable:
+    def _lasers_vs_player(self):
+        """Colisões lasers dos aliens vs jogador."""
+        g = self.game
+        sfx = g.sound_effects
+        exp_img = g.image.explosion_image
+        high_score = g.ranking_manager.is_high_score
+        if g.player.is_being_abducted:
+            return
+        for alien in live(g.aliens):
+            if hasattr(alien, "is_dead") and alien.is_dead:
+                continue
+            for laser in live(alien.lasers):
+                if not getattr(laser, "collision_enabled", True):
+                    continue
+                if g.player.rect.colliderect(laser.rect):
+                    if g.player.is_invulnerable:
+                        explosion = g.get_pooled_explosion(
+                            laser.x,
+                            laser.y,
+                            exp_img,
+                        )
+                        g.explosions.append(explosion)
+                        g.kill_entity(laser)
+                        g.add_score(15)
+                    else:
+                        if not g.player.is_hit:
+                            if getattr(g, "shield_active", False):
+                                g.shield_active = False
                                 explosion = g.get_pooled_explosion(
                                     laser.x,
                                     laser.y,
                                     exp_img,
                                 )
                                 g.explosions.append(explosion)
-                                alien.lasers.remove(laser)
-                                g.add_score(15)
+                                g.kill_entity(laser)
                             else:
-                                if not g.player.is_hit:
-                                    if getattr(g, "shield_active", False):
-                                        g.shield_active = False
-                                        explosion = g.get_pooled_explosion(
-                                            laser.x,
-                                            laser.y,
-                                            exp_img,
-                                        )
-                                        g.explosions.append(explosion)
-                                        if laser in alien.lasers:
-                                            alien.lasers.remove(laser)
+                                g.player.take_hit()
+                                sfx.play_sound_effect(
+                                    "player-hit"
+                                )
+                                explosion = g.get_pooled_explosion(
+                                    laser.x,
+                                    laser.y,
+                                    exp_img,
+                                )
+                                g.explosions.append(explosion)
+                                g.kill_entity(laser)
+                                g.lives -= 1
+                                if g.lives <= 0:
+                                    if high_score(g.score):
+                                        g.state = GameState.ENTER_NAME
                                     else:
-                                        g.player.take_hit()
-                                        sfx.play_sound_effect(
-                                            "player-hit"
-                                        )
-                                        explosion = g.get_pooled_explosion(
-                                            laser.x,
-                                            laser.y,
-                                            exp_img,
-                                        )
-                                        g.explosions.append(explosion)
-                                        alien.lasers.remove(laser)
-                                        g.lives -= 1
-                                        if g.lives <= 0:
-                                            if high_score(g.score):
-                                                g.state = GameState.ENTER_NAME
-                                            else:
-                                                g.state = GameState.GAME_OVER
-                                            g.start_game_over_hold()
-                            break
-
-            # Colisões tiros vs aliens (41-50)
-            if 41 <= g.current_level <= 50:
-                for bullet in g.player.bullets[:]:
-                    for alien in g.aliens[:]:
-                        if bullet.rect.colliderect(alien.rect):
-                            if hasattr(alien, "is_dead") and alien.is_dead:
-                                if bullet in g.player.bullets:
-                                    g.player.bullets.remove(bullet)
-                                g.return_bullet_to_pool(bullet)
-                                break
-                            if hasattr(alien, "die"):
-                                alien.die()
-                                g.sound_effects.play_sound_effect("bird-hit")
-                            if bullet in g.player.bullets:
-                                g.player.bullets.remove(bullet)
-                            g.return_bullet_to_pool(bullet)
-                            for laser in getattr(alien, "lasers", []):
-                                g.orphan_lasers.append(laser)
-                            g.add_score(60)
-                            break
-
-            # Atualizar mísseis/lases órfãos
-            if 31 <= g.current_level <= 40:
-                active_orphan_missiles = []
-                for missile in g.orphan_missiles:
-                    updater = getattr(missile, "update", None)
-                    keep = True if updater is None else bool(updater(g.camera_x))
-                    if keep:
-                        active_orphan_missiles.append(missile)
-                g.orphan_missiles = active_orphan_missiles
+                                        g.state = GameState.GAME_OVER
+                                    g.start_game_over_hold()
+                    break
 
-            if 41 <= g.current_level <= 50:
-                active_orphan_lasers = []
-                for laser in g.orphan_lasers:
-                    _c = self._apply_tempo_speed(laser)
-                    updater = getattr(laser, "update", None)
-                    keep = True if updater is None else bool(updater(g.camera_x))
-                    self._restore_tempo_speed(laser, _c)
-                    if keep:
-                        active_orphan_lasers.append(laser)
-                g.orphan_lasers = active_orphan_lasers
-
-            # Colisão/esquiva aves/morcegos/aviões/discos
-            if g.current_level <= 20:
-                if g.current_level <= 16:
-                    for bird in g.birds[:]:
-                        distance_x = abs(bird.x - g.player.x)
-                        distance_y = abs(bird.y - g.player.y)
-                        if (
-                            distance_x < 40
-                            and distance_y < 50
-                            and bird.x < g.player.x
-                            and bird.id not in g.birds_dodged
-                        ):
-                            g.birds_dodged.add(bird.id)
-                            g.add_score(10)
-                        # Usar hitbox efetiva quando abaixado para inimigos voadores
-                        player_rect = g.player.get_airborne_collision_rect()
-                        if player_rect.colliderect(bird.rect):
-                            if hasattr(bird, "is_dead") and bird.is_dead:
-                                continue
-                            if g.player.is_invulnerable:
-                                g.explosions.append(
-                                    Explosion(
-                                        bird.x,
-                                        bird.y,
-                                        g.image.explosion_image,
-                                    )
+    def _bullets_vs_aliens(self):
+        """Colisões tiros vs aliens."""
+        g = self.game
+        for bullet in live(g.player.bullets):
+            for alien in live(g.aliens):
+                if bullet.rect.colliderect(alien.rect):
+                    if hasattr(alien, "is_dead") and alien.is_dead:
+                        g.kill_entity(bullet)
+                        break
+                    if hasattr(alien, "die"):
+                        alien.die()
+                        g.sound_effects.play_sound_effect("bird-hit")
+                    g.kill_entity(bullet)
+                    for laser in getattr(alien, "lasers", []):
+                        g.orphan_lasers.append(laser)
+                    g.add_score(60)
+                    break
+
+    def _update_orphan_missiles(self):
+        """Atualizar mísseis órfãos."""
+        g = self.game
+        active_orphan_missiles = []
+        for missile in g.orphan_missiles:
+            updater = getattr(missile, "update", None)
+            keep = True if updater is None else bool(updater(g.camera_x))
+            if keep:
+                active_orphan_missiles.append(missile)
+        g.orphan_missiles = active_orphan_missiles
+
+    def _update_orphan_lasers(self):
+        """Atualizar lasers órfãos."""
+        g = self.game
+        active_orphan_lasers = []
+        for laser in g.orphan_lasers:
+            _c = self._apply_tempo_speed(laser)
+            updater = getattr(laser, "update", None)
+            keep = True if updater is None else bool(updater(g.camera_x))
+            self._restore_tempo_speed(laser, _c)
+            if keep:
+                active_orphan_lasers.append(laser)
+        g.orphan_lasers = active_orphan_lasers
+
+    def _player_vs_birds(self):
+        """Colisão/esquiva com pássaros."""
+        g = self.game
+        for bird in live(g.birds):
+            distance_x = abs(bird.x - g.player.x)
+            distance_y = abs(bird.y - g.player.y)
+            if (
+                distance_x < 40
+                and distance_y < 50
+                and bird.x < g.player.x
+                and bird.id not in g.birds_dodged
+            ):
+                g.birds_dodged.add(bird.id)
+                g.add_score(10)
+            # Usar hitbox efetiva quando abaixado para inimigos voadores
+            player_rect = g.player.get_airborne_collision_rect()
+            if collide_precise(g.player, bird, player_rect):
+                if hasattr(bird, "is_dead") and bird.is_dead:
+                    continue
+                if g.player.is_invulnerable:
+                    g.explosions.append(
+                        Explosion(
+                            bird.x,
+                            bird.y,
+                            g.image.explosion_image,
+                        )
+                    )
+                    g.kill_entity(bird)
+                    g.add_score(20)
+                else:
+                    if not g.player.is_hit:
+                        if getattr(g, "shield_active", False):
+                            g.shield_active = False
+                            g.explosions.append(
+                                Explosion(
+                                    bird.x,
+                                    bird.y,
+                                    g.image.explosion_image,
                                 )
-                                g.birds.remove(bird)
-                                g.add_score(20)
-                            else:
-                                if not g.player.is_hit:
-                                    if getattr(g, "shield_active", False):
-                                        g.shield_active = False
-                                        g.explosions.append(
-                                            Explosion(
-                                                bird.x,
-                                                bird.y,
-                                                g.image.explosion_image,
-                                            )
-                                        )
-                                        if bird in g.birds:
-                                            g.birds.remove(bird)
-                                    else:
-                                        g.player.take_hit()
-                                        g.sound_effects.play_sound_effect(
-                                            "player-hit"
-                                        )
-                                        g.explosions.append(
-                                            Explosion(
-                                                bird.x,
-                                                bird.y,
-                                                g.image.explosion_image,
-                                            )
-                                        )
-                                        g.birds.remove(bird)
-                                        g.lives -= 1
-                                        if g.lives <= 0:
-                                            if g.ranking_manager.is_high_score(
-                                                g.score
-                                            ):
-                                                g.state = GameState.ENTER_NAME
-                                            else:
-                                                g.state = GameState.GAME_OVER
-                                            g.start_game_over_hold()
-                            break
-                    # Colisão com gotas de chuva (fases 7-10)
-                    if 7 <= g.current_level <= 10:
-                        for drop in g.raindrops[:]:
-                            if g.player.rect.colliderect(drop.rect):
-                                if getattr(drop, "is_dead", False):
-                                    continue
-                                # Pulo destrói a gota; invulnerável também destrói
-                                if g.player.is_invulnerable or not getattr(
-                                    g.player, "on_ground", True
+                            )
+                            g.kill_entity(bird)
+                        else:
+                            g.player.take_hit()
+                            g.sound_effects.play_sound_effect(
+                                "player-hit"
+                            )
+                            g.explosions.append(
+                                Explosion(
+                                    bird.x,
+                                    bird.y,
+                                    g.image.explosion_image,
+                                )
+                            )
+                            g.kill_entity(bird)
+                            g.lives -= 1
+                            if g.lives <= 0:
+                                if g.ranking_manager.is_high_score(
+                                    g.score
                                 ):
-                                    drop.die()
-                                    g.sound_effects.play_sound_effect("water-hit")
-                                    g.add_score(20)
+                                    g.state = GameState.ENTER_NAME
                                 else:
-                                    if not g.player.is_hit:
-                                        if getattr(g, "shield_active", False):
-                                            g.shield_active = False
-                                            drop.die()
-                                            g.sound_effects.play_sound_effect(
-                                                "water-hit"
-                                            )
-                                        else:
-                                            g.player.take_hit()
-                                            g.sound_effects.play_sound_effect(
-                                                "player-hit"
-                                            )
-                                            drop.die()
-                                            g.lives -= 1
-                                            if g.lives <= 0:
-                                                if g.ranking_manager.is_high_score(
-                                                    g.score
-                                                ):
-                                                    g.state = GameState.ENTER_NAME
-                                                else:
-                                                    g.state = GameState.GAME_OVER
-                                                g.start_game_over_hold()
-                                break
+                                    g.state = GameState.GAME_OVER
+                                g.start_game_over_hold()
+                break
+
+    def _player_vs_raindrops(self):
+        """Colisão com gotas de chuva."""
+        g = self.game
+        for drop in live(g.raindrops):
+            if collide_precise(g.player, drop, g.player.rect):
+                if getattr(drop, "is_dead", False):
+                    continue
+                # Pulo destrói a gota; invulnerável também destrói
+                if g.player.is_invulnerable or not getattr(
+                    g.player, "on_ground", True
+                ):
+                    drop.die()
+                    g.sound_effects.play_sound_effect("water-hit")
+                    g.add_score(20)
                 else:
-                    # Compatibilidade de testes:
-                    # processar colisões com pássaros (fases 17–20)
-                    for bird in g.birds[:]:
-                        distance_x = abs(bird.x - g.player.x)
-                        distance_y = abs(bird.y - g.player.y)
-                        if (
-                            distance_x < 40
-                            and distance_y < 50
-                            and bird.x < g.player.x
-                            and bird.id not in g.birds_dodged
-                        ):
-                            g.birds_dodged.add(bird.id)
-                            g.add_score(10)
-                        player_rect = g.player.get_airborne_collision_rect()
-                        if player_rect.colliderect(bird.rect):
-                            if hasattr(bird, "is_dead") and bird.is_dead:
-                                continue
-                            if g.player.is_invulnerable:
-                                g.explosions.append(
-                                    Explosion(
-                                        bird.x,
-                                        bird.y,
-                                        exp_img,
-                                    )
-                                )
-                                g.birds.remove(bird)
-                                g.add_score(20)
-                            else:
-                                if not g.player.is_hit:
-                                    if getattr(g, "shield_active", False):
-                                        g.shield_active = False
-                                        g.explosions.append(
-                                            Explosion(
-                                                bird.x,
-                                                bird.y,
-                                                exp_img,
-                                            )
-                                        )
-                                        if bird in g.birds:
-                                            g.birds.remove(bird)
-                                    else:
-                                        g.player.take_hit()
-                                        g.sound_effects.play_sound_effect(
-                                            "player-hit"
-                                        )
-                                        g.explosions.append(
-                                            Explosion(
-                                                bird.x,
-                                                bird.y,
-                                                exp_img,
-                                            )
-                                        )
-                                        g.birds.remove(bird)
-                                        g.lives -= 1
-                                        if g.lives <= 0:
-                                            if high_score(g.score):
-                                                g.state = GameState.ENTER_NAME
-                                            else:
-                                                g.state = GameState.GAME_OVER
-                                            g.start_game_over_hold()
-                            break
-                    # Morcegos
-                    for bat in g.bats[:]:
-                        distance_x = abs(bat.x - g.player.x)
-                        distance_y = abs(bat.y - g.player.y)
-                        if (
-                            distance_x < 40
-                            and distance_y < 50
-                            and bat.x < g.player.x
-                            and bat.id not in g.birds_dodged
-                        ):
-                            g.birds_dodged.add(bat.id)
-                            g.add_score(15)
-                        player_rect = g.player.get_airborne_collision_rect()
-                        if player_rect.colliderect(bat.rect):
-                            if hasattr(bat, "is_dead") and bat.is_dead:
-                                continue
-                            if g.player.is_invulnerable:
-                                g.explosions.append(
-                                    Explosion(
-                                        bat.x,
-                                        bat.y,
-                                        exp_img,
-                                    )
-                                )
-                                if hasattr(bat, "die"):
-                                    bat.die()
-                                g.add_score(25)
-                            else:
-                                if not g.player.is_hit:
-                                    if getattr(g, "shield_active", False):
-                                        g.shield_active = False
-                                        g.explosions.append(
-                                            Explosion(
-                                                bat.x,
-                                                bat.y,
-                                                exp_img,
-                                            )
-                                        )
-                                        if hasattr(bat, "die"):
-                                            bat.die()
-                                    else:
-                                        g.player.take_hit()
-                                        g.sound_effects.play_sound_effect(
-                                            "player-hit"
-                                        )
-                                        g.explosions.append(
-                                            Explosion(
-                                                bat.x,
-                                                bat.y,
-                                                exp_img,
-                                            )
-                                        )
-                                        if hasattr(bat, "die"):
-                                            bat.die()
-                                        g.lives -= 1
-                                        if g.lives <= 0:
-                                            if high_score(g.score):
-                                                g.state = GameState.ENTER_NAME
-                                            else:
-                                                g.state = GameState.GAME_OVER
-                                            g.start_game_over_hold()
-                            break
-                    # Estrelas cadentes
-                    for star in getattr(g, "shooting_stars", [])[:]:
-                        distance_x = abs(star.x - g.player.x)
-                        distance_y = abs(star.y - g.player.y)
-                        if (
-                            distance_x < 45
-                            and distance_y < 55
-                            and star.x < g.player.x
-                            and star.id not in g.birds_dodged
-                        ):
-                            g.birds_dodged.add(star.id)
-                            g.add_score(45)
-                        player_rect = g.player.get_airborne_collision_rect()
-                        if player_rect.colliderect(star.rect):
-                            if hasattr(star, "is_dead") and star.is_dead:
-                                continue
-                            if g.player.is_invulnerable:
-                                explosion = g.get_pooled_explosion(
-                                    star.x, star.y, g.image.explosion_image
-                                )
-                                g.explosions.append(explosion)
-                                if star in g.shooting_stars:
-                                    g.shooting_stars.remove(star)
-                                g.add_score(75)
-                            else:
-                                if not g.player.is_hit:
-                                    if getattr(g, "shield_active", False):
-                                        g.shield_active = False
-                                        explosion = g.get_pooled_explosion(
-                                            star.x,
-                                            star.y,
-                                            exp_img,
-                                        )
-                                        g.explosions.append(explosion)
-                                        if star in g.shooting_stars:
-                                            g.shooting_stars.remove(star)
-                                    else:
-                                        g.player.take_hit()
-                                        sfx.play_sound_effect(
-                                            "player-hit"
-                                        )
-                                        explosion = g.get_pooled_explosion(
-                                            star.x,
-                                            star.y,
-                                            exp_img,
-                                        )
-                                        g.explosions.append(explosion)
-                                        if star in g.shooting_stars:
-                                            g.shooting_stars.remove(star)
-                                        g.lives -= 1
-                                        if g.lives <= 0:
-                                            if high_score(g.score):
-                                                g.state = GameState.ENTER_NAME
-                                            else:
-                                                g.state = GameState.GAME_OVER
-                                            g.start_game_over_hold()
-                            break
-            elif g.current_level <= 30:
-                for bat in g.bats[:]:
-                    distance_x = abs(bat.x - g.player.x)
-                    distance_y = abs(bat.y - g.player.y)
-                    if (
-                        distance_x < 40
-                        and distance_y < 50
-                        and bat.x < g.player.x
-                        and bat.id not in g.birds_dodged
-                    ):
-                        g.birds_dodged.add(bat.id)
-                        g.add_score(15)
-                    player_rect = g.player.get_airborne_collision_rect()
-                    if player_rect.colliderect(bat.rect):
-                        if hasattr(bat, "is_dead") and bat.is_dead:
-                            continue
-                        if g.player.is_invulnerable:
-                            import os as _os
-                            if _os.environ.get("DEBUG_SCORE"):
-                                print("invul_bat_collision")
+                    if not g.player.is_hit:
+                        if getattr(g, "shield_active", False):
+                            g.shield_active = False
+                            drop.die()
+                            g.sound_effects.play_sound_effect(
+                                "water-hit"
+                            )
+                        else:
+                            g.player.take_hit()
+                            g.sound_effects.play_sound_effect(
+                                "player-hit"
+                            )
+                            drop.die()
+                            g.lives -= 1
+                            if g.lives <= 0:
+                                if g.ranking_manager.is_high_score(
+                                    g.score
+                                ):
+                                    g.state = GameState.ENTER_NAME
+                                else:
+                                    g.state = GameState.GAME_OVER
+                                g.start_game_over_hold()
+                break
+
+    def _player_vs_bats(self):
+        """Colisão/esquiva com morcegos."""
+        g = self.game
+        for bat in live(g.bats):
+            distance_x = abs(bat.x - g.player.x)
+            distance_y = abs(bat.y - g.player.y)
+            if (
+                distance_x < 40
+                and distance_y < 50
+                and bat.x < g.player.x
+                and bat.id not in g.birds_dodged
+            ):
+                g.birds_dodged.add(bat.id)
+                g.add_score(15)
+            player_rect = g.player.get_airborne_collision_rect()
+            if collide_precise(g.player, bat, player_rect):
+                if hasattr(bat, "is_dead") and bat.is_dead:
+                    continue
+                if g.player.is_invulnerable:
+                    import os as _os
+                    if _os.environ.get("DEBUG_SCORE"):
+                        print("invul_bat_collision")
+                    g.explosions.append(
+                        Explosion(
+                            bat.x,
+                            bat.y,
+                            g.image.explosion_image,
+                        )
+                    )
+                    if hasattr(bat, "die"):
+                        bat.die()
+                    g.add_score(25)
+                else:
+                    if not g.player.is_hit:
+                        if getattr(g, "shield_active", False):
+                            g.shield_active = False
                             g.explosions.append(
                                 Explosion(
                                     bat.x,
@@ -2538,350 +2557,375 @@ class Update:
                             )
                             if hasattr(bat, "die"):
                                 bat.die()
-                            g.add_score(25)
                         else:
-                            if not g.player.is_hit:
-                                if getattr(g, "shield_active", False):
-                                    g.shield_active = False
-                                    g.explosions.append(
-                                        Explosion(
-                                            bat.x,
-                                            bat.y,
-                                            g.image.explosion_image,
-                                        )
-                                    )
-                                    if hasattr(bat, "die"):
-                                        bat.die()
-                                else:
-                                    g.player.take_hit()
-                                    g.sound_effects.play_sound_effect(
-                                        "player-hit"
-                                    )
-                                    g.explosions.append(
-                                        Explosion(
-                                            bat.x,
-                                            bat.y,
-                                            g.image.explosion_image,
-                                        )
-                                    )
-                                    if hasattr(bat, "die"):
-                                        bat.die()
-                                    g.lives -= 1
-                                    if g.lives <= 0:
-                                        if g.ranking_manager.is_high_score(
-                                            g.score
-                                        ):
-                                            g.state = GameState.ENTER_NAME
-                                        else:
-                                            g.state = GameState.GAME_OVER
-                                        g.start_game_over_hold()
-                        break
-                # Lava drops collision (27-30)
-                if 27 <= g.current_level <= 30:
-                    for drop in getattr(g, "lava_drops", [])[:]:
-                        if g.player.rect.colliderect(drop.rect):
-                            if g.player.is_invulnerable:
-                                continue
-                            if not g.player.is_hit:
-                                if getattr(g, "shield_active", False):
-                                    g.shield_active = False
-                                    g.player.take_hit()
-                                    sfx.play_sound_effect("player-hit")
+                            g.player.take_hit()
+                            g.sound_effects.play_sound_effect(
+                                "player-hit"
+                            )
+                            g.explosions.append(
+                                Explosion(
+                                    bat.x,
+                                    bat.y,
+                                    g.image.explosion_image,
+                                )
+                            )
+                            if hasattr(bat, "die"):
+                                bat.die()
+                            g.lives -= 1
+                            if g.lives <= 0:
+                                if g.ranking_manager.is_high_score(
+                                    g.score
+                                ):
+                                    g.state = GameState.ENTER_NAME
                                 else:
-                                    g.player.take_hit()
-                                    sfx.play_sound_effect("player-hit")
-                                    g.lives -= 1
-                                    if g.lives <= 0:
-                                        if g.ranking_manager.is_high_score(g.score):
-                                            g.state = GameState.ENTER_NAME
-                                        else:
-                                            g.state = GameState.GAME_OVER
-                                        g.start_game_over_hold()
-                # Shooting stars dodge/collision
-                for star in getattr(g, "shooting_stars", [])[:]:
-                    distance_x = abs(star.x - g.player.x)
-                    distance_y = abs(star.y - g.player.y)
-                    if (
-                        distance_x < 45
-                        and distance_y < 55
-                        and star.x < g.player.x
-                        and star.id not in g.birds_dodged
-                    ):
-                        g.birds_dodged.add(star.id)
-                        g.add_score(45)
-                    player_rect = g.player.get_airborne_collision_rect()
-                    if player_rect.colliderect(star.rect):
-                        if hasattr(star, "is_dead") and star.is_dead:
-                            continue
-                        if g.player.is_invulnerable:
+                                    g.state = GameState.GAME_OVER
+                                g.start_game_over_hold()
+                break
+
+    def _player_vs_lava_drops(self):
+        """Colisão com lava-drops."""
+        g = self.game
+        sfx = g.sound_effects
+        for drop in live(getattr(g, "lava_drops", [])):
+            if collide_precise(g.player, drop, g.player.rect):
+                if g.player.is_invulnerable:
+                    continue
+                if not g.player.is_hit:
+                    if getattr(g, "shield_active", False):
+                        g.shield_active = False
+                        g.player.take_hit()
+                        sfx.play_sound_effect("player-hit")
+                    else:
+                        g.player.take_hit()
+                        sfx.play_sound_effect("player-hit")
+                        g.lives -= 1
+                        if g.lives <= 0:
+                            if g.ranking_manager.is_high_score(g.score):
+                                g.state = GameState.ENTER_NAME
+                            else:
+                                g.state = GameState.GAME_OVER
+                            g.start_game_over_hold()
+
+    def _player_vs_shooting_stars(self):
+        """Colisão/esquiva com estrelas cadentes."""
+        g = self.game
+        sfx = g.sound_effects
+        exp_img = g.image.explosion_image
+        high_score = g.ranking_manager.is_high_score
+        for star in live(getattr(g, "shooting_stars", [])):
+            distance_x = abs(star.x - g.player.x)
+            distance_y = abs(star.y - g.player.y)
+            if (
+                distance_x < 45
+                and distance_y < 55
+                and star.x < g.player.x
+                and star.id not in g.birds_dodged
+            ):
+                g.birds_dodged.add(star.id)
+                g.add_score(45)
+            player_rect = g.player.get_airborne_collision_rect()
+            if collide_precise(g.player, star, player_rect):
+                if hasattr(star, "is_dead") and star.is_dead:
+                    continue
+                if g.player.is_invulnerable:
+                    explosion = g.get_pooled_explosion(
+                        star.x,
+                        star.y,
+                        exp_img,
+                    )
+                    g.explosions.append(explosion)
+                    g.kill_entity(star)
+                    g.add_score(75)
+                else:
+                    if not g.player.is_hit:
+                        if getattr(g, "shield_active", False):
+                            g.shield_active = False
                             explosion = g.get_pooled_explosion(
                                 star.x,
                                 star.y,
                                 exp_img,
                             )
                             g.explosions.append(explosion)
-                            if star in g.shooting_stars:
-                                g.shooting_stars.remove(star)
-                            g.add_score(75)
+                            g.kill_entity(star)
                         else:
-                            if not g.player.is_hit:
-                                if getattr(g, "shield_active", False):
-                                    g.shield_active = False
-                                    explosion = g.get_pooled_explosion(
-                                        star.x,
-                                        star.y,
-                                        exp_img,
-                                    )
-                                    g.explosions.append(explosion)
-                                    if star in g.shooting_stars:
-                                        g.shooting_stars.remove(star)
+                            g.player.take_hit()
+                            sfx.play_sound_effect("player-hit")
+                            explosion = g.get_pooled_explosion(
+                                star.x,
+                                star.y,
+                                exp_img,
+                            )
+                            g.explosions.append(explosion)
+                            g.kill_entity(star)
+                            g.lives -= 1
+                            if g.lives <= 0:
+                                if high_score(g.score):
+                                    g.state = GameState.ENTER_NAME
                                 else:
-                                    g.player.take_hit()
-                                    sfx.play_sound_effect("player-hit")
-                                    explosion = g.get_pooled_explosion(
-                                        star.x,
-                                        star.y,
-                                        exp_img,
-                                    )
-                                    g.explosions.append(explosion)
-                                    if star in g.shooting_stars:
-                                        g.shooting_stars.remove(star)
-                                    g.lives -= 1
-                                    if g.lives <= 0:
-                                        if high_score(g.score):
-                                            g.state = GameState.ENTER_NAME
-                                        else:
-                                            g.state = GameState.GAME_OVER
-                                        g.start_game_over_hold()
+                                    g.state = GameState.GAME_OVER
+                                g.start_game_over_hold()
+                break
+
+    def _player_vs_airplanes(self):
+        """Colisão/esquiva com aviões."""
+        g = self.game
+        exp_img = g.image.explosion_image
+        high_score = g.ranking_manager.is_high_score
+        for airplane in live(g.airplanes):
+            distance_x = abs(airplane.x - g.player.x)
+            distance_y = abs(airplane.y - g.player.y)
+            if (
+                distance_x < 50
+                and distance_y < 60
+                and airplane.x < g.player.x
+                and airplane.id not in g.birds_dodged
+            ):
+                g.birds_dodged.add(airplane.id)
+                g.add_score(20)
+            player_rect = g.player.get_airborne_collision_rect()
+            if collide_precise(g.player, airplane, player_rect):
+                if hasattr(airplane, "is_dead") and airplane.is_dead:
+                    continue
+                if g.player.is_invulnerable:
+                    g.explosions.append(
+                        Explosion(
+                            airplane.x,
+                            airplane.y,
+                            exp_img,
+                        )
+                    )
+                    g.kill_entity(airplane)
+                    g.add_score(30)
+                else:
+                    if not g.player.is_hit:
+                        if getattr(g, "shield_active", False):
+                            g.shield_active = False
+                            g.explosions.append(
+                                Explosion(
+                                    airplane.x,
+                                    airplane.y,
+                                    exp_img,
+                                )
+                            )
+                            g.kill_entity(airplane)
+                        else:
+                            g.player.take_hit()
+                            g.explosions.append(
+                                Explosion(
+                                    airplane.x,
+                                    airplane.y,
+                                    exp_img,
+                                )
+                            )
+                            g.kill_entity(airplane)
+                            g.lives -= 1
+                            if g.lives <= 0:
+                                if high_score(g.score):
+                                    g.state = GameState.ENTER_NAME
+                                else:
+                                    g.state = GameState.GAME_OVER
+                                g.start_game_over_hold()
+                break
+
+    def _update_lightning(self):
+        """Geradores e raios: ciclo de disparo e colisão."""
+        g = self.game
+        if (
+            not hasattr(g, 'generators')
+            or g.generators is None
+            or getattr(g, 'generators_level', None)
+            != g.current_level
+        ):
+            try:
+                # Criados pelo gerador estático; se não, inicializar agora a partir das plataformas
+                from internal.engine.level.generator.static import (
+                    StaticLevelGenerator,
+                )
+                platforms_rects = [
+                    (p.x, p.y, p.width, p.height)
+                    for p in g.platforms
+                ]
+                StaticLevelGenerator.drawGenerators(
+                    g,
+                    platforms_rects,
+                )
+                g.generators_level = g.current_level
+            except Exception:
+                g.generators = []
+                g.generators_level = g.current_level
+        # Atualizar geradores
+        for gen in getattr(g, 'generators', []):
+            try:
+                gen.update()
+            except Exception:
+                pass
+        # Controle de disparo dos raios
+        if not hasattr(g, 'lightning_timer'):
+            g.lightning_timer = 0
+            g.lightning_active = False
+            g.lightnings = []
+        g.lightning_timer = (g.lightning_timer + 1) % 240
+        activate_duration = 90
+        should_activate = g.lightning_timer < activate_duration
+        if should_activate and not g.lightning_active:
+            g.lightning_active = True
+            # Criar raios alinhados entre geradores
+            rows = {}
+            cols = {}
+            for gen in g.generators:
+                rows.setdefault(gen.y, []).append(gen)
+                cols.setdefault(gen.x, []).append(gen)
+            g.lightnings = []
+            h_img = getattr(g.image, 'lightning_h_img', None)
+            v_img = getattr(g.image, 'lightning_v_img', None)
+            # Conectar horizontalmente por linhas
+            for y, gens in rows.items():
+                gens_sorted = sorted(gens, key=lambda gg: gg.x)
+                for i in range(len(gens_sorted) - 1):
+                    a = gens_sorted[i]
+                    b = gens_sorted[i + 1]
+                    yb = (
+                        y
+                        + a.height // 2
+                        - (
+                            h_img.get_height() // 2 if h_img else 4
+                        )
+                    )
+                    start = (a.x + a.width, yb)
+                    end = (b.x, yb)
+                    lb = __import__(
+                        'internal.resources.lightning',
+                        fromlist=['LightningBeam'],
+                    ).LightningBeam(
+                        start,
+                        end,
+                        'h',
+                        h_img,
+                    )
+                    lb.build_segments(
+                        [p.rect for p in g.platforms]
+                    )
+                    g.lightnings.append(lb)
+            # Conectar verticalmente por colunas
+            for x, gens in cols.items():
+                gens_sorted = sorted(gens, key=lambda gg: gg.y)
+                for i in range(len(gens_sorted) - 1):
+                    a = gens_sorted[i]
+                    b = gens_sorted[i + 1]
+                    xb = (
+                        x
+                        + a.width // 2
+                        - (
+                            v_img.get_width() // 2 if v_img else 4
+                        )
+                    )
+                    start = (xb, a.y + a.height)
+                    end = (xb, b.y)
+                    lb = __import__(
+                        'internal.resources.lightning',
+                        fromlist=['LightningBeam'],
+                    ).LightningBeam(
+                        start,
+                        end,
+                        'v',
+                        v_img,
+                    )
+                    lb.build_segments(
+                        [p.rect for p in g.platforms]
+                    )
+                    g.lightnings.append(lb)
+            # Tocar som de choque
+            try:
+                g.sound_effects.play_sound_effect('shock')
+            except Exception:
+                pass
+        elif not should_activate and g.lightning_active:
+            g.lightning_active = False
+            g.lightnings = []
+        # Atualizar raios ativos
+        for beam in getattr(g, 'lightnings', []):
+            try:
+                beam.update()
+            except Exception:
+                pass
+        # Colisão com raios
+        if g.lightning_active:
+            player_rect = g.player.get_airborne_collision_rect()
+            for beam in g.lightnings:
+                # Colidir apenas com segmentos válidos, nunca sobre plataformas
+                hit = any(
+                    player_rect.colliderect(seg)
+                    for seg in getattr(beam, 'segments', [])
+                )
+                if hit:
+                    if g.player.is_invulnerable:
                         break
-            elif g.current_level <= 40:
-                for airplane in g.airplanes[:]:
-                    distance_x = abs(airplane.x - g.player.x)
-                    distance_y = abs(airplane.y - g.player.y)
-                    if (
-                        distance_x < 50
-                        and distance_y < 60
-                        and airplane.x < g.player.x
-                        and airplane.id not in g.birds_dodged
-                    ):
-                        g.birds_dodged.add(airplane.id)
-                        g.add_score(20)
-                    player_rect = g.player.get_airborne_collision_rect()
-                    if player_rect.colliderect(airplane.rect):
-                        if hasattr(airplane, "is_dead") and airplane.is_dead:
-                            continue
-                        if g.player.is_invulnerable:
+                    if not g.player.is_hit:
+                        if getattr(g, 'shield_active', False):
+                            g.shield_active = False
+                            g.player.take_hit()
+                            g.sound_effects.play_sound_effect(
+                                'player-hit'
+                            )
+                        else:
+                            g.player.take_hit()
+                            g.sound_effects.play_sound_effect(
+                                'player-hit'
+                            )
+                            g.lives -= 1
+                            if g.lives <= 0:
+                                if g.ranking_manager.is_high_score(
+                                    g.score
+                                ):
+                                    g.state = GameState.ENTER_NAME
+                                else:
+                                    g.state = GameState.GAME_OVER
+                                g.start_game_over_hold()
+                    break
+
+    def _player_vs_flying_disks(self):
+        """Colisão/esquiva com flying-disks."""
+        g = self.game
+        for disk in live(g.flying_disks):
+            distance_x = abs(disk.x - g.player.x)
+            distance_y = abs(disk.y - g.player.y)
+            if (
+                distance_x < 55
+                and distance_y < 65
+                and disk.x < g.player.x
+                and disk.id not in g.birds_dodged
+            ):
+                g.birds_dodged.add(disk.id)
+                g.add_score(25)
+            player_rect = g.player.get_airborne_collision_rect()
+            if collide_precise(g.player, disk, player_rect):
+                if hasattr(disk, "is_dead") and disk.is_dead:
+                    continue
+                if g.player.is_invulnerable:
+                    g.explosions.append(
+                        Explosion(
+                            disk.x,
+                            disk.y,
+                            g.image.explosion_image,
+                        )
+                    )
+                    g.kill_entity(disk)
+                    g.add_score(40)
+                else:
+                    if not g.player.is_hit:
+                        if getattr(g, "shield_active", False):
+                            g.shield_active = False
                             g.explosions.append(
                                 Explosion(
-                                    airplane.x,
-                                    airplane.y,
-                                    exp_img,
+                                    disk.x, disk.y, g.image.explosion_image
                                 )
                             )
-                            g.airplanes.remove(airplane)
-                            g.add_score(30)
+                            g.kill_entity(disk)
                         else:
-                            if not g.player.is_hit:
-                                if getattr(g, "shield_active", False):
-                                    g.shield_active = False
-                                    g.explosions.append(
-                                        Explosion(
-                                            airplane.x,
-                                            airplane.y,
-                                            exp_img,
-                                        )
-                                    )
-                                    if airplane in g.airplanes:
-                                        g.airplanes.remove(airplane)
-                                else:
-                                    g.player.take_hit()
-                                    g.explosions.append(
-                                        Explosion(
-                                            airplane.x,
-                                            airplane.y,
-                                            exp_img,
-                                        )
-                                    )
-                                    g.airplanes.remove(airplane)
-                                    g.lives -= 1
-                                    if g.lives <= 0:
-                                        if high_score(g.score):
-                                            g.state = GameState.ENTER_NAME
-                                        else:
-                                            g.state = GameState.GAME_OVER
-                                        g.start_game_over_hold()
-                        break
-                # Geradores e raios (37-40)
-                if 37 <= g.current_level <= 40:
-                    if (
-                        not hasattr(g, 'generators')
-                        or g.generators is None
-                        or getattr(g, 'generators_level', None)
-                        != g.current_level
-                    ):
-                        try:
-                            # Criados pelo gerador estático; se não, inicializar agora a partir das plataformas
-                            from internal.engine.level.generator.static import (
-                                StaticLevelGenerator,
-                            )
-                            platforms_rects = [
-                                (p.x, p.y, p.width, p.height)
-                                for p in g.platforms
-                            ]
-                            StaticLevelGenerator.drawGenerators(
-                                g,
-                                platforms_rects,
-                            )
-                            g.generators_level = g.current_level
-                        except Exception:
-                            g.generators = []
-                            g.generators_level = g.current_level
-                    # Atualizar geradores
-                    for gen in getattr(g, 'generators', []):
-                        try:
-                            gen.update()
-                        except Exception:
-                            pass
-                    # Controle de disparo dos raios
-                    if not hasattr(g, 'lightning_timer'):
-                        g.lightning_timer = 0
-                        g.lightning_active = False
-                        g.lightnings = []
-                    g.lightning_timer = (g.lightning_timer + 1) % 240
-                    activate_duration = 90
-                    should_activate = g.lightning_timer < activate_duration
-                    if should_activate and not g.lightning_active:
-                        g.lightning_active = True
-                        # Criar raios alinhados entre geradores
-                        rows = {}
-                        cols = {}
-                        for gen in g.generators:
-                            rows.setdefault(gen.y, []).append(gen)
-                            cols.setdefault(gen.x, []).append(gen)
-                        g.lightnings = []
-                        h_img = getattr(g.image, 'lightning_h_img', None)
-                        v_img = getattr(g.image, 'lightning_v_img', None)
-                        # Conectar horizontalmente por linhas
-                        for y, gens in rows.items():
-                            gens_sorted = sorted(gens, key=lambda gg: gg.x)
-                            for i in range(len(gens_sorted) - 1):
-                                a = gens_sorted[i]
-                                b = gens_sorted[i + 1]
-                                yb = (
-                                    y
-                                    + a.height // 2
-                                    - (
-                                        h_img.get_height() // 2 if h_img else 4
-                                    )
-                                )
-                                start = (a.x + a.width, yb)
-                                end = (b.x, yb)
-                                lb = __import__(
-                                    'internal.resources.lightning',
-                                    fromlist=['LightningBeam'],
-                                ).LightningBeam(
-                                    start,
-                                    end,
-                                    'h',
-                                    h_img,
-                                )
-                                lb.build_segments(
-                                    [p.rect for p in g.platforms]
-                                )
-                                g.lightnings.append(lb)
-                        # Conectar verticalmente por colunas
-                        for x, gens in cols.items():
-                            gens_sorted = sorted(gens, key=lambda gg: gg.y)
-                            for i in range(len(gens_sorted) - 1):
-                                a = gens_sorted[i]
-                                b = gens_sorted[i + 1]
-                                xb = (
-                                    x
-                                    + a.width // 2
-                                    - (
-                                        v_img.get_width() // 2 if v_img else 4
-                                    )
-                                )
-                                start = (xb, a.y + a.height)
-                                end = (xb, b.y)
-                                lb = __import__(
-                                    'internal.resources.lightning',
-                                    fromlist=['LightningBeam'],
-                                ).LightningBeam(
-                                    start,
-                                    end,
-                                    'v',
-                                    v_img,
-                                )
-                                lb.build_segments(
-                                    [p.rect for p in g.platforms]
-                                )
-                                g.lightnings.append(lb)
-                        # Tocar som de choque
-                        try:
-                            g.sound_effects.play_sound_effect('shock')
-                        except Exception:
-                            pass
-                    elif not should_activate and g.lightning_active:
-                        g.lightning_active = False
-                        g.lightnings = []
-                    # Atualizar raios ativos
-                    for beam in getattr(g, 'lightnings', []):
-                        try:
-                            beam.update()
-                        except Exception:
-                            pass
-                    # Colisão com raios
-                    if g.lightning_active:
-                        player_rect = g.player.get_airborne_collision_rect()
-                        for beam in g.lightnings:
-                            # Colidir apenas com segmentos válidos, nunca sobre plataformas
-                            hit = any(
-                                player_rect.colliderect(seg)
-                                for seg in getattr(beam, 'segments', [])
+                            g.player.take_hit()
+                            g.sound_effects.play_sound_effect(
+                                "player-hit"
                             )
-                            if hit:
-                                if g.player.is_invulnerable:
-                                    break
-                                if not g.player.is_hit:
-                                    if getattr(g, 'shield_active', False):
-                                        g.shield_active = False
-                                        g.player.take_hit()
-                                        g.sound_effects.play_sound_effect(
-                                            'player-hit'
-                                        )
-                                    else:
-                                        g.player.take_hit()
-                                        g.sound_effects.play_sound_effect(
-                                            'player-hit'
-                                        )
-                                        g.lives -= 1
-                                        if g.lives <= 0:
-                                            if g.ranking_manager.is_high_score(
-                                                g.score
-                                            ):
-                                                g.state = GameState.ENTER_NAME
-                                            else:
-                                                g.state = GameState.GAME_OVER
-                                            g.start_game_over_hold()
-                                break
-            else:
-                for disk in g.flying_disks[:]:
-                    distance_x = abs(disk.x - g.player.x)
-                    distance_y = abs(disk.y - g.player.y)
-                    if (
-                        distance_x < 55
-                        and distance_y < 65
-                        and disk.x < g.player.x
-                        and disk.id not in g.birds_dodged
-                    ):
-                        g.birds_dodged.add(disk.id)
-                        g.add_score(25)
-                    player_rect = g.player.get_airborne_collision_rect()
-                    if player_rect.colliderect(disk.rect):
-                        if hasattr(disk, "is_dead") and disk.is_dead:
-                            continue
-                        if g.player.is_invulnerable:
                             g.explosions.append(
                                 Explosion(
                                     disk.x,
@@ -2889,182 +2933,196 @@ class Update:
                                     g.image.explosion_image,
                                 )
                             )
-                            g.flying_disks.remove(disk)
-                            g.add_score(40)
-                        else:
-                            if not g.player.is_hit:
-                                if getattr(g, "shield_active", False):
-                                    g.shield_active = False
-                                    g.explosions.append(
-                                        Explosion(
-                                            disk.x, disk.y, g.image.explosion_image
-                                        )
-                                    )
-                                    if disk in g.flying_disks:
-                                        g.flying_disks.remove(disk)
+                            g.kill_entity(disk)
+                            g.lives -= 1
+                            if g.lives <= 0:
+                                if g.ranking_manager.is_high_score(
+                                    g.score
+                                ):
+                                    g.state = GameState.ENTER_NAME
                                 else:
-                                    g.player.take_hit()
-                                    g.sound_effects.play_sound_effect(
-                                        "player-hit"
-                                    )
-                                    g.explosions.append(
-                                        Explosion(
-                                            disk.x,
-                                            disk.y,
-                                            g.image.explosion_image,
-                                        )
-                                    )
-                                    g.flying_disks.remove(disk)
-                                    g.lives -= 1
-                                    if g.lives <= 0:
-                                        if g.ranking_manager.is_high_score(
-                                            g.score
-                                        ):
-                                            g.state = GameState.ENTER_NAME
-                                        else:
-                                            g.state = GameState.GAME_OVER
-                        break
+                                    g.state = GameState.GAME_OVER
+                break
 
-            # Colisão com foguinhos (51)
-            if g.current_level == 51:
-                for fire in g.fires[:]:
-                    if g.player.rect.colliderect(fire.rect):
-                        if (
-                            not g.player.is_invulnerable
-                            and not g.player.is_hit
-                        ):
-                            if getattr(g, "shield_active", False):
-                                g.shield_active = False
+    def _player_vs_fires(self):
+        """Colisão com foguinhos."""
+        g = self.game
+        for fire in live(g.fires):
+            if collide_precise(g.player, fire, g.player.rect):
+                if (
+                    not g.player.is_invulnerable
+                    and not g.player.is_hit
+                ):
+                    if getattr(g, "shield_active", False):
+                        g.shield_active = False
+                    else:
+                        g.player.take_hit()
+                        g.sound_effects.play_sound_effect("player-hit")
+                        g.lives -= 1
+                        if g.lives <= 0:
+                            if g.ranking_manager.is_high_score(
+                                g.score
+                            ):
+                                g.state = GameState.ENTER_NAME
                             else:
-                                g.player.take_hit()
-                                g.sound_effects.play_sound_effect("player-hit")
-                                g.lives -= 1
-                                if g.lives <= 0:
-                                    if g.ranking_manager.is_high_score(
-                                        g.score
-                                    ):
-                                        g.state = GameState.ENTER_NAME
-                                    else:
-                                        g.state = GameState.GAME_OVER
-                                    g.start_game_over_hold()
-                        break
+                                g.state = GameState.GAME_OVER
+                            g.start_game_over_hold()
+                break
 
-            # Meteoro (47-50): não é destruído por colisão com jogador
-            if 47 <= g.current_level <= 50:
-                for met in getattr(g, "meteors", [])[:]:
-                    player_rect = g.player.get_airborne_collision_rect()
-                    if player_rect.colliderect(met.rect):
-                        if getattr(met, "is_dead", False):
-                            continue
-                        if g.player.is_invulnerable:
-                            # Ignora meteoro; apenas tiro do jogador destrói
-                            pass
+    def _player_vs_meteors(self):
+        """Meteoro: não é destruído por colisão com o jogador."""
+        g = self.game
+        for met in live(getattr(g, "meteors", [])):
+            player_rect = g.player.get_airborne_collision_rect()
+            if collide_precise(g.player, met, player_rect):
+                if getattr(met, "is_dead", False):
+                    continue
+                if g.player.is_invulnerable:
+                    # Ignora meteoro; apenas tiro do jogador destrói
+                    pass
+                else:
+                    if not g.player.is_hit:
+                        if getattr(g, "shield_active", False):
+                            g.shield_active = False
+                            # Meteoro permanece
                         else:
-                            if not g.player.is_hit:
-                                if getattr(g, "shield_active", False):
-                                    g.shield_active = False
-                                    # Meteoro permanece
+                            g.player.take_hit()
+                            g.sound_effects.play_sound_effect(
+                                "player-hit"
+                            )
+                            g.lives -= 1
+                            if g.lives <= 0:
+                                if g.ranking_manager.is_high_score(
+                                    g.score
+                                ):
+                                    g.state = GameState.ENTER_NAME
                                 else:
-                                    g.player.take_hit()
-                                    g.sound_effects.play_sound_effect(
-                                        "player-hit"
-                                    )
-                                    g.lives -= 1
-                                    if g.lives <= 0:
-                                        if g.ranking_manager.is_high_score(
-                                            g.score
-                                        ):
-                                            g.state = GameState.ENTER_NAME
-                                        else:
-                                            g.state = GameState.GAME_OVER
-                                        g.start_game_over_hold()
-                        break
+                                    g.state = GameState.GAME_OVER
+                                g.start_game_over_hold()
+                break
 
-            # Colisão com tartarugas/aranhas
-            if g.current_level <= 20:
-                for turtle in g.turtles[:]:
-                    if g.player.rect.colliderect(turtle.rect):
-                        if hasattr(turtle, "is_dead") and turtle.is_dead:
-                            continue
-                        if g.player.is_invulnerable:
+    def _player_vs_turtles(self):
+        """Colisão com tartarugas."""
+        g = self.game
+        for turtle in live(g.turtles):
+            if g.player.rect.colliderect(turtle.rect):
+                if hasattr(turtle, "is_dead") and turtle.is_dead:
+                    continue
+                if g.player.is_invulnerable:
+                    if hasattr(turtle, "die"):
+                        turtle.die()
+                    g.sound_effects.play_sound_effect("bird-hit")
+                    g.add_score(20)
+                else:
+                    if not g.player.is_hit:
+                        if getattr(g, "shield_active", False):
+                            g.shield_active = False
                             if hasattr(turtle, "die"):
                                 turtle.die()
-                            g.sound_effects.play_sound_effect("bird-hit")
-                            g.add_score(20)
+                            g.sound_effects.play_sound_effect(
+                                "bird-hit"
+                            )
                         else:
-                            if not g.player.is_hit:
-                                if getattr(g, "shield_active", False):
-                                    g.shield_active = False
-                                    if hasattr(turtle, "die"):
-                                        turtle.die()
-                                    g.sound_effects.play_sound_effect(
-                                        "bird-hit"
-                                    )
+                            g.player.take_hit()
+                            g.sound_effects.play_sound_effect(
+                                "player-hit"
+                            )
+                            if hasattr(turtle, "die"):
+                                turtle.die()
+                            g.sound_effects.play_sound_effect(
+                                "bird-hit"
+                            )
+                            g.lives -= 1
+                            if g.lives <= 0:
+                                if g.ranking_manager.is_high_score(
+                                    g.score
+                                ):
+                                    g.state = GameState.ENTER_NAME
                                 else:
-                                    g.player.take_hit()
-                                    g.sound_effects.play_sound_effect(
-                                        "player-hit"
-                                    )
-                                    if hasattr(turtle, "die"):
-                                        turtle.die()
-                                    g.sound_effects.play_sound_effect(
-                                        "bird-hit"
-                                    )
-                                    g.lives -= 1
-                                    if g.lives <= 0:
-                                        if g.ranking_manager.is_high_score(
-                                            g.score
-                                        ):
-                                            g.state = GameState.ENTER_NAME
-                                        else:
-                                            g.state = GameState.GAME_OVER
-                                        g.start_game_over_hold()
-                        break
-            else:
-                for spider in g.spiders[:]:
-                    if g.player.rect.colliderect(spider.rect):
-                        if hasattr(spider, "is_dead") and spider.is_dead:
-                            continue
-                        if g.player.is_invulnerable:
+                                    g.state = GameState.GAME_OVER
+                                g.start_game_over_hold()
+                break
+
+    def _player_vs_spiders(self):
+        """Colisão com aranhas."""
+        g = self.game
+        for spider in live(g.spiders):
+            if g.player.rect.colliderect(spider.rect):
+                if hasattr(spider, "is_dead") and spider.is_dead:
+                    continue
+                if g.player.is_invulnerable:
+                    if hasattr(spider, "die"):
+                        spider.die()
+                    g.sound_effects.play_sound_effect("bird-hit")
+                    g.add_score(35)
+                else:
+                    if not g.player.is_hit:
+                        if getattr(g, "shield_active", False):
+                            g.shield_active = False
                             if hasattr(spider, "die"):
                                 spider.die()
-                            g.sound_effects.play_sound_effect("bird-hit")
-                            g.add_score(35)
+                            g.sound_effects.play_sound_effect(
+                                "bird-hit"
+                            )
                         else:
-                            if not g.player.is_hit:
-                                if getattr(g, "shield_active", False):
-                                    g.shield_active = False
-                                    if hasattr(spider, "die"):
-                                        spider.die()
-                                    g.sound_effects.play_sound_effect(
-                                        "bird-hit"
-                                    )
+                            g.player.take_hit()
+                            g.sound_effects.play_sound_effect(
+                                "player-hit"
+                            )
+                            if hasattr(spider, "die"):
+                                spider.die()
+                            g.sound_effects.play_sound_effect(
+                                "bird-hit"
+                            )
+                            g.lives -= 1
+                            if g.lives <= 0:
+                                if g.ranking_manager.is_high_score(
+                                    g.score
+                                ):
+                                    g.state = GameState.ENTER_NAME
                                 else:
-                                    g.player.take_hit()
-                                    g.sound_effects.play_sound_effect(
-                                        "player-hit"
-                                    )
-                                    if hasattr(spider, "die"):
-                                        spider.die()
-                                    g.sound_effects.play_sound_effect(
-                                        "bird-hit"
-                                    )
-                                    g.lives -= 1
-                                    if g.lives <= 0:
-                                        if g.ranking_manager.is_high_score(
-                                            g.score
-                                        ):
-                                            g.state = GameState.ENTER_NAME
-                                        else:
-                                            g.state = GameState.GAME_OVER
-                                        g.start_game_over_hold()
-                        break
+                                    g.state = GameState.GAME_OVER
+                                g.start_game_over_hold()
+                break
 
-            # Colisão com robôs (31-40)
-            if 31 <= g.current_level <= 40 and not g.player.is_being_abducted:
-                for robot in g.robots[:]:
-                    if g.player.rect.colliderect(robot.rect):
-                        if g.player.is_invulnerable:
+    def _player_vs_robots(self):
+        """Colisão com robôs."""
+        g = self.game
+        if g.player.is_being_abducted:
+            return
+        for robot in live(g.robots):
+            if g.player.rect.colliderect(robot.rect):
+                if g.player.is_invulnerable:
+                    explosion = g.get_pooled_explosion(
+                        robot.x,
+                        robot.y,
+                        g.image.explosion_image,
+                    )
+                    g.explosions.append(explosion)
+                    g.sound_effects.play_sound_effect(
+                        "explosion"
+                    )
+                    for missile in getattr(robot, "missiles", []):
+                        g.orphan_missiles.append(missile)
+                    g.kill_entity(robot)
+                    g.add_score(50)
+                else:
+                    if not g.player.is_hit:
+                        if getattr(g, "shield_active", False):
+                            g.shield_active = False
+                            explosion = g.get_pooled_explosion(
+                                robot.x, robot.y, g.image.explosion_image
+                            )
+                            g.explosions.append(explosion)
+                            g.sound_effects.play_sound_effect("explosion")
+                            for missile in getattr(robot, "missiles", []):
+                                g.orphan_missiles.append(missile)
+                            g.kill_entity(robot)
+                        else:
+                            g.player.take_hit()
+                            g.sound_effects.play_sound_effect(
+                                "player-hit"
+                            )
                             explosion = g.get_pooled_explosion(
                                 robot.x,
                                 robot.y,
@@ -3076,111 +3134,83 @@ class Update:
                             )
                             for missile in getattr(robot, "missiles", []):
                                 g.orphan_missiles.append(missile)
-                            if robot in g.robots:
-                                g.robots.remove(robot)
-                            g.add_score(50)
-                        else:
-                            if not g.player.is_hit:
-                                if getattr(g, "shield_active", False):
-                                    g.shield_active = False
-                                    explosion = g.get_pooled_explosion(
-                                        robot.x, robot.y, g.image.explosion_image
-                                    )
-                                    g.explosions.append(explosion)
-                                    g.sound_effects.play_sound_effect("explosion")
-                                    for missile in getattr(robot, "missiles", []):
-                                        g.orphan_missiles.append(missile)
-                                    if robot in g.robots:
-                                        g.robots.remove(robot)
+                            g.kill_entity(robot)
+                            g.lives -= 1
+                            if g.lives <= 0:
+                                if g.ranking_manager.is_high_score(
+                                    g.score
+                                ):
+                                    g.state = GameState.ENTER_NAME
                                 else:
-                                    g.player.take_hit()
-                                    g.sound_effects.play_sound_effect(
-                                        "player-hit"
-                                    )
-                                    explosion = g.get_pooled_explosion(
-                                        robot.x,
-                                        robot.y,
-                                        g.image.explosion_image,
-                                    )
-                                    g.explosions.append(explosion)
-                                    g.sound_effects.play_sound_effect(
-                                        "explosion"
-                                    )
-                                    for missile in getattr(robot, "missiles", []):
-                                        g.orphan_missiles.append(missile)
-                                    if robot in g.robots:
-                                        g.robots.remove(robot)
-                                    g.lives -= 1
-                                    if g.lives <= 0:
-                                        if g.ranking_manager.is_high_score(
-                                            g.score
-                                        ):
-                                            g.state = GameState.ENTER_NAME
-                                        else:
-                                            g.state = GameState.GAME_OVER
-                                        g.start_game_over_hold()
-                        break
+                                    g.state = GameState.GAME_OVER
+                                g.start_game_over_hold()
+                break
 
-            # Colisão com aliens (41-50)
-            if 41 <= g.current_level <= 50 and not g.player.is_being_abducted:
-                for alien in g.aliens[:]:
-                    if g.player.rect.colliderect(alien.rect):
-                        if hasattr(alien, "is_dead") and alien.is_dead:
-                            continue
-                        if g.player.is_invulnerable:
+    def _player_vs_aliens(self):
+        """Colisão com aliens."""
+        g = self.game
+        if g.player.is_being_abducted:
+            return
+        for alien in live(g.aliens):
+            if g.player.rect.colliderect(alien.rect):
+                if hasattr(alien, "is_dead") and alien.is_dead:
+                    continue
+                if g.player.is_invulnerable:
+                    if hasattr(alien, "die"):
+                        alien.die()
+                        g.sound_effects.play_sound_effect("bird-hit")
+                    for laser in alien.lasers:
+                        g.orphan_lasers.append(laser)
+                    g.add_score(60)
+                else:
+                    if not g.player.is_hit:
+                        if getattr(g, "shield_active", False):
+                            g.shield_active = False
                             if hasattr(alien, "die"):
                                 alien.die()
-                                g.sound_effects.play_sound_effect("bird-hit")
-                            for laser in alien.lasers:
+                                g.sound_effects.play_sound_effect(
+                                    "bird-hit"
+                                )
+                            for laser in getattr(alien, "lasers", []):
                                 g.orphan_lasers.append(laser)
-                            g.add_score(60)
                         else:
-                            if not g.player.is_hit:
-                                if getattr(g, "shield_active", False):
-                                    g.shield_active = False
-                                    if hasattr(alien, "die"):
-                                        alien.die()
-                                        g.sound_effects.play_sound_effect(
-                                            "bird-hit"
-                                        )
-                                    for laser in getattr(alien, "lasers", []):
-                                        g.orphan_lasers.append(laser)
-                                else:
-                                    g.player.take_hit()
-                                    g.sound_effects.play_sound_effect(
-                                        "player-hit"
-                                    )
-                                    if hasattr(alien, "die"):
-                                        alien.die()
-                                        g.sound_effects.play_sound_effect(
-                                            "bird-hit"
-                                        )
-                                for laser in alien.lasers:
-                                    g.orphan_lasers.append(laser)
-                                g.lives -= 1
-                                if g.lives <= 0:
-                                    if g.ranking_manager.is_high_score(
-                                        g.score
-                                    ):
-                                        g.state = GameState.ENTER_NAME
-                                    else:
-                                        g.state = GameState.GAME_OVER
-                        break
+                            g.player.take_hit()
+                            g.sound_effects.play_sound_effect(
+                                "player-hit"
+                            )
+                            if hasattr(alien, "die"):
+                                alien.die()
+                                g.sound_effects.play_sound_effect(
+                                    "bird-hit"
+                                )
+                        for laser in alien.lasers:
+                            g.orphan_lasers.append(laser)
+                        g.lives -= 1
+                        if g.lives <= 0:
+                            if g.ranking_manager.is_high_score(
+                                g.score
+                            ):
+                                g.state = GameState.ENTER_NAME
+                            else:
+                                g.state = GameState.GAME_OVER
+                break
 
-            # Verificar bandeira
-            if g.flag and g.player.rect.colliderect(g.flag.rect):
+    def _check_level_exit(self):
+        """Verificar bandeira e abdução (fase 50)."""
+        g = self.game
+        if g.flag and g.player.rect.colliderect(g.flag.rect):
+            if not getattr(g, "hold_active", False):
+                g.start_level_end_hold(g.current_level >= g.max_levels)
+                g._next_level_after_hold = True
+
+        # Verificar abdução (fase 50)
+        if (
+            g.spaceship
+            and g.player.rect.colliderect(g.spaceship.abduction_rect)
+        ):
+            if not g.player.is_being_abducted:
+                g.player.start_abduction()
+            if g.player.abduction_timer >= 600:
                 if not getattr(g, "hold_active", False):
                     g.start_level_end_hold(g.current_level >= g.max_levels)
                     g._next_level_after_hold = True
-
-            # Verificar abdução (fase 50)
-            if (
-                g.spaceship
-                and g.player.rect.colliderect(g.spaceship.abduction_rect)
-            ):
-                if not g.player.is_being_abducted:
-                    g.player.start_abduction()
-                if g.player.abduction_timer >= 600:
-                    if not getattr(g, "hold_active", False):
-                        g.start_level_end_hold(g.current_level >= g.max_levels)
-                        g._next_level_after_hold = True
@@ -0,0 +1,126 @@
+import gc
+import time
+
+
+class GCPolicy:
+    """Controle do coletor de lixo entre gameplay e transições.
+
+    - ``start``: coleta e congela (``gc.freeze``) tudo o que foi carregado
+      até o início do loop (imagens, sons, fontes), tirando esses objetos
+      das varreduras futuras.
+    - Durante ``PLAYING`` o limiar da geração 2 é elevado, adiando coletas
+      completas; gerações 0 e 1 continuam automáticas.
+    - ``collect`` faz a coleta completa em momentos sem ação: holds, troca
+      de fase e entrada em menus.
+
+    Pausas do coletor são medidas por ``gc.callbacks`` e entregues por
+    quadro em ``take_frame_pause`` para a telemetria. Enquanto ``start``
+    não é chamado (testes, ferramentas) a política não altera o ``gc``.
+    """
+
+    _instance = None
+    GAMEPLAY_GEN2_THRESHOLD = 1000
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(GCPolicy, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
+        self.active = False
+        self.gameplay = False
+        self._base_threshold = gc.get_threshold()
+        self._pause_start = None
+        self._frame_pause_ms = 0.0
+        self.pauses = 0
+        self.total_pause_ms = 0.0
+        self.max_pause_ms = 0.0
+        self.explicit_collections = 0
+        self.last_reason = None
+
+    def start(self):
+        """Chamado após o carregamento dos recursos, antes do loop do jogo."""
+        if self.active:
+            return
+        self.active = True
+        self._base_threshold = gc.get_threshold()
+        if self._on_gc not in gc.callbacks:
+            gc.callbacks.append(self._on_gc)
+        self.collect("assets")
+        try:
+            gc.freeze()
+        except AttributeError:
+            pass
+
+    def stop(self):
+        """Restaura o ``gc`` ao estado padrão (encerramento)."""
+        if not self.active:
+            return
+        self._leave_gameplay()
+        try:
+            gc.callbacks.remove(self._on_gc)
+        except ValueError:
+            pass
+        try:
+            gc.unfreeze()
+        except AttributeError:
+            pass
+        self.active = False
+
+    def on_state(self, state):
+        """Ajusta o modo conforme o estado atual do jogo (uma vez por quadro)."""
+        if not self.active:
+            return
+        playing = getattr(state, "name", state) == "PLAYING"
+        if playing and not self.gameplay:
+            t0, t1, _ = self._base_threshold
+            gc.set_threshold(t0, t1, self.GAMEPLAY_GEN2_THRESHOLD)
+            self.gameplay = True
+        elif not playing and self.gameplay:
+            self._leave_gameplay()
+            self.collect("menu")
+
+    def _leave_gameplay(self):
+        if self.gameplay:
+            gc.set_threshold(*self._base_threshold)
+            self.gameplay = False
+
+    def collect(self, reason):
+        """Coleta completa explícita em um momento sem ação."""
+        if not self.active:
+            return 0
+        self.last_reason = reason
+        self.explicit_collections += 1
+        return gc.collect()
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._pause_start = time.perf_counter()
+        elif self._pause_start is not None:
+            ms = (time.perf_counter() - self._pause_start) * 1000.0
+            self._pause_start = None
+            self.pauses += 1
+            self.total_pause_ms += ms
+            self._frame_pause_ms += ms
+            if ms > self.max_pause_ms:
+                self.max_pause_ms = ms
+
+    def take_frame_pause(self):
+        """Tempo (ms) gasto em coletas desde a última chamada."""
+        ms = self._frame_pause_ms
+        self._frame_pause_ms = 0.0
+        return ms
+
+    def get_stats(self):
+        return {
+            "active": self.active,
+            "gameplay": self.gameplay,
+            "pauses": self.pauses,
+            "total_pause_ms": self.total_pause_ms,
+            "max_pause_ms": self.max_pause_ms,
+            "explicit_collections": self.explicit_collections,
+        }
@@ -0,0 +1,163 @@
+import pygame
+
+
+# Sentinela: amostrar o joystick do próprio jogo (se conectado)
+_GAME_JOYSTICK = object()
+
+
+class InputState:
+    """Snapshot da entrada do quadro: ações resolvidas, bordas e eixos.
+
+    Os mapeamentos de ``game.controls``/``game.joystick_controls`` são
+    compilados em tuplas de teclas e índices de botão apenas quando mudam
+    (novo dicionário ou ``invalidate_bindings`` após editar em
+    OPTIONS_CONTROLS). No loop do jogo ``begin_frame`` marca o snapshot
+    como vencido e a primeira leitura após os eventos o amostra; fora do
+    loop (testes, ferramentas) toda leitura amostra de novo.
+    """
+
+    ACTIONS = ("left", "right", "crouch", "jump", "shoot")
+    DEFAULT_KEY_NAMES = {
+        "left": ("K_LEFT", "K_a"),
+        "right": ("K_RIGHT", "K_d"),
+        "crouch": ("K_DOWN", "K_s"),
+        "jump": ("K_UP", "K_w"),
+        "shoot": ("K_SPACE",),
+    }
+    DEFAULT_BUTTONS = {"jump": 0, "shoot": 1}
+    DEADZONE = 0.1
+
+    def __init__(self, pg=None):
+        # Módulo pygame usado para teclas (permite injetar um substituto)
+        self._pg = pg if pg is not None else pygame
+        self.down = dict.fromkeys(self.ACTIONS, False)
+        self.pressed = dict.fromkeys(self.ACTIONS, False)
+        self.released = dict.fromkeys(self.ACTIONS, False)
+        self.axis_x = 0.0
+        self.axis_y = 0.0
+        self.dpad_x = 0.0
+        self.dpad_y = 0.0
+        self.samples = 0
+        self._frame_driven = False
+        self._fresh = False
+        self._bindings_source = None
+        self._key_bindings = {}
+        self._button_bindings = {}
+
+    def invalidate_bindings(self):
+        """Forçar recompilação (controles alterados no lugar)."""
+        self._bindings_source = None
+
+    def _compile_bindings(self, game):
+        controls = getattr(game, "controls", None) if game else None
+        joystick_controls = getattr(game, "joystick_controls", None) if game else None
+        source = (id(controls), id(joystick_controls))
+        if source == self._bindings_source:
+            return
+        getter = getattr(controls, "get", None)
+        key_bindings = {}
+        for action, names in self.DEFAULT_KEY_NAMES.items():
+            keys = getter(action) if getter else None
+            if not keys:
+                keys = [getattr(self._pg, name) for name in names if hasattr(self._pg, name)]
+            key_bindings[action] = tuple(keys)
+        button_bindings = {}
+        for action, default in self.DEFAULT_BUTTONS.items():
+            try:
+                button_bindings[action] = int(joystick_controls.get(action, default))
+            except Exception:
+                button_bindings[action] = default
+        self._key_bindings = key_bindings
+        self._button_bindings = button_bindings
+        self._bindings_source = source
+
+    @staticmethod
+    def _any_down(keys, codes):
+        try:
+            return any(keys[k] for k in codes)
+        except Exception:
+            return False
+
+    def sample(self, game=None, joystick=_GAME_JOYSTICK):
+        """Lê teclado e joystick agora e atualiza ações e bordas."""
+        self._compile_bindings(game)
+        if joystick is _GAME_JOYSTICK:
+            joystick = None
+            if game is not None and getattr(game, "joystick_connected", False):
+                joystick = getattr(game, "joystick", None)
+
+        axis_x = axis_y = dpad_x = dpad_y = 0.0
+        num_buttons = 0
+        if joystick:
+            try:
+                num_axes = joystick.get_numaxes()
+                if num_axes >= 1:
+                    axis_x = joystick.get_axis(0)
+                    if abs(axis_x) < self.DEADZONE:
+                        axis_x = 0
+                if num_axes >= 2:
+                    axis_y = joystick.get_axis(1)
+                    if abs(axis_y) < self.DEADZONE:
+                        axis_y = 0
+                if num_axes > 6:
+                    dpad_x = joystick.get_axis(6)
+                if num_axes > 7:
+                    dpad_y = joystick.get_axis(7)
+            except Exception:
+                pass
+            try:
+                num_buttons = joystick.get_numbuttons()
+            except Exception:
+                num_buttons = 0
+
+        keys = self._pg.key.get_pressed()
+        down = {
+            action: self._any_down(keys, codes)
+            for action, codes in self._key_bindings.items()
+        }
+        # Analógico: horizontal move, para baixo agacha, para cima pula
+        down["left"] = down["left"] or axis_x < -self.DEADZONE
+        down["right"] = down["right"] or axis_x > self.DEADZONE
+        down["crouch"] = down["crouch"] or axis_y > 0.5
+        down["jump"] = down["jump"] or axis_y < -0.5
+        for action, index in self._button_bindings.items():
+            if not down[action] and 0 <= index < num_buttons:
+                try:
+                    down[action] = bool(joystick.get_button(index))
+                except Exception:
+                    pass
+
+        previous = self.down
+        self.pressed = {a: down[a] and not previous.get(a, False) for a in down}
+        self.released = {a: previous.get(a, False) and not down[a] for a in down}
+        self.down = down
+        self.axis_x = axis_x
+        self.axis_y = axis_y
+        self.dpad_x = dpad_x
+        self.dpad_y = dpad_y
+        self.samples += 1
+        return self
+
+    def begin_frame(self):
+        """Novo quadro do loop: a próxima leitura amostra a entrada."""
+        self._frame_driven = True
+        self._fresh = False
+
+    def current(self, game=None):
+        """Snapshot do quadro atual (amostrado na primeira leitura)."""
+        if not self._fresh:
+            self.sample(game)
+            self._fresh = self._frame_driven
+        return self
+
+
+def input_for(game):
+    """Snapshot de entrada do jogo, criando o ``InputState`` se faltar."""
+    state = getattr(game, "input_state", None)
+    if state is None:
+        state = InputState()
+        try:
+            game.input_state = state
+        except Exception:
+            pass
+    return state.current(game)
@@ -0,0 +1,206 @@
+import gc
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+from internal.engine.difficulty import Difficulty
+from internal.engine.level.level import Level
+from internal.engine.state import GameState
+from internal.resources.cache import ResourceCache
+
+
+def _peak_rss_kib():
+    """Pico de memória residente do processo (KiB); 0 se indisponível."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux informa KiB; macOS informa bytes
+        return peak // 1024 if sys.platform == "darwin" else peak
+    except Exception:
+        return 0
+
+
+class LevelBenchmark:
+    """Mede ``Level.init_level`` e os primeiros quadros de cada fase.
+
+    Para cada par (fase, dificuldade) registra a mediana de ``repeats``
+    medidas de:
+
+    - ``init_ms``: tempo de parede do ``init_level``;
+    - ``frame_ms``: média de ``update`` + ``draw`` nos ``frames`` quadros;
+    - ``blocks``: blocos alocados pelo Python que sobram após o
+      ``init_level`` (``sys.getallocatedblocks``, sem o custo do
+      ``tracemalloc``).
+
+    Cada medida começa a frio (imagens e sons do mundo e fundo fora do
+    cache) e com ``random`` semeado pela chave da fase: spawns, perigos e
+    raios dos quadros medidos são os mesmos em toda execução. A memória
+    residente por fase depende de quando o alocador cresce o heap, então
+    só o pico da execução inteira é registrado (``peak_rss_kib``), como
+    informação, sem reprovar a execução. ``compare`` aponta as fases que
+    passaram do limite em relação à linha de base salva no repositório.
+    """
+
+    # Limites de regressão: razão sobre a linha de base mais folga absoluta
+    # (medidas pequenas variam muito entre execuções)
+    THRESHOLDS = {
+        "init_ms": (1.5, 5.0),
+        "frame_ms": (1.5, 2.0),
+        "blocks": (1.25, 5000),
+    }
+    DEFAULT_BASELINE = os.path.join("benchmarks", "level_load_baseline.json")
+
+    def __init__(self, game, frames=30, repeats=3):
+        self.game = game
+        self.frames = frames
+        self.repeats = max(1, repeats)
+        self.peak_rss_kib = 0
+
+    @staticmethod
+    def key(level, difficulty):
+        return f"{level}/{difficulty.name}"
+
+    def measure(self, level, difficulty=Difficulty.NORMAL):
+        """Mediana de ``repeats`` medidas de ``level`` em ``difficulty``."""
+        return self._median([self._measure_once(level, difficulty) for _ in range(self.repeats)])
+
+    @staticmethod
+    def _median(samples):
+        return {
+            metric: statistics.median(sample[metric] for sample in samples)
+            for metric in samples[0]
+        }
+
+    def _measure_once(self, level, difficulty):
+        """Carrega ``level`` em ``difficulty`` e roda os primeiros quadros."""
+        g = self.game
+        g.difficulty = difficulty
+        g.current_level = level
+        self._evict_level_assets(level)
+        # Mesma sequência aleatória em toda execução da mesma fase
+        random.seed(self.key(level, difficulty))
+        # Coletor cíclico pausado durante a medida, como no timeit: uma
+        # coleta caindo numa fase qualquer não entra no tempo dela
+        gc.collect()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            blocks_before = sys.getallocatedblocks()
+            start = time.perf_counter()
+            Level.init_level(g)
+            init_ms = (time.perf_counter() - start) * 1000.0
+            blocks = sys.getallocatedblocks() - blocks_before
+
+            # Quadros estáveis: sem game over nem hold interrompendo a medida
+            g.lives = max(getattr(g, "lives", 0), 99)
+            start = time.perf_counter()
+            for _ in range(self.frames):
+                g.state = GameState.PLAYING
+                g.update()
+                g.draw()
+            frames_ms = (time.perf_counter() - start) * 1000.0
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return {
+            "init_ms": round(init_ms, 2),
+            "frame_ms": round(frames_ms / max(1, self.frames), 3),
+            "blocks": blocks,
+        }
+
+    def _evict_level_assets(self, level):
+        """Tira do cache as imagens e sons que o ``init_level`` de ``level`` carrega."""
+        g = self.game
+        try:
+            g.image.unload_world()
+        except Exception:
+            pass
+        try:
+            g.sound_effects.unload_world()
+        except Exception:
+            pass
+        try:
+            ResourceCache().release_images([Level.get_background_for_level(g, level)])
+        except Exception:
+            pass
+
+    def run(self, levels, difficulties=tuple(Difficulty), log=None):
+        """Mede todas as combinações; retorna ``{"fase/DIFICULDADE": medidas}``.
+
+        As repetições são rodadas completas sobre todas as combinações, não
+        medidas seguidas da mesma fase: uma lentidão passageira da máquina
+        atinge uma amostra de várias fases, e a mediana a descarta.
+        """
+        samples = {}
+        # Aquecimento descartado: fontes, caches de texto e buffers do
+        # primeiro quadro não entram na conta da primeira fase medida
+        if levels and difficulties:
+            self._measure_once(levels[0], difficulties[0])
+        for round_no in range(1, self.repeats + 1):
+            if log is not None and self.repeats > 1:
+                log(f"Rodada {round_no}/{self.repeats}")
+            for difficulty in difficulties:
+                for level in levels:
+                    samples.setdefault(self.key(level, difficulty), []).append(
+                        self._measure_once(level, difficulty)
+                    )
+        results = {key: self._median(runs) for key, runs in samples.items()}
+        if log is not None:
+            for key, sample in results.items():
+                level, difficulty = key.split("/")
+                log(
+                    f"Fase {int(level):2d} {difficulty:<6} "
+                    f"init={sample['init_ms']:.1f} ms "
+                    f"quadro={sample['frame_ms']:.2f} ms "
+                    f"blocos={sample['blocks']}"
+                )
+        self.peak_rss_kib = _peak_rss_kib()
+        return results
+
+    @classmethod
+    def compare(cls, results, baseline, thresholds=None):
+        """Lista de regressões ``(chave, métrica, base, atual)``.
+
+        Uma métrica regride quando passa de ``base * razão + folga``.
+        Combinações ausentes da linha de base são ignoradas.
+        """
+        thresholds = thresholds or cls.THRESHOLDS
+        regressions = []
+        for key, sample in results.items():
+            base = baseline.get(key)
+            if not base:
+                continue
+            for metric, (ratio, slack) in thresholds.items():
+                if metric not in sample or metric not in base:
+                    continue
+                if sample[metric] > base[metric] * ratio + slack:
+                    regressions.append((key, metric, base[metric], sample[metric]))
+        return regressions
+
+    @staticmethod
+    def load_baseline(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data.get("levels", {}) if isinstance(data, dict) else {}
+
+    @staticmethod
+    def save_baseline(path, results, frames, repeats=1, peak_rss_kib=0):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {
+            "frames": frames,
+            "repeats": repeats,
+            "python": sys.version.split()[0],
+            "peak_rss_kib": peak_rss_kib,
+            "levels": results,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.write("\n")
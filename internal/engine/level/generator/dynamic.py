@@ -10,7 +10,50 @@ from internal.utils.constants import *
 
 
 class DynamicLevelGenerator:
-    """Gerador procedural de níveis para criar fases variadas e interessantes"""
+    """Gerador procedural de níveis para criar fases variadas e interessantes
+
+    Layouts são gerados com um ``random.Random`` próprio semeado por
+    (tipo, nível, dificuldade, semente): o mesmo nível sai idêntico em
+    toda chamada. Layouts gerados ficam memorizados em memória durante a
+    sessão.
+    """
+
+    DEFAULT_SEED = 0
+    # Limite de layouts em memória (sai o usado há mais tempo)
+    MAX_CACHED_LAYOUTS = 256
+    _layouts = {}
+
+    @staticmethod
+    def layout_key(kind, level, difficulty=None, seed=None):
+        if seed is None:
+            seed = DynamicLevelGenerator.DEFAULT_SEED
+        diff = getattr(difficulty, "name", difficulty)
+        return f"{kind}:{level}:{diff}:{seed}"
+
+    @classmethod
+    def _trim_layouts(cls):
+        """Mantém no máximo ``MAX_CACHED_LAYOUTS`` (sai o usado há mais tempo)."""
+        excess = len(cls._layouts) - cls.MAX_CACHED_LAYOUTS
+        for key in list(cls._layouts)[:max(0, excess)]:
+            del cls._layouts[key]
+
+    @classmethod
+    def get_layout(cls, kind, level, difficulty, seed, build):
+        """Layout memorizado para a chave; gera com ``build(rng)`` se faltar."""
+        key = cls.layout_key(kind, level, difficulty, seed)
+        layout = cls._layouts.pop(key, None)
+        if layout is None:
+            layout = [tuple(row) for row in build(random.Random(key))]
+            cls._layouts[key] = layout
+            cls._trim_layouts()
+        else:
+            # Reinsere no fim: a ordem do dicionário é a de uso
+            cls._layouts[key] = layout
+        return list(layout)
+
+    @classmethod
+    def clear_layout_cache(cls):
+        cls._layouts = {}
 
     @staticmethod
     def get_platforms_stairway(
@@ -33,73 +76,77 @@ class DynamicLevelGenerator:
 
     @staticmethod
     def generate_staircase_pattern(
-        start_x, start_y, num_platforms, direction=1, step_size=160, height_variation=80
+        start_x, start_y, num_platforms, direction=1, step_size=160, height_variation=80, rng=None
     ):
         """Gera padrão de escada com variações - mais desafiador"""
+        rng = rng or random
         platforms = []
         x_pos = start_x
         y_pos = start_y
 
         for i in range(num_platforms):
             # Adicionar variação aleatória na altura (maior)
-            height_offset = random.randint(
+            height_offset = rng.randint(
                 -height_variation // 2, height_variation // 2
             )
             platforms.append(
-                (x_pos, y_pos + height_offset, random.randint(80, 120), 20)
+                (x_pos, y_pos + height_offset, rng.randint(80, 120), 20)
             )
 
             # Próxima posição - mais espaçada
-            x_pos += step_size + random.randint(-40, 60)
-            y_pos += direction * random.randint(40, 80)
+            x_pos += step_size + rng.randint(-40, 60)
+            y_pos += direction * rng.randint(40, 80)
 
             # Inverter direção ocasionalmente
-            if random.random() < 0.3:
+            if rng.random() < 0.3:
                 direction *= -1
 
         return platforms
 
     @staticmethod
     def generate_wave_pattern(
-        start_x, start_y, num_platforms, amplitude=120, frequency=0.25
+        start_x, start_y, num_platforms, amplitude=120, frequency=0.25, rng=None
     ):
         """Gera padrão ondulado - mais desafiador"""
+        rng = rng or random
         platforms = []
         x_pos = start_x
 
         for i in range(num_platforms):
             # Calcular altura baseada em função seno (amplitude maior)
             wave_y = start_y + amplitude * math.sin(i * frequency)
-            platforms.append((x_pos, wave_y, random.randint(80, 120), 20))
-            x_pos += random.randint(140, 200)  # Mais espaçadas
+            platforms.append((x_pos, wave_y, rng.randint(80, 120), 20))
+            x_pos += rng.randint(140, 200)  # Mais espaçadas
 
         return platforms
 
     @staticmethod
-    def generate_zigzag_pattern(start_x, start_y, num_platforms, segment_length=4):
+    def generate_zigzag_pattern(start_x, start_y, num_platforms, segment_length=4, rng=None):
         """Gera padrão em zigue-zague - mais desafiador"""
+        rng = rng or random
         platforms = []
         x_pos = start_x
         y_pos = start_y
         going_up = True
 
         for i in range(num_platforms):
-            platforms.append((x_pos, y_pos, random.randint(80, 120), 20))
+            platforms.append((x_pos, y_pos, rng.randint(80, 120), 20))
 
             # Mudar direção a cada segment_length plataformas
             if i % segment_length == segment_length - 1:
                 going_up = not going_up
 
-            x_pos += random.randint(150, 220)  # Mais espaçadas
-            y_pos += (-70 if going_up else 70) + random.randint(
+            x_pos += rng.randint(150, 220)  # Mais espaçadas
+            y_pos += (-70 if going_up else 70) + rng.randint(
                 -25, 25
             )  # Maior variação vertical
 
         return platforms
 
     @staticmethod
-    def generate_spiral_pattern(start_x, start_y, num_platforms, radius=200):
+    def generate_spiral_pattern(start_x, start_y, num_platforms, radius=200, rng=None):
         """Gera padrão em espiral - mais desafiador"""
+        rng = rng or random
         platforms = []
         center_x = start_x + radius
         center_y = start_y
@@ -113,30 +160,31 @@ class DynamicLevelGenerator:
             x = center_x + current_radius * math.cos(angle)
             y = center_y + current_radius * math.sin(angle)
 
-            platforms.append((x, y, random.randint(70, 100), 20))  # Plataformas maiores
+            platforms.append((x, y, rng.randint(70, 100), 20))  # Plataformas maiores
 
         return platforms
 
     @staticmethod
-    def generate_random_clusters(start_x, start_y, num_platforms, num_clusters=3):
+    def generate_random_clusters(start_x, start_y, num_platforms, num_clusters=3, rng=None):
         """Gera grupos aleatórios de plataformas - mais desafiador"""
+        rng = rng or random
         platforms = []
         cluster_size = num_platforms // num_clusters
 
         for cluster in range(num_clusters):
             # Centro do cluster - mais espaçados
-            cluster_x = start_x + cluster * 450 + random.randint(-80, 80)
-            cluster_y = start_y + random.randint(-150, 150)
+            cluster_x = start_x + cluster * 450 + rng.randint(-80, 80)
+            cluster_y = start_y + rng.randint(-150, 150)
 
             # Gerar plataformas no cluster - mais espalhadas
             for i in range(cluster_size):
-                offset_x = random.randint(-120, 120)
-                offset_y = random.randint(-100, 100)
+                offset_x = rng.randint(-120, 120)
+                offset_y = rng.randint(-100, 100)
                 platforms.append(
                     (
                         cluster_x + offset_x,
                         cluster_y + offset_y,
-                        random.randint(80, 120),
+                        rng.randint(80, 120),
                         20,
                     )
                 )
@@ -144,15 +192,16 @@ class DynamicLevelGenerator:
         # Adicionar plataformas restantes - mais espaçadas
         remaining = num_platforms - len(platforms)
         for i in range(remaining):
-            x = start_x + len(platforms) * 180 + random.randint(-50, 50)
-            y = start_y + random.randint(-80, 80)
-            platforms.append((x, y, random.randint(80, 120), 20))
+            x = start_x + len(platforms) * 180 + rng.randint(-50, 50)
+            y = start_y + rng.randint(-80, 80)
+            platforms.append((x, y, rng.randint(80, 120), 20))
 
         return platforms
 
     @staticmethod
-    def generate_maze_pattern(start_x, start_y, num_platforms):
+    def generate_maze_pattern(start_x, start_y, num_platforms, rng=None):
         """Gera um padrão de labirinto com caminhos alternativos"""
+        rng = rng or random
         platforms = []
         current_x = start_x
         current_y = start_y
@@ -163,29 +212,30 @@ class DynamicLevelGenerator:
             platforms.append((current_x, current_y, 80, 20))
 
             # Decidir direção: para frente ou para cima/baixo
-            if random.random() < 0.7:  # 70% chance de ir para frente
-                current_x += random.randint(100, 150)
+            if rng.random() < 0.7:  # 70% chance de ir para frente
+                current_x += rng.randint(100, 150)
             else:  # 30% chance de mudar altura
-                current_y += random.randint(-60, 60)
+                current_y += rng.randint(-60, 60)
                 current_y = max(100, min(current_y, HEIGHT - 100))
-                current_x += random.randint(80, 120)
+                current_x += rng.randint(80, 120)
 
         # Criar caminhos alternativos (becos sem saída e atalhos)
         for i in range(num_platforms - main_path_length):
             # Escolher uma plataforma existente como ponto de partida
             if platforms:
-                base_platform = random.choice(platforms)
-                branch_x = base_platform[0] + random.randint(-50, 50)
-                branch_y = base_platform[1] + random.randint(-100, 100)
+                base_platform = rng.choice(platforms)
+                branch_x = base_platform[0] + rng.randint(-50, 50)
+                branch_y = base_platform[1] + rng.randint(-100, 100)
                 branch_y = max(50, min(branch_y, HEIGHT - 50))
 
-                platforms.append((branch_x, branch_y, random.randint(60, 100), 20))
+                platforms.append((branch_x, branch_y, rng.randint(60, 100), 20))
 
         return platforms
 
     @staticmethod
-    def generate_bridge_pattern(start_x, start_y, num_platforms):
+    def generate_bridge_pattern(start_x, start_y, num_platforms, rng=None):
         """Gera um padrão de pontes com lacunas desafiadoras"""
+        rng = rng or random
         platforms = []
         current_x = start_x
         current_y = start_y
@@ -202,16 +252,17 @@ class DynamicLevelGenerator:
             # Criar plataformas da ponte
             for i in range(platforms_per_section):
                 platforms.append((current_x, section_y, 60, 20))
-                current_x += random.randint(70, 90)  # Lacunas menores dentro da seção
+                current_x += rng.randint(70, 90)  # Lacunas menores dentro da seção
 
             # Grande lacuna entre seções
-            current_x += random.randint(150, 200)
+            current_x += rng.randint(150, 200)
 
         return platforms
 
     @staticmethod
-    def generate_tower_pattern(start_x, start_y, num_platforms):
+    def generate_tower_pattern(start_x, start_y, num_platforms, rng=None):
         """Gera um padrão de torres verticais com plataformas de conexão"""
+        rng = rng or random
         platforms = []
 
         # Criar múltiplas torres
@@ -236,15 +287,29 @@ class DynamicLevelGenerator:
             # Adicionar plataformas de conexão entre torres
             if tower < num_towers - 1:
                 connection_x = tower_x + 150
-                connection_y = start_y - random.randint(40, 120)
+                connection_y = start_y - rng.randint(40, 120)
                 connection_y = max(100, connection_y)
                 platforms.append((connection_x, connection_y, 100, 20))
 
         return platforms
 
     @staticmethod
-    def generate_level_platforms(level, base_num_platforms=30):
-        """Gera plataformas para um nível específico usando diferentes padrões"""
+    def generate_level_platforms(level, base_num_platforms=30, difficulty=None, seed=None, rng=None):
+        """Gera plataformas para um nível específico usando diferentes padrões
+
+        Sem ``rng``, o layout é determinístico por (nível, dificuldade,
+        semente) e reaproveitado do cache de layouts.
+        """
+        if rng is None:
+            return DynamicLevelGenerator.get_layout(
+                f"patterns{base_num_platforms}",
+                level,
+                difficulty,
+                seed,
+                lambda r: DynamicLevelGenerator.generate_level_platforms(
+                    level, base_num_platforms, rng=r
+                ),
+            )
         # Aumentar número de plataformas com o nível
         num_platforms = base_num_platforms + (level - 6) * 3
         start_x = 60
@@ -255,35 +320,37 @@ class DynamicLevelGenerator:
 
         if pattern_choice == 0:
             return DynamicLevelGenerator.generate_staircase_pattern(
-                start_x, start_y, num_platforms
+                start_x, start_y, num_platforms, rng=rng
             )
         elif pattern_choice == 1:
-            return DynamicLevelGenerator.generate_wave_pattern(start_x, start_y, num_platforms)
+            return DynamicLevelGenerator.generate_wave_pattern(start_x, start_y, num_platforms, rng=rng)
         elif pattern_choice == 2:
             return DynamicLevelGenerator.generate_zigzag_pattern(
-                start_x, start_y, num_platforms
+                start_x, start_y, num_platforms, rng=rng
             )
         elif pattern_choice == 3:
             return DynamicLevelGenerator.generate_spiral_pattern(
-                start_x, start_y, num_platforms
+                start_x, start_y, num_platforms, rng=rng
             )
         elif pattern_choice == 4:
             return DynamicLevelGenerator.generate_random_clusters(
-                start_x, start_y, num_platforms
+                start_x, start_y, num_platforms, rng=rng
             )
         elif pattern_choice == 5:
-            return DynamicLevelGenerator.generate_maze_pattern(start_x, start_y, num_platforms)
+            return DynamicLevelGenerator.generate_maze_pattern(start_x, start_y, num_platforms, rng=rng)
         elif pattern_choice == 6:
             return DynamicLevelGenerator.generate_bridge_pattern(
-                start_x, start_y, num_platforms
+                start_x, start_y, num_platforms, rng=rng
             )
         else:
             return DynamicLevelGenerator.generate_tower_pattern(
-                start_x, start_y, num_platforms
+                start_x, start_y, num_platforms, rng=rng
             )
 
-    def create_advanced_level(self, level):
-        """Cria níveis avançados (11+) com base no padrão das fases anteriores"""
+    @staticmethod
+    def generate_advanced_platforms(level, rng=None):
+        """Layout das fases avançadas (11+): lista de (x, y, largura, altura)"""
+        rng = rng or random
         # Calcular parâmetros baseados no nível
         num_platforms = min(70 + (level - 11) * 2, 100)  # Máximo 100 plataformas
         platform_width = max(40, 50 - (level - 11))  # Plataformas menores
@@ -298,7 +365,7 @@ class DynamicLevelGenerator:
             y_pos = HEIGHT - (
                 80
                 + (i % 12) * y_variation // 3
-                + random.randint(-y_variation // 2, y_variation // 2)
+                + rng.randint(-y_variation // 2, y_variation // 2)
             )
 
             # Garantir que não fique muito alto ou baixo
@@ -307,9 +374,24 @@ class DynamicLevelGenerator:
             platforms.append((x_pos, y_pos, platform_width, 20))
 
             # Próxima posição com gap variável
-            gap = 80 + random.randint(0, max_gap - 80)
+            gap = 80 + rng.randint(0, max_gap - 80)
             x_pos += gap
 
+        return platforms
+
+    def create_advanced_level(self, level):
+        """Cria níveis avançados (11+) com base no padrão das fases anteriores"""
+        platform_width = max(40, 50 - (level - 11))  # Plataformas menores
+        # Mesmo layout em toda nova tentativa: gerado uma vez por
+        # (nível, dificuldade, semente) e reaproveitado do cache
+        platforms = DynamicLevelGenerator.get_layout(
+            "advanced",
+            level,
+            getattr(self, "difficulty", None),
+            getattr(self, "layout_seed", None),
+            lambda r: DynamicLevelGenerator.generate_advanced_platforms(level, r),
+        )
+
         for x, y, w, h in platforms:
             self.platforms.append(Platform(x, y, w, h, self.platform_texture))
 
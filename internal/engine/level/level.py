@@ -1,5 +1,6 @@
 from internal.utils.constants import WIDTH, HEIGHT
 from internal.resources.cache import ResourceCache
+from internal.engine.gc_policy import GCPolicy
 from internal.engine.level.generator.static import StaticLevelGenerator
 from internal.resources.player import Player
 from internal.resources.enemies.turtle import Turtle
@@ -257,8 +258,30 @@ class Level:
 
         # Atualizar dificuldade dos pássaros para o nível atual
         game.update_bird_difficulty()
+        # Ranking ativo acompanha a dificuldade da partida
+        try:
+            game.ranking_manager.set_board(game.difficulty)
+        except Exception:
+            pass
         game.background_img = Level.draw_level_bg(game, game.current_level)
 
+        # Trocar o conjunto de imagens e sons ao mudar de mundo (1-10, 11-20, ...)
+        try:
+            if game.image.load_world(game.current_level):
+                game.image.sync_game(game)
+        except Exception:
+            pass
+        try:
+            game.sound_effects.load_world(game.current_level)
+        except Exception:
+            pass
+
+        # Sistemas por quadro da fase (spawners, perigos, colisões)
+        try:
+            game._update.build_world_pipeline(game.current_level)
+        except Exception:
+            pass
+
         # Garantir que o fundo do menu permanece inalterado
         if not hasattr(game, "menu_background_img") or game.menu_background_img is None:
             cache = ResourceCache()
@@ -275,6 +298,7 @@ class Level:
 
         # Criar plataformas baseadas no nível
         Level.create_level_platforms(game, game.current_level)
+        Level.apply_animation_step(game)
 
         # Resetar e posicionar item de vida extra
         game.extra_lives = []
@@ -288,6 +312,31 @@ class Level:
         game.powerups = []
         Level.place_powerups(game)
 
+        # Troca de fase: coletar o lixo da fase anterior antes de jogar
+        try:
+            GCPolicy().collect("level")
+        except Exception:
+            pass
+
+        # Hook de MODs: nível pronto (plataformas, inimigos e itens criados)
+        try:
+            game.call_mod_hook("on_level_init")
+        except Exception:
+            pass
+
+    def apply_animation_step(game):
+        """Aplica o ``animation_step`` do perfil aos inimigos criados com a fase"""
+        try:
+            apply_step = game._update._apply_animation_step
+        except Exception:
+            return
+        for name in ("turtles", "spiders", "robots", "aliens", "airplanes", "birds", "bats"):
+            for enemy in getattr(game, name, None) or ():
+                apply_step(enemy)
+        boss = getattr(game, "boss_alien", None)
+        if boss is not None:
+            apply_step(boss)
+
     def place_extra_life(game):
         """Posiciona um item de vida em uma plataforma, exigindo um salto para alcançar"""
         if not hasattr(game, "platforms") or not game.platforms:
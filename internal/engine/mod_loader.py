@@ -1,18 +1,163 @@
 import os
 import sys
+import time
 import importlib.util
 from pathlib import Path
 
 
+# Pontos de extensão formais. Cada callback recebe ``game`` como primeiro
+# argumento; ``on_spawn`` recebe também o inimigo recém-criado.
+HOOK_NAMES = (
+    "pre_update",
+    "post_update",
+    "pre_draw",
+    "post_draw",
+    "on_level_init",
+    "on_spawn",
+)
+
+
 class ModLoader:
     """
     Gerenciador de MODs para Jump and Hit.
     Carrega arquivos .py da pasta mods/ e executa suas funções init_mod(game).
+
+    Além de ``init_mod``, um MOD pode registrar hooks (ver ``HOOK_NAMES``),
+    definindo funções com esses nomes no módulo ou chamando
+    ``game.register_mod_hook(nome, callback)`` dentro de ``init_mod``.
+    Cada chamada é cronometrada; um MOD que passa do orçamento por frame
+    gera aviso e, após ``disable_after`` frames seguidos, é desativado.
     """
+
+    # Orçamento de tempo por MOD e por frame (ms); .env: mod_frame_budget_ms
+    DEFAULT_FRAME_BUDGET_MS = 2.0
+    # Frames seguidos acima do orçamento até desativar (0 = apenas avisar);
+    # .env: mod_disable_after_frames
+    DEFAULT_DISABLE_AFTER = 120
+    # Intervalo mínimo entre avisos do mesmo MOD (frames)
+    WARN_INTERVAL = 60
     
     def __init__(self, game):
         self.game = game
         self.loaded_mods = []
+        self.hooks = {name: [] for name in HOOK_NAMES}
+        self.mod_stats = {}
+        self.frame_index = 0
+        self._loading_mod = None
+        env = getattr(game, "env_config", None) or {}
+        self.frame_budget_ms = self._env_number(
+            env, "mod_frame_budget_ms", self.DEFAULT_FRAME_BUDGET_MS
+        )
+        self.disable_after = int(
+            self._env_number(
+                env, "mod_disable_after_frames", self.DEFAULT_DISABLE_AFTER
+            )
+        )
+
+    @staticmethod
+    def _env_number(env, key, default):
+        try:
+            return float(env.get(key, default))
+        except Exception:
+            return default
+
+    def _stats_for(self, mod_name):
+        stats = self.mod_stats.get(mod_name)
+        if stats is None:
+            stats = {
+                "frame_ms": 0.0,
+                "last_ms": 0.0,
+                "avg_ms": 0.0,
+                "peak_ms": 0.0,
+                "over_frames": 0,
+                "last_warning": None,
+                "disabled": False,
+            }
+            self.mod_stats[mod_name] = stats
+        return stats
+
+    def register_hook(self, hook, callback, mod_name=None):
+        """Registra ``callback`` no hook ``hook`` para o MOD ``mod_name``.
+
+        Sem ``mod_name``, usa o MOD cujo ``init_mod`` está em execução.
+        """
+        if hook not in self.hooks:
+            raise ValueError(
+                f"Hook desconhecido: {hook} (disponíveis: {', '.join(HOOK_NAMES)})"
+            )
+        mod_name = mod_name or self._loading_mod or "anonimo"
+        self._stats_for(mod_name)
+        self.hooks[hook].append((mod_name, callback))
+
+    def _remove_hooks(self, mod_name):
+        for hook, callbacks in self.hooks.items():
+            callbacks[:] = [c for c in callbacks if c[0] != mod_name]
+        self.mod_stats.pop(mod_name, None)
+
+    def call_hook(self, hook, *args):
+        """Executa os callbacks de ``hook`` somando o tempo gasto por MOD."""
+        callbacks = self.hooks.get(hook)
+        if not callbacks:
+            return
+        game = self.game
+        for mod_name, callback in callbacks:
+            stats = self.mod_stats[mod_name]
+            if stats["disabled"]:
+                continue
+            start = time.perf_counter()
+            try:
+                callback(game, *args)
+            except Exception as e:
+                stats["disabled"] = True
+                print(f"[MOD LOADER] ✗ {mod_name}.{hook} falhou, MOD desativado: {e}")
+            stats["frame_ms"] += (time.perf_counter() - start) * 1000.0
+
+    def begin_frame(self):
+        """Fecha a contabilidade do frame anterior e aplica o orçamento."""
+        if not self.mod_stats:
+            return
+        self.frame_index += 1
+        for mod_name, stats in self.mod_stats.items():
+            cost = stats["frame_ms"]
+            stats["frame_ms"] = 0.0
+            if stats["disabled"]:
+                continue
+            stats["last_ms"] = cost
+            stats["avg_ms"] += (cost - stats["avg_ms"]) * 0.1
+            if cost > stats["peak_ms"]:
+                stats["peak_ms"] = cost
+            if cost <= self.frame_budget_ms:
+                stats["over_frames"] = 0
+                continue
+            stats["over_frames"] += 1
+            if self.disable_after > 0 and stats["over_frames"] >= self.disable_after:
+                stats["disabled"] = True
+                print(
+                    f"[MOD LOADER] ✗ {mod_name} desativado: acima de "
+                    f"{self.frame_budget_ms:.1f} ms/frame por "
+                    f"{stats['over_frames']} frames seguidos"
+                )
+                continue
+            last = stats["last_warning"]
+            if last is None or self.frame_index - last >= self.WARN_INTERVAL:
+                stats["last_warning"] = self.frame_index
+                print(
+                    f"[MOD LOADER] ⚠ {mod_name} gastou {cost:.2f} ms no frame "
+                    f"(orçamento {self.frame_budget_ms:.1f} ms)"
+                )
+
+    def get_stats(self):
+        """Custo por MOD: [(nome, último ms, média ms, pico ms, desativado)]."""
+        return [
+            (
+                name,
+                stats["last_ms"],
+                stats["avg_ms"],
+                stats["peak_ms"],
+                stats["disabled"],
+            )
+            for name, stats in sorted(self.mod_stats.items())
+        ]
     
     def get_mods_directory(self):
         """
@@ -75,7 +220,20 @@ class ModLoader:
         
         # Executar a função init_mod passando o objeto game
         init_mod = getattr(module, 'init_mod')
-        init_mod(self.game)
+        self._loading_mod = mod_name
+        try:
+            init_mod(self.game)
+        except Exception:
+            self._remove_hooks(mod_name)
+            raise
+        finally:
+            self._loading_mod = None
+
+        # Hooks declarados como funções do módulo
+        for hook in HOOK_NAMES:
+            callback = getattr(module, hook, None)
+            if callable(callback):
+                self.register_hook(hook, callback, mod_name)
         
         # Registrar MOD carregado
         self.loaded_mods.append({
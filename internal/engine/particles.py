@@ -0,0 +1,127 @@
+from itertools import islice
+
+import pygame
+
+from internal.utils.constants import RED
+
+
+# Sprites pré-renderizados por tamanho; gerados uma vez e reutilizados
+_GLOW_SPRITES = {}
+_EXPLOSION_SPRITES = {}
+
+
+def glow_size(width, height):
+    """Tamanho do brilho do super tiro para um tiro de ``width`` x ``height``."""
+    return max(10, int(width * 1.2)), max(8, int(height * 1.5))
+
+
+def glow_sprite(width, height):
+    """Brilho (ciano) do super tiro para um tiro desse tamanho.
+
+    Retorna ``(superfície, dx, dy)``: o deslocamento centraliza o brilho
+    sobre o tiro.
+    """
+    key = (int(width), int(height))
+    cached = _GLOW_SPRITES.get(key)
+    if cached is None:
+        glow_w, glow_h = glow_size(*key)
+        surface = pygame.Surface((glow_w, glow_h), pygame.SRCALPHA)
+        cx = glow_w // 2
+        cy = glow_h // 2
+        pygame.draw.circle(surface, (0, 255, 255, 110), (cx, cy), max(3, int(glow_h * 0.3)))
+        pygame.draw.circle(surface, (135, 206, 235, 90), (cx, cy), max(5, int(glow_h * 0.45)))
+        cached = (surface, -(glow_w - key[0]) // 2, -(glow_h - key[1]) // 2)
+        _GLOW_SPRITES[key] = cached
+    return cached
+
+
+def explosion_sprite(width, height):
+    """Círculo vermelho das explosões sem imagem, no tamanho da explosão."""
+    key = (int(width), int(height))
+    surface = _EXPLOSION_SPRITES.get(key)
+    if surface is None:
+        surface = pygame.Surface(key, pygame.SRCALPHA)
+        pygame.draw.circle(surface, RED, (key[0] // 2, key[1] // 2), key[0] // 2)
+        _EXPLOSION_SPRITES[key] = surface
+    return surface
+
+
+class ParticleLayer:
+    """Camada de partículas com buffer pré-alocado e um ``blits`` por quadro.
+
+    Cada slot é um par ``[superfície, [x, y]]`` reaproveitado entre quadros;
+    ``emit`` só preenche o próximo slot, sem criar objetos. O buffer cresce
+    se a capacidade for excedida (e mantém o novo tamanho). Com ``limit``
+    (perfil de desempenho leve) o excedente do quadro é descartado.
+    """
+
+    def __init__(self, name, capacity=128, limit=None):
+        self.name = name
+        self._slots = [[None, [0, 0]] for _ in range(capacity)]
+        self._count = 0
+        self.limit = limit
+        self.batches = 0
+        self.particles = 0
+        self.dropped = 0
+
+    @property
+    def capacity(self):
+        return len(self._slots)
+
+    def __len__(self):
+        return self._count
+
+    def emit(self, surface, x, y):
+        count = self._count
+        if self.limit is not None and count >= self.limit:
+            self.dropped += 1
+            return
+        if count == len(self._slots):
+            self._slots.append([None, [0, 0]])
+        slot = self._slots[count]
+        slot[0] = surface
+        dest = slot[1]
+        dest[0] = x
+        dest[1] = y
+        self._count = count + 1
+
+    def flush(self, screen):
+        """Desenha as partículas emitidas neste quadro e esvazia a camada."""
+        count = self._count
+        if not count:
+            return
+        slots = self._slots
+        try:
+            screen.blits(islice(slots, count), doreturn=False)
+        except Exception:
+            for i in range(count):
+                surface, dest = slots[i]
+                screen.blit(surface, dest)
+        for i in range(count):
+            slots[i][0] = None
+        self._count = 0
+        self.batches += 1
+        self.particles += count
+
+
+class ParticleSystem:
+    """Camadas de partículas do gameplay, na ordem de desenho."""
+
+    LAYERS = ("explosions", "glow")
+
+    def __init__(self, capacity=128, limit=None):
+        self.layers = {name: ParticleLayer(name, capacity, limit) for name in self.LAYERS}
+
+    def layer(self, name):
+        return self.layers[name]
+
+    def set_limit(self, limit):
+        """Máximo de partículas por camada e quadro (None = sem limite)."""
+        for layer in self.layers.values():
+            layer.limit = limit
+
+    def get_stats(self):
+        return {
+            name: (layer.capacity, layer.batches, layer.particles)
+            for name, layer in self.layers.items()
+        }
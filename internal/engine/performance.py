@@ -0,0 +1,139 @@
+import time
+
+import pygame
+
+from internal.utils.constants import WIDTH, HEIGHT
+
+
+class PerformanceProfile:
+    """Perfil de desempenho (alto/baixo) escolhido no início do jogo.
+
+    Cada perfil agrupa os ajustes que pesam em aparelhos fracos (Android):
+
+    - ``render_scale``: escala do backbuffer em tela cheia; abaixo de 1.0 a
+      tela real é menor e a ampliação fica com a GPU (``SCALED``);
+    - ``fast_textures``: texturas reduzidas ao tamanho final antes da
+      conversão, e opacas sem canal alfa;
+    - ``animation_step``: multiplica o intervalo entre quadros de animação
+      dos inimigos criados;
+    - ``max_hazards`` / ``max_particles``: limites de perigos simultâneos
+      (gotas, meteoros, estrelas, foguinhos) e partículas por camada;
+    - ``post_effects``: filtros 8 bits e daltônico no ``Screen.present``.
+
+    A preferência ``auto`` usa um benchmark curto de blits, executado uma
+    vez por processo em ``select`` (início do loop). Enquanto ``select``
+    não é chamado (testes, ferramentas) vale o perfil alto.
+    """
+
+    PROFILES = {
+        "high": {
+            "label": "Alto",
+            "render_scale": 1.0,
+            "fast_textures": False,
+            "animation_step": 1,
+            "max_hazards": None,
+            "max_particles": None,
+            "post_effects": True,
+        },
+        "low": {
+            "label": "Baixo",
+            "render_scale": 0.75,
+            "fast_textures": True,
+            "animation_step": 2,
+            "max_hazards": 12,
+            "max_particles": 24,
+            "post_effects": False,
+        },
+    }
+    CHOICES = ("auto", "high", "low")
+    # Quadro do benchmark acima disso (ms) seleciona o perfil baixo; o
+    # benchmark só cobre blits, cerca de um terço do orçamento de 60 FPS
+    BENCHMARK_FRAMES = 20
+    LOW_END_FRAME_MS = 6.0
+
+    # Resultado do benchmark (ms por quadro), medido uma vez por processo
+    _benchmark_ms = None
+
+    def __init__(self, preference="auto"):
+        self.preference = "auto"
+        self.name = "high"
+        self._apply_values("high")
+        self.set_preference(preference)
+
+    def _apply_values(self, name):
+        self.name = name
+        for key, value in self.PROFILES[name].items():
+            setattr(self, key, value)
+
+    def set_preference(self, preference):
+        """Define ``auto``/``high``/``low``; ``auto`` só resolve em ``select``."""
+        if preference not in self.CHOICES:
+            preference = "auto"
+        self.preference = preference
+        if preference != "auto":
+            self._apply_values(preference)
+        return self.preference
+
+    def cycle(self, step=1):
+        """Próxima preferência do menu de vídeo (auto -> alto -> baixo)."""
+        idx = self.CHOICES.index(self.preference)
+        return self.set_preference(self.CHOICES[(idx + step) % len(self.CHOICES)])
+
+    def select(self):
+        """Resolve a preferência (benchmark em ``auto``); retorna o perfil."""
+        if self.preference == "auto":
+            ms = self.benchmark()
+            self._apply_values("low" if ms > self.LOW_END_FRAME_MS else "high")
+        else:
+            self._apply_values(self.preference)
+        return self.name
+
+    @classmethod
+    def benchmark(cls):
+        """Tempo médio (ms) de um quadro sintético: fundo cheio e 80 sprites."""
+        if cls._benchmark_ms is not None:
+            return cls._benchmark_ms
+        try:
+            target = pygame.Surface((WIDTH, HEIGHT))
+            background = pygame.Surface((WIDTH, HEIGHT))
+            background.fill((40, 90, 160))
+            sprite = pygame.Surface((64, 64), pygame.SRCALPHA)
+            sprite.fill((255, 255, 255, 180))
+            start = time.perf_counter()
+            for frame in range(cls.BENCHMARK_FRAMES):
+                target.blit(background, (0, 0))
+                for i in range(80):
+                    target.blit(sprite, ((i * 37 + frame) % WIDTH, (i * 53) % HEIGHT))
+            elapsed = (time.perf_counter() - start) * 1000.0
+            cls._benchmark_ms = elapsed / cls.BENCHMARK_FRAMES
+        except Exception:
+            cls._benchmark_ms = 0.0
+        return cls._benchmark_ms
+
+    def describe(self):
+        """Texto do menu de vídeo, ex.: ``Auto (Baixo)``."""
+        label = self.PROFILES[self.name]["label"]
+        if self.preference == "auto":
+            return f"Auto ({label})"
+        return label
+
+    def apply(self, game):
+        """Propaga o perfil para cache de imagens, partículas e tela."""
+        try:
+            from internal.resources.cache import ResourceCache
+            ResourceCache().fast_textures = self.fast_textures
+        except Exception:
+            pass
+        try:
+            draw = getattr(game, "_draw", None)
+            if draw is not None:
+                draw._particles.set_limit(self.max_particles)
+        except Exception:
+            pass
+        try:
+            manager = getattr(game, "screen_manager", None)
+            if manager is not None and getattr(manager, "render_scale", 1.0) != self.render_scale:
+                from internal.engine.screen import Screen
+                Screen.init(game)
+        except Exception:
+            pass
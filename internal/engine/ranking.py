@@ -1,6 +1,10 @@
 import os
 import sys
 import json
+import bisect
+
+from internal.engine.difficulty import Difficulty
+from internal.utils.edition import GameEdition
 
 
 def _get_records_dir():
@@ -26,13 +30,29 @@ def _get_records_dir():
 
 
 class RankingManager:
+    """Rankings separados por edição e dificuldade.
+
+    Cada placar vive em seu próprio arquivo JSON Lines
+    (``records/<edição>_<dificuldade>.jsonl``): novas pontuações são
+    apenas anexadas ao final, e o arquivo é compactado periodicamente via
+    arquivo temporário + rename atômico. Uma linha truncada por queda
+    durante a escrita é ignorada na leitura. Placares só são lidos do disco
+    quando acessados pela primeira vez.
+    """
+
+    TOP_N = 10
+    HISTORY_DEPTH = 100
+    LEGACY_FILE = "top10.json"
+
     def __init__(self):
         self.records_dir = _get_records_dir()
-        # Seguir padrão de preferences/autosave: JSON
-        self.ranking_file = os.path.join(self.records_dir, "top10.json")
-        self.rankings = []
+        # Arquivo legado (top 10 global), migrado para o placar normal
+        self.ranking_file = os.path.join(self.records_dir, self.LEGACY_FILE)
+        self._boards = {}
+        self._keys = {}
+        self._appended = {}
         self.ensure_records_dir()
-        self.load_rankings()
+        self.set_board(Difficulty.NORMAL)
 
     def ensure_records_dir(self):
         """Cria o diretório records se não existir"""
@@ -42,48 +62,143 @@ class RankingManager:
             # Se não for possível criar, degradar para in-memory
             print(f"Erro ao criar diretório de records: {e}")
 
-    def load_rankings(self):
-        """Carrega os rankings do arquivo"""
+    @staticmethod
+    def board_key(difficulty=None, edition=None):
+        """Chave do placar: ``<edição>_<dificuldade>``."""
+        if edition is None:
+            edition = "demo" if GameEdition.is_demo() else "full"
+        if isinstance(difficulty, Difficulty):
+            difficulty = difficulty.name
+        difficulty = str(difficulty or Difficulty.NORMAL.name).lower()
+        return f"{edition}_{difficulty}"
+
+    def set_board(self, difficulty=None, edition=None):
+        """Seleciona o placar ativo (carregado sob demanda)."""
+        self.current_board = self.board_key(difficulty, edition)
+        return self.current_board
+
+    def _board_path(self, key):
+        return os.path.join(self.records_dir, f"{key}.jsonl")
+
+    def _get_board(self, key=None):
+        key = key or self.current_board
+        if key not in self._boards:
+            self._load_board(key)
+        return self._boards[key]
+
+    def _load_board(self, key):
+        entries = []
+        corrupted = False
+        path = self._board_path(key)
+        try:
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            item = json.loads(line)
+                            entries.append({"name": str(item["name"]), "score": int(item["score"])})
+                        except (ValueError, KeyError, TypeError):
+                            # Linha incompleta (queda durante a escrita): ignorar
+                            corrupted = True
+                            continue
+            elif key == self.board_key(Difficulty.NORMAL):
+                entries = self._load_legacy()
+        except OSError:
+            entries = []
+        # Ordenação estável: em empate, a pontuação mais antiga fica à frente
+        entries.sort(key=lambda x: x["score"], reverse=True)
+        line_count = len(entries)
+        entries = entries[:self.HISTORY_DEPTH]
+        self._boards[key] = entries
+        self._keys[key] = [-e["score"] for e in entries]
+        self._appended[key] = line_count
+        # Migração do legado ou linha corrompida: regravar limpo antes de anexar
+        if corrupted or (not os.path.exists(path) and entries):
+            self._compact(key)
+
+    def _load_legacy(self):
         try:
             if os.path.exists(self.ranking_file):
                 with open(self.ranking_file, "r", encoding="utf-8") as f:
-                    self.rankings = json.load(f)
-            else:
-                self.rankings = []
-        except (json.JSONDecodeError, FileNotFoundError):
-            self.rankings = []
+                    data = json.load(f)
+                if isinstance(data, list):
+                    return [
+                        {"name": str(e["name"]), "score": int(e["score"])}
+                        for e in data
+                        if isinstance(e, dict) and "name" in e and "score" in e
+                    ]
+        except (ValueError, OSError, KeyError, TypeError):
+            pass
+        return []
 
-    def save_rankings(self):
-        """Salva os rankings no arquivo"""
+    def load_rankings(self):
+        """Recarrega do disco o placar ativo"""
+        self._boards.pop(self.current_board, None)
+        self._get_board()
+
+    def _compact(self, key):
+        """Reescreve o placar de forma atômica (temp + rename)."""
+        path = self._board_path(key)
+        tmp_path = path + ".tmp"
         try:
-            with open(self.ranking_file, "w", encoding="utf-8") as f:
-                json.dump(self.rankings, f, ensure_ascii=False, indent=2)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for entry in self._boards[key]:
+                    f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+            self._appended[key] = len(self._boards[key])
         except Exception as e:
             print(f"Erro ao salvar rankings: {e}")
 
-    def is_high_score(self, score):
-        """Verifica se a pontuação entra no top 10"""
-        if len(self.rankings) < 10:
-            return True
-        return score > self.rankings[-1]["score"]
-
-    def add_score(self, name, score):
-        """Adiciona uma nova pontuação ao ranking"""
-        # Limitar nome a 25 caracteres
-        name = name[:25] if len(name) > 25 else name
+    def _append(self, key, entry):
+        path = self._board_path(key)
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._appended[key] = self._appended.get(key, 0) + 1
+        except Exception as e:
+            print(f"Erro ao salvar rankings: {e}")
 
-        # Adicionar nova pontuação
-        self.rankings.append({"name": name, "score": score})
+    def save_rankings(self):
+        """Salva o placar ativo no arquivo"""
+        self._get_board()
+        self._compact(self.current_board)
 
-        # Ordenar por pontuação (maior para menor)
-        self.rankings.sort(key=lambda x: x["score"], reverse=True)
+    def _insert_position(self, key, score):
+        # Chaves em ordem crescente de -score; bisect_right mantém a ordem de chegada
+        return bisect.bisect_right(self._keys[key], -score)
 
-        # Manter apenas top 10
-        self.rankings = self.rankings[:10]
+    def is_high_score(self, score, difficulty=None):
+        """Verifica se a pontuação entra no top 10 (O(log n))"""
+        key = self.board_key(difficulty) if difficulty is not None else self.current_board
+        self._get_board(key)
+        return self._insert_position(key, score) < self.TOP_N
 
-        # Salvar no arquivo
-        self.save_rankings()
+    def add_score(self, name, score, difficulty=None):
+        """Adiciona uma nova pontuação ao placar ativo (ou ao da dificuldade dada)"""
+        # Limitar nome a 25 caracteres
+        name = name[:25] if len(name) > 25 else name
+        key = self.board_key(difficulty) if difficulty is not None else self.current_board
+        board = self._get_board(key)
+        entry = {"name": name, "score": int(score)}
+        pos = self._insert_position(key, entry["score"])
+        if pos >= self.HISTORY_DEPTH:
+            return
+        board.insert(pos, entry)
+        self._keys[key].insert(pos, -entry["score"])
+        if len(board) > self.HISTORY_DEPTH:
+            board.pop()
+            self._keys[key].pop()
+        # Anexar é barato; compactar quando o arquivo acumular linhas demais
+        if self._appended.get(key, 0) + 1 > 2 * self.HISTORY_DEPTH:
+            self._compact(key)
+        else:
+            self._append(key, entry)
 
-    def get_rankings(self):
-        """Retorna a lista de rankings"""
-        return self.rankings.copy()
+    def get_rankings(self, difficulty=None):
+        """Retorna o top 10 do placar ativo (ou da dificuldade dada)"""
+        key = self.board_key(difficulty) if difficulty is not None else self.current_board
+        return [dict(e) for e in self._get_board(key)[:self.TOP_N]]
@@ -0,0 +1,34 @@
+class RenderQueue:
+    """Fila de (superfície, destino) despachada com um único ``Surface.blits``.
+
+    Entidades homogêneas enfileiram seus sprites e a camada é descarregada
+    de uma vez, reduzindo o custo Python por sprite. Quem precisar desenhar
+    algo fora da fila no meio de uma camada deve chamar ``flush`` antes,
+    para manter a ordem de desenho.
+    """
+
+    def __init__(self):
+        self._items = []
+        self.batches = 0
+        self.sprites = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def submit(self, surface, dest):
+        self._items.append((surface, dest))
+
+    def flush(self, screen):
+        """Desenha tudo o que está na fila em ``screen`` e esvazia a fila."""
+        items = self._items
+        if not items:
+            return
+        try:
+            screen.blits(items, doreturn=False)
+        except Exception:
+            # Superfícies sem blits (ou itens não suportados): um a um
+            for surface, dest in items:
+                screen.blit(surface, dest)
+        self.batches += 1
+        self.sprites += len(items)
+        self._items = []
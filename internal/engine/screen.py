@@ -29,6 +29,8 @@ class Screen(metaclass=_ScreenMeta):
         self.offset_x = 0
         self.offset_y = 0
         self.game_surface = None
+        # Escala do backbuffer pedida pelo perfil de desempenho
+        self.render_scale = 1.0
 
     def init(game):
         # Robust init: fall back to windowed mode on any error so tests can inspect set_mode calls
@@ -43,6 +45,8 @@ class Screen(metaclass=_ScreenMeta):
 
             # Detectar se deve usar fullscreen
             use_fullscreen = Screen.is_fullscreen(game)
+            render_scale = Screen.render_scale(game)
+            screen_manager.render_scale = render_scale
 
             if use_fullscreen:
                 # Obter informações da tela
@@ -53,6 +57,12 @@ class Screen(metaclass=_ScreenMeta):
 
                 # Criar tela real em fullscreen com resolução nativa
                 flags = pg.FULLSCREEN | getattr(pg, "DOUBLEBUF", 0)
+                if render_scale < 1.0:
+                    # Perfil leve: backbuffer menor que a tela; o SDL amplia
+                    # na GPU (SCALED) em vez de escalar para a resolução nativa
+                    screen_manager.screen_width = int(screen_manager.game_width * render_scale)
+                    screen_manager.screen_height = int(screen_manager.game_height * render_scale)
+                    flags |= getattr(pg, "SCALED", 0)
                 screen_manager.real_screen = pg.display.set_mode(
                     (screen_manager.screen_width, screen_manager.screen_height),
                     flags,
@@ -200,8 +210,9 @@ class Screen(metaclass=_ScreenMeta):
 
         # Preparar surface para apresentação com filtros visuais e acessibilidade
         source_surface = screen_manager.game_surface
+        post_effects = Screen.post_effects_enabled(game)
         try:
-            if hasattr(game, "visual_mode") and getattr(game, "visual_mode", "normal") == "8bit":
+            if post_effects and hasattr(game, "visual_mode") and getattr(game, "visual_mode", "normal") == "8bit":
                 try:
                     pw = max(1, screen_manager.game_width // 2)
                     ph = max(1, screen_manager.game_height // 2)
@@ -217,7 +228,7 @@ class Screen(metaclass=_ScreenMeta):
                     source_surface.blit(scan, (0, 0))
                 except Exception:
                     pass
-            if hasattr(game, "colorblind_mode") and getattr(game, "colorblind_mode", "none") != "none":
+            if post_effects and hasattr(game, "colorblind_mode") and getattr(game, "colorblind_mode", "none") != "none":
                 try:
                     overlay = pygame.Surface((screen_manager.game_width, screen_manager.game_height))
                     mode = getattr(game, "colorblind_mode", "none")
@@ -239,22 +250,54 @@ class Screen(metaclass=_ScreenMeta):
         scaled_width = int(screen_manager.game_width * screen_manager.scale_x)
         scaled_height = int(screen_manager.game_height * screen_manager.scale_y)
 
-        scaled_surface = pygame.transform.scale(
-            source_surface, (scaled_width, scaled_height)
+        scaled_surface = Screen._scaled_target(
+            screen_manager, source_surface, (scaled_width, scaled_height)
         )
         try:
-            scaled_surface = scaled_surface.convert()
+            pygame.transform.scale(
+                source_surface, (scaled_width, scaled_height), scaled_surface
+            )
         except Exception:
-            pass
+            scaled_surface = pygame.transform.scale(
+                source_surface, (scaled_width, scaled_height)
+            )
 
         screen_manager.real_screen.blit(
             scaled_surface, (screen_manager.offset_x, screen_manager.offset_y)
         )
         pygame.display.flip()
 
+    def _scaled_target(screen_manager, source_surface, size):
+        """Surface de destino da escala, criada uma vez por tamanho/formato.
+
+        Alocar um quadro escalado novo a cada ``present`` custa caro (e varia
+        conforme o estado do heap); a escala passa a escrever sempre na mesma.
+        """
+        target = getattr(screen_manager, "_scaled_surface", None)
+        if (
+            target is None
+            or target.get_size() != size
+            or target.get_bitsize() != source_surface.get_bitsize()
+        ):
+            target = pygame.Surface(size, 0, source_surface)
+            screen_manager._scaled_surface = target
+        return target
+
     def is_fullscreen(game):
         env = game.env_config
         return env.get("fullscreen", False)
 
+    def render_scale(game):
+        """Escala do backbuffer em tela cheia definida pelo perfil de desempenho"""
+        try:
+            scale = float(getattr(getattr(game, "performance", None), "render_scale", 1.0))
+        except Exception:
+            return 1.0
+        return max(0.5, min(1.0, scale))
+
+    def post_effects_enabled(game):
+        """Filtros 8 bits/daltônico ficam desligados no perfil leve"""
+        return getattr(getattr(game, "performance", None), "post_effects", True)
+
     # Guardar referência original para permitir restauração em cenários de testes
     _original_init = init
@@ -0,0 +1,165 @@
+import pygame
+
+
+class ChannelManager:
+    """Gerencia canais do mixer: limite de vozes, prioridades e canais reservados.
+
+    - Cada som tem um limite de instâncias simultâneas (``SOUND_CAPS``).
+    - Sons críticos de UI tocam em canais reservados, que nunca são
+      roubados por efeitos comuns.
+    - Disparos repetidos do mesmo som no mesmo frame são fundidos em um só.
+    - Sons de prioridade alta podem roubar um canal ocupado; os de
+      prioridade baixa são descartados quando não há canal livre.
+    """
+
+    CRITICAL = 3
+    HIGH = 2
+    NORMAL = 1
+    LOW = 0
+
+    NUM_CHANNELS = 16
+    RESERVED_CHANNELS = 2
+
+    SOUND_PRIORITIES = {
+        "new-life": CRITICAL,
+        "level-end": CRITICAL,
+        "game-over": CRITICAL,
+        "player-hit": HIGH,
+        "shock": HIGH,
+        "collect": HIGH,
+        "jump": NORMAL,
+        "shot": NORMAL,
+        "explosion": NORMAL,
+        "bird-hit": LOW,
+        "water-hit": LOW,
+    }
+
+    # Máximo de vozes simultâneas por som (padrão para sons não listados: 2)
+    SOUND_CAPS = {
+        "explosion": 3,
+        "shot": 3,
+        "bird-hit": 2,
+        "water-hit": 2,
+        "jump": 1,
+        "shock": 1,
+        "player-hit": 1,
+    }
+    DEFAULT_CAP = 2
+
+    def __init__(self, mixer=None):
+        # Módulo do mixer injetável para permitir testes sem hardware de áudio
+        self._mixer = mixer if mixer is not None else pygame.mixer
+        self._configured = False
+        self._frame = 0
+        self._played_this_frame = set()
+        self._active = {}
+        self.stats = {"played": 0, "merged": 0, "dropped": 0}
+
+    def _ensure_configured(self):
+        if self._configured:
+            return True
+        try:
+            if not self._mixer.get_init():
+                return False
+            if self._mixer.get_num_channels() < self.NUM_CHANNELS:
+                self._mixer.set_num_channels(self.NUM_CHANNELS)
+            self._mixer.set_reserved(self.RESERVED_CHANNELS)
+            self._configured = True
+        except Exception:
+            return False
+        return True
+
+    def begin_frame(self):
+        """Marca o início de um novo frame (libera a fusão de disparos)."""
+        self._frame += 1
+        self._played_this_frame.clear()
+
+    def get_priority(self, sound_name):
+        return self.SOUND_PRIORITIES.get(sound_name, self.NORMAL)
+
+    def get_cap(self, sound_name):
+        return self.SOUND_CAPS.get(sound_name, self.DEFAULT_CAP)
+
+    def _prune(self, sound_name, sound):
+        """Remove canais que já terminaram ou passaram a tocar outro som."""
+        channels = self._active.get(sound_name)
+        if not channels:
+            return []
+        alive = []
+        for ch in channels:
+            try:
+                if ch.get_busy() and ch.get_sound() is sound:
+                    alive.append(ch)
+            except Exception:
+                pass
+        self._active[sound_name] = alive
+        return alive
+
+    def _find_reserved_channel(self):
+        """Canal reservado livre; se todos ocupados, reutiliza o primeiro."""
+        first = None
+        for idx in range(self.RESERVED_CHANNELS):
+            try:
+                ch = self._mixer.Channel(idx)
+            except Exception:
+                continue
+            if first is None:
+                first = ch
+            try:
+                if not ch.get_busy():
+                    return ch
+            except Exception:
+                pass
+        return first
+
+    def play(self, sound_name, sound):
+        """Toca ``sound`` respeitando prioridade e limites. Retorna o canal ou None."""
+        if sound_name in self._played_this_frame:
+            self.stats["merged"] += 1
+            return None
+
+        priority = self.get_priority(sound_name)
+        if not self._ensure_configured():
+            # Mixer indisponível para gerenciamento: comportamento antigo
+            self._played_this_frame.add(sound_name)
+            self.stats["played"] += 1
+            return sound.play()
+
+        if priority >= self.CRITICAL:
+            # Só limpa a lista: canais reservados não seguem o limite de vozes
+            self._prune(sound_name, sound)
+            channel = self._find_reserved_channel()
+        else:
+            active = self._prune(sound_name, sound)
+            if len(active) >= self.get_cap(sound_name):
+                if priority >= self.HIGH:
+                    # Reiniciar a voz mais antiga do mesmo som
+                    channel = active.pop(0)
+                else:
+                    self.stats["dropped"] += 1
+                    return None
+            else:
+                try:
+                    channel = self._mixer.find_channel(priority >= self.HIGH)
+                except Exception:
+                    channel = None
+
+        if channel is None:
+            self.stats["dropped"] += 1
+            return None
+
+        try:
+            channel.play(sound)
+        except Exception:
+            self.stats["dropped"] += 1
+            return None
+        active = self._active.setdefault(sound_name, [])
+        if channel not in active:
+            active.append(channel)
+        self._played_this_frame.add(sound_name)
+        self.stats["played"] += 1
+        return channel
+
+    def get_stats(self):
+        """Retorna contadores de vozes tocadas, fundidas e descartadas."""
+        return dict(self.stats)
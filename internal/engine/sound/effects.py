@@ -1,7 +1,9 @@
 import os
 import pygame
 
+from internal.resources.asset_manifest import WORLD_MANIFESTS, manifest_for_level, world_for_level
 from internal.resources.cache import ResourceCache
+from internal.engine.sound.channels import ChannelManager
 from internal.utils.functions import resource_path
 
 
@@ -9,188 +11,125 @@ class SoundEffects:
     sound_effects = {}
     sound_volume = 0.8
 
+    # Efeito -> (arquivo, multiplicador de volume, nome usado no log)
+    EFFECTS = {
+        "jump": ("sounds/jump.mp3", 1.0, "pulo"),
+        "explosion": ("sounds/explosion.mp3", 1.0, "explosão"),
+        "shot": ("sounds/shot.mp3", 1.0, "tiro"),
+        # Volume mais alto para se sobressair sobre a música de fundo
+        "new-life": ("sounds/new-life.mp3", 1.5, "vida extra"),
+        "collect": ("sounds/collect.mp3", 1.0, "coleta"),
+        "level-end": ("sounds/level-end.mp3", 1.2, "fim de fase"),
+        "game-over": ("sounds/game-over.mp3", 1.0, "game over"),
+        # Impactos um pouco mais altos para destacar o acerto
+        "bird-hit": ("sounds/bird-hit.mp3", 1.2, "bird-hit"),
+        "water-hit": ("sounds/water-hit.mp3", 1.2, "water-hit"),
+        "player-hit": ("sounds/player-hit.mp3", 1.0, "player-hit"),
+        "shock": ("sounds/shock.mp3", 1.1, "choque"),
+    }
+    # Carregados no início: tocam nos primeiros segundos de qualquer fase.
+    # Os demais são carregados no primeiro uso (ver get)
+    EAGER_EFFECTS = ("jump", "shot", "explosion")
+    # Efeito sem arquivo próprio -> efeito cujo som é reaproveitado
+    FALLBACKS = {"collect": "new-life"}
+
     def __init__(self):
         self.sound_effects = {}
         self.sound_volume = 0.8
+        self.channels = ChannelManager()
+        # Efeitos sem arquivo: não tentar de novo a cada disparo
+        self._missing = set()
+        self.current_world = None
 
     def load_sound_effects(self):
-        """Carregar efeitos sonoros do jogo usando sistema de cache"""
+        """Carregar os efeitos frequentes; os raros ficam para o primeiro uso"""
+        for name in self.EAGER_EFFECTS:
+            self._load_effect(name)
+
+    def load_world(self, level):
+        """Carrega os sons do mundo de ``level`` e libera os do anterior.
+
+        Como ``Image.load_world``: só faz trabalho quando o mundo muda. Sons
+        de mundo fora do novo manifesto saem de ``sound_effects`` e do
+        ``ResourceCache``; os do novo mundo são carregados na troca, não no
+        primeiro disparo. Retorna True se houve troca de mundo.
+        """
+        world = world_for_level(level)
+        if world == getattr(self, "current_world", None):
+            return False
+        wanted = set(manifest_for_level(level)["sounds"])
+        self._release_world_sounds(keep=wanted)
+        for name, (path, _volume, _label) in self.EFFECTS.items():
+            if path in wanted:
+                self._load_effect(name)
+        self.current_world = world
+        return True
+
+    def unload_world(self):
+        """Libera os sons de mundo; o próximo ``load_world`` recarrega tudo."""
+        self._release_world_sounds(keep=())
+        self.current_world = None
+
+    def _release_world_sounds(self, keep):
+        world_sounds = {path for m in WORLD_MANIFESTS.values() for path in m["sounds"]}
+        released = []
+        for name, (path, _volume, _label) in self.EFFECTS.items():
+            if path not in world_sounds or path in keep:
+                continue
+            if self.sound_effects.pop(name, None) is not None:
+                released.append(path)
+        if released:
+            ResourceCache().release_sounds(released)
+
+    def get(self, sound_name):
+        """Som de ``sound_name``, carregado sob demanda; None se não existir"""
+        sound = self.sound_effects.get(sound_name)
+        if sound is None:
+            sound = self._load_effect(sound_name)
+        return sound
+
+    def _load_effect(self, name):
+        """Carrega ``name`` via cache (PCM decodificado quando disponível)"""
+        if name in self.sound_effects:
+            return self.sound_effects[name]
+        missing = getattr(self, "_missing", None)
+        if missing is None:
+            missing = self._missing = set()
+        if name in missing or name not in self.EFFECTS:
+            return None
+        path, volume_scale, label = self.EFFECTS[name]
+        fallback = self.FALLBACKS.get(name)
         try:
-            # Inicializar cache de recursos
-            cache = ResourceCache()
-
-            # Carregar som de pulo usando cache
-            jump_path = "sounds/jump.mp3"
-            if os.path.exists(resource_path(jump_path)):
-                sound = cache.get_sound(jump_path)
-                if sound:
-                    self.sound_effects["jump"] = sound
-                    self.sound_effects["jump"].set_volume(self.sound_volume)
-                    print("Som de pulo carregado com sucesso")
-            else:
-                print("Aviso: Arquivo sounds/jump.mp3 não encontrado")
-
-            # Carregar som de explosão usando cache
-            explosion_path = "sounds/explosion.mp3"
-            if os.path.exists(resource_path(explosion_path)):
-                sound = cache.get_sound(explosion_path)
-                if sound:
-                    self.sound_effects["explosion"] = sound
-                    self.sound_effects["explosion"].set_volume(
-                        self.sound_volume
-                    )
-                    print("Som de explosão carregado com sucesso")
-            else:
-                print("Aviso: Arquivo sounds/explosion.mp3 não encontrado")
-
-            # Carregar som de tiro usando cache
-            shot_path = "sounds/shot.mp3"
-            if os.path.exists(resource_path(shot_path)):
-                sound = cache.get_sound(shot_path)
+            if os.path.exists(resource_path(path)):
+                sound = ResourceCache().get_sound(path)
                 if sound:
-                    self.sound_effects["shot"] = sound
-                    self.sound_effects["shot"].set_volume(
-                        self.sound_volume
-                    )
-                    print("Som de tiro carregado com sucesso")
-            else:
-                print("Aviso: Arquivo sounds/shot.mp3 não encontrado")
-
-            # Carregar som de vida extra usando cache
-            newlife_path = "sounds/new-life.mp3"
-            if os.path.exists(resource_path(newlife_path)):
-                sound = cache.get_sound(newlife_path)
-                if sound:
-                    self.sound_effects["new-life"] = sound
-                    # Volume mais alto para se sobressair sobre a música de fundo
-                    self.sound_effects["new-life"].set_volume(
-                        min(1.0, self.sound_volume * 1.5)
-                    )
-                    print("Som de vida extra carregado com sucesso")
-                    # Alias para coletar powerups quando não houver som dedicado
-                    # Se existir um som específico de coletar, preferir ele
-                    collect_path = "sounds/collect.mp3"
-                    if os.path.exists(resource_path(collect_path)):
-                        collect_sound = cache.get_sound(collect_path)
-                        if collect_sound:
-                            self.sound_effects["collect"] = collect_sound
-                            self.sound_effects["collect"].set_volume(
-                                self.sound_volume
-                            )
-                            print("Som de coleta carregado com sucesso")
-                    else:
-                        # Mapear 'collect' para 'new-life' como fallback
-                        self.sound_effects["collect"] = (
-                            self.sound_effects["new-life"]
-                        )
-                        print(
-                            "Som 'collect' não encontrado; "
-                            "usando fallback de 'new-life'"
-                        )
-            else:
-                print("Aviso: Arquivo sounds/new-life.mp3 não encontrado")
-                # Ainda tentar carregar um som dedicado de 'collect' se existir
-                collect_path = "sounds/collect.mp3"
-                if os.path.exists(resource_path(collect_path)):
-                    collect_sound = cache.get_sound(collect_path)
-                    if collect_sound:
-                        self.sound_effects["collect"] = collect_sound
-                        self.sound_effects["collect"].set_volume(
-                            self.sound_volume
-                        )
-                        print("Som de coleta carregado com sucesso")
-
-            # Carregar som de fim de fase
-            level_end_path = "sounds/level-end.mp3"
-            if os.path.exists(resource_path(level_end_path)):
-                sound = cache.get_sound(level_end_path)
-                if sound:
-                    self.sound_effects["level-end"] = sound
-                    # leve destaque
-                    self.sound_effects["level-end"].set_volume(
-                        min(1.0, self.sound_volume * 1.2)
-                    )
-                    print("Som de fim de fase carregado com sucesso")
-            else:
-                print("Aviso: Arquivo sounds/level-end.mp3 não encontrado")
-
-            # Carregar som de game over
-            game_over_path = "sounds/game-over.mp3"
-            if os.path.exists(resource_path(game_over_path)):
-                sound = cache.get_sound(game_over_path)
-                if sound:
-                    self.sound_effects["game-over"] = sound
-                    # manter volume padrão
-                    self.sound_effects["game-over"].set_volume(
-                        self.sound_volume
-                    )
-                    print("Som de game over carregado com sucesso")
-            else:
-                print("Aviso: Arquivo sounds/game-over.mp3 não encontrado")
-
-            # Carregar som de acerto em pássaro
-            bird_hit_path = "sounds/bird-hit.mp3"
-            if os.path.exists(resource_path(bird_hit_path)):
-                sound = cache.get_sound(bird_hit_path)
-                if sound:
-                    self.sound_effects["bird-hit"] = sound
-                    # ligeiramente mais alto para destacar o impacto
-                    self.sound_effects["bird-hit"].set_volume(
-                        min(1.0, self.sound_volume * 1.2)
-                    )
-                    print("Som de bird-hit carregado com sucesso")
-            else:
-                print("Aviso: Arquivo sounds/bird-hit.mp3 não encontrado")
-
-            # Carregar som de acerto em gota de chuva
-            water_hit_path = "sounds/water-hit.mp3"
-            if os.path.exists(resource_path(water_hit_path)):
-                sound = cache.get_sound(water_hit_path)
-                if sound:
-                    self.sound_effects["water-hit"] = sound
-                    # um pouco mais alto para destacar o estouro da gota
-                    self.sound_effects["water-hit"].set_volume(
-                        min(1.0, self.sound_volume * 1.2)
-                    )
-                    print("Som de water-hit carregado com sucesso")
-            else:
-                print("Aviso: Arquivo sounds/water-hit.mp3 não encontrado")
-
-            # Carregar som de jogador atingido
-            player_hit_path = "sounds/player-hit.mp3"
-            if os.path.exists(resource_path(player_hit_path)):
-                sound = cache.get_sound(player_hit_path)
-                if sound:
-                    self.sound_effects["player-hit"] = sound
-                    # manter volume padrão
-                    self.sound_effects["player-hit"].set_volume(
-                        self.sound_volume
-                    )
-                    print("Som de player-hit carregado com sucesso")
-            else:
-                print("Aviso: Arquivo sounds/player-hit.mp3 não encontrado")
-
-            # Carregar som de choque elétrico
-            shock_path = "sounds/shock.mp3"
-            if os.path.exists(resource_path(shock_path)):
-                sound = cache.get_sound(shock_path)
-                if sound:
-                    self.sound_effects["shock"] = sound
-                    self.sound_effects["shock"].set_volume(
-                        min(1.0, self.sound_volume * 1.1)
-                    )
-                    print("Som de choque carregado com sucesso")
-            else:
-                print("Aviso: Arquivo sounds/shock.mp3 não encontrado")
-
+                    sound.set_volume(min(1.0, self.sound_volume * volume_scale))
+                    self.sound_effects[name] = sound
+                    print(f"Som de {label} carregado com sucesso")
+                    return sound
+            elif not fallback:
+                print(f"Aviso: Arquivo {path} não encontrado")
         except pygame.error as e:
             print(f"Erro ao carregar efeitos sonoros: {e}")
+        if fallback:
+            sound = self._load_effect(fallback)
+            if sound:
+                self.sound_effects[name] = sound
+                print(f"Som '{name}' não encontrado; usando fallback de '{fallback}'")
+                return sound
+        missing.add(name)
+        return None
 
     def play_sound_effect(self, sound_name):
         """Tocar um efeito sonoro específico"""
-        if sound_name in self.sound_effects:
+        sound = self.get(sound_name)
+        if sound is not None:
             try:
-                self.sound_effects[sound_name].play()
+                channels = getattr(self, "channels", None)
+                if channels is not None:
+                    channels.play(sound_name, sound)
+                else:
+                    sound.play()
             except pygame.error as e:
                 print(f"Erro ao tocar efeito sonoro {sound_name}: {e}")
         else:
@@ -1,5 +1,5 @@
 import os
-import io
+import struct
 import pygame
 from internal.utils.functions import resource_path
 from internal.engine.level.music import LevelMusic
@@ -80,31 +80,9 @@ class Music:
         full_music_path = resource_path(music_file)
 
         try:
-            try:
-                with open(full_music_path, "rb") as f:
-                    normal_bytes = f.read()
-            except Exception:
-                normal_bytes = None
-            try:
-                base, ext = os.path.splitext(music_file)
-                slow_file = f"{base}_slow{ext}"
-            except Exception:
-                slow_file = None
-            slow_path = resource_path(slow_file) if slow_file else None
-            try:
-                if slow_path and os.path.exists(slow_path):
-                    with open(slow_path, "rb") as f:
-                        slow_bytes = f.read()
-                else:
-                    slow_bytes = None
-            except Exception:
-                slow_bytes = None
-            game._music_cache = {
-                "normal_file": music_file,
-                "normal_bytes": normal_bytes,
-                "slow_file": slow_file,
-                "slow_bytes": slow_bytes,
-            }
+            # Preparar as variantes (normal e _slow) sem ler os arquivos:
+            # o mixer faz streaming direto do disco na troca de andamento.
+            game._music_cache = self._prepare_variants(music_file, full_music_path)
             volume = game.music_volumes.get(music_file, game.music_volume)
             self.play(game, music_file, full_music_path, volume)
 
@@ -112,6 +90,69 @@ class Music:
         except pygame.error as e:
             print(f"Erro ao carregar música {music_file}: {e}")
 
+    def _prepare_variants(self, music_file, full_music_path):
+        """Resolve caminhos e durações das variantes normal/lenta de uma faixa.
+
+        Apenas metadados são lidos (cabeçalho do MP3), nunca o arquivo inteiro.
+        """
+        try:
+            base, ext = os.path.splitext(music_file)
+            slow_file = f"{base}_slow{ext}"
+        except Exception:
+            slow_file = None
+        slow_path = resource_path(slow_file) if slow_file else None
+        if not (slow_path and os.path.exists(slow_path)):
+            slow_path = None
+        normal_length = estimate_mp3_length(full_music_path)
+        slow_length = estimate_mp3_length(slow_path) if slow_path else None
+        # Razão de duração lenta/normal para mapear a posição entre variantes
+        ratio = None
+        if normal_length and slow_length:
+            ratio = slow_length / normal_length
+        return {
+            "normal_file": music_file,
+            "normal_path": full_music_path,
+            "normal_length": normal_length,
+            "slow_file": slow_file,
+            "slow_path": slow_path,
+            "slow_length": slow_length,
+            "tempo_ratio": ratio,
+            "start_offset": 0.0,
+        }
+
+    def _current_position(self, game):
+        """Posição (em segundos) da variante tocando agora, ciente do loop."""
+        cache = getattr(game, "_music_cache", None)
+        if not isinstance(cache, dict):
+            return 0.0
+        try:
+            elapsed = max(0, pygame.mixer.music.get_pos()) / 1000.0
+        except Exception:
+            elapsed = 0.0
+        pos = float(cache.get("start_offset", 0.0)) + elapsed
+        length = cache.get("slow_length") if getattr(game, "_tempo_music_active", False) else cache.get("normal_length")
+        if length:
+            pos = pos % length
+        return pos
+
+    def _play_variant(self, game, music_file, path, volume, start=0.0):
+        """Troca para outra variante por streaming, retomando em ``start``."""
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.set_volume(volume)
+        try:
+            pygame.mixer.music.play(-1, start=start, fade_ms=400)
+        except (TypeError, pygame.error):
+            # Formato sem suporte a posicionamento: recomeçar do início
+            start = 0.0
+            try:
+                pygame.mixer.music.play(-1, fade_ms=400)
+            except TypeError:
+                pygame.mixer.music.play(-1)
+        cache = getattr(game, "_music_cache", None)
+        if isinstance(cache, dict):
+            cache["start_offset"] = start
+        game.current_music = music_file
+
     def play_music(self, music_type):
         """Tocar música especial (capture, credits, etc.)"""
         # Para músicas especiais, usar um volume padrão
@@ -159,6 +200,9 @@ class Music:
         pygame.mixer.music.set_volume(volume)
         pygame.mixer.music.play(-1)  # -1 para loop infinito
         game.current_music = music_file
+        cache = getattr(game, "_music_cache", None)
+        if isinstance(cache, dict):
+            cache["start_offset"] = 0.0
 
     def stop_music(self):
         """Parar qualquer música em execução (compatível com chamadas do jogo)."""
@@ -186,6 +230,8 @@ class Music:
 
     def enter_tempo_music(self, game):
         try:
+            # Posição da faixa normal antes de marcar o modo lento
+            position = self._current_position(game)
             game._tempo_music_active = True
             game._saved_level_music = getattr(game, "current_music", None)
             prev = getattr(game, "current_music", None)
@@ -193,109 +239,54 @@ class Music:
                 return
             base_vol = game.music_volumes.get(prev, game.music_volume)
             slow_vol = max(0.4, base_vol * 0.85)
+            cache = getattr(game, "_music_cache", None)
+            if not isinstance(cache, dict) or cache.get("normal_file") != prev:
+                cache = self._prepare_variants(prev, resource_path(prev))
+                game._music_cache = cache
             try:
-                slow_bytes = None
-                if hasattr(game, "_music_cache") and isinstance(getattr(game, "_music_cache", None), dict):
-                    slow_bytes = game._music_cache.get("slow_bytes")
-                    slow_file = game._music_cache.get("slow_file")
-                else:
-                    slow_file = None
+                pygame.mixer.music.fadeout(400)
             except Exception:
-                slow_bytes = None
-                slow_file = None
+                pass
             try:
-                pygame.mixer.music.fadeout(400)
+                if cache.get("slow_path"):
+                    # Retomar no ponto equivalente da variante lenta
+                    ratio = cache.get("tempo_ratio") or 1.0
+                    self._play_variant(game, cache["slow_file"], cache["slow_path"], slow_vol, position * ratio)
+                elif self.check_music_exists(prev):
+                    # Sem variante lenta: manter a faixa e só reduzir o volume
+                    self._play_variant(game, prev, resource_path(prev), slow_vol, position)
             except Exception:
                 pass
-            if slow_bytes:
-                try:
-                    pygame.mixer.music.load(io.BytesIO(slow_bytes))
-                    pygame.mixer.music.set_volume(slow_vol)
-                    try:
-                        pygame.mixer.music.play(-1, fade_ms=400)
-                    except TypeError:
-                        pygame.mixer.music.play(-1)
-                    if slow_file:
-                        game.current_music = slow_file
-                except Exception:
-                    pass
-            else:
-                try:
-                    base, ext = os.path.splitext(prev)
-                    slow_file2 = f"{base}_slow{ext}"
-                except Exception:
-                    slow_file2 = None
-                slow_full = self.check_music_exists(slow_file2) if slow_file2 else None
-                try:
-                    if slow_full:
-                        pygame.mixer.music.load(slow_full)
-                        pygame.mixer.music.set_volume(slow_vol)
-                        try:
-                            pygame.mixer.music.play(-1, fade_ms=400)
-                        except TypeError:
-                            pygame.mixer.music.play(-1)
-                        game.current_music = slow_file2
-                    else:
-                        full_prev = resource_path(prev)
-                        pygame.mixer.music.load(full_prev)
-                        pygame.mixer.music.set_volume(slow_vol)
-                        try:
-                            pygame.mixer.music.play(-1, fade_ms=400)
-                        except TypeError:
-                            pygame.mixer.music.play(-1)
-                except Exception:
-                    pass
         except Exception:
             pass
 
     def exit_tempo_music(self, game):
         try:
+            position = self._current_position(game)
             game._tempo_music_active = False
+            cache = getattr(game, "_music_cache", None)
             target = getattr(game, "_saved_level_music", None) or getattr(game, "current_music", None)
+            if isinstance(cache, dict) and cache.get("normal_file"):
+                target = cache["normal_file"]
+                if game.current_music == cache.get("slow_file"):
+                    ratio = cache.get("tempo_ratio") or 1.0
+                    position = position / ratio
             if not target:
                 return
             vol = game.music_volumes.get(target, game.music_volume)
             try:
-                normal_bytes = None
-                normal_file = None
-                if hasattr(game, "_music_cache") and isinstance(getattr(game, "_music_cache", None), dict):
-                    normal_bytes = game._music_cache.get("normal_bytes")
-                    normal_file = game._music_cache.get("normal_file")
+                pygame.mixer.music.fadeout(400)
             except Exception:
-                normal_bytes = None
-                normal_file = None
+                pass
             try:
-                pygame.mixer.music.fadeout(400)
+                if not self.check_music_exists(target):
+                    return
+                self._play_variant(game, target, resource_path(target), vol, position)
             except Exception:
                 pass
-            if normal_bytes:
-                try:
-                    pygame.mixer.music.load(io.BytesIO(normal_bytes))
-                    pygame.mixer.music.set_volume(vol)
-                    try:
-                        pygame.mixer.music.play(-1, fade_ms=400)
-                    except TypeError:
-                        pygame.mixer.music.play(-1)
-                    if normal_file:
-                        game.current_music = normal_file
-                except Exception:
-                    pass
-            else:
-                try:
-                    if not self.check_music_exists(target):
-                        return
-                    full_music_path = resource_path(target)
-                    pygame.mixer.music.load(full_music_path)
-                    pygame.mixer.music.set_volume(vol)
-                    try:
-                        pygame.mixer.music.play(-1, fade_ms=400)
-                    except TypeError:
-                        pygame.mixer.music.play(-1)
-                    game.current_music = target
-                except Exception:
-                    pass
         except Exception:
             pass
+
     def exit_invincibility_music(self, game):
         """Restaurar música do nível ao terminar invencibilidade."""
         try:
@@ -306,3 +297,86 @@ class Music:
                 self.play(game, prev, full_music_path, volume)
         except Exception:
             pass
+
+
+# Tabelas de bitrate (kbps) do MPEG Layer III: MPEG-1 e MPEG-2/2.5
+_MP3_BITRATES = {
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+
+
+def estimate_mp3_length(path):
+    """Estima a duração (s) de um MP3 lendo apenas os cabeçalhos.
+
+    Usa o cabeçalho Xing/Info quando presente; caso contrário percorre os
+    cabeçalhos dos frames com seek (sem carregar o áudio em memória).
+    Retorna None se não for possível determinar.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(10)
+            start = 0
+            if head[:3] == b"ID3" and len(head) == 10:
+                sz = head[6:10]
+                start = 10 + ((sz[0] & 0x7F) << 21 | (sz[1] & 0x7F) << 14 | (sz[2] & 0x7F) << 7 | (sz[3] & 0x7F))
+            f.seek(start)
+            data = f.read(4096)
+            first = _find_mp3_frame(data)
+            if first is None:
+                return None
+            i, version, _bitrate, sample_rate, _frame_len = first
+            samples_per_frame = 1152 if version == 3 else 576
+            for tag in (b"Xing", b"Info"):
+                pos = data.find(tag, i, i + 200)
+                if pos != -1 and pos + 12 <= len(data):
+                    flags = struct.unpack(">I", data[pos + 4:pos + 8])[0]
+                    if flags & 0x01:
+                        frames = struct.unpack(">I", data[pos + 8:pos + 12])[0]
+                        if frames > 0:
+                            return frames * samples_per_frame / float(sample_rate)
+            # Sem Xing: contar frames saltando de cabeçalho em cabeçalho
+            offset = start + i
+            frames = 0
+            while True:
+                f.seek(offset)
+                header = f.read(4)
+                info = _find_mp3_frame(header) if len(header) == 4 else None
+                if info is None or info[0] != 0:
+                    break
+                frames += 1
+                offset += info[4]
+            if frames == 0:
+                return None
+            return frames * samples_per_frame / float(sample_rate)
+    except Exception:
+        pass
+    return None
+
+
+def _find_mp3_frame(data):
+    """Localiza o primeiro cabeçalho MPEG Layer III válido em ``data``.
+
+    Retorna (índice, versão, bitrate, sample_rate, tamanho_do_frame) ou None.
+    """
+    for i in range(len(data) - 3):
+        if data[i] != 0xFF or (data[i + 1] & 0xE0) != 0xE0:
+            continue
+        version = (data[i + 1] >> 3) & 0x03
+        layer = (data[i + 1] >> 1) & 0x03
+        bitrate_idx = data[i + 2] >> 4
+        sr_idx = (data[i + 2] >> 2) & 0x03
+        padding = (data[i + 2] >> 1) & 0x01
+        if version == 1 or layer != 1 or sr_idx == 3 or bitrate_idx in (0, 15):
+            continue
+        sample_rate = _MP3_SAMPLE_RATES[version][sr_idx]
+        bitrate = _MP3_BITRATES[3 if version == 3 else 2][bitrate_idx] * 1000
+        coef = 144 if version == 3 else 72
+        frame_len = coef * bitrate // sample_rate + padding
+        return i, version, bitrate, sample_rate, frame_len
+    return None
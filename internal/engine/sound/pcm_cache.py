@@ -0,0 +1,116 @@
+import os
+import struct
+import sys
+
+import pygame
+
+
+def _get_cache_dir():
+    """Resolve diretório do cache de áudio decodificado.
+
+    - Em executável único (PyInstaller): dentro do diretório de dados do
+      usuário, ao lado de saves/records.
+    - Em desenvolvimento: ``saves/sound_cache`` no cwd, como os saves.
+    """
+    try:
+        if getattr(sys, "frozen", False):
+            appdata = os.environ.get("APPDATA")
+            if appdata:
+                base = os.path.join(appdata, "platform-game", "saves")
+            else:
+                base = os.path.join(os.path.expanduser("~"), ".platform-game", "saves")
+            return os.path.join(base, "sound_cache")
+        return os.path.join(os.getcwd(), "saves", "sound_cache")
+    except Exception:
+        return os.path.join(os.path.expanduser("~"), ".platform-game", "saves", "sound_cache")
+
+
+class PCMCache:
+    """Cache em disco dos efeitos sonoros já decodificados (PCM cru).
+
+    Decodificar MP3 é o custo dominante ao carregar um efeito. Na primeira
+    vez que um arquivo é decodificado, as amostras (``Sound.get_raw``) são
+    gravadas em ``<nome>.pcm``; nas execuções seguintes o som é montado
+    direto desse buffer (``Sound(buffer=...)``), sem passar pelo decoder.
+
+    O cabeçalho guarda o formato do mixer (frequência, tamanho da amostra,
+    canais) e o tamanho e horário de modificação do arquivo original: se
+    qualquer um mudar, o PCM é descartado e gerado de novo.
+    """
+
+    _instance = None
+
+    MAGIC = b"PCM2"
+    HEADER = struct.Struct("<4siiiqq")
+    # Mesma folga do bake de imagens (zip guarda horários em passos de 2 s)
+    MTIME_SLACK = 2
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(PCMCache, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
+        self.cache_dir = _get_cache_dir()
+        self.hits = 0
+        self.writes = 0
+
+    def cache_file(self, path):
+        """Arquivo ``.pcm`` correspondente a ``path`` (ex.: sounds/jump.mp3)."""
+        stem = os.path.splitext(path.replace("\\", "/"))[0].replace("/", "_")
+        return os.path.join(self.cache_dir, f"{stem}.pcm")
+
+    def _header_fields(self, source):
+        mixer = pygame.mixer.get_init()
+        if not mixer:
+            return None
+        freq, size, channels = mixer
+        stat = os.stat(source)
+        return (self.MAGIC, freq, size, channels, stat.st_size, int(stat.st_mtime))
+
+    def _is_current(self, header, fields):
+        """Cabeçalho gravado confere com o mixer e o original atuais?"""
+        try:
+            stored = self.HEADER.unpack(header)
+        except struct.error:
+            return False
+        return stored[:5] == fields[:5] and abs(stored[5] - fields[5]) <= self.MTIME_SLACK
+
+    def load(self, path, source):
+        """``Sound`` montado do PCM em cache, ou None se ausente/desatualizado."""
+        try:
+            fields = self._header_fields(source)
+            if fields is None:
+                return None
+            with open(self.cache_file(path), "rb") as f:
+                if not self._is_current(f.read(self.HEADER.size), fields):
+                    return None
+                sound = pygame.mixer.Sound(buffer=f.read())
+        except (OSError, pygame.error, ValueError, TypeError):
+            return None
+        self.hits += 1
+        return sound
+
+    def store(self, path, source, sound):
+        """Grava as amostras de ``sound``; escrita atômica (tmp + rename)."""
+        try:
+            fields = self._header_fields(source)
+            if fields is None:
+                return False
+            header = self.HEADER.pack(*fields)
+            raw = sound.get_raw()
+            os.makedirs(self.cache_dir, exist_ok=True)
+            target = self.cache_file(path)
+            tmp = target + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(header)
+                f.write(raw)
+            os.replace(tmp, target)
+        except Exception:
+            return False
+        self.writes += 1
+        return True
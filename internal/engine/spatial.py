@@ -0,0 +1,76 @@
+from internal.utils.constants import WIDTH
+
+
+class ChunkIndex:
+    """Índice espacial em colunas do mundo (uma coluna = largura da tela).
+
+    Objetos estáticos são inseridos uma vez com sua extensão horizontal;
+    objetos móveis usam ``update``, que só troca de balde quando a extensão
+    cruza uma fronteira de coluna. ``query`` devolve apenas os objetos dos
+    baldes que cobrem o intervalo pedido, na ordem de inserção (mantém a
+    ordem de desenho).
+    """
+
+    def __init__(self, chunk_width=WIDTH):
+        self.chunk_width = max(1, int(chunk_width))
+        self._buckets = {}
+        self._entries = {}
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        self._buckets.clear()
+        self._entries.clear()
+        self._seq = 0
+
+    def _columns(self, left, right):
+        cw = self.chunk_width
+        return int(left) // cw, int(right) // cw
+
+    def insert(self, obj, left, right):
+        """Registra ``obj`` ocupando o intervalo [left, right] do mundo."""
+        key = id(obj)
+        if key in self._entries:
+            self.remove(obj)
+        c0, c1 = self._columns(left, right)
+        entry = (self._seq, obj)
+        self._seq += 1
+        for col in range(c0, c1 + 1):
+            self._buckets.setdefault(col, []).append(entry)
+        self._entries[key] = (c0, c1, entry)
+
+    def update(self, obj, left, right):
+        """Atualiza a extensão de um objeto móvel (barato se não mudar de coluna)."""
+        current = self._entries.get(id(obj))
+        if current is not None and (current[0], current[1]) == self._columns(left, right):
+            return
+        self.insert(obj, left, right)
+
+    def remove(self, obj):
+        current = self._entries.pop(id(obj), None)
+        if current is None:
+            return
+        c0, c1, entry = current
+        for col in range(c0, c1 + 1):
+            bucket = self._buckets.get(col)
+            if bucket is None:
+                continue
+            try:
+                bucket.remove(entry)
+            except ValueError:
+                pass
+            if not bucket:
+                del self._buckets[col]
+
+    def query(self, left, right):
+        """Objetos cujos baldes cobrem [left, right], em ordem de inserção."""
+        c0, c1 = self._columns(left, right)
+        if c0 == c1:
+            return [obj for _, obj in self._buckets.get(c0, ())]
+        found = {}
+        for col in range(c0, c1 + 1):
+            for entry in self._buckets.get(col, ()):
+                found[entry[0]] = entry[1]
+        return [found[seq] for seq in sorted(found)]
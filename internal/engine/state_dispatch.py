@@ -0,0 +1,98 @@
+import time
+
+import pygame
+
+from internal.engine.state import GameState
+
+
+# Tipos de evento que nenhum estado lê da fila: bloqueados para não
+# acumular (o analógico e o teclado são amostrados direto do dispositivo,
+# cujo estado o SDL atualiza mesmo com o evento bloqueado)
+UNUSED_EVENT_NAMES = (
+    "KEYUP",
+    "MOUSEMOTION",
+    "MOUSEBUTTONDOWN",
+    "MOUSEBUTTONUP",
+    "MOUSEWHEEL",
+    "JOYAXISMOTION",
+    "JOYBALLMOTION",
+    "JOYHATMOTION",
+    "JOYBUTTONUP",
+    "FINGERMOTION",
+    "FINGERDOWN",
+    "FINGERUP",
+    "TEXTEDITING",
+    "TEXTINPUT",
+)
+
+# Estados que precisam de algum desses tipos (TEXTINPUT preenche o unicode
+# do KEYDOWN ao digitar o nome no ranking)
+EXTRA_EVENT_NAMES = {
+    GameState.ENTER_NAME: ("TEXTINPUT",),
+}
+
+
+def _event_types(names):
+    return [getattr(pygame, name) for name in names if hasattr(pygame, name)]
+
+
+def apply_event_filter(state):
+    """Restringe a fila do pygame aos tipos de evento usados em ``state``."""
+    extras = EXTRA_EVENT_NAMES.get(state, ())
+    blocked = _event_types(name for name in UNUSED_EVENT_NAMES if name not in extras)
+    allowed = _event_types(extras)
+    if blocked:
+        pygame.event.set_blocked(blocked)
+    if allowed:
+        pygame.event.set_allowed(allowed)
+
+
+class StateDispatch:
+    """Tabela de handlers por ``GameState`` com custo acumulado por estado.
+
+    Substitui cadeias ``if/elif game.state == ...``: cada estado registra
+    seu handler e ``dispatch`` faz uma única busca no dicionário. O tempo
+    de cada chamada é somado por estado para comparar o custo entre eles.
+    """
+
+    def __init__(self, name=""):
+        self.name = name
+        self._handlers = {}
+        self.timings = {}
+
+    def register(self, state, handler):
+        self._handlers[state] = handler
+
+    def register_many(self, states, handler):
+        for state in states:
+            self._handlers[state] = handler
+
+    def get(self, state):
+        return self._handlers.get(state)
+
+    def __contains__(self, state):
+        return state in self._handlers
+
+    def dispatch(self, state, *args):
+        """Chama o handler de ``state``; retorna o resultado (None se não houver)."""
+        handler = self._handlers.get(state)
+        if handler is None:
+            return None
+        start = time.perf_counter()
+        try:
+            return handler(*args)
+        finally:
+            entry = self.timings.get(state)
+            if entry is None:
+                entry = self.timings[state] = [0, 0.0]
+            entry[0] += 1
+            entry[1] += (time.perf_counter() - start) * 1000.0
+
+    def get_stats(self):
+        """Lista (estado, chamadas, ms médio, ms total), do mais caro ao mais barato."""
+        stats = []
+        for state, (calls, total) in self.timings.items():
+            name = getattr(state, "name", state)
+            stats.append((name, calls, total / calls if calls else 0.0, total))
+        stats.sort(key=lambda item: item[3], reverse=True)
+        return stats
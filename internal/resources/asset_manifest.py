@@ -0,0 +1,163 @@
+"""Manifestos de recursos por mundo.
+
+Cada mundo (faixa de 10 fases, mais a fase final do boss) declara os
+grupos de imagens e os sons de que precisa. ``Image.load_world`` e
+``SoundEffects.load_world`` usam estas tabelas para carregar o conjunto do
+mundo atual e liberar do ``ResourceCache`` o que ficou para trás ao trocar
+de mundo.
+"""
+
+# Mundo -> (primeira fase, última fase)
+WORLDS = {
+    1: (1, 10),
+    2: (11, 20),
+    3: (21, 30),
+    4: (31, 40),
+    5: (41, 50),
+    6: (51, 51),
+}
+
+# Grupo -> arquivos de imagem do grupo (usados para liberar o cache)
+IMAGE_GROUPS = {
+    "birds": [
+        "imagens/inimigos/bird1.png",
+        "imagens/inimigos/bird2.png",
+    ],
+    "bats": [
+        "imagens/inimigos/bat1.png",
+        "imagens/inimigos/bat2.png",
+        "imagens/inimigos/bat3.png",
+    ],
+    "airplanes": [
+        "imagens/inimigos/airplane1.png",
+        "imagens/inimigos/airplane2.png",
+        "imagens/inimigos/airplane3.png",
+    ],
+    "disks": [
+        "imagens/inimigos/disk1.png",
+        "imagens/inimigos/disk2.png",
+        "imagens/inimigos/disk3.png",
+    ],
+    "shooting_star": ["imagens/elementos/estrelaCadente.png"],
+    "meteor": ["imagens/elementos/meteoro.png"],
+    "turtles": [
+        f"imagens/inimigos/turtle-{side}{i}.png"
+        for side in ("left", "right")
+        for i in range(1, 4)
+    ],
+    "spiders": [f"imagens/inimigos/spider{i}.png" for i in range(1, 4)],
+    "robots": [
+        f"imagens/inimigos/robot-{kind}{side}{i}.png"
+        for kind in ("", "shot-")
+        for side in ("left", "right")
+        for i in range(1, 4)
+    ]
+    + [
+        "imagens/elementos/missil-right.png",
+        "imagens/elementos/missil-left.png",
+    ],
+    "aliens": [
+        f"imagens/inimigos/alien-{side}{i}.png"
+        for side in ("left", "right")
+        for i in range(1, 6)
+    ]
+    + [f"imagens/inimigos/alien-shot-left{i}.png" for i in range(1, 4)],
+    "boss": [f"imagens/boss/alien{i}.png" for i in range(1, 5)]
+    + [f"imagens/boss/alienJ{i}.png" for i in range(1, 5)]
+    + ["imagens/boss/alienStop.png"],
+    "fire": ["imagens/inimigos/fogo.png"],
+    "raindrop": ["imagens/elementos/chuva.png"],
+    "lava": ["imagens/elementos/lava.png"],
+    "lightning": [
+        "imagens/elementos/gerador.png",
+        "imagens/elementos/raioHorizontal.png",
+        "imagens/elementos/raioVertical.png",
+    ],
+}
+
+# Grupo -> atributos de ``Image`` zerados quando o grupo é descarregado
+GROUP_ATTRS = {
+    "birds": ["bird_img1", "bird_img2"],
+    "bats": ["bat_img1", "bat_img2", "bat_img3"],
+    "airplanes": ["airplane_img1", "airplane_img2", "airplane_img3"],
+    "disks": ["disk_img1", "disk_img2", "disk_img3", "flying_disk_images"],
+    "shooting_star": ["shooting_star_img"],
+    "meteor": ["meteor_img"],
+    "turtles": [
+        "turtle_left1", "turtle_left2", "turtle_left3",
+        "turtle_right1", "turtle_right2", "turtle_right3",
+        "turtle_images",
+    ],
+    "spiders": ["spider_img1", "spider_img2", "spider_img3", "spider_images"],
+    "robots": [
+        "robot_right1", "robot_right2", "robot_right3",
+        "robot_left1", "robot_left2", "robot_left3",
+        "robot_shot_right1", "robot_shot_right2", "robot_shot_right3",
+        "robot_shot_left1", "robot_shot_left2", "robot_shot_left3",
+        "robot_images",
+        "missile_right", "missile_left", "missile_images",
+    ],
+    "aliens": [
+        "alien_left1", "alien_left2", "alien_left3", "alien_left4", "alien_left5",
+        "alien_right1", "alien_right2", "alien_right3", "alien_right4", "alien_right5",
+        "alien_shot_left1", "alien_shot_left2", "alien_shot_left3",
+        "alien_images",
+    ],
+    "boss": [
+        "boss_alien_run1", "boss_alien_run2", "boss_alien_run3", "boss_alien_run4",
+        "boss_alien_jump1", "boss_alien_jump2", "boss_alien_jump3", "boss_alien_jump4",
+        "boss_alien_stop", "boss_alien_images",
+    ],
+    "fire": ["fire_image"],
+    "raindrop": ["raindrop_img"],
+    "lava": ["lava_drop_img"],
+    "lightning": ["generator_img", "lightning_h_img", "lightning_v_img"],
+}
+
+# Mundo -> grupos de imagens e sons exclusivos do mundo: só o que as fases
+# do mundo realmente criam (Image.__getattr__ carrega um grupo fora do
+# manifesto sob demanda). Sons e imagens comuns (tiro, explosão,
+# power-ups, texturas) ficam sempre carregados.
+WORLD_MANIFESTS = {
+    1: {
+        "images": ["birds", "raindrop"],
+        "sounds": ["sounds/water-hit.mp3"],
+    },
+    2: {
+        "images": ["birds", "turtles", "bats", "shooting_star"],
+        "sounds": [],
+    },
+    3: {
+        "images": ["spiders", "bats", "shooting_star", "lava"],
+        "sounds": [],
+    },
+    4: {
+        "images": ["robots", "airplanes", "lightning"],
+        "sounds": ["sounds/shock.mp3"],
+    },
+    5: {
+        "images": ["aliens", "disks", "meteor"],
+        "sounds": [],
+    },
+    6: {
+        "images": ["fire", "boss"],
+        "sounds": [],
+    },
+}
+
+
+def world_for_level(level):
+    """Mundo que contém ``level`` (fases fora das faixas caem no mais próximo)."""
+    try:
+        level = int(level)
+    except (TypeError, ValueError):
+        return 1
+    for world, (first, last) in WORLDS.items():
+        if first <= level <= last:
+            return world
+    return 1 if level < WORLDS[1][0] else max(WORLDS)
+
+
+def manifest_for_level(level):
+    """Manifesto (dict com ``images`` e ``sounds``) do mundo de ``level``."""
+    return WORLD_MANIFESTS[world_for_level(level)]
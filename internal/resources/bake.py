@@ -0,0 +1,152 @@
+"""Bake de imagens: cada pedido ``get_image(caminho, escala)`` vira um arquivo
+já no tamanho final, num formato de decodificação rápida.
+
+Os originais chegam a 1536x1024 em PNG; decodificar e reduzir isso na
+inicialização custa dezenas de milissegundos por fundo. O bake roda o jogo
+sem janela, registra as escalas que o código realmente pede ao
+``ResourceCache`` e grava em ``imagens_baked/``:
+
+- imagens opacas e grandes em JPEG (pequeno no pacote, decodifica rápido);
+- o resto em BMP 32 bits, que mantém o alfa e carrega quase sem custo.
+
+``manifest.json`` liga ``caminho@LxA`` ao arquivo gerado e lista em
+``covered`` os originais que o pacote pode deixar de fora (todo pedido
+deles tem versão assada e nenhum código os carrega direto do disco).
+"""
+
+import json
+import os
+import re
+import shutil
+
+import pygame
+
+BAKED_DIR = "imagens_baked"
+MANIFEST_FILE = "manifest.json"
+
+# Opacas a partir desta área vão para JPEG; abaixo disso o BMP já é pequeno
+JPEG_MIN_AREA = 64 * 64
+
+# Módulos que carregam imagens com pygame.image.load, fora do cache
+_DIRECT_LOAD = re.compile(r"pygame\.image\.load")
+_IMAGE_LITERAL = re.compile(r"[\"'](imagens/[^\"'{}]*)")
+
+
+def baked_file(path, scale, ext):
+    """Caminho relativo do arquivo assado de ``path`` em ``scale``."""
+    stem = os.path.splitext(path)[0]
+    if stem.startswith("imagens/"):
+        stem = stem[len("imagens/"):]
+    return f"{BAKED_DIR}/{stem}@{scale[0]}x{scale[1]}.{ext}"
+
+
+def is_opaque(surface):
+    """True se nenhum pixel de ``surface`` tem transparência."""
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return surface.get_colorkey() is None
+    width, height = surface.get_size()
+    return pygame.mask.from_surface(surface, 254).count() == width * height
+
+
+def choose_format(surface):
+    """``jpg`` para opacas grandes, ``bmp`` (com alfa) para o resto."""
+    width, height = surface.get_size()
+    if width * height >= JPEG_MIN_AREA and is_opaque(surface):
+        return "jpg"
+    return "bmp"
+
+
+def collect_requests(game, levels=range(1, 52)):
+    """Percorre título, menu e todas as fases; retorna os pedidos do cache.
+
+    O resultado é ``{caminho: {escala ou None}}``, exatamente o que o código
+    pediu ao ``ResourceCache`` durante o percurso.
+    """
+    from internal.engine.level.level import Level
+    from internal.engine.title import TitleScreen
+    from internal.resources.cache import ResourceCache
+
+    cache = ResourceCache()
+    try:
+        TitleScreen.show(game)
+    except Exception:
+        pass
+    for level in levels:
+        game.current_level = level
+        try:
+            Level.init_level(game)
+        except Exception:
+            pass
+    return {path: set(scales) for path, scales in cache.image_requests.items()}
+
+
+def direct_load_paths(source_root="internal"):
+    """Prefixos ``imagens/...`` citados em módulos que usam ``pygame.image.load``.
+
+    Esses arquivos (ou pastas, ex. ``imagens/final``) são lidos sem passar
+    pelo cache e precisam continuar no pacote. ``image.py`` fica de fora:
+    lá o ``pygame.image.load`` só recebe caminhos passados por quem chama.
+    """
+    protected = set()
+    for folder, _dirs, files in os.walk(source_root):
+        for name in files:
+            if not name.endswith(".py") or name in ("cache.py", "image.py", "bake.py"):
+                continue
+            try:
+                with open(os.path.join(folder, name), "r", encoding="utf-8") as f:
+                    text = f.read()
+            except OSError:
+                continue
+            if not _DIRECT_LOAD.search(text):
+                continue
+            protected.update(literal.rstrip("/") for literal in _IMAGE_LITERAL.findall(text))
+    return protected
+
+
+def bake(requests, root=".", protected=()):
+    """Grava as versões pré-escaladas de ``requests`` e o manifesto.
+
+    Retorna o manifesto gravado. Só pedidos com escala são assados: sem
+    escala o original já é o tamanho final.
+    """
+    out_dir = os.path.join(root, BAKED_DIR)
+    # Saída sempre regenerada: nada de variantes órfãs de pedidos antigos
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.makedirs(out_dir, exist_ok=True)
+    images = {}
+    for path in sorted(requests):
+        scales = sorted(s for s in requests[path] if s)
+        if not scales:
+            continue
+        source = os.path.join(root, path)
+        try:
+            original = pygame.image.load(source)
+        except (pygame.error, FileNotFoundError):
+            continue
+        source_stat = os.stat(source)
+        for scale in scales:
+            image = pygame.transform.scale(original.convert_alpha(), scale)
+            ext = choose_format(image)
+            rel = baked_file(path, scale, ext)
+            target = os.path.join(root, rel)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            pygame.image.save(image if ext == "bmp" else image.convert(), target)
+            images[f"{path}@{scale[0]}x{scale[1]}"] = {
+                "file": rel,
+                "alpha": ext == "bmp",
+                "source_size": source_stat.st_size,
+                "source_mtime": int(source_stat.st_mtime),
+            }
+
+    baked_sources = {key.split("@", 1)[0] for key in images}
+    covered = sorted(
+        path
+        for path in baked_sources
+        if None not in requests[path]
+        and not any(path == p or path.startswith(p + "/") for p in protected)
+    )
+    manifest = {"images": images, "covered": covered}
+    with open(os.path.join(out_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+    return manifest
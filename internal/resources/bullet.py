@@ -1,5 +1,6 @@
 import pygame
 from internal.utils.constants import *
+from internal.engine.particles import glow_sprite
 
 
 class Bullet:
@@ -13,6 +14,8 @@ class Bullet:
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
         self.image = image
         self.is_super = False
+        # Marcada em colisão; sai da lista no sweep do quadro
+        self.removed = False
 
     def update(self):
         """Atualizar posição do tiro"""
@@ -22,6 +25,16 @@ class Bullet:
         # Manter tiro ativo (remoção será feita no método update do Player)
         return True
 
+    def sprite_image(self):
+        """Imagem para desenho em lote; None sem imagem."""
+        return self.image
+
+    def glow_particle(self):
+        """Brilho do super tiro: ``(superfície, dx, dy)`` pré-renderizado, ou None."""
+        if not getattr(self, "is_super", False):
+            return None
+        return glow_sprite(self.width, self.height)
+
     def draw(self, screen):
         """Desenhar o tiro"""
         if self.image:
@@ -30,15 +43,7 @@ class Bullet:
             pygame.draw.rect(screen, YELLOW, self.rect)
         if getattr(self, "is_super", False):
             try:
-                glow_w = max(10, int(self.width * 1.2))
-                glow_h = max(8, int(self.height * 1.5))
-                overlay = pygame.Surface((glow_w, glow_h), pygame.SRCALPHA)
-                cx = glow_w // 2
-                cy = glow_h // 2
-                pygame.draw.circle(overlay, (0, 255, 255, 110), (cx, cy), max(3, int(glow_h * 0.3)))
-                pygame.draw.circle(overlay, (135, 206, 235, 90), (cx, cy), max(5, int(glow_h * 0.45)))
-                ox = - (glow_w - self.width) // 2
-                oy = - (glow_h - self.height) // 2
-                screen.blit(overlay, (int(self.x + ox), int(self.y + oy)))
+                glow, ox, oy = self.glow_particle()
+                screen.blit(glow, (int(self.x + ox), int(self.y + oy)))
             except Exception:
                 pass
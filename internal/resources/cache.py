@@ -1,4 +1,9 @@
+import json
+import os
+import weakref
+
 import pygame
+from internal.engine.sound.pcm_cache import PCMCache
 from internal.utils.functions import resource_path
 
 
@@ -20,8 +25,17 @@ class ResourceCache:
         self.image_cache = {}
         self.sound_cache = {}
         self.music_cache = {}
+        # Máscaras de colisão por superfície (um quadro de animação = uma
+        # máscara); referência fraca para não reter quadros descartados
+        self.mask_cache = weakref.WeakKeyDictionary()
         self.cache_hits = 0
         self.cache_misses = 0
+        # Perfil de desempenho leve: ver _load_fast_texture
+        self.fast_textures = False
+        # Escalas pedidas por caminho (None = sem escala); lidas pelo bake
+        self.image_requests = {}
+        # Manifesto das imagens pré-escaladas (carregado sob demanda)
+        self._baked = None
 
     def get_image(self, path, scale=None):
         """Carrega uma imagem do cache ou do disco"""
@@ -31,10 +45,23 @@ class ResourceCache:
             self.cache_hits += 1
             return self.image_cache[cache_key]
 
+        self.image_requests.setdefault(path, set()).add(tuple(scale) if scale else None)
+        if scale:
+            image = self._load_baked(path, scale)
+            if image is not None:
+                self.image_cache[cache_key] = image
+                self.cache_misses += 1
+                return image
+
         try:
             # Carregar imagem do disco usando caminho correto
             full_path = resource_path(path)
             image = pygame.image.load(full_path)
+            if scale and self.fast_textures:
+                image = self._load_fast_texture(image, scale)
+                self.image_cache[cache_key] = image
+                self.cache_misses += 1
+                return image
             # Converter para formato otimizado de exibição (com alpha)
             try:
                 image = image.convert_alpha()
@@ -62,6 +89,98 @@ class ResourceCache:
             print(f"Erro ao carregar imagem {path}: {e}")
             return None
 
+    def baked_manifest(self):
+        """Manifesto de ``imagens_baked`` (``{}`` se o bake não foi rodado)."""
+        if self._baked is None:
+            from internal.resources.bake import BAKED_DIR, MANIFEST_FILE
+            try:
+                with open(resource_path(os.path.join(BAKED_DIR, MANIFEST_FILE)), "r", encoding="utf-8") as f:
+                    self._baked = json.load(f).get("images", {})
+            except (OSError, ValueError, AttributeError):
+                self._baked = {}
+        return self._baked
+
+    def _load_baked(self, path, scale):
+        """Versão pré-escalada de ``path`` em ``scale``, se houver uma válida.
+
+        A versão assada já está no tamanho final e num formato de decodificação
+        rápida: não passa por ``transform.scale``. É ignorada quando o original
+        mudou em disco depois do bake (tamanho ou mtime).
+        """
+        manifest = self.baked_manifest()
+        if not manifest:
+            return None
+        entry = manifest.get(f"{path}@{scale[0]}x{scale[1]}")
+        source = resource_path(path)
+        source_exists = os.path.exists(source)
+        rescale = False
+        if not entry and not source_exists:
+            # Pacote sem o original e escala não vista no bake: parte da
+            # maior variante assada
+            entry = self._largest_baked(path)
+            rescale = True
+        if not entry:
+            return None
+        try:
+            if source_exists and self._baked_is_stale(source, entry):
+                return None
+            image = pygame.image.load(resource_path(entry["file"]))
+        except (pygame.error, OSError, KeyError, TypeError):
+            return None
+        if rescale:
+            image = pygame.transform.scale(image, scale)
+        try:
+            if entry.get("alpha", True):
+                image = image.convert_alpha()
+            else:
+                image = image.convert()
+        except Exception:
+            pass
+        return image
+
+    # Folga na comparação de mtime: zip (APK) guarda horários com 2 s de resolução
+    BAKED_MTIME_SLACK = 2
+
+    def _baked_is_stale(self, source, entry):
+        """Original mudou depois do bake (tamanho ou horário de modificação)?"""
+        stat = os.stat(source)
+        if stat.st_size != entry.get("source_size"):
+            return True
+        mtime = entry.get("source_mtime")
+        return mtime is None or abs(stat.st_mtime - mtime) > self.BAKED_MTIME_SLACK
+
+    def _largest_baked(self, path):
+        prefix = f"{path}@"
+        best, best_area = None, -1
+        for key, entry in self.baked_manifest().items():
+            if not key.startswith(prefix):
+                continue
+            try:
+                width, height = (int(v) for v in key[len(prefix):].split("x"))
+            except ValueError:
+                continue
+            if width * height > best_area:
+                best, best_area = entry, width * height
+        return best
+
+    @staticmethod
+    def _load_fast_texture(image, scale):
+        """Reduz ao tamanho final antes de converter (perfil leve).
+
+        Evita a cópia convertida em resolução cheia (os originais chegam a
+        1536x1024) e converte sem alfa as texturas totalmente opacas, que
+        são copiadas mais rápido a cada quadro.
+        """
+        image = pygame.transform.scale(image, scale)
+        try:
+            if image.get_flags() & pygame.SRCALPHA:
+                opaque = pygame.mask.from_surface(image, 254).count() == image.get_width() * image.get_height()
+            else:
+                opaque = True
+            return image.convert() if opaque else image.convert_alpha()
+        except Exception:
+            return image
+
     def get_sound(self, path):
         """Carrega um som do cache ou do disco"""
         if path in self.sound_cache:
@@ -71,7 +190,12 @@ class ResourceCache:
         try:
             # Carregar som usando caminho correto
             full_path = resource_path(path)
-            sound = pygame.mixer.Sound(full_path)
+            # PCM já decodificado em execuções anteriores evita o decoder
+            pcm = PCMCache()
+            sound = pcm.load(path, full_path)
+            if sound is None:
+                sound = pygame.mixer.Sound(full_path)
+                pcm.store(path, full_path, sound)
             self.sound_cache[path] = sound
             self.cache_misses += 1
             return sound
@@ -79,6 +203,29 @@ class ResourceCache:
             print(f"Erro ao carregar som {path}: {e}")
             return None
 
+    def get_mask(self, surface):
+        """Máscara de colisão de ``surface``, gerada uma única vez.
+
+        A chave é a própria superfície: quadros vindos do cache de imagens
+        (ou criados uma vez no carregamento) nunca recalculam a máscara.
+        """
+        if surface is None:
+            return None
+        mask = self.mask_cache.get(surface)
+        if mask is None:
+            try:
+                mask = pygame.mask.from_surface(surface)
+            except Exception:
+                return None
+            self.mask_cache[surface] = mask
+        return mask
+
+    def preload_masks(self, surfaces):
+        """Pré-calcula máscaras para uma lista de quadros de animação"""
+        for surface in surfaces:
+            if surface is not None:
+                self.get_mask(surface)
+
     def preload_images(self, image_paths):
         """Pré-carrega uma lista de imagens"""
         for path_info in image_paths:
@@ -93,11 +240,34 @@ class ResourceCache:
         for path in sound_paths:
             self.get_sound(path)
 
+    def release_images(self, paths):
+        """Remove do cache as imagens de ``paths`` (em todas as escalas).
+
+        Retorna quantas entradas foram liberadas. Quem ainda segurar a
+        superfície continua funcionando; o cache apenas deixa de retê-la.
+        """
+        released = 0
+        for path in paths:
+            prefix = f"{path}_"
+            for key in [k for k in self.image_cache if k == path or k.startswith(prefix)]:
+                del self.image_cache[key]
+                released += 1
+        return released
+
+    def release_sounds(self, paths):
+        """Remove do cache os sons de ``paths``; retorna quantos saíram."""
+        released = 0
+        for path in paths:
+            if self.sound_cache.pop(path, None) is not None:
+                released += 1
+        return released
+
     def clear_cache(self):
         """Limpa o cache para liberar memória"""
         self.image_cache.clear()
         self.sound_cache.clear()
         self.music_cache.clear()
+        self.mask_cache.clear()
 
     def get_cache_stats(self):
         """Retorna estatísticas do cache"""
@@ -109,4 +279,5 @@ class ResourceCache:
             "hit_rate": hit_rate,
             "images_cached": len(self.image_cache),
             "sounds_cached": len(self.sound_cache),
+            "masks_cached": len(self.mask_cache),
         }
@@ -1,8 +1,15 @@
+import weakref
+
 import pygame
 from internal.utils.functions import resource_path
 from internal.utils.constants import *
 
 
+# Quadros espelhados por imagem original (morcegos voando para a direita);
+# referência fraca para liberar junto com o mundo que usa morcegos
+_FLIPPED_IMAGES = weakref.WeakKeyDictionary()
+
+
 class Bat:
     _id_counter = 0  # Contador de ID para morcegos
 
@@ -57,6 +64,32 @@ class Bat:
         self.speed = 0
         self.direction = 0
 
+    @staticmethod
+    def _flipped(image):
+        """Versão espelhada da imagem, criada uma única vez por quadro."""
+        try:
+            flipped = _FLIPPED_IMAGES.get(image)
+        except TypeError:
+            # Objeto sem suporte a weakref: espelha sem guardar
+            return pygame.transform.flip(image, True, False)
+        if flipped is None:
+            flipped = pygame.transform.flip(image, True, False)
+            _FLIPPED_IMAGES[image] = flipped
+        return flipped
+
+    def sprite_image(self):
+        """Quadro atual (já espelhado) para desenho em lote; None se não houver."""
+        if self.is_dead or not self.bat_images:
+            return None
+        current_image = self.bat_images[
+            (self.animation_frame // self.animation_speed) % len(self.bat_images)
+        ]
+        if not current_image:
+            return None
+        if self.direction == 1:
+            return self._flipped(current_image)
+        return current_image
+
     def draw(self, screen):
         if self.bat_images and len(self.bat_images) > 0:
             if not self.is_dead:
@@ -68,8 +101,7 @@ class Bat:
                 if current_image:
                     # Espelhar imagem se necessário
                     if self.direction == 1:
-                        flipped_image = pygame.transform.flip(current_image, True, False)
-                        screen.blit(flipped_image, (self.x, self.y))
+                        screen.blit(self._flipped(current_image), (self.x, self.y))
                     else:
                         screen.blit(current_image, (self.x, self.y))
                     return
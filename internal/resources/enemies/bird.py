@@ -51,6 +51,16 @@ class Bird:
         # Ao morrer, parar deslocamento horizontal
         self.speed = 0
 
+    def sprite_image(self):
+        """Quadro atual se o pássaro for desenhável com um único blit em (x, y).
+
+        Retorna None quando é preciso o caminho completo de ``draw``
+        (queda com sprite rotacionado ou desenho de fallback).
+        """
+        if self.is_dead or not (self.bird_images and self.bird_images[0] and self.bird_images[1]):
+            return None
+        return self.bird_images[(self.animation_frame // self.animation_speed) % 2]
+
     def draw(self, screen):
         if self.bird_images and self.bird_images[0] and self.bird_images[1]:
             if not self.is_dead:
@@ -43,6 +43,10 @@ class Fire:
 
         return True
 
+    def sprite_image(self):
+        """Imagem para desenho em lote; None se não houver imagem."""
+        return self.fire_image
+
     def draw(self, screen):
         """Desenhar o foguinho"""
         if self.fire_image:
@@ -53,6 +53,12 @@ class FlyingDisk:
             return False
         return True
 
+    def sprite_image(self):
+        """Quadro atual para colisão precisa; None sem imagens."""
+        if not self.disk_images:
+            return None
+        return self.disk_images[(self.animation_frame // self.animation_speed) % len(self.disk_images)]
+
     def draw(self, screen):
         if self.disk_images and len(self.disk_images) > 0:
             current_image_index = (self.animation_frame // self.animation_speed) % len(self.disk_images)
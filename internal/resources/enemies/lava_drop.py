@@ -20,6 +20,10 @@ class LavaDrop:
             return False
         return True
 
+    def sprite_image(self):
+        """Imagem para desenho em lote; None se não houver imagem."""
+        return self.image
+
     def draw(self, surface: pygame.Surface, camera_x: int = 0):
         if self.image:
             surface.blit(self.image, (self.x, self.y))
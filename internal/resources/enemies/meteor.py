@@ -41,6 +41,12 @@ class Meteor:
         self.speed_x = 0
         self.speed_y = 0
 
+    def sprite_image(self):
+        """Imagem para desenho em lote; None se morto ou sem imagem."""
+        if self.is_dead:
+            return None
+        return self.image
+
     def draw(self, screen: pygame.Surface):
         if self.image and not self.is_dead:
             screen.blit(self.image, (self.x, self.y))
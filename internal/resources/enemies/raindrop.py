@@ -54,6 +54,12 @@ class Raindrop:
             {"x": cx, "y": cy, "vx": -1.0, "vy": 1.5, "angle": 75},
         ]
 
+    def sprite_image(self):
+        """Imagem para desenho em lote; None durante o respingo."""
+        if self.is_dead:
+            return None
+        return self.image
+
     def draw(self, surface: pygame.Surface, camera_x: int = 0):
         if not self.is_dead:
             surface.blit(self.image, (self.x, self.y))
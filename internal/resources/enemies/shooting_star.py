@@ -57,6 +57,12 @@ class ShootingStar:
         self.speed_y = 0
         self.direction = 0
 
+    def sprite_image(self):
+        """Imagem para desenho em lote; None se morta ou sem imagem."""
+        if self.is_dead:
+            return None
+        return self.image
+
     def draw(self, screen: pygame.Surface):
         # If an image is supplied, draw it; otherwise draw a simple star with a trail
         if self.image and not self.is_dead:
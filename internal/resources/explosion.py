@@ -1,5 +1,6 @@
 import pygame
 from internal.utils.constants import *
+from internal.engine.particles import explosion_sprite
 
 
 class Explosion:
@@ -16,6 +17,17 @@ class Explosion:
         self.timer -= 1
         return self.timer > 0
 
+    def sprite_image(self):
+        """Sprite do quadro para a camada de partículas; None quando apagada."""
+        if self.timer <= 0:
+            return None
+        if self.image:
+            return self.image
+        # Sem imagem: círculo vermelho pré-renderizado, piscando
+        if self.timer % 6 < 3:
+            return explosion_sprite(self.width, self.height)
+        return None
+
     def draw(self, screen):
         """Desenhar explosão"""
         if self.timer > 0:
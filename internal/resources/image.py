@@ -1,8 +1,19 @@
 import pygame
+from internal.resources.asset_manifest import (
+    GROUP_ATTRS,
+    IMAGE_GROUPS,
+    manifest_for_level,
+    world_for_level,
+)
 from internal.resources.cache import ResourceCache
 from internal.utils.constants import WIDTH, HEIGHT
 from internal.engine.level.level import Level
 
+# Atributo de imagem -> grupo do manifesto que o carrega
+_ATTR_GROUPS = {
+    attr: group for group, attrs in GROUP_ATTRS.items() for attr in attrs
+}
+
 
 class Image:
     def __init__(self, image_path=None):
@@ -12,9 +23,28 @@ class Image:
         else:
             self.image_path = None
             self.image = None
+        # Mundo cujas imagens estão carregadas e grupos residentes
+        self.current_world = None
+        self.loaded_groups = set()
+
+    def __getattr__(self, name):
+        # Imagem de outro mundo acessada fora de hora (ex.: fase trocada sem
+        # init_level): carrega o grupo sob demanda em vez de falhar
+        group = _ATTR_GROUPS.get(name)
+        loaded = self.__dict__.get("loaded_groups")
+        if group is None or loaded is None or group in loaded:
+            raise AttributeError(name)
+        try:
+            self._load_group(group, ResourceCache())
+        except Exception:
+            raise AttributeError(name)
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(name)
 
     def load_images(self, game=None):
-        """Carregar todas as imagens do jogo usando sistema de cache"""
+        """Carregar imagens comuns e as do mundo atual usando sistema de cache"""
         try:
             # Inicializar cache de recursos
             cache = ResourceCache()
@@ -55,378 +85,6 @@ class Image:
             # Usa a mesma textura das plataformas comuns por padrão
             self.platform_texture_flag = self.platform_texture
 
-            # Carregar imagens dos pássaros usando cache
-            self.bird_img1 = cache.get_image(
-                "imagens/inimigos/bird1.png",
-                (40, 30),
-            )
-            self.bird_img2 = cache.get_image(
-                "imagens/inimigos/bird2.png",
-                (40, 30),
-            )
-
-            # Carregar imagens dos morcegos usando cache
-            self.bat_img1 = cache.get_image(
-                "imagens/inimigos/bat1.png",
-                (40, 30),
-            )
-            self.bat_img2 = cache.get_image(
-                "imagens/inimigos/bat2.png",
-                (40, 30),
-            )
-            self.bat_img3 = cache.get_image(
-                "imagens/inimigos/bat3.png",
-                (40, 30),
-            )
-
-            # Carregar imagens dos aviões usando cache
-            self.airplane_img1 = cache.get_image(
-                "imagens/inimigos/airplane1.png", (50, 30)
-            )
-            self.airplane_img2 = cache.get_image(
-                "imagens/inimigos/airplane2.png", (50, 30)
-            )
-            self.airplane_img3 = cache.get_image(
-                "imagens/inimigos/airplane3.png", (50, 30)
-            )
-
-            # Carregar imagens do flying-disk usando cache
-            try:
-                self.disk_img1 = cache.get_image(
-                    "imagens/inimigos/disk1.png",
-                    (40, 40),
-                )
-                self.disk_img2 = cache.get_image(
-                    "imagens/inimigos/disk2.png",
-                    (40, 40),
-                )
-                self.disk_img3 = cache.get_image(
-                    "imagens/inimigos/disk3.png",
-                    (40, 40),
-                )
-                self.flying_disk_images = [
-                    self.disk_img1,
-                    self.disk_img2,
-                    self.disk_img3,
-                ]
-            except pygame.error as e:
-                print(f"Erro ao carregar imagens do flying-disk: {e}")
-                self.flying_disk_images = None
-
-            # Carregar imagem da estrela cadente (shooting star) com fallback
-            try:
-                self.shooting_star_img = None
-                # Caminho correto informado pelo projeto
-                path = "imagens/elementos/estrelaCadente.png"
-                try:
-                    img = cache.get_image(path, (26, 26))
-                except Exception:
-                    img = None
-                if img:
-                    self.shooting_star_img = img
-                # Fallback: desenhar um pequeno círculo branco se não houver imagem
-                if self.shooting_star_img is None:
-                    surf = pygame.Surface((26, 26), pygame.SRCALPHA)
-                    pygame.draw.circle(surf, (255, 255, 255), (13, 13), 6)
-                    self.shooting_star_img = surf
-            except Exception as e:
-                print(f"Erro ao carregar imagem da estrela cadente: {e}")
-                self.shooting_star_img = None
-
-            try:
-                self.meteor_img = None
-                path = "imagens/elementos/meteoro.png"
-                try:
-                    img = cache.get_image(path, (30, 30))
-                except Exception:
-                    img = None
-                if img:
-                    self.meteor_img = img
-                if self.meteor_img is None:
-                    surf = pygame.Surface((30, 30), pygame.SRCALPHA)
-                    pygame.draw.circle(surf, (160, 160, 160), (15, 15), 12)
-                    self.meteor_img = surf
-            except Exception:
-                self.meteor_img = None
-
-            # Carregar imagens das tartarugas usando cache
-            try:
-                self.turtle_left1 = cache.get_image(
-                    "imagens/inimigos/turtle-left1.png", (40, 30)
-                )
-                self.turtle_left2 = cache.get_image(
-                    "imagens/inimigos/turtle-left2.png", (40, 30)
-                )
-                self.turtle_left3 = cache.get_image(
-                    "imagens/inimigos/turtle-left3.png", (40, 30)
-                )
-                self.turtle_right1 = cache.get_image(
-                    "imagens/inimigos/turtle-right1.png", (40, 30)
-                )
-                self.turtle_right2 = cache.get_image(
-                    "imagens/inimigos/turtle-right2.png", (40, 30)
-                )
-                self.turtle_right3 = cache.get_image(
-                    "imagens/inimigos/turtle-right3.png", (40, 30)
-                )
-
-                # Organizar imagens em dicionário para facilitar o uso
-                self.turtle_images = {
-                    "left": [self.turtle_left1, self.turtle_left2, self.turtle_left3],
-                    "right": [
-                        self.turtle_right1,
-                        self.turtle_right2,
-                        self.turtle_right3,
-                    ],
-                }
-            except pygame.error as e:
-                print(f"Erro ao carregar imagens das tartarugas: {e}")
-                self.turtle_images = None
-
-            # Carregar imagens das aranhas usando cache
-            try:
-                self.spider_img1 = cache.get_image(
-                    "imagens/inimigos/spider1.png", (40, 30)
-                )
-                self.spider_img2 = cache.get_image(
-                    "imagens/inimigos/spider2.png", (40, 30)
-                )
-                self.spider_img3 = cache.get_image(
-                    "imagens/inimigos/spider3.png", (40, 30)
-                )
-
-                # Organizar imagens em lista para facilitar o uso
-                self.spider_images = [
-                    self.spider_img1,
-                    self.spider_img2,
-                    self.spider_img3,
-                ]
-            except pygame.error as e:
-                print(f"Erro ao carregar imagens das aranhas: {e}")
-                self.spider_images = None
-
-            # Carregar imagens dos robôs usando cache
-            try:
-                # Imagens de movimento
-                self.robot_right1 = cache.get_image(
-                    "imagens/inimigos/robot-right1.png", (57, 57)
-                )
-                self.robot_right2 = cache.get_image(
-                    "imagens/inimigos/robot-right2.png", (57, 57)
-                )
-                self.robot_right3 = cache.get_image(
-                    "imagens/inimigos/robot-right3.png", (57, 57)
-                )
-                self.robot_left1 = cache.get_image(
-                    "imagens/inimigos/robot-left1.png", (57, 57)
-                )
-                self.robot_left2 = cache.get_image(
-                    "imagens/inimigos/robot-left2.png", (57, 57)
-                )
-                self.robot_left3 = cache.get_image(
-                    "imagens/inimigos/robot-left3.png", (57, 57)
-                )
-
-                # Imagens de tiro
-                self.robot_shot_right1 = cache.get_image(
-                    "imagens/inimigos/robot-shot-right1.png", (57, 57)
-                )
-                self.robot_shot_right2 = cache.get_image(
-                    "imagens/inimigos/robot-shot-right2.png", (57, 57)
-                )
-                self.robot_shot_right3 = cache.get_image(
-                    "imagens/inimigos/robot-shot-right3.png", (57, 57)
-                )
-                self.robot_shot_left1 = cache.get_image(
-                    "imagens/inimigos/robot-shot-left1.png", (57, 57)
-                )
-                self.robot_shot_left2 = cache.get_image(
-                    "imagens/inimigos/robot-shot-left2.png", (57, 57)
-                )
-                self.robot_shot_left3 = cache.get_image(
-                    "imagens/inimigos/robot-shot-left3.png", (57, 57)
-                )
-
-                # Organizar imagens em dicionário para facilitar o uso
-                self.robot_images = {
-                    "left": [self.robot_left1, self.robot_left2, self.robot_left3],
-                    "right": [self.robot_right1, self.robot_right2, self.robot_right3],
-                    "shot_left": [
-                        self.robot_shot_left1,
-                        self.robot_shot_left2,
-                        self.robot_shot_left3,
-                    ],
-                    "shot_right": [
-                        self.robot_shot_right1,
-                        self.robot_shot_right2,
-                        self.robot_shot_right3,
-                    ],
-                }
-            except pygame.error as e:
-                print(f"Erro ao carregar imagens dos robôs: {e}")
-                self.robot_images = None
-
-            # Carregar imagens dos aliens usando cache
-            try:
-                # Imagens de movimento (esquerda e direita)
-                self.alien_left1 = cache.get_image(
-                    "imagens/inimigos/alien-left1.png", (57, 57)
-                )
-                self.alien_left2 = cache.get_image(
-                    "imagens/inimigos/alien-left2.png", (57, 57)
-                )
-                self.alien_left3 = cache.get_image(
-                    "imagens/inimigos/alien-left3.png", (57, 57)
-                )
-                self.alien_left4 = cache.get_image(
-                    "imagens/inimigos/alien-left4.png", (57, 57)
-                )
-                self.alien_left5 = cache.get_image(
-                    "imagens/inimigos/alien-left5.png", (57, 57)
-                )
-
-                self.alien_right1 = cache.get_image(
-                    "imagens/inimigos/alien-right1.png", (57, 57)
-                )
-                self.alien_right2 = cache.get_image(
-                    "imagens/inimigos/alien-right2.png", (57, 57)
-                )
-                self.alien_right3 = cache.get_image(
-                    "imagens/inimigos/alien-right3.png", (57, 57)
-                )
-                self.alien_right4 = cache.get_image(
-                    "imagens/inimigos/alien-right4.png", (57, 57)
-                )
-                self.alien_right5 = cache.get_image(
-                    "imagens/inimigos/alien-right5.png", (57, 57)
-                )
-
-                # Imagens de tiro (apenas virado para a esquerda)
-                self.alien_shot_left1 = cache.get_image(
-                    "imagens/inimigos/alien-shot-left1.png", (57, 57)
-                )
-                self.alien_shot_left2 = cache.get_image(
-                    "imagens/inimigos/alien-shot-left2.png", (57, 57)
-                )
-                self.alien_shot_left3 = cache.get_image(
-                    "imagens/inimigos/alien-shot-left3.png", (57, 57)
-                )
-
-                # Organizar imagens em dicionário para facilitar o uso
-                self.alien_images = {
-                    "left": [
-                        self.alien_left1,
-                        self.alien_left2,
-                        self.alien_left3,
-                        self.alien_left4,
-                        self.alien_left5,
-                    ],
-                    "right": [
-                        self.alien_right1,
-                        self.alien_right2,
-                        self.alien_right3,
-                        self.alien_right4,
-                        self.alien_right5,
-                    ],
-                    "shot_left": [
-                        self.alien_shot_left1,
-                        self.alien_shot_left2,
-                        self.alien_shot_left3,
-                    ],
-                }
-            except pygame.error as e:
-                print(f"Erro ao carregar imagens dos aliens: {e}")
-                self.alien_images = None
-
-            # Carregar imagens do boss alien usando cache
-            try:
-                # Imagens de corrida
-                self.boss_alien_run1 = cache.get_image(
-                    "imagens/boss/alien1.png", (57, 57)
-                )
-                self.boss_alien_run2 = cache.get_image(
-                    "imagens/boss/alien2.png", (57, 57)
-                )
-                self.boss_alien_run3 = cache.get_image(
-                    "imagens/boss/alien3.png", (57, 57)
-                )
-                self.boss_alien_run4 = cache.get_image(
-                    "imagens/boss/alien4.png", (57, 57)
-                )
-
-                # Imagens de salto
-                self.boss_alien_jump1 = cache.get_image(
-                    "imagens/boss/alienJ1.png", (57, 57)
-                )
-                self.boss_alien_jump2 = cache.get_image(
-                    "imagens/boss/alienJ2.png", (57, 57)
-                )
-                self.boss_alien_jump3 = cache.get_image(
-                    "imagens/boss/alienJ3.png", (57, 57)
-                )
-                self.boss_alien_jump4 = cache.get_image(
-                    "imagens/boss/alienJ4.png", (57, 57)
-                )
-
-                # Imagem de parado
-                self.boss_alien_stop = cache.get_image(
-                    "imagens/boss/alienStop.png", (57, 57)
-                )
-
-                # Organizar imagens em dicionário para facilitar o uso
-                self.boss_alien_images = {
-                    "running": [
-                        self.boss_alien_run1,
-                        self.boss_alien_run2,
-                        self.boss_alien_run3,
-                        self.boss_alien_run4,
-                    ],
-                    "jumping": [
-                        self.boss_alien_jump1,
-                        self.boss_alien_jump2,
-                        self.boss_alien_jump3,
-                        self.boss_alien_jump4,
-                    ],
-                    "stopped": self.boss_alien_stop,
-                }
-            except pygame.error as e:
-                print(f"Erro ao carregar imagens do boss alien: {e}")
-                self.boss_alien_images = None
-
-            # Carregar imagem do foguinho mantendo proporção
-            try:
-                base_fire = cache.get_image("imagens/inimigos/fogo.png")
-                if base_fire:
-                    orig_w, orig_h = base_fire.get_size()
-                    target_h = 30
-                    new_w = max(1, int(orig_w * target_h / orig_h))
-                    self.fire_image = pygame.transform.scale(
-                        base_fire, (new_w, target_h)
-                    )
-                else:
-                    self.fire_image = None
-            except pygame.error as e:
-                print(f"Erro ao carregar imagem do foguinho: {e}")
-                self.fire_image = None
-
-            # Carregar imagens dos mísseis usando cache
-            try:
-                self.missile_right = cache.get_image(
-                    "imagens/elementos/missil-right.png", (20, 8)
-                )
-                self.missile_left = cache.get_image(
-                    "imagens/elementos/missil-left.png", (20, 8)
-                )
-
-                # Organizar imagens em dicionário para facilitar o uso
-                self.missile_images = {
-                    "right": self.missile_right,
-                    "left": self.missile_left,
-                }
-            except pygame.error as e:
-                print(f"Erro ao carregar imagens dos mísseis: {e}")
-                self.missile_images = None
-
             # Carregar imagem do tiro usando cache (seta)
             self.bullet_img = cache.get_image("imagens/elementos/arrow.png", (15, 8))
             self.bullet_image = self.bullet_img  # Alias para compatibilidade
@@ -437,44 +95,12 @@ class Image:
             )
             self.explosion_image = self.explosion_img  # Alias para compatibilidade
 
-            # Carregar imagem da gota de chuva (elemento das fases 7-10)
-            try:
-                self.raindrop_img = cache.get_image(
-                    "imagens/elementos/chuva.png", (20, 20)
-                )
-            except pygame.error as e:
-                print(f"Erro ao carregar imagem da gota de chuva: {e}")
-                self.raindrop_img = None
-
-            try:
-                self.lava_drop_img = cache.get_image(
-                    "imagens/elementos/lava.png", (20, 20)
-                )
-            except pygame.error as e:
-                print(f"Erro ao carregar imagem da gota de lava: {e}")
-                self.lava_drop_img = None
-
-            # Geradores e raios (fases 37-40)
-            try:
-                self.generator_img = cache.get_image(
-                    "imagens/elementos/gerador.png", (32, 32)
-                )
-            except pygame.error:
-                self.generator_img = None
-            try:
-                base_h = cache.get_image("imagens/elementos/raioHorizontal.png")
-                self.lightning_h_img = (
-                    pygame.transform.scale(base_h, (12, 6)) if base_h else None
-                )
-            except pygame.error:
-                self.lightning_h_img = None
-            try:
-                base_v = cache.get_image("imagens/elementos/raioVertical.png")
-                self.lightning_v_img = (
-                    pygame.transform.scale(base_v, (6, 12)) if base_v else None
-                )
-            except pygame.error:
-                self.lightning_v_img = None
+            # Imagens específicas de cada mundo (ver asset_manifest)
+            if game is not None:
+                self.load_world(getattr(game, "current_level", 1))
+            else:
+                for group in IMAGE_GROUPS:
+                    self._load_group(group, cache)
 
             # Carregar imagem de vida extra (item colecionável)
             self.extra_life_img = cache.get_image(
@@ -566,3 +192,488 @@ class Image:
             self.bullet_image = None
             self.explosion_img = None
             self.explosion_image = None
+
+    def load_world(self, level):
+        """Carrega as imagens do mundo de ``level`` e libera as do anterior.
+
+        Só faz trabalho quando o mundo muda: grupos fora do novo manifesto
+        são removidos do ``ResourceCache`` e os que faltam são carregados.
+        Retorna True se houve troca de mundo.
+        """
+        world = world_for_level(level)
+        if world == self.current_world:
+            return False
+        cache = ResourceCache()
+        wanted = set(manifest_for_level(level)["images"])
+        for group in sorted(self.loaded_groups - wanted):
+            self._unload_group(group, cache)
+        for group in IMAGE_GROUPS:
+            if group in wanted and group not in self.loaded_groups:
+                self._load_group(group, cache)
+        self.current_world = world
+        return True
+
+    def unload_world(self):
+        """Libera as imagens de mundo; o próximo ``load_world`` recarrega tudo."""
+        cache = ResourceCache()
+        for group in sorted(self.loaded_groups):
+            self._unload_group(group, cache)
+        self.current_world = None
+
+    def sync_game(self, game):
+        """Reflete no jogo as imagens de mundo espelhadas em atributos diretos."""
+        for attr in (
+            "turtle_images",
+            "spider_images",
+            "robot_images",
+            "missile_images",
+            "alien_images",
+            "airplane_img1",
+            "airplane_img2",
+            "airplane_img3",
+            "flying_disk_images",
+            "fire_image",
+            "lava_drop_img",
+        ):
+            setattr(game, attr, self.__dict__.get(attr))
+        game.airplane_images = (
+            (game.airplane_img1, game.airplane_img2, game.airplane_img3)
+            if game.airplane_img1 and game.airplane_img2 and game.airplane_img3
+            else None
+        )
+
+    def _load_group(self, group, cache):
+        getattr(self, f"_load_{group}")(cache)
+        self.loaded_groups.add(group)
+
+    def _unload_group(self, group, cache):
+        for attr in GROUP_ATTRS.get(group, ()):
+            self.__dict__.pop(attr, None)
+        cache.release_images(IMAGE_GROUPS.get(group, ()))
+        self.loaded_groups.discard(group)
+
+    def _load_birds(self, cache):
+        # Carregar imagens dos pássaros usando cache
+        self.bird_img1 = cache.get_image(
+            "imagens/inimigos/bird1.png",
+            (40, 30),
+        )
+        self.bird_img2 = cache.get_image(
+            "imagens/inimigos/bird2.png",
+            (40, 30),
+        )
+
+    def _load_bats(self, cache):
+        # Carregar imagens dos morcegos usando cache
+        self.bat_img1 = cache.get_image(
+            "imagens/inimigos/bat1.png",
+            (40, 30),
+        )
+        self.bat_img2 = cache.get_image(
+            "imagens/inimigos/bat2.png",
+            (40, 30),
+        )
+        self.bat_img3 = cache.get_image(
+            "imagens/inimigos/bat3.png",
+            (40, 30),
+        )
+
+    def _load_airplanes(self, cache):
+        # Carregar imagens dos aviões usando cache
+        self.airplane_img1 = cache.get_image(
+            "imagens/inimigos/airplane1.png", (50, 30)
+        )
+        self.airplane_img2 = cache.get_image(
+            "imagens/inimigos/airplane2.png", (50, 30)
+        )
+        self.airplane_img3 = cache.get_image(
+            "imagens/inimigos/airplane3.png", (50, 30)
+        )
+
+    def _load_disks(self, cache):
+        # Carregar imagens do flying-disk usando cache
+        try:
+            self.disk_img1 = cache.get_image(
+                "imagens/inimigos/disk1.png",
+                (40, 40),
+            )
+            self.disk_img2 = cache.get_image(
+                "imagens/inimigos/disk2.png",
+                (40, 40),
+            )
+            self.disk_img3 = cache.get_image(
+                "imagens/inimigos/disk3.png",
+                (40, 40),
+            )
+            self.flying_disk_images = [
+                self.disk_img1,
+                self.disk_img2,
+                self.disk_img3,
+            ]
+        except pygame.error as e:
+            print(f"Erro ao carregar imagens do flying-disk: {e}")
+            self.flying_disk_images = None
+
+    def _load_shooting_star(self, cache):
+        # Carregar imagem da estrela cadente (shooting star) com fallback
+        try:
+            self.shooting_star_img = None
+            # Caminho correto informado pelo projeto
+            path = "imagens/elementos/estrelaCadente.png"
+            try:
+                img = cache.get_image(path, (26, 26))
+            except Exception:
+                img = None
+            if img:
+                self.shooting_star_img = img
+            # Fallback: desenhar um pequeno círculo branco se não houver imagem
+            if self.shooting_star_img is None:
+                surf = pygame.Surface((26, 26), pygame.SRCALPHA)
+                pygame.draw.circle(surf, (255, 255, 255), (13, 13), 6)
+                self.shooting_star_img = surf
+        except Exception as e:
+            print(f"Erro ao carregar imagem da estrela cadente: {e}")
+            self.shooting_star_img = None
+
+    def _load_meteor(self, cache):
+        try:
+            self.meteor_img = None
+            path = "imagens/elementos/meteoro.png"
+            try:
+                img = cache.get_image(path, (30, 30))
+            except Exception:
+                img = None
+            if img:
+                self.meteor_img = img
+            if self.meteor_img is None:
+                surf = pygame.Surface((30, 30), pygame.SRCALPHA)
+                pygame.draw.circle(surf, (160, 160, 160), (15, 15), 12)
+                self.meteor_img = surf
+        except Exception:
+            self.meteor_img = None
+
+    def _load_turtles(self, cache):
+        # Carregar imagens das tartarugas usando cache
+        try:
+            self.turtle_left1 = cache.get_image(
+                "imagens/inimigos/turtle-left1.png", (40, 30)
+            )
+            self.turtle_left2 = cache.get_image(
+                "imagens/inimigos/turtle-left2.png", (40, 30)
+            )
+            self.turtle_left3 = cache.get_image(
+                "imagens/inimigos/turtle-left3.png", (40, 30)
+            )
+            self.turtle_right1 = cache.get_image(
+                "imagens/inimigos/turtle-right1.png", (40, 30)
+            )
+            self.turtle_right2 = cache.get_image(
+                "imagens/inimigos/turtle-right2.png", (40, 30)
+            )
+            self.turtle_right3 = cache.get_image(
+                "imagens/inimigos/turtle-right3.png", (40, 30)
+            )
+
+            # Organizar imagens em dicionário para facilitar o uso
+            self.turtle_images = {
+                "left": [self.turtle_left1, self.turtle_left2, self.turtle_left3],
+                "right": [
+                    self.turtle_right1,
+                    self.turtle_right2,
+                    self.turtle_right3,
+                ],
+            }
+        except pygame.error as e:
+            print(f"Erro ao carregar imagens das tartarugas: {e}")
+            self.turtle_images = None
+
+    def _load_spiders(self, cache):
+        # Carregar imagens das aranhas usando cache
+        try:
+            self.spider_img1 = cache.get_image(
+                "imagens/inimigos/spider1.png", (40, 30)
+            )
+            self.spider_img2 = cache.get_image(
+                "imagens/inimigos/spider2.png", (40, 30)
+            )
+            self.spider_img3 = cache.get_image(
+                "imagens/inimigos/spider3.png", (40, 30)
+            )
+
+            # Organizar imagens em lista para facilitar o uso
+            self.spider_images = [
+                self.spider_img1,
+                self.spider_img2,
+                self.spider_img3,
+            ]
+        except pygame.error as e:
+            print(f"Erro ao carregar imagens das aranhas: {e}")
+            self.spider_images = None
+
+    def _load_robots(self, cache):
+        # Carregar imagens dos robôs usando cache
+        try:
+            # Imagens de movimento
+            self.robot_right1 = cache.get_image(
+                "imagens/inimigos/robot-right1.png", (57, 57)
+            )
+            self.robot_right2 = cache.get_image(
+                "imagens/inimigos/robot-right2.png", (57, 57)
+            )
+            self.robot_right3 = cache.get_image(
+                "imagens/inimigos/robot-right3.png", (57, 57)
+            )
+            self.robot_left1 = cache.get_image(
+                "imagens/inimigos/robot-left1.png", (57, 57)
+            )
+            self.robot_left2 = cache.get_image(
+                "imagens/inimigos/robot-left2.png", (57, 57)
+            )
+            self.robot_left3 = cache.get_image(
+                "imagens/inimigos/robot-left3.png", (57, 57)
+            )
+
+            # Imagens de tiro
+            self.robot_shot_right1 = cache.get_image(
+                "imagens/inimigos/robot-shot-right1.png", (57, 57)
+            )
+            self.robot_shot_right2 = cache.get_image(
+                "imagens/inimigos/robot-shot-right2.png", (57, 57)
+            )
+            self.robot_shot_right3 = cache.get_image(
+                "imagens/inimigos/robot-shot-right3.png", (57, 57)
+            )
+            self.robot_shot_left1 = cache.get_image(
+                "imagens/inimigos/robot-shot-left1.png", (57, 57)
+            )
+            self.robot_shot_left2 = cache.get_image(
+                "imagens/inimigos/robot-shot-left2.png", (57, 57)
+            )
+            self.robot_shot_left3 = cache.get_image(
+                "imagens/inimigos/robot-shot-left3.png", (57, 57)
+            )
+
+            # Organizar imagens em dicionário para facilitar o uso
+            self.robot_images = {
+                "left": [self.robot_left1, self.robot_left2, self.robot_left3],
+                "right": [self.robot_right1, self.robot_right2, self.robot_right3],
+                "shot_left": [
+                    self.robot_shot_left1,
+                    self.robot_shot_left2,
+                    self.robot_shot_left3,
+                ],
+                "shot_right": [
+                    self.robot_shot_right1,
+                    self.robot_shot_right2,
+                    self.robot_shot_right3,
+                ],
+            }
+        except pygame.error as e:
+            print(f"Erro ao carregar imagens dos robôs: {e}")
+            self.robot_images = None
+
+        # Carregar imagens dos mísseis usando cache
+        try:
+            self.missile_right = cache.get_image(
+                "imagens/elementos/missil-right.png", (20, 8)
+            )
+            self.missile_left = cache.get_image(
+                "imagens/elementos/missil-left.png", (20, 8)
+            )
+
+            # Organizar imagens em dicionário para facilitar o uso
+            self.missile_images = {
+                "right": self.missile_right,
+                "left": self.missile_left,
+            }
+        except pygame.error as e:
+            print(f"Erro ao carregar imagens dos mísseis: {e}")
+            self.missile_images = None
+
+    def _load_aliens(self, cache):
+        # Carregar imagens dos aliens usando cache
+        try:
+            # Imagens de movimento (esquerda e direita)
+            self.alien_left1 = cache.get_image(
+                "imagens/inimigos/alien-left1.png", (57, 57)
+            )
+            self.alien_left2 = cache.get_image(
+                "imagens/inimigos/alien-left2.png", (57, 57)
+            )
+            self.alien_left3 = cache.get_image(
+                "imagens/inimigos/alien-left3.png", (57, 57)
+            )
+            self.alien_left4 = cache.get_image(
+                "imagens/inimigos/alien-left4.png", (57, 57)
+            )
+            self.alien_left5 = cache.get_image(
+                "imagens/inimigos/alien-left5.png", (57, 57)
+            )
+
+            self.alien_right1 = cache.get_image(
+                "imagens/inimigos/alien-right1.png", (57, 57)
+            )
+            self.alien_right2 = cache.get_image(
+                "imagens/inimigos/alien-right2.png", (57, 57)
+            )
+            self.alien_right3 = cache.get_image(
+                "imagens/inimigos/alien-right3.png", (57, 57)
+            )
+            self.alien_right4 = cache.get_image(
+                "imagens/inimigos/alien-right4.png", (57, 57)
+            )
+            self.alien_right5 = cache.get_image(
+                "imagens/inimigos/alien-right5.png", (57, 57)
+            )
+
+            # Imagens de tiro (apenas virado para a esquerda)
+            self.alien_shot_left1 = cache.get_image(
+                "imagens/inimigos/alien-shot-left1.png", (57, 57)
+            )
+            self.alien_shot_left2 = cache.get_image(
+                "imagens/inimigos/alien-shot-left2.png", (57, 57)
+            )
+            self.alien_shot_left3 = cache.get_image(
+                "imagens/inimigos/alien-shot-left3.png", (57, 57)
+            )
+
+            # Organizar imagens em dicionário para facilitar o uso
+            self.alien_images = {
+                "left": [
+                    self.alien_left1,
+                    self.alien_left2,
+                    self.alien_left3,
+                    self.alien_left4,
+                    self.alien_left5,
+                ],
+                "right": [
+                    self.alien_right1,
+                    self.alien_right2,
+                    self.alien_right3,
+                    self.alien_right4,
+                    self.alien_right5,
+                ],
+                "shot_left": [
+                    self.alien_shot_left1,
+                    self.alien_shot_left2,
+                    self.alien_shot_left3,
+                ],
+            }
+        except pygame.error as e:
+            print(f"Erro ao carregar imagens dos aliens: {e}")
+            self.alien_images = None
+
+    def _load_boss(self, cache):
+        # Carregar imagens do boss alien usando cache
+        try:
+            # Imagens de corrida
+            self.boss_alien_run1 = cache.get_image(
+                "imagens/boss/alien1.png", (57, 57)
+            )
+            self.boss_alien_run2 = cache.get_image(
+                "imagens/boss/alien2.png", (57, 57)
+            )
+            self.boss_alien_run3 = cache.get_image(
+                "imagens/boss/alien3.png", (57, 57)
+            )
+            self.boss_alien_run4 = cache.get_image(
+                "imagens/boss/alien4.png", (57, 57)
+            )
+
+            # Imagens de salto
+            self.boss_alien_jump1 = cache.get_image(
+                "imagens/boss/alienJ1.png", (57, 57)
+            )
+            self.boss_alien_jump2 = cache.get_image(
+                "imagens/boss/alienJ2.png", (57, 57)
+            )
+            self.boss_alien_jump3 = cache.get_image(
+                "imagens/boss/alienJ3.png", (57, 57)
+            )
+            self.boss_alien_jump4 = cache.get_image(
+                "imagens/boss/alienJ4.png", (57, 57)
+            )
+
+            # Imagem de parado
+            self.boss_alien_stop = cache.get_image(
+                "imagens/boss/alienStop.png", (57, 57)
+            )
+
+            # Organizar imagens em dicionário para facilitar o uso
+            self.boss_alien_images = {
+                "running": [
+                    self.boss_alien_run1,
+                    self.boss_alien_run2,
+                    self.boss_alien_run3,
+                    self.boss_alien_run4,
+                ],
+                "jumping": [
+                    self.boss_alien_jump1,
+                    self.boss_alien_jump2,
+                    self.boss_alien_jump3,
+                    self.boss_alien_jump4,
+                ],
+                "stopped": self.boss_alien_stop,
+            }
+        except pygame.error as e:
+            print(f"Erro ao carregar imagens do boss alien: {e}")
+            self.boss_alien_images = None
+
+    def _load_fire(self, cache):
+        # Carregar imagem do foguinho mantendo proporção
+        try:
+            base_fire = cache.get_image("imagens/inimigos/fogo.png")
+            if base_fire:
+                orig_w, orig_h = base_fire.get_size()
+                target_h = 30
+                new_w = max(1, int(orig_w * target_h / orig_h))
+                self.fire_image = pygame.transform.scale(
+                    base_fire, (new_w, target_h)
+                )
+            else:
+                self.fire_image = None
+        except pygame.error as e:
+            print(f"Erro ao carregar imagem do foguinho: {e}")
+            self.fire_image = None
+
+    def _load_raindrop(self, cache):
+        # Carregar imagem da gota de chuva (elemento das fases 7-10)
+        try:
+            self.raindrop_img = cache.get_image(
+                "imagens/elementos/chuva.png", (20, 20)
+            )
+        except pygame.error as e:
+            print(f"Erro ao carregar imagem da gota de chuva: {e}")
+            self.raindrop_img = None
+
+    def _load_lava(self, cache):
+        try:
+            self.lava_drop_img = cache.get_image(
+                "imagens/elementos/lava.png", (20, 20)
+            )
+        except pygame.error as e:
+            print(f"Erro ao carregar imagem da gota de lava: {e}")
+            self.lava_drop_img = None
+
+    def _load_lightning(self, cache):
+        # Geradores e raios (fases 37-40)
+        try:
+            self.generator_img = cache.get_image(
+                "imagens/elementos/gerador.png", (32, 32)
+            )
+        except pygame.error:
+            self.generator_img = None
+        try:
+            base_h = cache.get_image("imagens/elementos/raioHorizontal.png")
+            self.lightning_h_img = (
+                pygame.transform.scale(base_h, (12, 6)) if base_h else None
+            )
+        except pygame.error:
+            self.lightning_h_img = None
+        try:
+            base_v = cache.get_image("imagens/elementos/raioVertical.png")
+            self.lightning_v_img = (
+                pygame.transform.scale(base_v, (6, 12)) if base_v else None
+            )
+        except pygame.error:
+            self.lightning_v_img = None
@@ -2,6 +2,8 @@ import pygame
 from internal.utils.functions import resource_path
 from internal.utils.constants import WIDTH, HEIGHT, GRAVITY, JUMP_STRENGTH, PLAYER_SPEED, BLUE, RED
 from internal.resources.bullet import Bullet
+from internal.resources.cache import ResourceCache
+from internal.engine.input_state import InputState
 
 
 class Player:
@@ -176,6 +178,25 @@ class Player:
                 for sprite in self.sprites[animation]:
                     sprite.fill(BLUE)
 
+        # Máscaras de colisão de todos os quadros, calculadas no carregamento
+        try:
+            ResourceCache().preload_masks(
+                sprite for frames in self.sprites.values() for sprite in frames
+            )
+        except Exception:
+            pass
+
+    def sprite_frame(self):
+        """Quadro atual e posição de desenho (mesma regra de ``draw``)."""
+        frames = self.sprites.get(self.current_animation)
+        if not frames:
+            return None, None
+        current_sprite = frames[self.animation_frame % len(frames)]
+        draw_y = self.y
+        if self.current_animation in ("crouch", "shoot_crouch"):
+            draw_y = self.y + (self.height - current_sprite.get_height())
+        return current_sprite, (self.x, draw_y)
+
     def update_animation(self):
         """Atualizar a animação do personagem baseada no estado atual"""
         # Determinar qual animação usar
@@ -330,54 +351,23 @@ class Player:
         # Aplicar gravidade
         self.vel_y += GRAVITY
 
-        # Movimento horizontal
-        keys = pygame.key.get_pressed()
-        joystick_x = 0
-
-        # Verificar entrada do joystick
-        if joystick and joystick.get_numaxes() >= 1:
-            joystick_x = joystick.get_axis(0)  # Eixo X do analógico esquerdo
-            # Aplicar zona morta para evitar drift
-            if abs(joystick_x) < 0.1:
-                joystick_x = 0
+        # Entrada do quadro (teclado + joystick já resolvidos em ações)
+        if game is not None and getattr(game, "input_state", None) is not None:
+            snapshot = game.input_state.current(game)
+        else:
+            snapshot = InputState(pygame).sample(game, joystick)
+        down = snapshot.down
 
         # Movimento com teclado ou joystick
-        left_defaults = [pygame.K_LEFT, pygame.K_a]
-        right_defaults = [pygame.K_RIGHT, pygame.K_d]
-        left_keys = getattr(getattr(game, "controls", {}), "get", lambda *_: [])("left") if game else []
-        right_keys = getattr(getattr(game, "controls", {}), "get", lambda *_: [])("right") if game else []
-        if not left_keys:
-            left_keys = left_defaults
-        if not right_keys:
-            right_keys = right_defaults
-
-        def _any_down(key_list):
-            try:
-                return any(keys[k] for k in key_list)
-            except Exception:
-                return False
-        if _any_down(left_keys) or joystick_x < -0.1:
+        if down["left"]:
             self.vel_x = -PLAYER_SPEED
-        elif _any_down(right_keys) or joystick_x > 0.1:
+        elif down["right"]:
             self.vel_x = PLAYER_SPEED
         else:
             self.vel_x = 0
 
         # Sistema de agachamento
-        joystick_y = 0
-        joystick_crouch = False
-
-        # Verificar entrada do joystick para agachamento
-        if joystick and joystick.get_numaxes() >= 2:
-            joystick_y = joystick.get_axis(1)  # Eixo Y do analógico esquerdo
-            if joystick_y > 0.5:  # Analógico para baixo
-                joystick_crouch = True
-
-        crouch_defaults = [pygame.K_DOWN, pygame.K_s]
-        crouch_keys = getattr(getattr(game, "controls", {}), "get", lambda *_: [])("crouch") if game else []
-        if not crouch_keys:
-            crouch_keys = crouch_defaults
-        if _any_down(crouch_keys) or joystick_crouch:
+        if down["crouch"]:
             if not self.is_crouching and self.on_ground:
                 # Começar a agachar
                 old_y = self.y
@@ -393,46 +383,13 @@ class Player:
                 self.is_crouching = False
 
         # Tiro com barra de espaço ou botão do joystick
-        joystick_shoot = False
-        if joystick and joystick.get_numbuttons() > 0:
-            shoot_button = 1
-            try:
-                if game and hasattr(game, "joystick_controls"):
-                    shoot_button = int(game.joystick_controls.get("shoot", 1))
-            except Exception:
-                shoot_button = 1
-            if shoot_button < joystick.get_numbuttons():
-                joystick_shoot = joystick.get_button(shoot_button)
-
         shot_sound = False
-        shoot_defaults = [pygame.K_SPACE]
-        shoot_keys = getattr(getattr(game, "controls", {}), "get", lambda *_: [])("shoot") if game else []
-        if not shoot_keys:
-            shoot_keys = shoot_defaults
-        if _any_down(shoot_keys) or joystick_shoot:
+        if down["shoot"]:
             shot_sound = self.shoot(bullet_image, game)
 
         # Pulo com setas/WASD ou botão/analógico do joystick
-        joystick_jump = False
-        if joystick:
-            jump_button = 0
-            try:
-                if game and hasattr(game, "joystick_controls"):
-                    jump_button = int(game.joystick_controls.get("jump", 0))
-            except Exception:
-                jump_button = 0
-            if joystick.get_numbuttons() > 0 and jump_button < joystick.get_numbuttons():
-                joystick_jump = joystick.get_button(jump_button)
-            # Ou analógico para cima
-            if joystick.get_numaxes() >= 2 and joystick_y < -0.5:
-                joystick_jump = True
-
         jump_sound = False
-        jump_defaults = [pygame.K_UP, pygame.K_w]
-        jump_keys = getattr(getattr(game, "controls", {}), "get", lambda *_: [])("jump") if game else []
-        if not jump_keys:
-            jump_keys = jump_defaults
-        want_jump = _any_down(jump_keys) or joystick_jump
+        want_jump = down["jump"]
         press_jump = want_jump and not self.jump_was_down
         if press_jump:
             self.jump_buffer_frames_left = self.jump_buffer_max_frames
@@ -507,15 +464,23 @@ class Player:
                 jump_sound = True
                 self.jump_buffer_frames_left = 0
 
-        # Atualizar tiros e remover os que saíram da área visível
-        for bullet in self.bullets[:]:
+        # Atualizar tiros e compactar a lista em uma passada
+        kept = []
+        for bullet in self.bullets:
+            if getattr(bullet, "removed", False):
+                # Marcado em colisão: o sweep do quadro devolve ao pool
+                kept.append(bullet)
+                continue
             bullet.update()
             # Remover tiro se saiu muito da área visível da câmera
             if bullet.x < camera_x - 300 or bullet.x > camera_x + WIDTH + 300:
-                self.bullets.remove(bullet)
                 # Retornar bala ao pool se disponível
                 if game and hasattr(game, "return_bullet_to_pool"):
                     game.return_bullet_to_pool(bullet)
+            else:
+                kept.append(bullet)
+        if len(kept) != len(self.bullets):
+            self.bullets[:] = kept
 
         # Atualizar cooldown de tiro
         if self.shoot_cooldown > 0:
@@ -0,0 +1,95 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCache:
+    """Cache LRU de textos renderizados e de fontes por tamanho.
+
+    Chave do texto: (fonte, texto, antialias, cor, fundo). As superfícies
+    devolvidas são compartilhadas: quem precisar alterá-las (set_alpha,
+    fill) deve trabalhar sobre uma cópia.
+    """
+
+    _instance = None
+    MAX_ENTRIES = 512
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(TextCache, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
+        self.max_entries = self.MAX_ENTRIES
+        self._surfaces = OrderedDict()
+        self._sizes = OrderedDict()
+        self._fonts = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _color_key(color):
+        if color is None:
+            return None
+        try:
+            return tuple(color)
+        except TypeError:
+            return color
+
+    def _remember(self, store, key, value):
+        store[key] = value
+        if len(store) > self.max_entries:
+            store.popitem(last=False)
+
+    def render(self, font, text, antialias, color, background=None):
+        """Equivalente a ``font.render`` com cache LRU."""
+        key = (font, text, bool(antialias), self._color_key(color), self._color_key(background))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self._remember(self._surfaces, key, surface)
+        self.misses += 1
+        return surface
+
+    def size(self, font, text):
+        """Equivalente a ``font.size`` com cache LRU."""
+        key = (font, text)
+        value = self._sizes.get(key)
+        if value is not None:
+            self._sizes.move_to_end(key)
+            return value
+        value = font.size(text)
+        self._remember(self._sizes, key, value)
+        return value
+
+    def get_font(self, size, name=None):
+        """Fonte criada uma única vez por (nome, tamanho)."""
+        key = (name, int(size))
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, int(size))
+            self._fonts[key] = font
+        return font
+
+    def clear(self):
+        self._surfaces.clear()
+        self._sizes.clear()
+        self._fonts.clear()
+
+    def get_stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "surfaces_cached": len(self._surfaces),
+            "fonts_cached": len(self._fonts),
+        }
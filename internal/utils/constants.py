@@ -8,6 +8,8 @@ PLAYER_SPEED = 5
 
 # Constantes da câmera
 CAMERA_OFFSET_X = WIDTH // 3  # Jogador fica no terço esquerdo da tela
+# Inimigos de plataforma fora de camera_x ± margem ficam adormecidos
+ENEMY_ACTIVATION_MARGIN = WIDTH // 2
 
 # Cores
 WHITE = (255, 255, 255)
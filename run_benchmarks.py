@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import sys
+
+
+def parse_levels(spec, max_levels):
+    """Converte ``1-10,21,51`` em lista de fases (vazio = todas)."""
+    if not spec:
+        return list(range(1, max_levels + 1))
+    levels = []
+    for part in spec.split(","):
+        part = part.strip()
+        if "-" in part:
+            first, last = part.split("-", 1)
+            levels.extend(range(int(first), int(last) + 1))
+        elif part:
+            levels.append(int(part))
+    return [lvl for lvl in levels if 1 <= lvl <= max_levels]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark de carregamento de fases (init_level + primeiros quadros)"
+    )
+    parser.add_argument("--levels", default="", help="Fases, ex.: 1-10,21,51 (padrão: todas)")
+    parser.add_argument(
+        "--difficulty",
+        action="append",
+        choices=["EASY", "NORMAL", "HARD"],
+        help="Dificuldade (repetível; padrão: todas)",
+    )
+    parser.add_argument("--frames", type=int, default=30, help="Quadros medidos após o init_level")
+    parser.add_argument(
+        "--repeats", type=int, default=3, help="Medidas por fase; vale a mediana (padrão: 3)"
+    )
+    parser.add_argument("--baseline", default=None, help="Arquivo JSON da linha de base")
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Grava os resultados como nova linha de base em vez de comparar",
+    )
+    args = parser.parse_args()
+
+    # Ambiente headless, como no run_tests.py
+    os.environ.setdefault("PLATFORM_GAME_FULLSCREEN", "0")
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    import pygame
+    from internal.engine.difficulty import Difficulty
+    from internal.engine.game import Game
+    from internal.engine.level.benchmark import LevelBenchmark
+
+    pygame.init()
+    game = Game()
+    levels = parse_levels(args.levels, game.max_levels)
+    difficulties = [Difficulty[name] for name in (args.difficulty or ["EASY", "NORMAL", "HARD"])]
+    baseline_path = args.baseline or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), LevelBenchmark.DEFAULT_BASELINE
+    )
+
+    print(
+        f"▶️  Medindo {len(levels)} fase(s) x {len(difficulties)} dificuldade(s), "
+        f"{args.frames} quadros cada, mediana de {args.repeats}..."
+    )
+    bench = LevelBenchmark(game, frames=args.frames, repeats=args.repeats)
+    results = bench.run(levels, difficulties, log=print)
+    print(f"   Pico de memória residente: {bench.peak_rss_kib} KiB")
+
+    if args.update_baseline:
+        LevelBenchmark.save_baseline(
+            baseline_path, results, args.frames, args.repeats, bench.peak_rss_kib
+        )
+        print(f"✅ Linha de base gravada em {baseline_path}")
+        return 0
+
+    baseline = LevelBenchmark.load_baseline(baseline_path)
+    if not baseline:
+        print(f"⚠️  Linha de base não encontrada em {baseline_path}; use --update-baseline")
+        return 0
+    regressions = LevelBenchmark.compare(results, baseline)
+    if not regressions:
+        print("✅ Nenhuma fase regrediu em relação à linha de base")
+        return 0
+    print(f"❌ {len(regressions)} regressão(ões):")
+    for key, metric, base, current in regressions:
+        print(f"   {key}: {metric} {base} -> {current}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
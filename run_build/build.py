@@ -184,7 +184,7 @@ class GameBuilder:
                 break
 
         # Adicionar recursos (imagens, sons, vídeos)
-        resource_dirs = ["imagens", "musicas", "sounds", "videos"]
+        resource_dirs = ["imagens", "imagens_baked", "musicas", "sounds", "videos"]
         for res_dir in resource_dirs:
             res_path = self.project_root / res_dir
             if res_path.exists():
@@ -5,6 +5,7 @@ PLATFORM GAME - BUILD APK ONLY
 Gera apenas o APK sem tentar instalar no emulador
 """
 
+import json
 import os
 import sys
 import shutil
@@ -91,9 +92,21 @@ def create_apk_structure():
         if os.path.exists(file):
             shutil.copy2(file, os.path.join(apk_dir, "assets"))
     
-    # Copia recursos
+    # Copia recursos (imagens pré-escaladas pelo bake_assets.py, quando
+    # existirem, substituem os originais que cobrem)
+    covered = set()
+    if os.path.exists(os.path.join("imagens_baked", "manifest.json")):
+        with open(os.path.join("imagens_baked", "manifest.json"), "r", encoding="utf-8") as f:
+            covered = set(json.load(f).get("covered", []))
+        shutil.copytree("imagens_baked", os.path.join(apk_dir, "assets", "imagens_baked"), dirs_exist_ok=True)
+        print(f"✅ {len(covered)} imagem(ns) original(is) substituída(s) por versões pré-escaladas")
+
+    def skip_covered(folder, names):
+        rel = os.path.relpath(folder).replace(os.sep, "/")
+        return [name for name in names if f"{rel}/{name}" in covered]
+
     if os.path.exists("imagens"):
-        shutil.copytree("imagens", os.path.join(apk_dir, "assets", "imagens"), dirs_exist_ok=True)
+        shutil.copytree("imagens", os.path.join(apk_dir, "assets", "imagens"), dirs_exist_ok=True, ignore=skip_covered)
     
     if os.path.exists("sounds"):
         shutil.copytree("sounds", os.path.join(apk_dir, "assets", "sounds"), dirs_exist_ok=True)
@@ -41,4 +41,30 @@ def disable_audio(monkeypatch):
         monkeypatch.setattr(Mixer, "init", lambda *_, **__: None)
     except Exception:
         # Se módulo não existir/for diferente em alguns testes, ignore.
-        pass
\ No newline at end of file
+        pass
+
+
+@pytest.fixture(autouse=True)
+def isolated_layout_cache():
+    """Cache de layouts vazio por teste: nenhum teste lê layouts de outro."""
+    try:
+        from internal.engine.level.generator.dynamic import DynamicLevelGenerator
+    except Exception:
+        yield
+        return
+    DynamicLevelGenerator.clear_layout_cache()
+    yield
+    DynamicLevelGenerator.clear_layout_cache()
+
+
+@pytest.fixture(autouse=True)
+def isolated_sound_cache(tmp_path, monkeypatch):
+    """PCM decodificado gravado no tmp_path do teste, não em saves/ do repo."""
+    try:
+        from internal.engine.sound.pcm_cache import PCMCache
+    except Exception:
+        yield
+        return
+    monkeypatch.setattr(PCMCache, "_instance", None)
+    PCMCache().cache_dir = str(tmp_path / "sound_cache")
+    yield
@@ -0,0 +1,45 @@
+from internal.engine.difficulty import Difficulty
+from internal.engine.level.generator.dynamic import DynamicLevelGenerator
+
+
+def test_same_key_gives_identical_layout():
+    a = DynamicLevelGenerator.generate_level_platforms(10, difficulty=Difficulty.HARD, seed=7)
+    # Memória limpa: o layout é regenerado pela mesma semente, idêntico
+    DynamicLevelGenerator.clear_layout_cache()
+    b = DynamicLevelGenerator.generate_level_platforms(10, difficulty=Difficulty.HARD, seed=7)
+    assert a == b
+    assert "patterns30:10:HARD:7" in DynamicLevelGenerator._layouts
+
+
+def test_seed_and_difficulty_change_the_layout():
+    base = DynamicLevelGenerator.generate_level_platforms(10, seed=1)
+    assert DynamicLevelGenerator.generate_level_platforms(10, seed=2) != base
+    assert (
+        DynamicLevelGenerator.generate_level_platforms(10, difficulty=Difficulty.EASY, seed=1)
+        != base
+    )
+
+
+def test_cached_layout_skips_regeneration():
+    calls = []
+
+    def build(rng):
+        calls.append(rng)
+        return [(rng.randint(0, 100), 0, 50, 20)]
+
+    first = DynamicLevelGenerator.get_layout("teste", 1, None, 3, build)
+    second = DynamicLevelGenerator.get_layout("teste", 1, None, 3, build)
+    assert first == second and len(calls) == 1
+    # A lista devolvida é uma cópia: alterá-la não corrompe o cache
+    first.append((0, 0, 1, 1))
+    assert DynamicLevelGenerator.get_layout("teste", 1, None, 3, build) == second
+
+
+def test_memory_cache_is_capped(monkeypatch):
+    monkeypatch.setattr(DynamicLevelGenerator, "MAX_CACHED_LAYOUTS", 3)
+    for level in range(1, 5):
+        DynamicLevelGenerator.get_layout("teste", level, None, 0, lambda r: [(1, 2, 3, 4)])
+    # Reusar o nível 2 deixa o nível 3 como o usado há mais tempo
+    DynamicLevelGenerator.get_layout("teste", 2, None, 0, lambda r: [(1, 2, 3, 4)])
+    DynamicLevelGenerator.get_layout("teste", 5, None, 0, lambda r: [(1, 2, 3, 4)])
+    assert list(DynamicLevelGenerator._layouts) == ["teste:4:None:0", "teste:2:None:0", "teste:5:None:0"]
@@ -0,0 +1,114 @@
+import random
+
+from internal.engine.difficulty import Difficulty
+from internal.engine.level import benchmark as benchmark_module
+from internal.engine.level.benchmark import LevelBenchmark
+from internal.engine.state import GameState
+
+
+def test_compare_flags_metrics_past_ratio_and_slack():
+    baseline = {
+        "1/NORMAL": {"init_ms": 10.0, "frame_ms": 4.0, "blocks": 100},
+        "2/NORMAL": {"init_ms": 10.0, "frame_ms": 4.0, "blocks": 100},
+    }
+    results = {
+        # Within 1.5x + 5 ms
+        "1/NORMAL": {"init_ms": 19.9, "frame_ms": 4.0, "blocks": 100},
+        "2/NORMAL": {"init_ms": 25.0, "frame_ms": 8.5, "blocks": 100},
+        # Not in the baseline: ignored
+        "3/NORMAL": {"init_ms": 999.0},
+    }
+    regressions = LevelBenchmark.compare(results, baseline)
+    assert [(key, metric) for key, metric, _base, _cur in regressions] == [
+        ("2/NORMAL", "init_ms"),
+        ("2/NORMAL", "frame_ms"),
+    ]
+    # Old baselines may still carry per-level RSS: no longer compared
+    old = {"1/NORMAL": dict(baseline["1/NORMAL"], rss_kib=0)}
+    assert LevelBenchmark.compare({"1/NORMAL": dict(results["1/NORMAL"], rss_kib=9000)}, old) == []
+
+
+def test_baseline_roundtrip(tmp_path):
+    path = tmp_path / "bench" / "baseline.json"
+    results = {"1/EASY": {"init_ms": 1.0, "frame_ms": 0.5, "blocks": 3}}
+    LevelBenchmark.save_baseline(str(path), results, frames=5, repeats=3, peak_rss_kib=1024)
+    assert LevelBenchmark.load_baseline(str(path)) == results
+    assert LevelBenchmark.load_baseline(str(tmp_path / "missing.json")) == {}
+
+
+class FakeImage:
+    def __init__(self):
+        self.unloads = 0
+
+    def unload_world(self):
+        self.unloads += 1
+
+
+class FakeGame:
+    def __init__(self):
+        self.image = FakeImage()
+        self.frames = []
+
+    def update(self):
+        self.frames.append(self.state)
+        self.state = GameState.GAME_OVER
+
+    def draw(self):
+        pass
+
+
+def test_run_measures_every_level_and_difficulty_cold(monkeypatch):
+    levels_built = []
+    monkeypatch.setattr(
+        benchmark_module.Level,
+        "init_level",
+        lambda game: levels_built.append((game.current_level, game.difficulty)),
+    )
+    game = FakeGame()
+    bench = LevelBenchmark(game, frames=3, repeats=3)
+
+    results = bench.run([1, 2], [Difficulty.EASY, Difficulty.HARD])
+
+    assert list(results) == ["1/EASY", "2/EASY", "1/HARD", "2/HARD"]
+    # One warm-up load plus three cold loads per combination, in full rounds
+    assert levels_built[0] == (1, Difficulty.EASY)
+    assert len(levels_built) == 1 + 4 * 3
+    assert levels_built[1:5] == levels_built[5:9] == [
+        (1, Difficulty.EASY), (2, Difficulty.EASY), (1, Difficulty.HARD), (2, Difficulty.HARD)
+    ]
+    assert game.image.unloads == 13
+    # Each measured frame runs in PLAYING even if the previous one ended the game
+    assert set(game.frames) == {GameState.PLAYING}
+    assert set(results["2/HARD"]) == {"init_ms", "frame_ms", "blocks"}
+    assert bench.peak_rss_kib >= 0
+
+
+def test_each_level_replays_the_same_random_sequence(monkeypatch):
+    draws = {}
+    monkeypatch.setattr(
+        benchmark_module.Level,
+        "init_level",
+        lambda game: draws.setdefault(
+            LevelBenchmark.key(game.current_level, game.difficulty), []
+        ).append(random.random()),
+    )
+    bench = LevelBenchmark(FakeGame(), frames=1, repeats=2)
+
+    bench.run([1, 2], [Difficulty.NORMAL])
+    bench.run([1], [Difficulty.NORMAL])
+
+    assert len(set(draws["1/NORMAL"])) == 1
+    assert len(draws["1/NORMAL"]) == 6
+    assert draws["1/NORMAL"][0] != draws["2/NORMAL"][0]
+
+
+def test_measure_reports_the_median(monkeypatch):
+    samples = iter([
+        {"init_ms": 9.0, "frame_ms": 1.0, "blocks": 5},
+        {"init_ms": 1.0, "frame_ms": 30.0, "blocks": 7},
+        {"init_ms": 2.0, "frame_ms": 2.0, "blocks": 6},
+    ])
+    bench = LevelBenchmark(FakeGame(), repeats=3)
+    monkeypatch.setattr(bench, "_measure_once", lambda level, difficulty: next(samples))
+
+    assert bench.measure(1) == {"init_ms": 2.0, "frame_ms": 2.0, "blocks": 6}
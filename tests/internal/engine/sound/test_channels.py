@@ -0,0 +1,115 @@
+from internal.engine.sound.channels import ChannelManager
+
+
+class FakeSound:
+    def __init__(self, name):
+        self.name = name
+
+    def play(self):
+        return None
+
+
+class FakeChannel:
+    def __init__(self, idx):
+        self.idx = idx
+        self.sound = None
+
+    def play(self, sound):
+        self.sound = sound
+
+    def get_busy(self):
+        return self.sound is not None
+
+    def get_sound(self):
+        return self.sound
+
+
+class FakeMixer:
+    def __init__(self, num=16):
+        self.channels = [FakeChannel(i) for i in range(num)]
+        self.reserved = 0
+
+    def get_init(self):
+        return (44100, -16, 2)
+
+    def get_num_channels(self):
+        return len(self.channels)
+
+    def set_num_channels(self, n):
+        while len(self.channels) < n:
+            self.channels.append(FakeChannel(len(self.channels)))
+
+    def set_reserved(self, n):
+        self.reserved = n
+
+    def Channel(self, idx):
+        return self.channels[idx]
+
+    def find_channel(self, force=False):
+        for ch in self.channels[self.reserved:]:
+            if not ch.get_busy():
+                return ch
+        return self.channels[self.reserved] if force else None
+
+
+def test_same_frame_triggers_are_merged():
+    cm = ChannelManager(FakeMixer())
+    snd = FakeSound("explosion")
+    assert cm.play("explosion", snd) is not None
+    assert cm.play("explosion", snd) is None
+    assert cm.get_stats()["merged"] == 1
+    cm.begin_frame()
+    assert cm.play("explosion", snd) is not None
+    assert cm.get_stats()["played"] == 2
+
+
+def test_per_sound_cap_drops_low_priority_voices():
+    cm = ChannelManager(FakeMixer())
+    snd = FakeSound("bird-hit")
+    for _ in range(cm.get_cap("bird-hit")):
+        assert cm.play("bird-hit", snd) is not None
+        cm.begin_frame()
+    assert cm.play("bird-hit", snd) is None
+    assert cm.get_stats()["dropped"] == 1
+
+
+def test_high_priority_restarts_oldest_voice_at_cap():
+    cm = ChannelManager(FakeMixer())
+    snd = FakeSound("player-hit")
+    first = cm.play("player-hit", snd)
+    cm.begin_frame()
+    again = cm.play("player-hit", snd)
+    assert again is first
+    assert cm.get_stats()["dropped"] == 0
+
+
+def test_critical_sounds_use_reserved_channels():
+    mixer = FakeMixer()
+    cm = ChannelManager(mixer)
+    # Saturar todos os canais comuns
+    for ch in mixer.channels[cm.RESERVED_CHANNELS:]:
+        ch.play(FakeSound("shot"))
+    assert cm.play("shot", FakeSound("shot")) is None
+    ch = cm.play("level-end", FakeSound("level-end"))
+    assert ch is not None
+    assert ch.idx < cm.RESERVED_CHANNELS
+    assert mixer.reserved == cm.RESERVED_CHANNELS
+
+
+def test_reserved_channel_plays_do_not_accumulate():
+    mixer = FakeMixer()
+    cm = ChannelManager(mixer)
+    snd = FakeSound("new-life")
+    for _ in range(50):
+        assert cm.play("new-life", snd) is not None
+        cm.begin_frame()
+        # Terminou de tocar antes do próximo disparo
+        for ch in mixer.channels[:cm.RESERVED_CHANNELS]:
+            ch.sound = None
+    assert len(cm._active["new-life"]) == 1
+
+    # Os dois canais reservados ocupados com o mesmo som: sem duplicatas
+    for _ in range(10):
+        cm.play("new-life", snd)
+        cm.begin_frame()
+    assert len(cm._active["new-life"]) <= cm.RESERVED_CHANNELS
@@ -0,0 +1,88 @@
+import types
+
+import pygame
+
+from internal.engine.sound import music as music_mod
+from internal.engine.sound.music import Music, estimate_mp3_length
+from internal.utils.functions import resource_path
+
+
+class FakeMusicStream:
+    def __init__(self):
+        self.loaded = None
+        self.started_at = None
+        self.pos_ms = 0
+
+    def load(self, path):
+        self.loaded = path
+
+    def set_volume(self, v):
+        pass
+
+    def play(self, loops=0, start=0.0, fade_ms=0):
+        self.started_at = start
+
+    def fadeout(self, ms):
+        pass
+
+    def stop(self):
+        pass
+
+    def get_pos(self):
+        return self.pos_ms
+
+
+def _fake_game():
+    return types.SimpleNamespace(
+        music_volume=0.7,
+        music_volumes={},
+        music_files={1: "musicas/fundo1.mp3"},
+        current_music=None,
+    )
+
+
+def test_estimate_mp3_length_reads_headers_only():
+    length = estimate_mp3_length(resource_path("musicas/capture.mp3"))
+    assert length is not None
+    assert 80 < length < 110
+    assert estimate_mp3_length(resource_path("musicas/nao-existe.mp3")) is None
+
+
+def test_level_music_keeps_no_whole_file_bytes(monkeypatch):
+    fake = FakeMusicStream()
+    monkeypatch.setattr(pygame.mixer, "music", fake)
+    g = _fake_game()
+    Music().play_level_music(g, 1)
+    assert "normal_bytes" not in g._music_cache
+    assert "slow_bytes" not in g._music_cache
+    assert g._music_cache["normal_length"] > 0
+    assert fake.loaded.endswith("fundo1.mp3")
+
+
+def test_tempo_switch_resumes_at_matching_position(monkeypatch, tmp_path):
+    fake = FakeMusicStream()
+    monkeypatch.setattr(pygame.mixer, "music", fake)
+    m = Music()
+    g = _fake_game()
+    m.play_level_music(g, 1)
+    # Simular variante lenta com o dobro da duração
+    g._music_cache.update({
+        "slow_file": "musicas/fundo1_slow.mp3",
+        "slow_path": str(tmp_path / "fundo1_slow.mp3"),
+        "slow_length": g._music_cache["normal_length"] * 2,
+        "tempo_ratio": 2.0,
+    })
+    monkeypatch.setattr(m, "check_music_exists", lambda f: True)
+    monkeypatch.setattr(music_mod, "resource_path", lambda p: p)
+
+    fake.pos_ms = 10000
+    m.enter_tempo_music(g)
+    assert g._tempo_music_active is True
+    assert g.current_music == "musicas/fundo1_slow.mp3"
+    assert abs(fake.started_at - 20.0) < 1e-6
+
+    fake.pos_ms = 4000
+    m.exit_tempo_music(g)
+    assert g._tempo_music_active is False
+    assert g.current_music == "musicas/fundo1.mp3"
+    assert abs(fake.started_at - 12.0) < 1e-6
@@ -0,0 +1,97 @@
+import os
+import wave
+
+import pygame
+import pytest
+
+from internal.engine.sound import effects as effects_module
+from internal.engine.sound.effects import SoundEffects
+from internal.engine.sound.pcm_cache import PCMCache
+from internal.resources.cache import ResourceCache
+
+
+@pytest.fixture
+def pcm(tmp_path, monkeypatch):
+    # Mixer real, mas sem hardware: driver dummy, como no bake_assets.py
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    was_init = pygame.mixer.get_init()
+    if not was_init:
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            pytest.skip(f"mixer indisponível: {e}")
+    monkeypatch.setattr(PCMCache, "_instance", None)
+    cache = PCMCache()
+    cache.cache_dir = str(tmp_path / "sound_cache")
+    yield cache
+    if not was_init:
+        pygame.mixer.quit()
+
+
+def _write_wav(path, frames=2205):
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(22050)
+        w.writeframes(bytes(range(256)) * (frames * 2 // 256))
+
+
+def test_store_then_load_skips_decoder(pcm, tmp_path):
+    source = tmp_path / "beep.wav"
+    _write_wav(source)
+    decoded = pygame.mixer.Sound(str(source))
+
+    assert pcm.load("sounds/beep.wav", str(source)) is None
+    assert pcm.store("sounds/beep.wav", str(source), decoded)
+    assert pcm.cache_file("sounds/beep.wav").endswith("sounds_beep.pcm")
+
+    cached = pcm.load("sounds/beep.wav", str(source))
+    assert cached.get_raw() == decoded.get_raw()
+    assert pcm.hits == 1
+
+
+def test_changed_source_invalidates_entry(pcm, tmp_path):
+    source = tmp_path / "beep.wav"
+    _write_wav(source)
+    pcm.store("sounds/beep.wav", str(source), pygame.mixer.Sound(str(source)))
+
+    _write_wav(source, frames=4410)
+    assert pcm.load("sounds/beep.wav", str(source)) is None
+
+
+def test_same_size_edit_invalidates_entry(pcm, tmp_path):
+    source = tmp_path / "beep.wav"
+    _write_wav(source)
+    pcm.store("sounds/beep.wav", str(source), pygame.mixer.Sound(str(source)))
+    stored_mtime = os.stat(source).st_mtime
+
+    # Dentro da folga de 2 s: continua válido
+    os.utime(source, (stored_mtime + 1, stored_mtime + 1))
+    assert pcm.load("sounds/beep.wav", str(source)) is not None
+
+    # Mesmo tamanho, modificado depois: o horário denuncia a edição
+    os.utime(source, (stored_mtime + 60, stored_mtime + 60))
+    assert pcm.load("sounds/beep.wav", str(source)) is None
+
+
+def test_rare_effects_load_on_first_use(pcm, monkeypatch):
+    monkeypatch.setattr(ResourceCache, "_instance", None)
+    loaded = []
+    real_get_sound = ResourceCache.get_sound
+    monkeypatch.setattr(
+        ResourceCache, "get_sound", lambda self, p: loaded.append(p) or real_get_sound(self, p)
+    )
+    monkeypatch.setattr(
+        effects_module.os.path, "exists", lambda p: not p.endswith("collect.mp3")
+    )
+
+    sfx = SoundEffects()
+    sfx.load_sound_effects()
+    assert set(sfx.sound_effects) == {"jump", "shot", "explosion"}
+    assert "sounds/game-over.mp3" not in loaded
+
+    assert sfx.get("game-over") is not None
+    assert loaded[-1] == "sounds/game-over.mp3"
+    # Missing file: reuses the fallback effect's sound
+    assert sfx.get("collect") is sfx.get("new-life")
+    assert sfx.get("unknown") is None
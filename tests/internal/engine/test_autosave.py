@@ -0,0 +1,41 @@
+import json
+import os
+
+from internal.engine.autosave import AutosaveWriter, write_json_atomic
+
+
+def test_write_json_atomic_replaces_without_leftovers(tmp_path):
+    path = str(tmp_path / "autosave.json")
+    write_json_atomic(path, {"level": 1})
+    write_json_atomic(path, {"level": 2})
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == {"level": 2}
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_writer_coalesces_to_newest_snapshot(tmp_path):
+    path = str(tmp_path / "autosave.json")
+    w = AutosaveWriter()
+    # Segurar a escrita enquanto vários snapshots chegam
+    with w._write_lock:
+        for lvl in range(1, 6):
+            w.submit(path, {"level": lvl})
+    w.flush()
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == {"level": 5}
+    assert w.writes == 1
+    assert w.coalesced == 4
+    w.close()
+
+
+def test_writer_clear_drops_pending_and_removes_file(tmp_path):
+    path = str(tmp_path / "autosave.json")
+    w = AutosaveWriter()
+    w.submit(path, {"level": 3})
+    w.flush()
+    assert os.path.exists(path)
+    w.submit(path, {"level": 4})
+    w.clear(path)
+    w.flush()
+    assert not os.path.exists(path)
+    w.close()
@@ -0,0 +1,54 @@
+import types
+
+import pygame
+
+from internal.engine.collision import collide_precise
+from internal.resources.cache import ResourceCache
+
+
+def _sprite(x, y, image):
+    return types.SimpleNamespace(
+        x=x,
+        y=y,
+        rect=pygame.Rect(x, y, image.get_width(), image.get_height()),
+        sprite_image=lambda: image,
+    )
+
+
+def _corner_dot(size=20):
+    """Superfície transparente com só o pixel superior esquerdo opaco."""
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    surf.fill((0, 0, 0, 0))
+    surf.set_at((0, 0), (255, 255, 255, 255))
+    return surf
+
+
+def test_transparent_corners_do_not_count_as_hit():
+    a = _sprite(0, 0, _corner_dot())
+    b = _sprite(10, 10, _corner_dot())
+    assert a.rect.colliderect(b.rect)
+    assert not collide_precise(a, b)
+
+
+def test_opaque_pixels_overlap_counts_as_hit():
+    solid = pygame.Surface((20, 20))
+    a = _sprite(0, 0, solid)
+    b = _sprite(10, 10, solid)
+    assert collide_precise(a, b)
+    assert not collide_precise(a, _sprite(100, 100, solid))
+
+
+def test_without_image_falls_back_to_rect():
+    a = types.SimpleNamespace(rect=pygame.Rect(0, 0, 10, 10))
+    b = _sprite(5, 5, _corner_dot())
+    assert collide_precise(a, b)
+
+
+def test_masks_are_cached_per_surface():
+    cache = ResourceCache()
+    image = _corner_dot()
+    mask = cache.get_mask(image)
+    assert cache.get_mask(image) is mask
+    cache.preload_masks([image, None])
+    assert cache.get_mask(image) is mask
+    assert cache.get_cache_stats()["masks_cached"] >= 1
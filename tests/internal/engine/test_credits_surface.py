@@ -0,0 +1,64 @@
+import pygame
+
+from internal.engine.game import Game
+from internal.engine.state import GameState
+from internal.engine.game_modules.draw import (
+    CREDITS_LINE_HEIGHT,
+    ENDING_CREDITS,
+    Draw,
+)
+from internal.utils.constants import HEIGHT, WIDTH
+
+
+def _ending_game():
+    g = Game()
+    g.music.play_menu_music = lambda *_a, **_k: None
+    g.state = GameState.CREDITS
+    g.credits_type = "ending"
+    return g
+
+
+def test_credits_surface_is_built_once():
+    g = _ending_game()
+    drawer = Draw(g)
+    surface, pad = drawer._get_credits_surface(g)
+    again, _ = drawer._get_credits_surface(g)
+    assert again is surface
+    assert surface.get_height() == pad * 2 + len(ENDING_CREDITS) * CREDITS_LINE_HEIGHT
+    assert surface.get_width() <= WIDTH
+
+
+def test_credits_window_blit_is_single_and_clipped():
+    screen = pygame.Surface((WIDTH, HEIGHT))
+    tall = pygame.Surface((100, HEIGHT * 3))
+    tall.fill((255, 255, 255))
+
+    calls = []
+
+    class SpyScreen:
+        def blit(self, surface, dest, area=None):
+            calls.append((dest, area))
+            return screen.blit(surface, dest, area)
+
+    # Janela no meio da superfície: uma única cópia com a altura da tela
+    Draw._blit_window(SpyScreen(), tall, -HEIGHT)
+    assert len(calls) == 1
+    dest, area = calls[0]
+    assert dest == ((WIDTH - 100) // 2, 0)
+    assert area.y == HEIGHT and area.height == HEIGHT
+
+    # Totalmente abaixo ou acima da tela: nada a desenhar
+    calls.clear()
+    Draw._blit_window(SpyScreen(), tall, HEIGHT)
+    Draw._blit_window(SpyScreen(), tall, -HEIGHT * 3)
+    assert calls == []
+
+
+def test_credits_scroll_draws_text_pixels():
+    g = _ending_game()
+    # Linha "JUMP & HIT" (índice 3) no meio da tela
+    g.credits_scroll_y = HEIGHT - HEIGHT // 2 + 3 * CREDITS_LINE_HEIGHT
+    g.draw()
+    assert g.state == GameState.CREDITS
+    row = [g.screen.get_at((x, HEIGHT // 2))[:3] for x in range(0, WIDTH, 4)]
+    assert any(px != (0, 0, 0) for px in row)
@@ -0,0 +1,31 @@
+import types
+
+from internal.engine.game_modules.update import Update
+from internal.resources.enemies.turtle import Turtle
+from internal.resources.enemies.robot import Robot
+from internal.utils.constants import WIDTH, ENEMY_ACTIVATION_MARGIN
+
+
+def _update():
+    return Update(types.SimpleNamespace())
+
+
+def test_far_turtle_sleeps_and_near_turtle_is_awake():
+    u = _update()
+    near = Turtle(300, 500, 200, 400)
+    far = Turtle(20000, 500, 19900, 20100)
+    assert u._is_awake(near, 0) is True
+    assert u._is_awake(far, 0) is False
+    # Acorda quando a câmera se aproxima (dentro da margem)
+    assert u._is_awake(far, 19900 - WIDTH - ENEMY_ACTIVATION_MARGIN + 10) is True
+
+
+def test_dying_or_shooting_enemies_stay_awake():
+    u = _update()
+    far = Turtle(20000, 500, 19900, 20100)
+    far.die()
+    assert u._is_awake(far, 0) is True
+    robot = Robot(20000, 500, 19900, 20100)
+    assert u._is_awake(robot, 0, "missiles") is False
+    robot.missiles.append(object())
+    assert u._is_awake(robot, 0, "missiles") is True
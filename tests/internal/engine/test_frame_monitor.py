@@ -0,0 +1,98 @@
+import internal.engine.frame_monitor as fm_mod
+from internal.engine.frame_monitor import FrameMonitor
+from internal.engine.state import GameState
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _frame(monitor, clock, timings, state=GameState.PLAYING, level=1):
+    monitor.begin_frame()
+    for section, ms in timings:
+        clock.now += ms / 1000.0
+        monitor.lap(section)
+    return monitor.end_frame(state, level)
+
+
+def test_fast_frames_are_not_logged(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(fm_mod.time, "perf_counter", clock)
+    lines = []
+    monitor = FrameMonitor(log=lines.append)
+
+    total = _frame(monitor, clock, [("events", 1), ("update", 5), ("draw", 6)])
+
+    assert abs(total - 12) < 1e-6
+    assert lines == []
+    assert monitor.frames == 1
+    assert monitor.histogram[2] == 1
+
+
+def test_long_frame_logged_with_state_level_and_cause(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(fm_mod.time, "perf_counter", clock)
+    lines = []
+    monitor = FrameMonitor(log=lines.append)
+
+    _frame(monitor, clock, [("events", 1), ("update", 30), ("draw", 4)], level=37)
+
+    assert monitor.long_frames == 1
+    assert len(lines) == 1
+    assert "PLAYING" in lines[0]
+    assert "fase=37" in lines[0]
+    assert "update=30.0" in lines[0]
+    assert monitor.worst_cause == "update em PLAYING (fase 37)"
+
+
+def test_summary_percentiles_and_histogram(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(fm_mod.time, "perf_counter", clock)
+    lines = []
+    monitor = FrameMonitor(log=lines.append)
+
+    for _ in range(98):
+        _frame(monitor, clock, [("draw", 10)])
+    _frame(monitor, clock, [("draw", 40)])
+    _frame(monitor, clock, [("update", 120)], level=51)
+    lines.clear()
+
+    summary = monitor.get_summary()
+    assert summary["frames"] == 100
+    assert summary["long_frames"] == 2
+    assert abs(summary["p50_ms"] - 10) < 1e-6
+    assert abs(summary["worst_ms"] - 120) < 1e-6
+    assert summary["histogram"][-1] == 1
+
+    monitor.log_summary()
+    assert len(lines) == 3
+    assert "100 quadros" in lines[0]
+    assert "fase 51" in lines[1]
+    assert ">100:1" in lines[2]
+
+
+def test_empty_summary_writes_nothing():
+    lines = []
+    FrameMonitor(log=lines.append).log_summary()
+    assert lines == []
+
+
+def test_notes_are_reported_but_not_summed(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(fm_mod.time, "perf_counter", clock)
+    lines = []
+    monitor = FrameMonitor(log=lines.append)
+
+    monitor.begin_frame()
+    clock.now += 0.025
+    monitor.lap("update")
+    monitor.note("gc", 12.0)
+    total = monitor.end_frame(GameState.PLAYING, 3)
+
+    assert abs(total - 25) < 1e-6
+    assert "(gc=12.0)" in lines[0]
+    assert monitor.get_summary()["notes"] == {"gc": (12.0, 12.0)}
@@ -665,8 +665,9 @@ def test_draw_show_ranking_renders_table(monkeypatch):
 
     g = make_game(monkeypatch)
     # Stub ranking manager
+    requested = []
     g.ranking_manager = types.SimpleNamespace(
-        get_rankings=lambda: [
+        get_rankings=lambda difficulty=None: requested.append(difficulty) or [
             {"name": "AAA", "score": 1000},
             {"name": "BBB", "score": 750},
         ]
@@ -677,6 +678,8 @@ def test_draw_show_ranking_renders_table(monkeypatch):
     g.draw()
     # Title, headers and at least two rows should be blitted
     assert len(g.screen.blit_calls) > pre_blits
+    # The board shown is the one of the current difficulty
+    assert requested == [g.difficulty]
 
 
 def test_draw_fim_screen_shows_skip_hint(monkeypatch):
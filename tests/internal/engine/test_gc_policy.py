@@ -0,0 +1,67 @@
+import gc
+
+import pytest
+
+from internal.engine.gc_policy import GCPolicy
+from internal.engine.state import GameState
+
+
+@pytest.fixture
+def policy():
+    threshold = gc.get_threshold()
+    GCPolicy._instance = None
+    p = GCPolicy()
+    yield p
+    p.stop()
+    GCPolicy._instance = None
+    gc.set_threshold(*threshold)
+
+
+def test_inactive_policy_leaves_gc_alone(policy):
+    before = gc.get_threshold()
+    assert policy.collect("level") == 0
+    policy.on_state(GameState.PLAYING)
+    assert gc.get_threshold() == before
+    assert policy.explicit_collections == 0
+
+
+def test_start_collects_and_freezes(policy, monkeypatch):
+    frozen = []
+    monkeypatch.setattr(gc, "freeze", lambda: frozen.append(True))
+    policy.start()
+    assert policy.active
+    assert frozen == [True]
+    assert policy.last_reason == "assets"
+    assert policy._on_gc in gc.callbacks
+    policy.stop()
+    assert policy._on_gc not in gc.callbacks
+
+
+def test_playing_raises_gen2_threshold_and_menu_collects(policy, monkeypatch):
+    monkeypatch.setattr(gc, "freeze", lambda: None)
+    base = gc.get_threshold()
+    policy.start()
+
+    policy.on_state(GameState.PLAYING)
+    assert policy.gameplay
+    assert gc.get_threshold() == (base[0], base[1], GCPolicy.GAMEPLAY_GEN2_THRESHOLD)
+
+    collections = policy.explicit_collections
+    policy.on_state(GameState.PAUSED)
+    assert not policy.gameplay
+    assert gc.get_threshold() == base
+    assert policy.explicit_collections == collections + 1
+    assert policy.last_reason == "menu"
+
+
+def test_gc_pauses_are_reported_per_frame(policy, monkeypatch):
+    monkeypatch.setattr(gc, "freeze", lambda: None)
+    policy.start()
+    policy.take_frame_pause()
+
+    gc.collect()
+
+    assert policy.pauses >= 1
+    assert policy.take_frame_pause() > 0
+    assert policy.take_frame_pause() == 0
+    assert policy.get_stats()["max_pause_ms"] > 0
@@ -0,0 +1,118 @@
+import types
+
+import pygame
+
+from internal.engine.input_state import InputState, input_for
+
+
+class FakeKeys:
+    def __init__(self, down=()):
+        self.down = set(down)
+
+    def __getitem__(self, key):
+        return key in self.down
+
+
+def fake_pygame(down=()):
+    keys = FakeKeys(down)
+    pg = types.SimpleNamespace(
+        K_LEFT=pygame.K_LEFT,
+        K_a=pygame.K_a,
+        K_RIGHT=pygame.K_RIGHT,
+        K_d=pygame.K_d,
+        K_DOWN=pygame.K_DOWN,
+        K_s=pygame.K_s,
+        K_UP=pygame.K_UP,
+        K_w=pygame.K_w,
+        K_SPACE=pygame.K_SPACE,
+    )
+    pg.key = types.SimpleNamespace(get_pressed=lambda: keys)
+    return pg, keys
+
+
+class FakeJoystick:
+    def __init__(self, axes=(), buttons=()):
+        self.axes = list(axes)
+        self.buttons = list(buttons)
+
+    def get_numaxes(self):
+        return len(self.axes)
+
+    def get_axis(self, i):
+        return self.axes[i]
+
+    def get_numbuttons(self):
+        return len(self.buttons)
+
+    def get_button(self, i):
+        return self.buttons[i]
+
+
+def test_default_keys_resolve_to_actions():
+    pg, _ = fake_pygame([pygame.K_a, pygame.K_SPACE])
+    state = InputState(pg).sample()
+    assert state.down["left"] and state.down["shoot"]
+    assert not state.down["right"] and not state.down["jump"]
+
+
+def test_custom_controls_and_edges():
+    pg, keys = fake_pygame([pygame.K_j])
+    game = types.SimpleNamespace(controls={"left": [pygame.K_j]}, joystick_controls={})
+    state = InputState(pg)
+    state.sample(game)
+    assert state.down["left"] and state.pressed["left"]
+    state.sample(game)
+    assert state.down["left"] and not state.pressed["left"]
+    keys.down.clear()
+    state.sample(game)
+    assert not state.down["left"] and state.released["left"]
+
+
+def test_in_place_edit_requires_invalidate():
+    pg, _ = fake_pygame([pygame.K_k])
+    game = types.SimpleNamespace(controls={"jump": [pygame.K_UP]}, joystick_controls={})
+    state = InputState(pg)
+    assert not state.sample(game).down["jump"]
+    game.controls["jump"] = [pygame.K_k]
+    assert not state.sample(game).down["jump"]
+    state.invalidate_bindings()
+    assert state.sample(game).down["jump"]
+
+
+def test_joystick_axes_buttons_and_deadzone():
+    pg, _ = fake_pygame()
+    game = types.SimpleNamespace(controls={}, joystick_controls={"jump": 0, "shoot": 2})
+    joystick = FakeJoystick(
+        axes=[0.05, 0.8, 0, 0, 0, 0, -1.0, 1.0],
+        buttons=[False, True, True],
+    )
+    state = InputState(pg).sample(game, joystick)
+    assert state.axis_x == 0
+    assert state.axis_y == 0.8
+    assert state.down["crouch"] and state.down["shoot"]
+    assert not state.down["jump"]
+    assert (state.dpad_x, state.dpad_y) == (-1.0, 1.0)
+
+
+def test_current_samples_once_per_frame():
+    pg, keys = fake_pygame()
+    game = types.SimpleNamespace(controls={}, joystick_controls={})
+    state = InputState(pg)
+    # Outside the loop every read samples again
+    state.current(game)
+    state.current(game)
+    assert state.samples == 2
+    state.begin_frame()
+    state.current(game)
+    keys.down.add(pygame.K_RIGHT)
+    assert not state.current(game).down["right"]
+    assert state.samples == 3
+    state.begin_frame()
+    assert state.current(game).down["right"]
+
+
+def test_input_for_attaches_state():
+    game = types.SimpleNamespace(controls={}, joystick_controls={})
+    snapshot = input_for(game)
+    assert game.input_state is snapshot
+    assert input_for(game) is snapshot
@@ -0,0 +1,80 @@
+import types
+
+from internal.engine.game_modules.lifecycle import Lifecycle, is_removed, live
+
+
+class Thing:
+    def __init__(self, name):
+        self.name = name
+
+
+def make_game():
+    pooled = []
+    game = types.SimpleNamespace(
+        player=types.SimpleNamespace(bullets=[Thing("b1"), Thing("b2")]),
+        birds=[Thing("bird1"), Thing("bird2")],
+        robots=[],
+        return_bullet_to_pool=pooled.append,
+    )
+    return game, pooled
+
+
+def test_kill_marks_without_touching_lists():
+    game, _ = make_game()
+    lifecycle = Lifecycle(game)
+    bird = game.birds[0]
+    lifecycle.kill(bird)
+    lifecycle.kill(bird)
+
+    assert is_removed(bird)
+    assert lifecycle.pending == 1
+    assert len(game.birds) == 2
+    assert [b.name for b in live(game.birds)] == ["bird2"]
+
+
+def test_sweep_compacts_lists_and_returns_bullets_to_pool():
+    game, pooled = make_game()
+    lifecycle = Lifecycle(game)
+    bullets = game.player.bullets
+    bullet = bullets[0]
+    lifecycle.kill(bullet)
+    lifecycle.kill(game.birds[1])
+
+    assert lifecycle.sweep() == 2
+    assert game.player.bullets is bullets
+    assert [b.name for b in bullets] == ["b2"]
+    assert [b.name for b in game.birds] == ["bird1"]
+    assert pooled == [bullet]
+    assert lifecycle.pending == 0
+
+
+def test_sweep_is_free_without_pending_kills():
+    game, pooled = make_game()
+    lifecycle = Lifecycle(game)
+    game.birds[0].removed = True  # marked outside the lifecycle
+    assert lifecycle.sweep() == 0
+    assert len(game.birds) == 2
+
+
+def test_sweep_compacts_projectiles_owned_by_enemies():
+    game, _ = make_game()
+    missile = Thing("m1")
+    robot = Thing("robot")
+    robot.missiles = [missile, Thing("m2")]
+    game.robots.append(robot)
+    lifecycle = Lifecycle(game)
+    lifecycle.kill(missile)
+    lifecycle.sweep()
+
+    assert [m.name for m in robot.missiles] == ["m2"]
+    assert game.robots == [robot]
+
+
+def test_live_skips_entities_killed_during_iteration():
+    game, _ = make_game()
+    lifecycle = Lifecycle(game)
+    seen = []
+    for bird in live(game.birds):
+        seen.append(bird.name)
+        lifecycle.kill(game.birds[1])
+    assert seen == ["bird1"]
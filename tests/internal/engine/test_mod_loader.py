@@ -0,0 +1,88 @@
+import types
+
+import pytest
+
+from internal.engine.mod_loader import HOOK_NAMES, ModLoader
+
+
+def _loader(**env):
+    game = types.SimpleNamespace(env_config=env)
+    return ModLoader(game), game
+
+
+def test_hooks_receive_game_and_args():
+    loader, game = _loader()
+    seen = []
+    loader.register_hook("on_spawn", lambda g, enemy: seen.append((g, enemy)), "m")
+    loader.call_hook("on_spawn", "bird")
+    loader.call_hook("pre_update")  # sem callbacks: nada acontece
+    assert seen == [(game, "bird")]
+
+
+def test_unknown_hook_is_rejected():
+    loader, _ = _loader()
+    with pytest.raises(ValueError):
+        loader.register_hook("on_whatever", lambda g: None, "m")
+
+
+def test_over_budget_warns_then_disables(capsys):
+    loader, _ = _loader(mod_frame_budget_ms="1", mod_disable_after_frames="3")
+    calls = []
+    loader.register_hook("post_update", lambda g: calls.append(1), "pesado")
+    for _ in range(3):
+        loader.call_hook("post_update")
+        loader.mod_stats["pesado"]["frame_ms"] += 5.0  # simula custo alto
+        loader.begin_frame()
+    out = capsys.readouterr().out
+    assert "pesado" in out and "desativado" in out
+    name, _last, _avg, peak, disabled = loader.get_stats()[0]
+    assert name == "pesado" and disabled and peak >= 5.0
+
+    loader.call_hook("post_update")
+    assert len(calls) == 3
+
+
+def test_within_budget_keeps_running():
+    loader, _ = _loader(mod_frame_budget_ms="50")
+    loader.register_hook("pre_draw", lambda g: None, "leve")
+    for _ in range(200):
+        loader.call_hook("pre_draw")
+        loader.begin_frame()
+    assert loader.get_stats()[0][4] is False
+
+
+def test_failing_hook_disables_only_that_mod():
+    loader, _ = _loader()
+    ok = []
+
+    def broken(g):
+        raise RuntimeError("boom")
+
+    loader.register_hook("pre_update", broken, "a_quebrado")
+    loader.register_hook("pre_update", lambda g: ok.append(1), "b_ok")
+    loader.call_hook("pre_update")
+    loader.call_hook("pre_update")
+    assert ok == [1, 1]
+    assert [s[4] for s in loader.get_stats()] == [True, False]
+
+
+def test_load_mods_registers_module_hooks(tmp_path, monkeypatch):
+    (tmp_path / "meu_mod.py").write_text(
+        "def init_mod(game):\n"
+        "    game.register_mod_hook('on_level_init', lambda g: g.log.append('init'))\n"
+        "def post_draw(game):\n"
+        "    game.log.append('draw')\n",
+        encoding="utf-8",
+    )
+    loader, game = _loader()
+    game.log = []
+    game.register_mod_hook = lambda hook, cb, mod_name=None: loader.register_hook(
+        hook, cb, mod_name
+    )
+    monkeypatch.setattr(loader, "get_mods_directory", lambda: tmp_path)
+    loader.load_mods()
+    loader.call_hook("on_level_init")
+    loader.call_hook("post_draw")
+    assert game.log == ["init", "draw"]
+    assert [s[0] for s in loader.get_stats()] == ["meu_mod"]
+    assert set(loader.hooks) == set(HOOK_NAMES)
@@ -0,0 +1,69 @@
+import pygame
+
+from internal.engine.game import Game
+from internal.engine.state import GameState
+from internal.engine.game_modules.draw import Draw
+
+
+def _game(state):
+    g = Game()
+    g.music.play_menu_music = lambda *_a, **_k: None
+    g.state = state
+    return g
+
+
+def test_pause_panel_reused_until_selection_changes():
+    g = _game(GameState.PAUSED)
+    drawer = Draw(g)
+    drawer.draw_ocean_background = lambda *_a: None
+    g.pause_selected = 0
+
+    drawer._draw_paused()
+    key, panel, _pos = drawer._modal_panels["paused"]
+    drawer._draw_paused()
+    assert drawer._modal_panels["paused"][1] is panel
+
+    g.pause_selected = 1
+    drawer._draw_paused()
+    new_key, new_panel, _pos = drawer._modal_panels["paused"]
+    assert new_panel is not panel
+    assert new_key != key
+
+
+def test_overlay_surface_created_once_per_alpha():
+    g = _game(GameState.CONFIRM_NEW_GAME)
+    drawer = Draw(g)
+    assert drawer._modal_overlay(180) is drawer._modal_overlay(180)
+    assert drawer._modal_overlay(160) is not drawer._modal_overlay(180)
+    assert drawer._modal_overlay(180).get_at((0, 0)).a == 180
+
+
+def test_dialog_rebuilt_when_button_labels_change():
+    g = _game(GameState.CONFIRM_EXIT_TO_MENU)
+    drawer = Draw(g)
+    drawer.draw_ocean_background = lambda *_a: None
+    g.joystick_connected = False
+
+    drawer._draw_confirm_exit_to_menu()
+    _key, panel, pos = drawer._modal_panels["confirm_exit_to_menu"]
+    assert panel.get_size() == (760 + 24, 240 + 24)
+    drawer._draw_confirm_exit_to_menu()
+    assert drawer._modal_panels["confirm_exit_to_menu"][1] is panel
+
+    g.joystick_connected = True
+    g.joystick_name = "Xbox Controller"
+    drawer._draw_confirm_exit_to_menu()
+    assert drawer._modal_panels["confirm_exit_to_menu"][1] is not panel
+    assert drawer._modal_panels["confirm_exit_to_menu"][2] == pos
+
+
+def test_confirm_dialog_matches_screen_layout():
+    g = _game(GameState.CONFIRM_NEW_GAME)
+    drawer = Draw(g)
+    g.screen = pygame.Surface(g.screen.get_size())
+    drawer.draw_ocean_background = lambda surface=None: g.screen.fill((0, 0, 0))
+    drawer._draw_confirm_new_game()
+    _key, panel, (x, y) = drawer._modal_panels["confirm_new_game"]
+    # Box center carries the dark blue fill from the panel
+    center = (x + panel.get_width() // 2, y + panel.get_height() // 2 - 40)
+    assert g.screen.get_at(center)[:3] == panel.get_at((panel.get_width() // 2, panel.get_height() // 2 - 40))[:3]
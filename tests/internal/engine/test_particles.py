@@ -0,0 +1,107 @@
+import types
+
+import pygame
+
+from internal.engine.particles import (
+    ParticleLayer,
+    ParticleSystem,
+    explosion_sprite,
+    glow_sprite,
+)
+from internal.engine.game_modules.draw import Draw
+from internal.resources.bullet import Bullet
+from internal.resources.explosion import Explosion
+from internal.utils.constants import WIDTH
+
+
+class SpyScreen:
+    def __init__(self):
+        self.surface = pygame.Surface((WIDTH, 200))
+        self.blits_calls = []
+        self.blit_calls = []
+
+    def blits(self, items, doreturn=True):
+        items = [(surface, tuple(dest)) for surface, dest in items]
+        self.blits_calls.append(items)
+        return self.surface.blits(items, doreturn=doreturn)
+
+    def blit(self, surface, dest, *args):
+        self.blit_calls.append(dest)
+        return self.surface.blit(surface, dest, *args)
+
+
+def test_sprites_are_rendered_once_per_size():
+    glow, dx, dy = glow_sprite(15, 8)
+    assert glow_sprite(15, 8)[0] is glow
+    assert glow.get_size() == (18, 12)
+    assert (dx, dy) == (-2, -2)
+    assert explosion_sprite(40, 40) is explosion_sprite(40, 40)
+
+
+def test_layer_reuses_slots_and_flushes_in_one_blits():
+    layer = ParticleLayer("test", capacity=2)
+    screen = SpyScreen()
+    img = pygame.Surface((4, 4))
+    slots = list(layer._slots)
+    for i in range(3):
+        layer.emit(img, i * 10, 5)
+    assert layer.capacity == 3
+    assert layer._slots[:2] == slots
+    layer.flush(screen)
+    assert screen.blits_calls == [[(img, (0, 5)), (img, (10, 5)), (img, (20, 5))]]
+    assert len(layer) == 0
+    layer.flush(screen)
+    assert len(screen.blits_calls) == 1
+    assert (layer.batches, layer.particles) == (1, 3)
+
+
+def test_explosion_sprite_blinks_without_image():
+    explosion = Explosion(0, 0)
+    explosion.timer = 30
+    assert explosion.sprite_image() is explosion_sprite(40, 40)
+    explosion.timer = 27
+    assert explosion.sprite_image() is None
+    img = pygame.Surface((40, 40))
+    assert Explosion(0, 0, img).sprite_image() is img
+
+
+def make_game(**lists):
+    player = types.SimpleNamespace(bullets=lists.pop("bullets", []))
+    return types.SimpleNamespace(screen=SpyScreen(), camera_x=100, player=player, **lists)
+
+
+def test_super_shot_glow_is_batched_over_bullets():
+    img = pygame.Surface((15, 8))
+    bullets = [Bullet(150 + i * 20, 40, 1, img) for i in range(3)]
+    bullets[1].is_super = True
+    bullets[2].is_super = True
+    game = make_game(bullets=bullets)
+    draw = Draw(game)
+
+    draw._draw_layer(game, bullets, -20, WIDTH + 20, overlay=draw._particles.layer("glow"))
+
+    sprites, glows = game.screen.blits_calls
+    assert [dest for _, dest in sprites] == [(50, 40), (70, 40), (90, 40)]
+    glow = glow_sprite(15, 8)[0]
+    assert [(s, dest) for s, dest in glows] == [(glow, (68, 38)), (glow, (88, 38))]
+    assert game.screen.blit_calls == []
+
+
+def test_explosions_drawn_as_one_particle_batch():
+    img = pygame.Surface((40, 40))
+    explosions = [Explosion(120 + i * 50, 10, img) for i in range(4)]
+    explosions.append(Explosion(100 + WIDTH * 2, 10, img))  # off screen
+    game = make_game(explosions=explosions)
+    draw = Draw(game)
+
+    draw._draw_particles(game, explosions, -50, WIDTH, "explosions")
+
+    assert len(game.screen.blits_calls) == 1
+    assert len(game.screen.blits_calls[0]) == 4
+    assert explosions[0].x == 120  # world position untouched
+
+
+def test_particle_system_layers():
+    system = ParticleSystem(capacity=4)
+    assert list(system.layers) == ["explosions", "glow"]
+    assert system.get_stats()["glow"] == (4, 0, 0)
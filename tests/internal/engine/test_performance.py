@@ -0,0 +1,152 @@
+import types
+
+import pygame
+
+from internal.engine import screen as screen_module
+from internal.engine.game_modules.update import Update
+from internal.engine.particles import ParticleSystem
+from internal.engine.performance import PerformanceProfile
+from internal.resources.cache import ResourceCache
+
+
+def test_preference_cycles_and_auto_resolves_from_benchmark(monkeypatch):
+    profile = PerformanceProfile()
+    assert (profile.preference, profile.name) == ("auto", "high")
+    assert profile.cycle() == "high"
+    assert profile.cycle() == "low"
+    assert profile.max_hazards == 12 and not profile.post_effects
+    assert profile.cycle() == "auto"
+
+    monkeypatch.setattr(PerformanceProfile, "_benchmark_ms", 50.0)
+    assert profile.select() == "low"
+    assert profile.describe() == "Auto (Baixo)"
+    monkeypatch.setattr(PerformanceProfile, "_benchmark_ms", 1.0)
+    assert profile.select() == "high"
+    assert PerformanceProfile("bogus").preference == "auto"
+
+
+class FakeDisplay:
+    def __init__(self):
+        self.set_mode_calls = []
+
+    def set_mode(self, size, flags=0):
+        self.set_mode_calls.append((size, flags))
+        return types.SimpleNamespace(size=size)
+
+    def Info(self):
+        return types.SimpleNamespace(current_w=2400, current_h=1080)
+
+
+class FakePygame:
+    FULLSCREEN = 1
+    SCALED = 512
+
+    def __init__(self):
+        self.display = FakeDisplay()
+        self.Surface = lambda size: types.SimpleNamespace(size=size)
+
+
+def test_low_profile_fullscreen_uses_smaller_scaled_backbuffer(monkeypatch):
+    monkeypatch.setattr(screen_module, "pygame", FakePygame(), raising=True)
+    monkeypatch.setattr(screen_module.Screen, "is_fullscreen", lambda g: True, raising=True)
+    game = types.SimpleNamespace(env_config={}, performance=PerformanceProfile("low"))
+
+    screen_module.Screen.init(game)
+
+    size, flags = screen_module.pygame.display.set_mode_calls[-1]
+    assert size == (int(screen_module.WIDTH * 0.75), int(screen_module.HEIGHT * 0.75))
+    assert flags == FakePygame.FULLSCREEN | FakePygame.SCALED
+    manager = game.screen_manager
+    assert manager.scale_x == 0.75 and (manager.offset_x, manager.offset_y) == (0, 0)
+    assert not screen_module.Screen.post_effects_enabled(game)
+
+
+def test_hazard_cap_limits_spawns():
+    game = types.SimpleNamespace(
+        camera_x=0,
+        raindrops=[],
+        raindrop_spawn_timer=0,
+        raindrop_spawn_interval=1,
+        raindrops_per_spawn=5,
+        image=types.SimpleNamespace(raindrop_img=pygame.Surface((6, 12))),
+        call_mod_hook=lambda *a: None,
+        performance=types.SimpleNamespace(max_hazards=3, animation_step=1),
+    )
+    update = Update(game)
+    update._spawn_raindrops()
+    update._spawn_raindrops()
+    assert len(game.raindrops) == 3
+
+
+def test_spawned_enemies_animate_slower_on_low_profile():
+    game = types.SimpleNamespace(
+        call_mod_hook=lambda *a: None,
+        performance=PerformanceProfile("low"),
+    )
+    enemy = types.SimpleNamespace(animation_speed=8)
+    Update(game)._notify_spawn(enemy)
+    assert enemy.animation_speed == 16
+
+
+def test_particle_limit_drops_excess():
+    particles = ParticleSystem(capacity=4, limit=2)
+    layer = particles.layer("explosions")
+    img = pygame.Surface((2, 2))
+    for i in range(5):
+        layer.emit(img, i, 0)
+    assert (len(layer), layer.dropped) == (2, 3)
+    particles.set_limit(None)
+    layer.emit(img, 0, 0)
+    assert len(layer) == 3
+
+
+def test_fast_textures_are_scaled_and_opaque_ones_drop_alpha():
+    pygame.display.set_mode((10, 10))
+    opaque = pygame.Surface((64, 64), pygame.SRCALPHA)
+    opaque.fill((10, 20, 30, 255))
+    image = ResourceCache._load_fast_texture(opaque, (16, 16))
+    assert image.get_size() == (16, 16)
+    assert not image.get_flags() & pygame.SRCALPHA
+
+    sprite = pygame.Surface((64, 64), pygame.SRCALPHA)
+    sprite.fill((10, 20, 30, 0))
+    image = ResourceCache._load_fast_texture(sprite, (16, 16))
+    assert image.get_flags() & pygame.SRCALPHA
+
+
+def test_level_enemies_animate_slower_on_low_profile():
+    from internal.engine.game import Game
+    from internal.engine.level.level import Level
+
+    g = Game()
+    g.current_level = 11
+    Level.init_level(g)
+    normal = [t.animation_speed for t in g.turtles]
+    assert normal
+
+    g.performance = PerformanceProfile("low")
+    Level.init_level(g)
+    assert [t.animation_speed for t in g.turtles] == [2 * speed for speed in normal]
+    # Applied once per entity, even if it goes through another path later
+    g._update._notify_spawn(g.turtles[0])
+    assert g.turtles[0].animation_speed == 2 * normal[0]
+
+
+def test_present_reuses_scaled_target():
+    pygame.display.set_mode((300, 200))
+    manager = types.SimpleNamespace(
+        real_screen=pygame.display.get_surface(),
+        game_surface=pygame.Surface((400, 266)),
+        game_width=400,
+        game_height=266,
+        scale_x=0.75,
+        scale_y=0.75,
+        offset_x=0,
+        offset_y=0,
+    )
+    game = types.SimpleNamespace(screen_manager=manager, performance=PerformanceProfile("low"))
+    screen_module.Screen.present(game)
+    target = manager._scaled_surface
+    assert target.get_size() == (300, 199)
+    screen_module.Screen.present(game)
+    assert manager._scaled_surface is target
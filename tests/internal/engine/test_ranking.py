@@ -34,4 +34,57 @@ def test_ranking_persistence_and_order(tmp_path, monkeypatch):
 
     last_score = rm2.get_rankings()[-1]["score"]
     assert rm2.is_high_score(last_score + 1) is True
-    assert rm2.is_high_score(last_score) is False
\ No newline at end of file
+    assert rm2.is_high_score(last_score) is False
+
+
+def test_ranking_boards_per_difficulty_and_edition(tmp_path, monkeypatch):
+    from internal.engine.difficulty import Difficulty
+
+    monkeypatch.chdir(tmp_path)
+    rm = RankingManager()
+    rm.set_board(Difficulty.HARD)
+    rm.add_score("Hard", 500)
+    rm.set_board(Difficulty.EASY)
+    rm.add_score("Easy", 10)
+    assert [r["name"] for r in rm.get_rankings()] == ["Easy"]
+    assert [r["name"] for r in rm.get_rankings(Difficulty.HARD)] == ["Hard"]
+    assert rm.get_rankings(Difficulty.NORMAL) == []
+
+    rm.set_board(Difficulty.HARD, edition="demo")
+    assert rm.get_rankings() == []
+    assert os.path.exists(os.path.join("records", "full_hard.jsonl"))
+
+
+def test_ranking_ties_keep_arrival_order_and_history(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    rm = RankingManager()
+    for i in range(15):
+        rm.add_score(f"P{i}", 100)
+    ranks = rm.get_rankings()
+    assert len(ranks) == 10
+    assert ranks[0]["name"] == "P0"
+    # Empate com o 10º não entra no top 10
+    assert rm.is_high_score(100) is False
+    assert rm.is_high_score(101) is True
+    # Histórico mais profundo preservado além do top 10
+    rm2 = RankingManager()
+    assert len(rm2._get_board()) == 15
+
+
+def test_ranking_ignores_truncated_line_and_migrates_legacy(tmp_path, monkeypatch):
+    import json
+
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("records")
+    with open(os.path.join("records", "top10.json"), "w", encoding="utf-8") as f:
+        json.dump([{"name": "Old", "score": 42}], f)
+    rm = RankingManager()
+    assert rm.get_rankings() == [{"name": "Old", "score": 42}]
+    path = os.path.join("records", "full_normal.jsonl")
+    assert os.path.exists(path)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"name": "Cut", "sco')
+    assert RankingManager().get_rankings() == [{"name": "Old", "score": 42}]
+    rm3 = RankingManager()
+    rm3.add_score("New", 7)
+    assert [r["name"] for r in RankingManager().get_rankings()] == ["Old", "New"]
@@ -0,0 +1,81 @@
+import types
+
+import pygame
+
+from internal.engine.render_queue import RenderQueue
+from internal.engine.game_modules.draw import Draw
+from internal.resources.enemies.bat import Bat
+from internal.resources.enemies.bird import Bird
+from internal.utils.constants import WIDTH
+
+
+class SpyScreen:
+    def __init__(self):
+        self.surface = pygame.Surface((WIDTH, 200))
+        self.blits_calls = []
+        self.blit_calls = []
+
+    def blits(self, items, doreturn=True):
+        self.blits_calls.append(list(items))
+        return self.surface.blits(items, doreturn=doreturn)
+
+    def blit(self, surface, dest, *args):
+        self.blit_calls.append(dest)
+        return self.surface.blit(surface, dest, *args)
+
+
+def test_flush_uses_single_blits_call_and_empties_queue():
+    queue = RenderQueue()
+    screen = SpyScreen()
+    img = pygame.Surface((4, 4))
+    for i in range(5):
+        queue.submit(img, (i * 10, 0))
+    queue.flush(screen)
+    assert len(screen.blits_calls) == 1 and len(screen.blits_calls[0]) == 5
+    assert len(queue) == 0
+    queue.flush(screen)  # fila vazia: nada a fazer
+    assert len(screen.blits_calls) == 1
+    assert (queue.batches, queue.sprites) == (1, 5)
+
+
+def test_flush_falls_back_to_blit_without_blits():
+    class OnlyBlit:
+        def __init__(self):
+            self.calls = []
+
+        def blit(self, surface, dest):
+            self.calls.append(dest)
+
+    queue = RenderQueue()
+    screen = OnlyBlit()
+    queue.submit(pygame.Surface((2, 2)), (1, 2))
+    queue.flush(screen)
+    assert screen.calls == [(1, 2)]
+
+
+def test_draw_layer_batches_visible_sprites_and_keeps_world_x():
+    frames = [pygame.Surface((30, 20)), pygame.Surface((30, 20))]
+    birds = [Bird(100 + i * 40, 50, frames) for i in range(3)]
+    birds.append(Bird(100 + WIDTH * 3, 50, frames))  # fora da tela
+    dead = Bird(300, 60, frames)
+    dead.is_dead = True  # sprite rotacionado: caminho completo de draw
+    birds.append(dead)
+
+    screen = SpyScreen()
+    game = types.SimpleNamespace(screen=screen, camera_x=80)
+    drawer = Draw.__new__(Draw)
+    drawer._render_queue = RenderQueue()
+    drawer._draw_layer(game, birds, -50, WIDTH)
+
+    assert [dest for _, dest in screen.blits_calls[0]] == [(20, 50), (60, 50), (100, 50)]
+    assert screen.blit_calls == [(220, 60)]
+    assert [b.x for b in birds] == [100, 140, 180, 100 + WIDTH * 3, 300]
+
+
+def test_bat_flipped_frame_is_reused():
+    img = pygame.Surface((40, 30))
+    bat = Bat(0, 0, [img])
+    bat.direction = 1
+    assert bat.sprite_image() is bat.sprite_image()
+    bat.direction = -1
+    assert bat.sprite_image() is img
@@ -0,0 +1,28 @@
+from internal.engine.spatial import ChunkIndex
+
+
+def test_query_returns_only_overlapping_buckets_in_insertion_order():
+    idx = ChunkIndex(chunk_width=100)
+    a, b, c = object(), object(), object()
+    idx.insert(a, 0, 50)
+    idx.insert(b, 950, 1250)
+    idx.insert(c, 150, 180)
+    assert idx.query(0, 99) == [a]
+    assert idx.query(0, 199) == [a, c]
+    assert idx.query(1000, 1100) == [b]
+    assert idx.query(5000, 5100) == []
+    assert len(idx) == 3
+
+
+def test_update_moves_object_between_buckets_and_remove():
+    idx = ChunkIndex(chunk_width=100)
+    o = object()
+    idx.insert(o, 10, 20)
+    idx.update(o, 30, 40)  # mesma coluna: nada muda
+    assert idx.query(0, 50) == [o]
+    idx.update(o, 510, 520)
+    assert idx.query(0, 99) == []
+    assert idx.query(500, 599) == [o]
+    idx.remove(o)
+    assert idx.query(500, 599) == []
+    assert len(idx) == 0
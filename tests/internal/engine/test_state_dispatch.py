@@ -0,0 +1,80 @@
+import types
+
+import pygame
+
+import internal.engine.state_dispatch as sd_mod
+from internal.engine.state import GameState
+from internal.engine.state_dispatch import StateDispatch, apply_event_filter
+from internal.engine.game_modules.draw import Draw
+from internal.engine.game_modules.events import Events
+from internal.engine.game_modules.update import Update
+
+
+def test_dispatch_calls_registered_handler_and_records_cost():
+    calls = []
+    table = StateDispatch("test")
+    table.register(GameState.PLAYING, lambda x: calls.append(x) or "ok")
+
+    assert table.dispatch(GameState.PLAYING, 5) == "ok"
+    assert table.dispatch(GameState.MAIN_MENU, 5) is None
+    assert calls == [5]
+    assert GameState.PLAYING in table
+    assert GameState.MAIN_MENU not in table
+
+    stats = table.get_stats()
+    assert stats[0][0] == "PLAYING"
+    assert stats[0][1] == 1
+
+
+def test_modules_register_a_handler_per_state():
+    game = types.SimpleNamespace()
+    draw = Draw(game)
+    assert GameState.PLAYING in draw._states
+    assert GameState.DEMO_END_MESSAGE in draw._states
+
+    update = Update(game)
+    assert GameState.PLAYING in update._states
+    assert GameState.MAIN_MENU not in update._states
+
+    events = Events(game)
+    assert GameState.PAUSED in events._keydown
+    assert GameState.ENTER_NAME not in events._keydown
+    assert GameState.SHOW_RANKING in events._joybutton
+
+
+def test_update_playing_skips_world_when_state_changes():
+    calls = []
+    game = types.SimpleNamespace(
+        state=GameState.PLAYING,
+        sweep_entities=lambda: calls.append("sweep"),
+    )
+    update = Update(game)
+
+    def player():
+        calls.append("player")
+        game.state = GameState.GAME_OVER
+
+    update._update_playing_player = player
+    update._update_playing_world = lambda: calls.append("world")
+    update._update_playing()
+
+    assert calls == ["player", "sweep"]
+
+
+def test_event_filter_blocks_unused_types_and_allows_text_for_names(monkeypatch):
+    blocked, allowed = [], []
+    fake_event = types.SimpleNamespace(
+        set_blocked=lambda types_: blocked.append(set(types_)),
+        set_allowed=lambda types_: allowed.append(set(types_)),
+    )
+    monkeypatch.setattr(sd_mod.pygame, "event", fake_event, raising=False)
+
+    apply_event_filter(GameState.PLAYING)
+    assert pygame.MOUSEMOTION in blocked[-1]
+    assert pygame.TEXTINPUT in blocked[-1]
+    assert pygame.KEYDOWN not in blocked[-1]
+    assert allowed == []
+
+    apply_event_filter(GameState.ENTER_NAME)
+    assert pygame.TEXTINPUT not in blocked[-1]
+    assert allowed[-1] == {pygame.TEXTINPUT}
@@ -0,0 +1,60 @@
+import types
+
+from internal.engine.game_modules.update import Update
+
+
+def names(pipeline):
+    return [system.__name__ for system in pipeline]
+
+
+def test_every_system_in_table_exists():
+    update = Update(types.SimpleNamespace())
+    for _first, _last, name in Update.WORLD_SYSTEMS:
+        assert callable(getattr(update, name))
+
+
+def test_rain_levels_run_birds_and_raindrops_only():
+    update = Update(types.SimpleNamespace(current_level=8))
+    selected = names(update.build_world_pipeline())
+    assert "_spawn_birds" in selected
+    assert "_spawn_raindrops" in selected
+    assert "_player_vs_raindrops" in selected
+    assert "_spawn_bats" not in selected
+    assert "_update_lightning" not in selected
+    assert "_update_boss" not in selected
+    assert selected[-1] == "_check_level_exit"
+
+
+def test_pipeline_keeps_frame_order():
+    update = Update(types.SimpleNamespace())
+    selected = names(update.build_world_pipeline(28))
+    assert selected.index("_spawn_bats") < selected.index("_spawn_lava_drops")
+    assert selected.index("_spawn_lava_drops") < selected.index("_spawn_shooting_stars")
+    assert selected.index("_update_lava_drops") < selected.index("_clear_shooting_stars")
+    assert selected.index("_player_vs_bats") < selected.index("_player_vs_lava_drops")
+
+
+def test_lightning_and_boss_ranges():
+    update = Update(types.SimpleNamespace())
+    assert "_update_lightning" in names(update.build_world_pipeline(37))
+    assert "_update_lightning" not in names(update.build_world_pipeline(36))
+    boss_level = names(update.build_world_pipeline(51))
+    assert "_update_boss" in boss_level
+    assert "_player_vs_fires" in boss_level
+    assert "_player_vs_flying_disks" in boss_level
+    assert "_update_aliens" not in boss_level
+
+
+def test_world_update_rebuilds_after_level_change():
+    game = types.SimpleNamespace(current_level=3)
+    update = Update(game)
+    calls = []
+    update.WORLD_SYSTEMS = ((None, None, "_probe"),)
+    update._probe = lambda: calls.append(game.current_level)
+
+    update._update_playing_world()
+    game.current_level = 12
+    update._update_playing_world()
+
+    assert calls == [3, 12]
+    assert update._world_pipeline_level == 12
@@ -0,0 +1,190 @@
+import types
+
+import internal.resources.image as image_mod
+import internal.resources.cache as cache_mod
+from internal.resources.asset_manifest import (
+    GROUP_ATTRS,
+    IMAGE_GROUPS,
+    WORLD_MANIFESTS,
+    WORLDS,
+    manifest_for_level,
+    world_for_level,
+)
+
+
+class FakeSurface:
+    def __init__(self, w=10, h=10):
+        self._w = w
+        self._h = h
+
+    def get_size(self):
+        return (self._w, self._h)
+
+
+def _fake_loading(monkeypatch):
+    monkeypatch.setattr(
+        image_mod,
+        "pygame",
+        types.SimpleNamespace(
+            transform=types.SimpleNamespace(scale=lambda img, size: FakeSurface(*size)),
+            error=Exception,
+        ),
+        raising=False,
+    )
+
+    def fake_get_image(self, path, scale=None):
+        key = f"{path}_{scale}" if scale else path
+        surf = FakeSurface(*(scale or (20, 20)))
+        self.image_cache[key] = surf
+        return surf
+
+    monkeypatch.setattr(cache_mod.ResourceCache, "get_image", fake_get_image, raising=False)
+    cache = cache_mod.ResourceCache()
+    cache.image_cache.clear()
+    return cache
+
+
+def test_world_for_level_ranges():
+    assert world_for_level(1) == 1
+    assert world_for_level(10) == 1
+    assert world_for_level(11) == 2
+    assert world_for_level(40) == 4
+    assert world_for_level(50) == 5
+    assert world_for_level(51) == 6
+    assert world_for_level(0) == 1
+    assert world_for_level(99) == 6
+    assert world_for_level(None) == 1
+    assert manifest_for_level(27) is WORLD_MANIFESTS[3]
+
+
+def test_manifests_reference_known_groups():
+    assert set(WORLDS) == set(WORLD_MANIFESTS)
+    assert set(IMAGE_GROUPS) == set(GROUP_ATTRS)
+    for manifest in WORLD_MANIFESTS.values():
+        for group in manifest["images"]:
+            assert group in IMAGE_GROUPS
+            assert hasattr(image_mod.Image, f"_load_{group}")
+
+
+def test_load_world_swaps_groups_and_releases_cache(monkeypatch):
+    cache = _fake_loading(monkeypatch)
+    img = image_mod.Image()
+
+    assert img.load_world(5) is True
+    assert img.loaded_groups == {"birds", "raindrop"}
+    assert img.bird_img1 is not None
+    assert "imagens/inimigos/bird1.png_(40, 30)" in cache.image_cache
+    assert not any("boss" in key for key in cache.image_cache)
+
+    # Same level range: nothing changes
+    assert img.load_world(9) is False
+
+    assert img.load_world(51) is True
+    assert img.loaded_groups == {"fire", "boss"}
+    assert "bird_img1" not in vars(img)
+    assert "raindrop_img" not in vars(img)
+    assert img.boss_alien_images is not None
+    assert not any("bird" in key or "chuva" in key for key in cache.image_cache)
+
+
+def test_out_of_world_access_loads_group_on_demand(monkeypatch):
+    _fake_loading(monkeypatch)
+    img = image_mod.Image()
+    img.load_world(1)
+
+    assert img.bat_img1 is not None
+    assert "bats" in img.loaded_groups
+    # Released again on the next world change
+    img.load_world(51)
+    assert "bats" not in img.loaded_groups
+    assert not hasattr(img, "not_an_image")
+
+
+def test_release_images_matches_all_scales():
+    cache = cache_mod.ResourceCache()
+    cache.image_cache.clear()
+    cache.image_cache["a.png"] = 1
+    cache.image_cache["a.png_(1, 1)"] = 2
+    cache.image_cache["a.png_(2, 2)"] = 3
+    cache.image_cache["ab.png"] = 4
+
+    assert cache.release_images(["a.png"]) == 3
+    assert list(cache.image_cache) == ["ab.png"]
+    cache.image_cache.clear()
+
+
+def test_sync_game_mirrors_world_images():
+    img = image_mod.Image()
+    img.airplane_img1 = img.airplane_img2 = img.airplane_img3 = FakeSurface()
+    game = types.SimpleNamespace()
+
+    img.sync_game(game)
+
+    assert game.airplane_images == (img.airplane_img1,) * 3
+    assert game.fire_image is None
+    assert game.turtle_images is None
+    assert "fire_image" not in vars(img)
+
+
+def test_level_enemy_groups_match_world_manifests():
+    from internal.engine.game import Game
+    from internal.engine.level.level import Level
+
+    level_enemies = ("turtles", "spiders", "robots", "aliens")
+    g = Game()
+    created = {world: set() for world in WORLDS}
+    for level in range(1, 52):
+        g.current_level = level
+        Level.init_level(g)
+        for group in level_enemies:
+            if getattr(g, group):
+                created[world_for_level(level)].add(group)
+
+    for world, manifest in WORLD_MANIFESTS.items():
+        resident = set(manifest["images"]) & set(level_enemies)
+        assert resident == created[world], world
+
+
+def test_sound_effects_swap_world_sounds(monkeypatch):
+    from internal.engine.sound import effects as effects_mod
+
+    cache = cache_mod.ResourceCache()
+    cache.sound_cache.clear()
+
+    def fake_get_sound(self, path):
+        sound = types.SimpleNamespace(path=path, set_volume=lambda v: None)
+        self.sound_cache[path] = sound
+        return sound
+
+    monkeypatch.setattr(cache_mod.ResourceCache, "get_sound", fake_get_sound)
+    monkeypatch.setattr(effects_mod.os.path, "exists", lambda p: True)
+    sfx = effects_mod.SoundEffects()
+
+    assert sfx.load_world(3) is True
+    assert "water-hit" in sfx.sound_effects
+    assert "sounds/water-hit.mp3" in cache.sound_cache
+    assert sfx.load_world(10) is False
+
+    assert sfx.load_world(35) is True
+    assert "water-hit" not in sfx.sound_effects
+    assert "sounds/water-hit.mp3" not in cache.sound_cache
+    assert sfx.sound_effects["shock"].path == "sounds/shock.mp3"
+
+    # Common effects are never released by a world change
+    sfx.get("jump")
+    sfx.load_world(51)
+    assert "jump" in sfx.sound_effects
+    assert "shock" not in sfx.sound_effects
+    assert set(cache.sound_cache) == {"sounds/jump.mp3"}
+
+    sfx.unload_world()
+    assert sfx.load_world(51) is True
+    cache.sound_cache.clear()
+
+
+def test_release_sounds_counts_removed_entries():
+    cache = cache_mod.ResourceCache()
+    cache.sound_cache.clear()
+    cache.sound_cache["a.mp3"] = 1
+    assert cache.release_sounds(["a.mp3", "b.mp3"]) == 1
+    assert cache.sound_cache == {}
@@ -0,0 +1,106 @@
+import json
+import os
+
+import pygame
+import pytest
+
+from internal.resources import cache as cache_module
+from internal.resources.bake import bake, choose_format, direct_load_paths
+from internal.resources.cache import ResourceCache
+
+
+@pytest.fixture
+def baked_tree(tmp_path, monkeypatch):
+    pygame.display.set_mode((10, 10))
+    os.makedirs(tmp_path / "imagens" / "bg")
+    os.makedirs(tmp_path / "imagens" / "elementos")
+    background = pygame.Surface((64, 48))
+    background.fill((20, 40, 200))
+    pygame.image.save(background, str(tmp_path / "imagens" / "bg" / "fase.png"))
+    sprite = pygame.Surface((32, 32), pygame.SRCALPHA)
+    sprite.fill((255, 0, 0, 128))
+    pygame.image.save(sprite, str(tmp_path / "imagens" / "elementos" / "gota.png"))
+
+    # Fresh cache singleton rooted at tmp_path
+    monkeypatch.setattr(ResourceCache, "_instance", None)
+    monkeypatch.setattr(cache_module, "resource_path", lambda p: str(tmp_path / p))
+    return tmp_path
+
+
+def test_format_choice_keeps_alpha_and_small_images_in_bmp():
+    opaque = pygame.Surface((100, 100))
+    assert choose_format(opaque) == "jpg"
+    assert choose_format(pygame.Surface((16, 16))) == "bmp"
+    translucent = pygame.Surface((100, 100), pygame.SRCALPHA)
+    translucent.fill((0, 0, 0, 0))
+    assert choose_format(translucent) == "bmp"
+
+
+def test_bake_writes_variants_and_covered_sources(baked_tree):
+    requests = {
+        "imagens/bg/fase.png": {(80, 60)},
+        "imagens/elementos/gota.png": {(8, 8), None},
+    }
+    manifest = bake(requests, root=str(baked_tree))
+
+    images = manifest["images"]
+    assert images["imagens/bg/fase.png@80x60"]["file"] == "imagens_baked/bg/fase@80x60.jpg"
+    assert images["imagens/elementos/gota.png@8x8"]["file"] == "imagens_baked/elementos/gota@8x8.bmp"
+    # Requested unscaled somewhere: the original stays in the package
+    assert manifest["covered"] == ["imagens/bg/fase.png"]
+    with open(baked_tree / "imagens_baked" / "manifest.json", encoding="utf-8") as f:
+        assert json.load(f) == manifest
+
+    protected = bake(requests, root=str(baked_tree), protected={"imagens/bg"})
+    assert protected["covered"] == []
+
+
+def test_cache_prefers_baked_variant_and_records_requests(baked_tree, monkeypatch):
+    bake({"imagens/elementos/gota.png": {(8, 8)}}, root=str(baked_tree))
+    scaled = []
+    real_scale = pygame.transform.scale
+    monkeypatch.setattr(
+        pygame.transform, "scale", lambda s, size: scaled.append(size) or real_scale(s, size)
+    )
+
+    cache = ResourceCache()
+    image = cache.get_image("imagens/elementos/gota.png", (8, 8))
+    assert image.get_size() == (8, 8)
+    assert image.get_flags() & pygame.SRCALPHA
+    assert scaled == []
+    assert cache.image_requests == {"imagens/elementos/gota.png": {(8, 8)}}
+
+
+def test_stale_or_missing_sources(baked_tree):
+    bake({"imagens/elementos/gota.png": {(8, 8)}}, root=str(baked_tree))
+    source = baked_tree / "imagens" / "elementos" / "gota.png"
+    cache = ResourceCache()
+
+    assert cache._load_baked("imagens/elementos/gota.png", (8, 8)) is not None
+
+    # Same-size edit after the bake: caught by the modification time
+    baked_mtime = os.stat(source).st_mtime
+    os.utime(source, (baked_mtime + 60, baked_mtime + 60))
+    assert cache._load_baked("imagens/elementos/gota.png", (8, 8)) is None
+
+    # Source edited after the bake: the baked file is ignored
+    os.utime(source, (baked_mtime, baked_mtime))
+    pygame.image.save(pygame.Surface((40, 40), pygame.SRCALPHA), str(source))
+    os.utime(source, (baked_mtime, baked_mtime))
+    assert cache._load_baked("imagens/elementos/gota.png", (8, 8)) is None
+
+    # Source left out of the package: an unseen scale comes from the baked variant
+    os.remove(source)
+    image = cache.get_image("imagens/elementos/gota.png", (4, 4))
+    assert image.get_size() == (4, 4)
+
+
+def test_direct_loads_protect_their_paths(tmp_path):
+    (tmp_path / "flag.py").write_text(
+        'path = resource_path("imagens/elementos/bandeira.png")\n'
+        "img = pygame.image.load(path)\n"
+        'frames = f"imagens/final/{i}.png"\n',
+        encoding="utf-8",
+    )
+    (tmp_path / "menu.py").write_text('cache.get_image("imagens/bg/menu.png")\n', encoding="utf-8")
+    assert direct_load_paths(str(tmp_path)) == {"imagens/elementos/bandeira.png", "imagens/final"}
@@ -87,6 +87,10 @@ def test_load_images_with_game_and_scaling(monkeypatch):
     assert img.game_logo.get_width() == 300
     assert img.game_logo.get_height() == 200
 
+    # Fire image belongs to the final world; load it on world change
+    assert "fire_image" not in vars(img)
+    assert img.load_world(51) is True
+
     # Fire image keeps aspect ratio to target height 30
     assert img.fire_image.get_width() == 15
     assert img.fire_image.get_height() == 30
@@ -0,0 +1,73 @@
+import pygame
+
+from internal.resources.text_cache import TextCache
+
+
+class FakeFont:
+    def __init__(self):
+        self.render_calls = 0
+        self.size_calls = 0
+
+    def render(self, text, antialias, color, background=None):
+        self.render_calls += 1
+        return pygame.Surface((max(1, len(text)), 10))
+
+    def size(self, text):
+        self.size_calls += 1
+        return (len(text) * 8, 10)
+
+
+def _fresh_cache(max_entries=TextCache.MAX_ENTRIES):
+    cache = TextCache()
+    cache.clear()
+    cache.hits = 0
+    cache.misses = 0
+    cache.max_entries = max_entries
+    return cache
+
+
+def test_render_reuses_surface_for_same_key():
+    cache = _fresh_cache()
+    font = FakeFont()
+    first = cache.render(font, "Olá", True, (255, 255, 255))
+    second = cache.render(font, "Olá", True, [255, 255, 255])
+    assert first is second
+    assert font.render_calls == 1
+    assert cache.get_stats()["hits"] == 1
+
+    cache.render(font, "Olá", True, (255, 0, 0))
+    cache.render(font, "Olá", False, (255, 255, 255))
+    assert font.render_calls == 3
+
+
+def test_lru_evicts_least_recently_used():
+    cache = _fresh_cache(max_entries=2)
+    font = FakeFont()
+    cache.render(font, "a", True, (0, 0, 0))
+    cache.render(font, "b", True, (0, 0, 0))
+    cache.render(font, "a", True, (0, 0, 0))  # "a" passa a ser o mais recente
+    cache.render(font, "c", True, (0, 0, 0))  # expulsa "b"
+    assert font.render_calls == 3
+
+    cache.render(font, "a", True, (0, 0, 0))
+    assert font.render_calls == 3
+    cache.render(font, "b", True, (0, 0, 0))
+    assert font.render_calls == 4
+    assert cache.get_stats()["surfaces_cached"] == 2
+    cache.max_entries = TextCache.MAX_ENTRIES
+
+
+def test_size_is_cached():
+    cache = _fresh_cache()
+    font = FakeFont()
+    assert cache.size(font, "888") == (24, 10)
+    assert cache.size(font, "888") == (24, 10)
+    assert font.size_calls == 1
+
+
+def test_get_font_creates_once_per_size():
+    pygame.font.init()
+    cache = _fresh_cache()
+    assert cache.get_font(48) is cache.get_font(48)
+    assert cache.get_font(48) is not cache.get_font(56)
+    assert cache.get_stats()["fonts_cached"] == 2
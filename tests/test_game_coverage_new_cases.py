@@ -559,4 +559,18 @@ def test_keyboard_credits_menu_esc_back_to_main(monkeypatch):
     evt = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
     pygame.event.post(evt)
     g.handle_events()
-    assert g.state == GameState.MAIN_MENU
\ No newline at end of file
+    assert g.state == GameState.MAIN_MENU
+
+
+def test_records_board_follows_selected_difficulty(monkeypatch):
+    from internal.engine.difficulty import Difficulty
+
+    g = _init_game_for_draw()
+    assert g.ranking_manager.current_board == g.ranking_manager.board_key(g.difficulty)
+
+    g.state = GameState.SELECT_DIFFICULTY
+    g.difficulty_selected = 2
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN))
+    g.handle_events()
+    assert g.difficulty == Difficulty.HARD
+    assert g.ranking_manager.current_board == g.ranking_manager.board_key(Difficulty.HARD)